@@ -0,0 +1,90 @@
+"""
+Girder analysis benchmark for Highway Bridge Design.
+
+Times the grillage and continuous beam analyses of a bridge with an
+increasing number of equal spans, with the time per span, which stays flat
+as the banded solver's cost grows linearly. For comparison, the grillage
+stiffness matrix is also expanded to a dense matrix and solved with
+numpy.linalg.solve, whose cost grows with the cube of the spans.
+
+Usage:
+    python benchmarks/bench_analysis.py [--src PATH] [--spans 1,2,5,10,20] [--girders N] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def dense(band):
+    """The full matrix of a BlockBand"""
+    import numpy as np
+    stations, size = band.diagonal.shape[:2]
+    matrix = np.zeros((stations * size, stations * size))
+    for i, block in enumerate(band.diagonal):
+        matrix[i * size:(i + 1) * size, i * size:(i + 1) * size] = block
+    for i, block in enumerate(band.lower):
+        matrix[(i + 1) * size:(i + 2) * size, i * size:(i + 1) * size] = block
+        matrix[i * size:(i + 1) * size, (i + 1) * size:(i + 2) * size] = block.T
+    return matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--spans", default="1,2,5,10,20")
+    parser.add_argument("--girders", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    import numpy as np
+    from osbridge.backend.common import KEY_SPAN, KEY_NO_OF_SPANS, KEY_NO_OF_GIRDERS, KEY_CARRIAGEWAY_WIDTH
+    from osbridge.backend.model import BridgeInputs
+    from osbridge.backend import analysis
+
+    # Capture the grillage stiffness matrix of each run for the dense comparison
+    bands = []
+    factor = analysis.BlockBand.factor
+
+    def capture(band):
+        bands.append(band)
+        return factor(band)
+
+    print(f"{args.girders} girders, {analysis.SEGMENTS_PER_SPAN} elements per span")
+    print(f"{'spans':>5} {'model':16} {'DOFs':>6} {'median ms':>10} {'min ms':>10} {'ms/span':>8}")
+    for spans in (int(value) for value in args.spans.split(",")):
+        inputs = BridgeInputs({KEY_SPAN: 30.0, KEY_NO_OF_SPANS: spans, KEY_NO_OF_GIRDERS: args.girders,
+                               KEY_CARRIAGEWAY_WIDTH: 2.5 * args.girders})
+        for model in analysis.ANALYSIS_MODELS:
+            samples = timed(lambda: analysis.analyse_girders(inputs, model), args.repeat)
+            bands.clear()
+            analysis.BlockBand.factor = capture
+            try:
+                analysis.analyse_girders(inputs, model)
+            finally:
+                analysis.BlockBand.factor = factor
+            band = bands[0]
+            dofs = band.diagonal.shape[0] * band.diagonal.shape[1]
+            print(f"{spans:5} {model:16} {dofs:6} {statistics.median(samples):10.1f} {min(samples):10.1f} "
+                  f"{statistics.median(samples) / spans:8.2f}")
+            if model == analysis.GRILLAGE:
+                matrix, rhs = dense(band), np.ones((dofs, len(analysis.LOAD_CASES) + spans))
+                samples = timed(lambda: np.linalg.solve(matrix, rhs), args.repeat)
+                print(f"{spans:5} {'dense solve':16} {dofs:6} {statistics.median(samples):10.1f} "
+                      f"{min(samples):10.1f} {statistics.median(samples) / spans:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
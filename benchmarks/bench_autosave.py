@@ -0,0 +1,69 @@
+"""
+Autosave journal benchmark for Highway Bridge Design.
+
+Times input edits with and without the autosave journal listening (the
+cost the UI thread sees), how long the writer thread takes to get a burst
+of edits onto the disk, compacting the journal into the project file and
+recovering a project from a journal of a given length.
+
+Usage:
+    python benchmarks/bench_autosave.py [--src PATH] [--edits N] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--edits", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    from osbridge.backend import journal
+    from osbridge.backend.common import KEY_SPAN, KEY_CARRIAGEWAY_WIDTH
+    from osbridge.backend.model import BridgeInputs
+
+    def edits(inputs):
+        for i in range(args.edits):
+            inputs.set(KEY_SPAN if i % 2 else KEY_CARRIAGEWAY_WIDTH, 20.0 + i % 25)
+
+    def timed(func):
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples), min(samples)
+
+    print(f"{args.edits} edits per run")
+    print(f"{'phase':40} {'median ms':>10} {'min ms':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "autosave.osbridge")
+        inputs = BridgeInputs()
+        results = [("edits, no autosave", timed(lambda: edits(inputs)))]
+
+        autosave = journal.AutosaveJournal(inputs, path)
+        results.append(("edits, autosave listening", timed(lambda: edits(inputs))))
+        autosave.flush()
+        results.append(("edits until on disk", timed(lambda: (edits(inputs), autosave.flush()))))
+        autosave.close()
+
+        values = inputs.to_dict()
+        results.append(("compact into the project file", timed(lambda: journal.write_project(path, values))))
+        with open(journal.journal_path(path), "w", encoding="utf-8") as stream:
+            stream.writelines(f'["{KEY_SPAN}",{20 + i % 25}.0,{20 + (i + 1) % 25}.0]\n'
+                              for i in range(journal.COMPACT_CHANGES))
+        results.append((f"recover, {journal.COMPACT_CHANGES} line journal", timed(lambda: journal.recover_inputs(path))))
+    for name, (median, best) in results:
+        print(f"{name:40} {median:10.2f} {best:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
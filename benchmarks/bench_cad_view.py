@@ -0,0 +1,104 @@
+"""
+CAD view benchmark for Highway Bridge Design.
+
+Times full and moving-camera frames of the software-rendered CAD view,
+with and without level of detail, picking and box selection, and the
+update after editing the number of girders or the stiffener spacing:
+rebuilding the affected components, applying their instance diffs and
+bringing the scene arrays up to date, with and without rendering the next
+frame.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_cad_view.py [--src PATH] [--girders N]
+        [--span M] [--stiffener-spacing MM] [--repeat N]
+"""
+import argparse
+import itertools
+import os
+import statistics
+import sys
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--girders", type=int, default=10)
+    parser.add_argument("--span", type=float, default=45.0)
+    parser.add_argument("--stiffener-spacing", type=float, default=1500.0)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    from PySide6.QtCore import QRect
+    from PySide6.QtWidgets import QApplication
+    from osbridge.backend.backend import BackendOsBridge
+    from osbridge.backend.common import KEY_SPAN, KEY_NO_OF_GIRDERS, KEY_CARRIAGEWAY_WIDTH, KEY_FOOTPATH, \
+        KEY_FOOTPATH_WIDTH, KEY_STIFFENER_SPACING
+    from osbridge.ui.cad_view import CadView
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    backend = BackendOsBridge()
+    backend.inputs.update({KEY_SPAN: args.span, KEY_NO_OF_GIRDERS: args.girders,
+                           KEY_CARRIAGEWAY_WIDTH: 2.5 * args.girders, KEY_FOOTPATH: "Both",
+                           KEY_FOOTPATH_WIDTH: 1.5, KEY_STIFFENER_SPACING: args.stiffener_spacing})
+    view = CadView()
+    view.resize(1000, 700)
+    view.show()
+    view.set_components(backend.get_3d_components())
+    app.processEvents()
+    level = view.scene_faces()[3]
+    print(f"scene: {len(view.instances[0]):,} instances, {(level == 0).sum():,} faces at full detail, "
+          f"view {view.width()} x {view.height()}")
+
+    def frame(interactive=False, level_of_detail=True, zoom=1.0):
+        view.level_of_detail = level_of_detail
+        view.interactive = interactive
+        view.fit()
+        view.distance *= zoom
+        view.repaint()
+
+    def edit(key, values, render=True):
+        values = itertools.cycle(values)
+
+        def run():
+            backend.inputs.set(key, next(values))
+            view.apply_diffs(backend.update_3d_components())
+            if render:
+                view.repaint()
+            else:
+                view.scene_faces()
+        return run
+
+    print(f"{'phase':40} {'median ms':>10} {'min ms':>10}")
+    for name, func in (
+        ("full frame, whole model", frame),
+        ("full frame, whole model, full detail", lambda: frame(level_of_detail=False)),
+        ("moving camera frame", lambda: frame(True)),
+        ("moving camera frame, full detail", lambda: frame(True, False)),
+        ("full frame, zoomed out", lambda: frame(zoom=3.0)),
+        ("full frame, zoomed out, full detail", lambda: frame(level_of_detail=False, zoom=3.0)),
+        ("full frame, close up", lambda: frame(zoom=0.25)),
+        ("pick at the view centre", lambda: view.pick(view.width() / 2, view.height() / 2)),
+        ("box select, centre quarter", lambda: view.select_box(
+            QRect(view.width() // 4, view.height() // 4, view.width() // 2, view.height() // 2))),
+        ("select one instance, next frame", lambda: (view.set_selection(["G1"]), view.repaint())),
+        ("edit no. of girders, scene update", edit(KEY_NO_OF_GIRDERS, (args.girders - 2, args.girders), False)),
+        ("edit no. of girders, next frame", edit(KEY_NO_OF_GIRDERS, (args.girders - 2, args.girders))),
+        ("edit stiffener spacing, scene update", edit(KEY_STIFFENER_SPACING, (2000.0, 1500.0), False)),
+        ("edit stiffener spacing, next frame", edit(KEY_STIFFENER_SPACING, (2000.0, 1500.0))),
+    ):
+        view.level_of_detail = True
+        view.interactive = False
+        view.fit()
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+        print(f"{name:40} {statistics.median(samples):10.1f} {min(samples):10.1f}")
+
+
+if __name__ == "__main__":
+    main()
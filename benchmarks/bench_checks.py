@@ -0,0 +1,79 @@
+"""
+Design check query benchmark for Highway Bridge Design.
+
+Builds synthetic utilization ratios and times the controlling check
+reduction over all members and stations, the heat map colours, the
+incremental recompute after a few members are re-analysed, and top-K
+critical check queries.
+
+Usage:
+    python benchmarks/bench_checks.py [--src PATH] [--members N] [--stations N]
+        [--combinations N] [--checks N] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--members", type=int, default=200)
+    parser.add_argument("--stations", type=int, default=51)
+    parser.add_argument("--combinations", type=int, default=30)
+    parser.add_argument("--checks", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    import numpy as np
+    from osbridge.backend.checks import DesignChecks, utilization_colors
+
+    rng = np.random.default_rng(0)
+    shape = (args.members, args.stations, args.combinations, args.checks)
+    checks = DesignChecks(
+        rng.random(shape) * 1.1,
+        [f"G{i % 10 + 1}-S{i // 10 + 1}" for i in range(args.members)],
+        [f"LC{i + 1}" for i in range(args.combinations)],
+        [f"Cl. {601 + i}" for i in range(args.checks)],
+        np.linspace(0.0, 30.0, args.stations),
+        [f"G{i % 10 + 1}" for i in range(args.members)],
+    )
+    print(f"checks: {' x '.join(map(str, shape))} = {checks.utilization.size:,} ratios, "
+          f"{checks.utilization.nbytes / 1e6:.1f} MB")
+
+    def full():
+        checks._controlling = None
+        checks.controlling()
+
+    rerun = rng.random((5,) + shape[1:]) * 1.1
+    print(f"{'phase':40} {'median ms':>10} {'min ms':>10}")
+    for name, func in (
+        ("controlling check, all members", full),
+        ("heat map colours", lambda: utilization_colors(checks.controlling()[0])),
+        ("update 5 re-analysed members", lambda: checks.update(range(5), rerun)),
+        ("top 10, all checks", lambda: checks.top_k(10)),
+        ("top 100, all checks", lambda: checks.top_k(100)),
+        ("top 10, girder G1", lambda: checks.top_k(10, girder="G1")),
+        ("top 10, member G1-S1", lambda: checks.top_k(10, member="G1-S1")),
+        ("top 10, one clause", lambda: checks.top_k(10, check=checks.checks[0])),
+        ("full argsort, for comparison", lambda: np.argsort(checks.utilization, axis=None)),
+    ):
+        median, best = timed(func, args.repeat)
+        print(f"{name:40} {median:10.2f} {best:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
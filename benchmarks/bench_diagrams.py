@@ -0,0 +1,99 @@
+"""
+Diagram redraw benchmark for Highway Bridge Design.
+
+Builds synthetic results with fine station spacing (millions of diagram
+points) and times the arrival of the results, then repaints of the diagram
+view: the first draw, a repaint from cached tiles, panning, zooming in and
+back out, and checking another component.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_diagrams.py [--src PATH] [--members N]
+        [--stations N] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--members", type=int, default=20)
+    parser.add_argument("--stations", type=int, default=25001)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    import numpy as np
+    from PySide6.QtWidgets import QApplication
+    from osbridge.backend.results import AnalysisResults, COMPONENTS
+    from osbridge.ui.diagram_view import DiagramView
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    rng = np.random.default_rng(0)
+    stations = np.linspace(0.0, 40.0, args.stations)
+    shape = (args.members, args.stations, 2, len(COMPONENTS))
+    # Smooth moment-like curves with noise, so min/max decimation has real work to do
+    base = np.sin(np.pi * stations / stations[-1])[None, :, None, None]
+    values = base * rng.uniform(0.5, 1.5, (args.members, 1, 2, len(COMPONENTS))) + 0.05 * rng.standard_normal(shape)
+    results = AnalysisResults(values, [f"G{i + 1}" for i in range(args.members)], ["LC1", "LC2"], stations)
+    points = args.members * args.stations * 2
+    print(f"diagram points per component (envelope): {points:,}")
+
+    view = DiagramView()
+    view.resize(1200, 320)
+    view.show()
+    app.processEvents()
+    start = time.perf_counter()
+    view.set_results(results)
+    arrival = (time.perf_counter() - start) * 1000
+
+    def repaint():
+        start = time.perf_counter()
+        view.repaint()
+        return (time.perf_counter() - start) * 1000
+
+    view.set_components(["Mz"])
+    rows = [("results arrive", [arrival]), ("first draw, Mz", [repaint()])]
+    rows.append(("repaint from cache", [repaint() for _ in range(args.repeat)]))
+
+    view.zoom(8.0, 600)
+    repaint()
+    samples = []
+    for _ in range(args.repeat):
+        view.offset += 40.0 / view.scale
+        samples.append(repaint())
+    rows.append(("pan 40 px at 8x", samples))
+
+    samples = []
+    for _ in range(args.repeat):
+        view.zoom(1.25, 600)
+        samples.append(repaint())
+    rows.append(("zoom in one step", samples))
+
+    samples = []
+    for _ in range(args.repeat):
+        view.zoom(0.8, 600)
+        samples.append(repaint())
+    rows.append(("zoom back out", samples))
+
+    view.scale = None
+    repaint()
+    view.set_components(["Mz", "Fy"])
+    rows.append(("check Fy", [repaint()]))
+    view.set_components(["Mz"])
+    repaint()
+    view.set_components(["Mz", "Fy"])
+    rows.append(("check Fy again", [repaint()]))
+
+    print(f"{'phase':32} {'median ms':>10} {'max ms':>10}")
+    for name, samples in rows:
+        print(f"{name:32} {statistics.median(samples):10.1f} {max(samples):10.1f}")
+    view.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+3D model export benchmark for Highway Bridge Design.
+
+Times exporting a bridge (10 girders over 45 m by default) to STL, glTF
+and IFC, with the file size and the peak memory allocated while writing,
+next to the memory of merging every instance into model-space meshes at
+once. A skew angle makes the instances unplaceable by glTF matrices and
+IFC operators, so their triangles are written out instead.
+
+Usage:
+    python benchmarks/bench_export.py [--src PATH] [--girders N] [--span M] [--skew DEG] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+def peak_memory(func):
+    """Peak bytes allocated while func runs"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--girders", type=int, default=10)
+    parser.add_argument("--span", type=float, default=45.0)
+    parser.add_argument("--skew", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    from osbridge.backend.common import KEY_SPAN, KEY_NO_OF_GIRDERS, KEY_CARRIAGEWAY_WIDTH, KEY_FOOTPATH, \
+        KEY_FOOTPATH_WIDTH, KEY_SKEW_ANGLE
+    from osbridge.backend.model import BridgeInputs
+    from osbridge.backend.model3d import model_components
+    from osbridge.backend.export import EXPORTERS, export_model
+
+    inputs = BridgeInputs({KEY_SPAN: args.span, KEY_NO_OF_GIRDERS: args.girders,
+                           KEY_CARRIAGEWAY_WIDTH: 2.5 * args.girders, KEY_FOOTPATH: "Both", KEY_FOOTPATH_WIDTH: 1.5,
+                           KEY_SKEW_ANGLE: args.skew})
+    components = model_components(inputs)
+    faces = sum(len(component) * len(component.mesh.faces) for component in components)
+    print(f"model: {sum(map(len, components)):,} instances, {faces:,} faces, skew {args.skew} deg")
+    merged = peak_memory(lambda: [component.world_mesh() for component in components])
+    print(f"merging every instance at once: peak {merged / 2**20:.1f} MiB")
+
+    print(f"{'format':8} {'median ms':>10} {'min ms':>10} {'file MiB':>10} {'peak MiB':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in EXPORTERS:
+            path = os.path.join(directory, "bridge" + extension)
+            samples = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                export_model(components, path)
+                samples.append((time.perf_counter() - start) * 1000)
+            peak = peak_memory(lambda: export_model(components, path))
+            print(f"{extension:8} {statistics.median(samples):10.1f} {min(samples):10.1f} "
+                  f"{os.path.getsize(path) / 2**20:10.2f} {peak / 2**20:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Undo history benchmark for Highway Bridge Design.
+
+Records a number of single-value edits of the bridge inputs as undo steps
+and reports the memory the steps hold, next to keeping a full copy of the
+inputs per step, then times undoing and redoing every step.
+
+Usage:
+    python benchmarks/bench_history.py [--src PATH] [--steps N] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--steps", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    from osbridge.backend.common import KEY_SPAN, KEY_CARRIAGEWAY_WIDTH, KEY_SKEW_ANGLE
+    from osbridge.backend.model import BridgeInputs
+    from osbridge.backend.history import InputHistory
+
+    keys = (KEY_SPAN, KEY_CARRIAGEWAY_WIDTH, KEY_SKEW_ANGLE)
+    edits = [(keys[step % len(keys)], 20.0 + step % 25 + step / args.steps) for step in range(args.steps)]
+
+    inputs = BridgeInputs()
+    history = InputHistory(inputs)
+    tracemalloc.start()
+    for key, value in edits:
+        inputs.set(key, value)
+        history.commit()
+    shared = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    copies_inputs = BridgeInputs()
+    tracemalloc.start()
+    copies = [copies_inputs.to_dict()]
+    for key, value in edits:
+        copies_inputs.set(key, value)
+        copies.append(copies_inputs.to_dict())
+    copied = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{len(inputs.to_dict())} inputs, {args.steps:,} steps")
+    print(f"{'storage':14} {'total KiB':>10} {'bytes/step':>11}")
+    print(f"{'snapshots':14} {shared / 1024:10.1f} {shared / args.steps:11.0f}")
+    print(f"{'full copies':14} {copied / 1024:10.1f} {copied / args.steps:11.0f}")
+
+    # Undo every step, then redo them all
+    samples = {"undo": [], "redo": []}
+    for _ in range(args.repeat):
+        for name, step in (("undo", history.undo), ("redo", history.redo)):
+            start = time.perf_counter()
+            while step():
+                pass
+            samples[name].append((time.perf_counter() - start) * 1e6 / args.steps)
+    print(f"{'operation':14} {'median us':>10} {'min us':>10}")
+    for name, times in samples.items():
+        print(f"{name:14} {statistics.median(times):10.2f} {min(times):10.2f}")
+
+
+if __name__ == "__main__":
+    main()
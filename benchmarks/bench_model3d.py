@@ -0,0 +1,61 @@
+"""
+3D model generation benchmark for Highway Bridge Design.
+
+Times the instanced component meshes of a bridge (10 girders over 45 m by
+default) and merging every instance into model-space meshes, as an
+exporter or a renderer without instancing would.
+
+Usage:
+    python benchmarks/bench_model3d.py [--src PATH] [--girders N] [--span M] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--girders", type=int, default=10)
+    parser.add_argument("--span", type=float, default=45.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    from osbridge.backend.common import KEY_SPAN, KEY_NO_OF_GIRDERS, KEY_CARRIAGEWAY_WIDTH, KEY_FOOTPATH, \
+        KEY_FOOTPATH_WIDTH
+    from osbridge.backend.model import BridgeInputs
+    from osbridge.backend.model3d import model_components
+
+    inputs = BridgeInputs({KEY_SPAN: args.span, KEY_NO_OF_GIRDERS: args.girders,
+                           KEY_CARRIAGEWAY_WIDTH: 2.5 * args.girders, KEY_FOOTPATH: "Both", KEY_FOOTPATH_WIDTH: 1.5})
+    components = model_components(inputs)
+    for component in components:
+        print(f"{component.name:20} {len(component):6} instances x {len(component.mesh.faces):4} faces")
+    faces = sum(len(component) * len(component.mesh.faces) for component in components)
+    print(f"{'total':20} {sum(map(len, components)):6} instances, {faces:,} faces")
+
+    print(f"{'phase':32} {'median ms':>10} {'min ms':>10}")
+    for name, func in (
+        ("instanced components", lambda: model_components(inputs)),
+        ("merge to model-space meshes", lambda: [component.world_mesh() for component in components]),
+        ("instance bounding boxes", lambda: [component.bounds() for component in components]),
+    ):
+        median, best = timed(func, args.repeat)
+        print(f"{name:32} {median:10.2f} {best:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
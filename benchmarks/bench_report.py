@@ -0,0 +1,102 @@
+"""
+Design report benchmark for Highway Bridge Design.
+
+Times writing the design report of a bridge with synthetic analysis
+results and design checks (240 members by default, about 200 pages) to
+HTML and LaTeX: rendering in the writing process, in the worker pool and
+again with every table, figure and model snapshot cached, as a rerun with
+unchanged inputs is. Model snapshots come from a SnapshotRenderer with the
+same number of workers as the writer, as in the application.
+
+Usage:
+    python benchmarks/bench_report.py [--src PATH] [--members N] [--stations N] [--combinations N]
+        [--workers N] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Rough LaTeX page layout used for the page estimate
+TABLE_ROWS_PER_PAGE = 50
+FIGURES_PER_PAGE = 3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--members", type=int, default=240)
+    parser.add_argument("--stations", type=int, default=31)
+    parser.add_argument("--combinations", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    import numpy as np
+    from osbridge.backend.checks import DesignChecks
+    from osbridge.backend.model import BridgeInputs
+    from osbridge.backend.model3d import model_components
+    from osbridge.backend.report import ReportWriter, Table, Figure, Image, design_report
+    from osbridge.backend.results import AnalysisResults
+    from osbridge.backend.snapshots import SnapshotRenderer
+
+    rng = np.random.default_rng(0)
+    members = [f"G{i % 10 + 1}-S{i // 10 + 1}" for i in range(args.members)]
+    combinations = [f"LC{i + 1}" for i in range(args.combinations)]
+    stations = np.linspace(0.0, 45.0, args.stations)
+    results = AnalysisResults(rng.normal(size=(args.members, args.stations, args.combinations, 9)) * 100,
+                              members, combinations, stations)
+    checks = DesignChecks(rng.random((args.members, args.stations, args.combinations, 12)) * 1.1, members,
+                          combinations, [f"Cl. {601 + i}" for i in range(12)], stations,
+                          [member.split("-")[0] for member in members])
+    inputs = BridgeInputs()
+    components = model_components(inputs)
+
+    def blocks(renderer):
+        return design_report(inputs, renderer.render(components), results, checks)
+
+    serial = ReportWriter(workers=0), SnapshotRenderer(workers=0)
+    pool = ReportWriter(workers=args.workers), SnapshotRenderer(workers=args.workers)
+    rows = sum(len(block.rows) + 1 for block in blocks(serial[1]) if isinstance(block, Table))
+    figures = sum(isinstance(block, (Figure, Image)) for block in blocks(serial[1]))
+    print(f"report: {rows:,} table rows, {figures} figures, "
+          f"about {rows // TABLE_ROWS_PER_PAGE + figures // FIGURES_PER_PAGE} pages")
+
+    with tempfile.TemporaryDirectory() as directory:
+        def write(writers, extension, cached=False):
+            writer, renderer = writers
+
+            def run():
+                if not cached:
+                    writer.cache.clear()
+                    writer.cache_size = 0
+                    renderer.cache.clear()
+                writer.write(blocks(renderer), os.path.join(directory, "report" + extension))
+            return run
+
+        write(pool, ".html")()  # Start the workers
+        print(f"{'phase':40} {'median ms':>10} {'min ms':>10}")
+        for name, func in (
+            ("HTML, in process", write(serial, ".html")),
+            (f"HTML, {pool[0].workers} workers", write(pool, ".html")),
+            ("HTML rerun, fragments cached", write(pool, ".html", cached=True)),
+            ("LaTeX, in process", write(serial, ".tex")),
+            (f"LaTeX, {pool[0].workers} workers", write(pool, ".tex")),
+            ("LaTeX rerun, fragments cached", write(pool, ".tex", cached=True)),
+        ):
+            samples = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                func()
+                samples.append((time.perf_counter() - start) * 1000)
+            print(f"{name:40} {statistics.median(samples):10.1f} {min(samples):10.1f}")
+    pool[0].close()
+    pool[1].close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Results view and query benchmark for Highway Bridge Design.
+
+Builds synthetic analysis results (girders x stations x load combinations x
+components) and times the results table model: loading, filtering, sorting,
+reading a screen of cells and scrolling the view through the whole table.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_results.py [--src PATH] [--members N]
+        [--stations N] [--combinations N] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--members", type=int, default=20)
+    parser.add_argument("--stations", type=int, default=101)
+    parser.add_argument("--combinations", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    import numpy as np
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication
+    from osbridge.backend.results import AnalysisResults, COMPONENTS, ENVELOPE, ALL_COMBINATIONS
+    from osbridge.ui.results_table import ResultsTableModel, ResultsTableDialog
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    rng = np.random.default_rng(0)
+    shape = (args.members, args.stations, args.combinations, len(COMPONENTS))
+    results = AnalysisResults(
+        rng.standard_normal(shape),
+        [f"G{i + 1}" for i in range(args.members)],
+        [f"LC{i + 1}" for i in range(args.combinations)],
+        np.linspace(0.0, 30.0, args.stations),
+    )
+    print(f"results: {' x '.join(map(str, shape))} = {results.values.size:,} values, "
+          f"{results.values.nbytes / 1e6:.1f} MB")
+
+    model = ResultsTableModel()
+    tracemalloc.start()
+    model.set_results(results)
+    model.set_filter(None, "LC1")
+    model.set_filter(None, ENVELOPE)
+    envelope_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    model.set_filter(None, ALL_COMBINATIONS)
+    model.sort(3, Qt.DescendingOrder)
+    model.set_filter(None, ALL_COMBINATIONS)
+    view_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"model memory: envelope {envelope_peak / 1e6:.1f} MB, row index peak {view_peak / 1e6:.1f} MB")
+
+    def read_screen():
+        for row in range(0, 40):
+            for column in range(model.columnCount()):
+                model.data(model.index(row, column))
+
+    dialog = ResultsTableDialog(model)
+    dialog.show()
+    app.processEvents()
+    scrollbar = dialog.view.verticalScrollBar()
+
+    def scroll():
+        for step in range(0, 21):
+            scrollbar.setValue(scrollbar.maximum() * step // 20)
+            dialog.view.viewport().repaint()
+
+    model.sort(-1)
+    model.set_filter(None, ALL_COMBINATIONS)
+    print(f"rows: all combinations {model.rowCount():,}")
+    results_rows = [
+        ("load results", timed(lambda: model.set_results(results), args.repeat)),
+        ("filter member + combination", timed(lambda: model.set_filter("G2", "LC7"), args.repeat)),
+        ("filter all combinations", timed(lambda: model.set_filter(None, ALL_COMBINATIONS), args.repeat)),
+        ("sort all rows by Mz", timed(lambda: model.sort(8, Qt.DescendingOrder), args.repeat)),
+        ("data(), 40 rows", timed(read_screen, args.repeat)),
+        ("scroll 21 pages", timed(scroll, args.repeat)),
+    ]
+    print(f"{'phase':32} {'median ms':>10} {'min ms':>10}")
+    for name, (median, best) in results_rows:
+        print(f"{name:32} {median:10.2f} {best:10.2f}")
+
+    dialog.close()
+
+
+if __name__ == "__main__":
+    main()
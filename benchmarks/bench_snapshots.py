@@ -0,0 +1,84 @@
+"""
+Report snapshot benchmark for Highway Bridge Design.
+
+Times rendering the plan, elevation and isometric snapshots of one bridge
+in the calling process and in the worker pool, and a batch of reports over
+a design sweep whose designs share their geometry in groups (as sweeps of
+loads or materials over a few layouts do), first with an empty cache and
+then again with the images cached.
+
+Usage:
+    python benchmarks/bench_snapshots.py [--src PATH] [--girders N] [--layouts N] [--designs N]
+        [--workers N] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--girders", type=int, default=10)
+    parser.add_argument("--layouts", type=int, default=3, help="distinct spans in the sweep")
+    parser.add_argument("--designs", type=int, default=24, help="designs in the sweep")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    from osbridge.backend.common import KEY_SPAN, KEY_NO_OF_GIRDERS, KEY_CARRIAGEWAY_WIDTH, KEY_FOOTPATH, \
+        KEY_FOOTPATH_WIDTH
+    from osbridge.backend.model import BridgeInputs
+    from osbridge.backend.model3d import model_components
+    from osbridge.backend.snapshots import SnapshotRenderer, SNAPSHOT_VIEWS, SNAPSHOT_SIZE
+
+    def model(span):
+        return model_components(BridgeInputs({
+            KEY_SPAN: span, KEY_NO_OF_GIRDERS: args.girders, KEY_CARRIAGEWAY_WIDTH: 2.5 * args.girders,
+            KEY_FOOTPATH: "Both", KEY_FOOTPATH_WIDTH: 1.5}))
+
+    bridge = model(45.0)
+    sweep = [model(30.0 + 5.0 * (design % args.layouts)) for design in range(args.designs)]
+    views = len(SNAPSHOT_VIEWS)
+    print(f"snapshots {SNAPSHOT_SIZE[0]} x {SNAPSHOT_SIZE[1]} px; sweep of {args.designs} designs over "
+          f"{args.layouts} layouts: {args.designs * views} images, {args.layouts * views} distinct")
+
+    serial = SnapshotRenderer(workers=0)
+    pool = SnapshotRenderer(workers=args.workers)
+    pool.render_batch([model(20.0), model(25.0)])  # Start the workers
+
+    def uncached(renderer, models):
+        def run():
+            renderer.cache.clear()
+            renderer.render_batch(models)
+        return run
+
+    print(f"{'phase':40} {'median ms':>10} {'min ms':>10}")
+    for name, func in (
+        ("one bridge, in process", uncached(serial, [bridge])),
+        (f"one bridge, {pool.workers} workers", uncached(pool, [bridge])),
+        ("sweep, in process, no cache", lambda: [uncached(serial, [components])() for components in sweep]),
+        ("sweep, in process", uncached(serial, sweep)),
+        (f"sweep, {pool.workers} workers", uncached(pool, sweep)),
+        ("sweep again, images cached", lambda: pool.render_batch(sweep)),
+    ):
+        median, best = timed(func, args.repeat)
+        print(f"{name:40} {median:10.1f} {best:10.1f}")
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Stylesheet cost benchmark for the Highway Bridge Design window.
+
+Measures the phases whose time is dominated by stylesheet parsing and
+polishing: building the main window, building every Additional Inputs page,
+resizing the window and re-polishing validated fields.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_stylesheet.py [--src PATH] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+
+def timed(func, repeat, setup=None):
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    from PySide6.QtWidgets import QApplication
+    from osbridge.template_page import CustomWindow
+    from osbridge.backend.backend import BackendOsBridge
+    from osbridge.ui.lazy import LazyWidget
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    windows = []
+
+    def discard_window():
+        from PySide6.QtCore import QCoreApplication, QEvent
+        while windows:
+            window = windows.pop()
+            window.close()
+            window.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+        app.processEvents()
+
+    def build_window():
+        window = CustomWindow("Osdag Bridge", BackendOsBridge)
+        window.resize(1400, 900)
+        window.show()
+        app.processEvents()
+        windows.append(window)
+
+    def build_additional_inputs():
+        window = windows[-1]
+        window.input_dock.release_additional_inputs()
+        window.input_dock.show_additional_inputs()
+        dialog = window.input_dock.additional_inputs_window
+        for page in dialog.findChildren(LazyWidget):
+            page.build()
+        for page in dialog.findChildren(LazyWidget):
+            page.build()  # Nested pages created by the first pass
+        app.processEvents()
+        dialog.hide()
+
+    def resize_window():
+        window = windows[-1]
+        for width in range(1200, 1600, 40):
+            window.resize(width, 900)
+            app.processEvents()
+
+    def repolish_fields():
+        window = windows[-1]
+        validation = window.input_dock.validation
+        for widgets in validation.fields.values():
+            for widget, tooltip in widgets:
+                widget.style().unpolish(widget)
+                widget.style().polish(widget)
+        app.processEvents()
+
+    results = [
+        ("main window construction", timed(build_window, args.repeat, discard_window)),
+        ("additional inputs, all pages", timed(build_additional_inputs, args.repeat)),
+        ("resize x10", timed(resize_window, args.repeat)),
+        ("re-polish validated fields", timed(repolish_fields, args.repeat)),
+    ]
+    print(f"{'phase':32} {'median ms':>10} {'min ms':>10}")
+    for name, (median, best) in results:
+        print(f"{name:32} {median:10.1f} {best:10.1f}")
+
+    discard_window()
+
+
+if __name__ == "__main__":
+    main()
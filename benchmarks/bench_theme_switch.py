@@ -0,0 +1,86 @@
+"""
+Theme switch benchmark for the Highway Bridge Design window.
+
+Times light/dark switches, including the repaint that follows, on the main
+window alone, then once every Additional Inputs page has been built with the
+dialog closed and open, and the first show of the dialog after a switch made
+while it was closed.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_theme_switch.py [--src PATH] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    from PySide6.QtWidgets import QApplication, QWidget
+    from osbridge.template_page import CustomWindow
+    from osbridge.backend.backend import BackendOsBridge
+    from osbridge.ui.lazy import LazyWidget
+    from osbridge.ui.theme import THEME_LIGHT, THEME_DARK, theme_manager
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    manager = theme_manager(app)
+
+    def switch_times():
+        samples = []
+        for i in range(args.repeat):
+            theme = THEME_DARK if i % 2 == 0 else THEME_LIGHT
+            start = time.perf_counter()
+            manager.set_theme(theme)
+            app.processEvents()
+            samples.append((time.perf_counter() - start) * 1000)
+        return samples
+
+    def report(name, widgets, samples):
+        print(f"{name:32} {widgets:>8} {statistics.median(samples):10.1f} "
+              f"{min(samples):10.1f} {max(samples):10.1f}")
+
+    window = CustomWindow("Osdag Bridge", BackendOsBridge)
+    window.resize(1400, 900)
+    window.show()
+    app.processEvents()
+    print(f"{'phase':32} {'widgets':>8} {'median ms':>10} {'min ms':>10} {'max ms':>10}")
+    report("main window", len(window.findChildren(QWidget)), switch_times())
+
+    window.input_dock.show_additional_inputs()
+    dialog = window.input_dock.additional_inputs_window
+    for _ in range(2):  # The second pass builds pages nested in the first
+        for page in dialog.findChildren(LazyWidget):
+            page.build()
+    app.processEvents()
+    widgets = len(window.findChildren(QWidget))  # The dialog is parented to the input dock
+    report("additional inputs open", widgets, switch_times())
+    dialog.hide()
+    app.processEvents()
+    report("additional inputs closed", widgets, switch_times())
+
+    samples = []
+    for i in range(args.repeat):
+        manager.set_theme(THEME_DARK if i % 2 == 0 else THEME_LIGHT)
+        app.processEvents()
+        start = time.perf_counter()
+        dialog.show()
+        app.processEvents()
+        samples.append((time.perf_counter() - start) * 1000)
+        dialog.hide()
+        app.processEvents()
+    report("show after switch while closed", widgets, samples)
+
+    dialog.close()
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Input validation benchmark for Highway Bridge Design.
+
+First checks a few boundary cases against the rules they must trip,
+including schema maximums of fields that also carry an IRC rule, then
+times validation of one record, re-validation after a single edit, and a
+batch of synthetic records drawn partly outside the schema bounds.
+
+Usage:
+    python benchmarks/bench_validation.py [--src PATH] [--records N] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", default=os.path.join(os.path.dirname(__file__), "..", "src"),
+                        help="directory containing the osbridge package")
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    sys.path.insert(0, os.path.abspath(args.src))
+
+    import numpy as np
+    from osbridge.backend.common import (KEY_SPAN, KEY_CARRIAGEWAY_WIDTH, KEY_NO_OF_GIRDERS,
+                                         KEY_SKEW_ANGLE, KEY_RAILING_HEIGHT)
+    from osbridge.backend.schema import INPUT_SCHEMA
+    from osbridge.backend.validation import VALIDATION_ENGINE
+
+    base = {KEY_SPAN: 30.0, KEY_CARRIAGEWAY_WIDTH: 7.5, KEY_NO_OF_GIRDERS: 4}
+    cases = (
+        ("valid record", {}, set()),
+        ("carriageway above maximum", {KEY_CARRIAGEWAY_WIDTH: 150.0}, {f"range:{KEY_CARRIAGEWAY_WIDTH}"}),
+        ("carriageway below IRC 5 minimum", {KEY_CARRIAGEWAY_WIDTH: 3.0}, {"carriageway_min"}),
+        ("girders above maximum", {KEY_NO_OF_GIRDERS: 120}, {f"range:{KEY_NO_OF_GIRDERS}"}),
+        ("span above maximum", {KEY_SPAN: 500.0}, {"span_range"}),
+        ("skew beyond IRC 24 (warning only)", {KEY_SKEW_ANGLE: 40.0}, {"skew_angle"}),
+        ("railing above maximum", {KEY_RAILING_HEIGHT: 2500.0}, {f"range:{KEY_RAILING_HEIGHT}"}),
+    )
+    failures = 0
+    for name, changes, expected in cases:
+        found = {d.rule_id for d in VALIDATION_ENGINE.evaluate({**base, **changes})}
+        ok = found == expected
+        failures += not ok
+        print(f"{'ok' if ok else 'FAIL':4} {name:36} {', '.join(sorted(found)) or '-'}")
+    if failures:
+        sys.exit(f"{failures} validation case(s) failed")
+
+    # Numeric fields drawn up to 20% past their bounds, so some records fail
+    rng = np.random.default_rng(0)
+    columns = {}
+    for spec in INPUT_SCHEMA:
+        if spec.type in (int, float) and spec.minimum is not None and spec.maximum is not None:
+            reach = (spec.maximum - spec.minimum) * 0.2
+            values = rng.uniform(spec.minimum - reach, spec.maximum + reach, args.records)
+            columns[spec.key] = np.round(values) if spec.type is int else values
+    records = [dict(zip(columns, row)) for row in zip(*columns.values())]
+    record = {**base, **records[0]}
+    previous = VALIDATION_ENGINE.evaluate(record)
+    edited = {**record, KEY_CARRIAGEWAY_WIDTH: 150.0}
+
+    print(f"\nrules: {len(VALIDATION_ENGINE.rules)}, records: {args.records:,}")
+    print(f"{'phase':40} {'median ms':>10} {'min ms':>10}")
+    for name, func in (
+        ("one record, all rules", lambda: VALIDATION_ENGINE.evaluate(record)),
+        ("one record, after one edit", lambda: VALIDATION_ENGINE.reevaluate(edited, {KEY_CARRIAGEWAY_WIDTH}, previous)),
+        ("batch of records", lambda: VALIDATION_ENGINE.evaluate_batch(records)),
+        ("column arrays", lambda: VALIDATION_ENGINE.evaluate_columns(columns, args.records)),
+    ):
+        median, best = timed(func, args.repeat)
+        print(f"{name:40} {median:10.2f} {best:10.2f}")
+    result = VALIDATION_ENGINE.evaluate_columns(columns, args.records)
+    print(f"\nvalid records: {int(result.valid.sum()):,} of {len(result):,}")
+
+
+if __name__ == "__main__":
+    main()
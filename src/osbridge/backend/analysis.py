@@ -0,0 +1,485 @@
+"""
+Girder analysis of Highway Bridge Design over one or more equal spans.
+The girders run continuously over every pier and are supported vertically
+at the abutments and piers. Nodes are numbered station by station along
+the bridge, so the stiffness matrix is block tridiagonal: a band whose
+blocks hold the degrees of freedom of one station. It is stored as its
+diagonal and sub-diagonal blocks and factored by block Cholesky, so memory
+and time grow linearly with the number of spans.
+
+Member results use member axes: x along the girder, y up and z across;
+forces in kN, moments in kNm and deflections in mm, sagging moments and
+upward deflections positive. design_checks turns the results into the
+utilization ratios of the steel girders.
+"""
+import re
+from collections import namedtuple
+
+import numpy as np
+
+from .common import *
+from .model3d import model_layout, edge_positions, girder_of, CRASH_BARRIER_HEIGHT, CRASH_BARRIER_TOP_RATIO
+from .results import COMPONENTS, AnalysisResults
+from .checks import DesignChecks
+
+
+GRILLAGE = "Grillage"
+CONTINUOUS_BEAM = "Continuous Beam"
+ANALYSIS_MODELS = (GRILLAGE, CONTINUOUS_BEAM)
+
+SEGMENTS_PER_SPAN = 16  # Elements of each girder in each span; stations are their ends
+STRIP_POINTS = 64  # Points integrating an area load across the deck
+
+STEEL_E = 2.0e8  # kN/m2
+STEEL_G = 7.69e7  # kN/m2
+CONCRETE_POISSON = 0.2
+
+# Loads used while the corresponding input is unset
+DEFAULT_DECK_THICKNESS = 250.0  # mm
+DEFAULT_FOOTPATH_THICKNESS = 200.0  # mm
+DEFAULT_WEARING_COAT_DENSITY = 22.0  # kN/m3
+DEFAULT_WEARING_COAT_THICKNESS = 75.0  # mm
+DEFAULT_RAILING_LOAD = 1.0  # kN/m
+# Uniform live load over the carriageway, applied span by span (preliminary design assumption)
+LIVE_LOAD = 5.0  # kN/m2
+
+# Permanent load cases; the load case inputs choose one of them for each load
+LOAD_CASES = ("DL", "SIDL", "DW")
+LOAD_CASE_OF = dict(zip(VALUES_LOAD_CASE, LOAD_CASES))
+
+# Load combinations as (name, factor of each permanent load case, live load factor); combinations
+# with live load are split into Max and Min, loading the spans that increase or decrease each result
+COMBINATIONS = (
+    ("DL", {"DL": 1.0}, 0.0),
+    ("SIDL", {"SIDL": 1.0}, 0.0),
+    ("DW", {"DW": 1.0}, 0.0),
+    ("LL", {}, 1.0),
+    ("ULS", {"DL": 1.35, "SIDL": 1.35, "DW": 1.75}, 1.5),
+    ("SLS", {"DL": 1.0, "SIDL": 1.0, "DW": 1.0}, 1.0),
+)
+
+# Design checks of the steel girders: partial safety factor on yielding (IS 800 Table 5) and the
+# live load deflection limit as a fraction of the span (IRC 24)
+GAMMA_M0 = 1.10
+DEFLECTION_LIMIT = 1 / 800
+CHECK_BENDING = "IS 800 Cl. 8.2.1 Bending"
+CHECK_SHEAR = "IS 800 Cl. 8.4 Shear"
+CHECK_DEFLECTION = "IRC 24 Deflection (L/800)"
+DESIGN_CHECKS = (CHECK_BENDING, CHECK_SHEAR, CHECK_DEFLECTION)
+
+# Result components filled by the analysis
+SHEAR, TORSION, MOMENT, DEFLECTION = (COMPONENTS.index(name) for name in ("Fy", "Mx", "Mz", "Dy"))
+
+BandFactor = namedtuple("BandFactor", "inverse lower")
+BandFactor.__doc__ = """Block Cholesky factor L of a BlockBand.
+
+inverse -- (n, m, m) inverses of the diagonal blocks of L
+lower   -- (n - 1, m, m) blocks L[i + 1, i]
+"""
+
+Section = namedtuple("Section", "EI GJ weight")
+Section.__doc__ = """Girder stiffness (kNm2) and steel self weight (kN/m)"""
+
+Strip = namedtuple("Strip", "case start end intensity")
+Strip.__doc__ = """Area load (kN/m2) of a load case over the deck from y = start to end; a line load (kN/m) when start == end"""
+
+
+class BlockBand:
+    """Symmetric matrix of stations x stations blocks of size m, nonzero only on and next to the block diagonal.
+
+    diagonal -- (stations, m, m) blocks A[i, i]
+    lower    -- (stations - 1, m, m) blocks A[i + 1, i]; A[i, i + 1] is their transpose
+    Degree of freedom d of station i has the global index i * m + d.
+    """
+
+    __slots__ = ("diagonal", "lower")
+
+    def __init__(self, stations, size):
+        self.diagonal = np.zeros((stations, size, size))
+        self.lower = np.zeros((max(stations - 1, 0), size, size))
+
+    def add(self, dofs, matrices):
+        """Add element matrices (elements, k, k) at global degrees of freedom dofs (elements, k)"""
+        size = self.diagonal.shape[1]
+        rows = np.broadcast_to(dofs[:, :, np.newaxis], matrices.shape).ravel()
+        cols = np.broadcast_to(dofs[:, np.newaxis, :], matrices.shape).ravel()
+        values = matrices.ravel()
+        row_station, row_dof = np.divmod(rows, size)
+        col_station, col_dof = np.divmod(cols, size)
+        if np.any(np.abs(row_station - col_station) > 1):
+            raise ValueError("Element couples stations that are not adjacent")
+        for blocks, station, selected in (
+                (self.diagonal, row_station, row_station == col_station),
+                (self.lower, col_station, row_station == col_station + 1)):
+            index = (station[selected] * size + row_dof[selected]) * size + col_dof[selected]
+            blocks.reshape(-1)[:] += np.bincount(index, values[selected], minlength=blocks.size)
+
+    def constrain(self, fixed):
+        """Fix the degrees of freedom marked in fixed (stations, m) at zero"""
+        self.diagonal[fixed[:, :, np.newaxis] | fixed[:, np.newaxis, :]] = 0.0
+        station, dof = np.nonzero(fixed)
+        self.diagonal[station, dof, dof] = 1.0
+        self.lower[fixed[1:, :, np.newaxis] | fixed[:-1, np.newaxis, :]] = 0.0
+
+    def factor(self):
+        """Block Cholesky factor, one station at a time: O(stations * m^3)"""
+        inverse = np.empty_like(self.diagonal)
+        lower = np.empty_like(self.lower)
+        for i, block in enumerate(self.diagonal):
+            if i:
+                block = block - lower[i - 1] @ lower[i - 1].T
+            try:
+                inverse[i] = np.linalg.inv(np.linalg.cholesky(block))
+            except np.linalg.LinAlgError:
+                raise ValueError(f"Structure is unstable at station {i}") from None
+            if i < len(lower):
+                lower[i] = self.lower[i] @ inverse[i].T
+        return BandFactor(inverse, lower)
+
+
+def band_solve(factor, rhs):
+    """Solve A x = rhs with the BandFactor of A; rhs and x are (stations, m, columns)"""
+    inverse, lower = factor
+    y = np.empty_like(rhs)
+    for i in range(len(rhs)):
+        y[i] = inverse[i] @ (rhs[i] - lower[i - 1] @ y[i - 1] if i else rhs[i])
+    x = np.empty_like(rhs)
+    for i in reversed(range(len(rhs))):
+        x[i] = inverse[i].T @ (y[i] - lower[i].T @ x[i + 1] if i < len(lower) else y[i])
+    return x
+
+
+def grid_elements(length, EI, GJ):
+    """Stiffness matrices (elements, 6, 6) of grid members.
+
+    Degrees of freedom at each end are the deflection, the slope along the
+    member and its twist: (w1, s1, t1, w2, s2, t2).
+    """
+    length, EI, GJ = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in (length, EI, GJ)))
+    L = length.ravel()
+    bending = (EI.ravel() / L ** 3)[:, np.newaxis, np.newaxis] * np.stack((
+        np.stack((12.0 + 0 * L, 6 * L, -12.0 + 0 * L, 6 * L), axis=-1),
+        np.stack((6 * L, 4 * L ** 2, -6 * L, 2 * L ** 2), axis=-1),
+        np.stack((-12.0 + 0 * L, -6 * L, 12.0 + 0 * L, -6 * L), axis=-1),
+        np.stack((6 * L, 2 * L ** 2, -6 * L, 4 * L ** 2), axis=-1),
+    ), axis=1)
+    matrices = np.zeros((len(L), 6, 6))
+    bend = np.array((0, 1, 3, 4))
+    matrices[:, bend[:, np.newaxis], bend] = bending
+    torsion = GJ.ravel() / L
+    twist = np.array((2, 5))
+    matrices[:, twist[:, np.newaxis], twist] = torsion[:, np.newaxis, np.newaxis] * np.array(((1.0, -1.0), (-1.0, 1.0)))
+    return matrices
+
+
+def fixed_end_forces(length, load, torque=0.0):
+    """Nodal loads (..., 6) equivalent to uniform loads on grid members.
+
+    load   -- upward force per length along the member
+    torque -- twisting moment per length
+    """
+    length, load, torque = np.broadcast_arrays(length, load, torque)
+    return np.stack((load * length / 2, load * length ** 2 / 12, torque * length / 2,
+                     load * length / 2, -load * length ** 2 / 12, torque * length / 2), axis=-1)
+
+
+def girder_plates(inputs):
+    """Depth, bottom flange width and thickness, web thickness, top flange width and thickness (m)"""
+    mm = lambda key, default: (default if inputs.get(key) is None else inputs.get(key)) / 1000.0
+    return (mm(KEY_GIRDER_DEPTH, DEFAULT_GIRDER_DEPTH),
+            mm(KEY_GIRDER_BOTTOM_FLANGE_WIDTH, DEFAULT_FLANGE_WIDTH),
+            mm(KEY_GIRDER_BOTTOM_FLANGE_THICKNESS, DEFAULT_FLANGE_THICKNESS),
+            mm(KEY_GIRDER_WEB_THICKNESS, DEFAULT_WEB_THICKNESS),
+            mm(KEY_GIRDER_TOP_FLANGE_WIDTH, DEFAULT_FLANGE_WIDTH),
+            mm(KEY_GIRDER_TOP_FLANGE_THICKNESS, DEFAULT_FLANGE_THICKNESS))
+
+
+def steel_parts(depth, bottom_width, bottom, web, top_width, top):
+    """(area, centroid height, own second moment) of the bottom flange, web and top flange"""
+    return np.array((
+        (bottom_width * bottom, bottom / 2, bottom_width * bottom ** 3 / 12),
+        (web * (depth - bottom - top), (depth + bottom - top) / 2, web * (depth - bottom - top) ** 3 / 12),
+        (top_width * top, depth - top / 2, top_width * top ** 3 / 12),
+    ))
+
+
+def girder_section(inputs, spacing):
+    """Composite stiffness of one girder with its share of the deck slab"""
+    plates = girder_plates(inputs)
+    depth, bottom_width, bottom, web, top_width, top = plates
+    mm = lambda key, default: (default if inputs.get(key) is None else inputs.get(key)) / 1000.0
+    deck = mm(KEY_DECK_THICKNESS, DEFAULT_DECK_THICKNESS)
+    concrete = concrete_modulus(inputs)
+    ratio = STEEL_E / concrete
+    # (area, centroid height, own second moment) of each part, the slab transformed to steel
+    parts = np.vstack((steel_parts(*plates),
+                       (spacing * deck / ratio, depth + deck / 2, spacing * deck ** 3 / 12 / ratio)))
+    area, height, own = parts.T
+    centroid = (area * height).sum() / area.sum()
+    inertia = (own + area * (height - centroid) ** 2).sum()
+    # Open section torsion constants: steel plates plus the slab, shared with the cross members
+    J = (bottom_width * bottom ** 3 + top_width * top ** 3 + (depth - bottom - top) * web ** 3) / 3
+    slab_GJ = concrete / (2 * (1 + CONCRETE_POISSON)) * spacing * deck ** 3 / 6
+    weight = area[:3].sum() * DEFAULT_STEEL_DENSITY
+    return Section(STEEL_E * inertia, STEEL_G * J + slab_GJ, weight)
+
+
+def yield_strength(inputs):
+    """Yield stress of the girder steel, e.g. 250 MPa for grade "E250 (Fe 410W)A", in kN/m2"""
+    grade = inputs.get(KEY_GIRDER) or VALUES_MATERIAL[0]
+    return float(re.match(r"E\s*(\d+)", grade).group(1)) * 1000.0
+
+
+def concrete_modulus(inputs):
+    """Short-term modulus of the deck concrete, 5000 sqrt(fck) MPa, in kN/m2"""
+    grade = inputs.get(KEY_DECK_CONCRETE_GRADE) or VALUES_DECK_CONCRETE_GRADE[0]
+    return 5000.0 * float(grade.lstrip("M")) ** 0.5 * 1000.0
+
+
+def deck_strips(inputs, layout):
+    """Permanent and live loads across the deck as Strips; live load strips have case "LL" """
+    value = lambda key, default: default if inputs.get(key) is None else inputs.get(key)
+    case = lambda key, default: LOAD_CASE_OF.get(inputs.get(key), default)
+    edge = layout["width"] / 2
+    left, right, left_railing, right_railing, railing_width = edge_positions(inputs, layout)
+    barrier = value(KEY_CRASH_BARRIER_WIDTH, DEFAULT_CRASH_BARRIER_WIDTH)
+    footpath = inputs.get(KEY_FOOTPATH) or "None"
+
+    deck = value(KEY_DECK_THICKNESS, DEFAULT_DECK_THICKNESS) / 1000.0
+    strips = [Strip(case(KEY_DECK_LOAD_CASE, "DL"), -edge, edge, deck * DEFAULT_CONCRETE_DENSITY)]
+    wearing = value(KEY_WEARING_COAT_DENSITY, DEFAULT_WEARING_COAT_DENSITY) * value(
+        KEY_WEARING_COAT_THICKNESS, DEFAULT_WEARING_COAT_THICKNESS) / 1000.0
+    strips.append(Strip(case(KEY_WEARING_COAT_LOAD_CASE, "DW"), left + barrier, right - barrier, wearing))
+    strips.append(Strip("LL", left + barrier, right - barrier, LIVE_LOAD))
+    if barrier:
+        area = inputs.get(KEY_CRASH_BARRIER_AREA)
+        density = value(KEY_CRASH_BARRIER_DENSITY, DEFAULT_CONCRETE_DENSITY)
+        if not area:
+            area = barrier * (1 + CRASH_BARRIER_TOP_RATIO) / 2 * CRASH_BARRIER_HEIGHT
+        for y in (left + barrier / 2, right - barrier / 2):
+            strips.append(Strip(case(KEY_CRASH_BARRIER_LOAD_CASE, "SIDL"), y, y, area * density))
+    if footpath != "None":
+        thickness = value(KEY_FOOTPATH_THICKNESS, DEFAULT_FOOTPATH_THICKNESS) / 1000.0
+        footpaths = [(left_railing + railing_width, left)] if footpath in ("Single Sided", "Both") else []
+        if footpath == "Both":
+            footpaths.append((right, right_railing))
+        for start, end in footpaths:
+            strips.append(Strip(case(KEY_DECK_LOAD_CASE, "DL"), start, end, thickness * DEFAULT_CONCRETE_DENSITY))
+        railing = value(KEY_RAILING_LOAD, DEFAULT_RAILING_LOAD)
+        for y in (left_railing + railing_width / 2, right_railing + railing_width / 2):
+            strips.append(Strip(case(KEY_RAILING_LOAD_CASE, "SIDL"), y, y, railing))
+    return strips
+
+
+def transverse_shares(girder_y, y, moments):
+    """Share of unit downward loads at positions y carried by each girder line, (len(y), girders).
+
+    Loads between two girders are shared by the lever rule. Loads beyond
+    an edge girder go to it with their moment about it, returned as a
+    second array when moments is true; otherwise the lever rule extends
+    the cantilever onto the next girder.
+    """
+    y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+    count = len(girder_y)
+    forces = np.zeros((len(y), count))
+    torques = np.zeros((len(y), count))
+    if count == 1:
+        forces[:, 0] = 1.0
+        torques[:, 0] = y - girder_y[0]
+        return (forces, torques) if moments else forces
+    bay = np.clip(np.searchsorted(girder_y, y) - 1, 0, count - 2)
+    fraction = (y - girder_y[bay]) / (girder_y[bay + 1] - girder_y[bay])
+    rows = np.arange(len(y))
+    if moments:
+        outside = (fraction < 0) | (fraction > 1)
+        edge = np.where(fraction < 0, bay, bay + 1)
+        fraction = np.clip(fraction, 0.0, 1.0)
+        torques[rows[outside], edge[outside]] = y[outside] - girder_y[edge[outside]]
+    forces[rows, bay] = 1 - fraction
+    forces[rows, bay + 1] += fraction
+    return (forces, torques) if moments else forces
+
+
+def girder_line_loads(strips, girder_y, moments):
+    """Downward line loads (and torques) on each girder line per load case, as {case: (forces, torques)}"""
+    loads = {}
+    for strip in strips:
+        if strip.end > strip.start:
+            width = (strip.end - strip.start) / STRIP_POINTS
+            y = strip.start + width * (np.arange(STRIP_POINTS) + 0.5)
+            weight = np.full(STRIP_POINTS, strip.intensity * width)
+        else:
+            y, weight = np.array([strip.start]), np.array([strip.intensity])
+        shares = transverse_shares(girder_y, y, moments)
+        forces, torques = shares if moments else (shares, np.zeros_like(shares))
+        total = loads.setdefault(strip.case, (np.zeros(len(girder_y)), np.zeros(len(girder_y))))
+        total[0][:] += weight @ forces
+        total[1][:] += weight @ torques
+    return loads
+
+
+def load_columns(layout, section, strips, spans, moments):
+    """Line loads on every girder and element for each load column.
+
+    Returns (names, forces, torques): column names are the permanent load
+    cases followed by the live load on each span ("LL1", "LL2", ...);
+    forces and torques are (girders, elements, columns), upward positive.
+    """
+    girders = layout["girders"]
+    elements = spans * SEGMENTS_PER_SPAN
+    per_case = girder_line_loads(strips, layout["girder_y"], moments)
+    names = list(LOAD_CASES) + [f"LL{span + 1}" for span in range(spans)]
+    forces = np.zeros((girders, elements, len(names)))
+    torques = np.zeros_like(forces)
+    for column, case in enumerate(LOAD_CASES):
+        force, torque = per_case.get(case, (np.zeros(girders), np.zeros(girders)))
+        forces[:, :, column] = -(force + (section.weight if case == "DL" else 0.0))[:, np.newaxis]
+        torques[:, :, column] = -torque[:, np.newaxis]
+    live_force, live_torque = per_case.get("LL", (np.zeros(girders), np.zeros(girders)))
+    span_of = np.arange(elements) // SEGMENTS_PER_SPAN
+    for span in range(spans):
+        column = len(LOAD_CASES) + span
+        forces[:, span_of == span, column] = -live_force[:, np.newaxis]
+        torques[:, span_of == span, column] = -live_torque[:, np.newaxis]
+    return names, forces, torques
+
+
+def solve_girders(layout, section, strips, spans, grillage):
+    """Member actions of every girder element: (girders, elements, 6, columns) end forces and the
+    nodal deflections (girders, stations, columns), with the load column names"""
+    girders, girder_y = layout["girders"], layout["girder_y"]
+    span = layout["span"]
+    length = span / SEGMENTS_PER_SPAN
+    elements = spans * SEGMENTS_PER_SPAN
+    stations = elements + 1
+    names, forces, torques = load_columns(layout, section, strips, spans, grillage)
+    element_matrix = grid_elements(length, section.EI, section.GJ)[0]
+    supports = np.arange(0, stations, SEGMENTS_PER_SPAN)
+    fixed_end = fixed_end_forces(length, forces, torques)  # (girders, elements, columns, 6)
+
+    if grillage:
+        # Three degrees of freedom per node: deflection w, slopes dw/dx and dw/dy
+        size = 3 * girders
+        band = BlockBand(stations, size)
+        node = np.arange(stations)[:, np.newaxis] * size + 3 * np.arange(girders)  # (stations, girders)
+        start = node[:-1].T.reshape(-1, 1) + np.arange(3)  # Girders along x: slope dw/dx, twist dw/dy
+        end = node[1:].T.reshape(-1, 1) + np.arange(3)
+        girder_dofs = np.concatenate((start, end), axis=1).reshape(girders, elements, 6)
+        band.add(girder_dofs.reshape(-1, 6), np.broadcast_to(element_matrix, (girders * elements, 6, 6)))
+        if girders > 1:
+            # Slab strips across the deck at every station, half as wide at the ends
+            width = np.full(stations, length)
+            width[[0, -1]] /= 2
+            deck, concrete = layout["deck"], layout["concrete"]
+            gaps = np.diff(girder_y)
+            cross = grid_elements(gaps[np.newaxis, :], (concrete * width[:, np.newaxis] * deck ** 3 / 12),
+                                  concrete / (2 * (1 + CONCRETE_POISSON)) * width[:, np.newaxis] * deck ** 3 / 6)
+            across = np.array((0, 2, 1))  # Members along y: slope dw/dy, twist dw/dx
+            cross_dofs = np.concatenate((node[:, :-1, np.newaxis] + across, node[:, 1:, np.newaxis] + across),
+                                        axis=2).reshape(-1, 6)
+            band.add(cross_dofs, cross)
+        fixed = np.zeros((stations, size), dtype=bool)
+        fixed[supports, 0::3] = True
+        band.constrain(fixed)
+        rhs = np.zeros((stations * size, len(names)))
+        np.add.at(rhs, girder_dofs.reshape(-1), np.moveaxis(fixed_end, 3, 2).reshape(-1, len(names)))
+        rhs[fixed.reshape(-1)] = 0.0
+        displacement = band_solve(band.factor(), rhs.reshape(stations, size, -1)).reshape(-1, len(names))
+        element_displacement = displacement[girder_dofs]  # (girders, elements, 6, columns)
+    else:
+        # Every girder line is the same continuous beam: one factor, a load column per girder and case
+        band = BlockBand(stations, 2)
+        dofs = np.arange(elements)[:, np.newaxis] * 2 + np.array((0, 1, 2, 3))
+        bend = np.array((0, 1, 3, 4))
+        band.add(dofs, np.broadcast_to(element_matrix[bend[:, np.newaxis], bend], (elements, 4, 4)))
+        fixed = np.zeros((stations, 2), dtype=bool)
+        fixed[supports, 0] = True
+        band.constrain(fixed)
+        loads = np.moveaxis(fixed_end[..., bend], 3, 1)  # (girders, 4, elements, columns)
+        rhs = np.zeros((girders, stations * 2, len(names)))
+        for column in range(4):
+            rhs[:, dofs[:, column]] += loads[:, column]
+        rhs[:, fixed.reshape(-1)] = 0.0
+        columns = np.moveaxis(rhs, 0, 1).reshape(stations, 2, -1)
+        displacement = band_solve(band.factor(), columns).reshape(stations * 2, girders, len(names))
+        element_displacement = np.zeros((girders, elements, 6, len(names)))
+        element_displacement[:, :, bend] = np.moveaxis(displacement[dofs], 2, 0)
+    actions = np.einsum("ij,gejc->geic", element_matrix, element_displacement) - np.moveaxis(fixed_end, 3, 2)
+    deflections = np.concatenate((element_displacement[:, :, 0], element_displacement[:, -1:, 3]), axis=1)
+    return names, actions, deflections
+
+
+def analyse_girders(inputs, model=GRILLAGE):
+    """AnalysisResults of every girder in every span, members "G1-S1", "G1-S2", ..."""
+    if model not in ANALYSIS_MODELS:
+        raise ValueError(f"Unknown analysis model {model!r}; expected one of {', '.join(ANALYSIS_MODELS)}")
+    layout = model_layout(inputs)
+    layout["concrete"] = concrete_modulus(inputs)
+    spans = inputs.get(KEY_NO_OF_SPANS) or 1
+    girders = layout["girders"]
+    spacing = layout["girder_y"][1] - layout["girder_y"][0] if girders > 1 else layout["width"]
+    section = girder_section(inputs, spacing)
+    names, actions, deflections = solve_girders(layout, section, deck_strips(inputs, layout), spans,
+                                                model == GRILLAGE)
+
+    # Member actions at each station: the start of the element beginning there, the end of the last one
+    elements = actions.reshape(girders, spans, SEGMENTS_PER_SPAN, 6, -1)
+    at_stations = np.empty((girders, spans, SEGMENTS_PER_SPAN + 1, 3, len(names)))
+    at_stations[:, :, :-1, 0] = elements[:, :, :, 0]
+    at_stations[:, :, -1, 0] = -elements[:, :, -1, 3]
+    at_stations[:, :, :-1, 1] = -elements[:, :, :, 1]
+    at_stations[:, :, -1, 1] = elements[:, :, -1, 4]
+    at_stations[:, :, :-1, 2] = -elements[:, :, :, 2]
+    at_stations[:, :, -1, 2] = elements[:, :, -1, 5]
+    station_index = np.arange(spans)[:, np.newaxis] * SEGMENTS_PER_SPAN + np.arange(SEGMENTS_PER_SPAN + 1)
+    deflection = deflections[:, station_index] * 1000.0  # (girders, spans, stations, columns)
+
+    cases = np.zeros((girders, spans, SEGMENTS_PER_SPAN + 1, len(COMPONENTS), len(names)))
+    for component, values in ((SHEAR, at_stations[:, :, :, 0]), (MOMENT, at_stations[:, :, :, 1]),
+                              (TORSION, at_stations[:, :, :, 2]), (DEFLECTION, deflection)):
+        cases[:, :, :, component] = values
+    permanent, live = cases[..., :len(LOAD_CASES)], cases[..., len(LOAD_CASES):]
+    # Loading only the spans that raise (or lower) a result gives its live load extreme
+    live_max, live_min = np.clip(live, 0.0, None).sum(axis=-1), np.clip(live, None, 0.0).sum(axis=-1)
+    combinations, values = [], []
+    for name, factors, live_factor in COMBINATIONS:
+        dead = sum((factor * permanent[..., LOAD_CASES.index(case)] for case, factor in factors.items()),
+                   np.zeros(permanent.shape[:-1]))
+        if live_factor:
+            combinations += [f"{name} Max", f"{name} Min"]
+            values += [dead + live_factor * live_max, dead + live_factor * live_min]
+        else:
+            combinations.append(name)
+            values.append(dead)
+    values = np.stack(values, axis=3)  # (girders, spans, stations, combinations, components)
+    members = [f"G{girder + 1}-S{span + 1}" for girder in range(girders) for span in range(spans)]
+    return AnalysisResults(values.reshape(girders * spans, SEGMENTS_PER_SPAN + 1, len(combinations), -1),
+                           members, combinations, np.linspace(0.0, layout["span"], SEGMENTS_PER_SPAN + 1))
+
+
+def design_checks(inputs, results):
+    """DesignChecks of the steel girders for the AnalysisResults of analyse_girders.
+
+    Bending uses the elastic modulus of the steel section alone and shear
+    the full web, both for the ULS combinations; the deflection is checked
+    for the live load combinations. A check gives a ratio of 0 for the
+    combinations it does not apply to.
+    """
+    plates = girder_plates(inputs)
+    depth, web = plates[0], plates[3]
+    area, height, own = steel_parts(*plates).T
+    centroid = (area * height).sum() / area.sum()
+    inertia = (own + area * (height - centroid) ** 2).sum()
+    fy = yield_strength(inputs)
+    moment_capacity = fy * inertia / max(centroid, depth - centroid) / GAMMA_M0
+    shear_capacity = fy * depth * web / (3 ** 0.5 * GAMMA_M0)
+    span = (results.stations[-1] - results.stations[0]) * 1000.0  # mm, like the deflections
+
+    kind = np.array([name.split()[0] for name in results.combinations])
+    values = results.values
+    utilization = np.zeros(values.shape[:3] + (len(DESIGN_CHECKS),))
+    utilization[..., 0] = np.abs(values[..., MOMENT]) / moment_capacity * (kind == "ULS")
+    utilization[..., 1] = np.abs(values[..., SHEAR]) / shear_capacity * (kind == "ULS")
+    utilization[..., 2] = np.abs(values[..., DEFLECTION]) / (span * DEFLECTION_LIMIT) * (kind == "LL")
+    return DesignChecks(utilization, results.members, results.combinations, DESIGN_CHECKS, results.stations,
+                        [girder_of(member) for member in results.members])
@@ -1,4 +1,13 @@
 from .common import *
+from .model import BridgeInputs
+from .schema import INPUT_SCHEMA
+from .validation import VALIDATION_ENGINE, SEVERITY_ERROR
+from .model3d import ModelCache
+from .export import export_model
+from .snapshots import SnapshotRenderer, SNAPSHOT_VIEWS, SNAPSHOT_SIZE
+from .report import ReportWriter, design_report
+from .history import InputHistory
+from .analysis import analyse_girders, design_checks, GRILLAGE
 
 class BackendOsBridge:
     """Backend for Highway Bridge Design"""
@@ -7,61 +16,19 @@ class BackendOsBridge:
         self.module = KEY_DISP_FINPLATE
         self.design_status = False
         self.design_button_status = False
+        self.inputs = BridgeInputs()
+        self.validation = VALIDATION_ENGINE
+        self.model_3d = ModelCache()
+        self.snapshots = SnapshotRenderer()
+        self.report = ReportWriter()
+        self.history = InputHistory(self.inputs)
         
     def module_name(self):
         return KEY_DISP_FINPLATE
     
     def input_values(self):
-        """Return list of input fields for the UI"""
-        options_list = []
-
-        t1 = (KEY_MODULE, KEY_DISP_FINPLATE, TYPE_MODULE, None, True, 'No Validator')
-        options_list.append(t1)
-
-        # Type of Structure section
-        t2 = (None, DISP_TITLE_STRUCTURE, TYPE_TITLE, None, True, 'No Validator')
-        options_list.append(t2)
-
-        t3 = (KEY_STRUCTURE_TYPE, KEY_DISP_STRUCTURE_TYPE, TYPE_COMBOBOX, VALUES_STRUCTURE_TYPE, True, 'No Validator')
-        options_list.append(t3)
-
-        # Project Location section
-        t4 = (None, DISP_TITLE_PROJECT, TYPE_TITLE, None, True, 'No Validator')
-        options_list.append(t4)
-
-        t5 = (KEY_PROJECT_LOCATION, KEY_DISP_PROJECT_LOCATION, TYPE_COMBOBOX, VALUES_PROJECT_LOCATION, True, 'No Validator')
-        options_list.append(t5)
-
-        # Geometric Details section
-        t6 = (None, DISP_TITLE_GEOMETRIC, TYPE_TITLE, None, True, 'No Validator')
-        options_list.append(t6)
-
-        t7 = (KEY_SPAN, KEY_DISP_SPAN, TYPE_TEXTBOX, None, True, 'Double Validator')
-        options_list.append(t7)
-
-        t8 = (KEY_CARRIAGEWAY_WIDTH, KEY_DISP_CARRIAGEWAY_WIDTH, TYPE_TEXTBOX, None, True, 'Double Validator')
-        options_list.append(t8)
-
-        t9 = (KEY_FOOTPATH, KEY_DISP_FOOTPATH, TYPE_COMBOBOX, VALUES_FOOTPATH, True, 'No Validator')
-        options_list.append(t9)
-
-        t10 = (KEY_SKEW_ANGLE, KEY_DISP_SKEW_ANGLE, TYPE_TEXTBOX, None, True, 'Double Validator')
-        options_list.append(t10)
-
-        # Material Inputs section
-        t11 = (None, DISP_TITLE_MATERIAL, TYPE_TITLE, None, True, 'No Validator')
-        options_list.append(t11)
-
-        t12 = (KEY_GIRDER, KEY_DISP_GIRDER, TYPE_COMBOBOX, connectdb("Material"), True, 'No Validator')
-        options_list.append(t12)
-
-        t13 = (KEY_CROSS_BRACING, KEY_DISP_CROSS_BRACING, TYPE_COMBOBOX, connectdb("Material"), True, 'No Validator')
-        options_list.append(t13)
-
-        t14 = (KEY_DECK, KEY_DISP_DECK, TYPE_COMBOBOX, connectdb("Material"), True, 'No Validator')
-        options_list.append(t14)
-
-        return options_list
+        """Return the input fields for the UI, compiled once by the schema registry"""
+        return INPUT_SCHEMA.input_values
     
     def customized_input(self):
         """Return empty list for now"""
@@ -80,10 +47,41 @@ class BackendOsBridge:
         return []
     
     def func_for_validation(self, design_inputs):
-        """Mock validation - always passes for testing"""
-        return None
+        """Validate design inputs against the IRC rules; returns error messages or None"""
+        if not isinstance(design_inputs, BridgeInputs):
+            design_inputs = INPUT_SCHEMA.parse_record(design_inputs)
+        errors = [d.message for d in self.validation.evaluate(design_inputs) if d.severity == SEVERITY_ERROR]
+        return errors or None
+    
+    def validate_batch(self, records):
+        """Validate many raw input records at once, e.g. rows of a parametric study"""
+        return self.validation.evaluate_batch(records)
     
+    def analyse(self, model=GRILLAGE):
+        """AnalysisResults of the girders over every span, by grillage or continuous beam analysis"""
+        return analyse_girders(self.inputs, model)
+
+    def check_design(self, results):
+        """DesignChecks of the girders for AnalysisResults of the current inputs"""
+        return design_checks(self.inputs, results)
+
     def get_3d_components(self):
-        """Mock 3D components"""
-        return []
+        """Instanced meshes of the bridge for the current inputs, see model3d.Component"""
+        self.model_3d.update(self.inputs)
+        return self.model_3d.component_list()
+
+    def update_3d_components(self):
+        """Rebuild the components whose inputs changed; returns their model3d.ComponentDiffs"""
+        return self.model_3d.update(self.inputs)
+
+    def export_3d_model(self, path):
+        """Write the 3D model to path as STL, glTF (.glb) or IFC, chosen by its extension"""
+        export_model(self.get_3d_components(), path)
+
+    def model_snapshots(self, views=tuple(SNAPSHOT_VIEWS), size=SNAPSHOT_SIZE):
+        """PNG images of the 3D model for reports as {view: bytes}, cached by geometry"""
+        return self.snapshots.render(self.get_3d_components(), views, size)
 
+    def write_report(self, path, results=None, checks=None):
+        """Write the design report to path as HTML, LaTeX or PDF, chosen by its extension"""
+        self.report.write(design_report(self.inputs, self.model_snapshots(), results, checks), path)
@@ -0,0 +1,190 @@
+"""
+Bounding volume hierarchy over axis-aligned boxes, used to pick members of
+the 3D model. Boxes are split at the median of their centres along the
+widest axis until a leaf holds at most LEAF_SIZE of them, one tree level at
+a time over flat arrays. Ray and frustum queries only descend into the nodes
+they touch; boxes that move are refitted in place instead of rebuilding.
+"""
+import numpy as np
+
+
+LEAF_SIZE = 4
+
+# Refitting keeps the tree shape, which loosens it when boxes move far; the
+# tree is rebuilt once the total node surface area has grown by this factor
+REFIT_LIMIT = 2.0
+
+
+class BoundingVolumeHierarchy:
+    """Binary tree over boxes of shape (n, 2, 3) as (min, max).
+
+    Nodes are stored level by level from the root. Node i bounds the boxes
+    order[start[i]:start[i] + count[i]]; a leaf has left[i] == -1, other
+    nodes have the children left[i] and right[i].
+    """
+
+    __slots__ = ("boxes", "order", "low", "high", "left", "right", "start", "count", "depth", "area")
+
+    def __init__(self, boxes):
+        self.boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 2, 3)
+        self.build()
+
+    def __len__(self):
+        return len(self.boxes)
+
+    def build(self):
+        """Split all nodes of one depth at once: each range is sorted by its centres along
+        its widest axis and halved"""
+        centres = self.boxes.sum(axis=1) / 2
+        order = np.arange(len(self.boxes))
+        start, count = [np.zeros(1, dtype=np.intp)], [np.array([len(self.boxes)], dtype=np.intp)]
+        left, right = [], []
+        level, first_node = 0, 0
+        while True:
+            starts, counts = start[level], count[level]
+            split = np.flatnonzero(counts > LEAF_SIZE)
+            children = first_node + len(counts) + 2 * np.arange(len(split))
+            node_left = np.full(len(counts), -1, dtype=np.intp)
+            node_right = np.full(len(counts), -1, dtype=np.intp)
+            node_left[split], node_right[split] = children, children + 1
+            left.append(node_left)
+            right.append(node_right)
+            if not len(split):
+                break
+            first_node += len(counts)
+            starts, counts = starts[split], counts[split]
+            offsets = np.cumsum(counts) - counts
+            segment = np.repeat(np.arange(len(split)), counts)
+            positions = np.repeat(starts - offsets, counts) + np.arange(counts.sum())
+            points = centres[order[positions]]
+            low = np.minimum.reduceat(points, offsets)
+            extent = np.maximum.reduceat(points, offsets) - low
+            axis = np.argmax(extent, axis=1)
+            # Centres scaled into [0, 1) within each range and offset by the range number sort
+            # every range at once
+            split_axis = np.arange(len(split)), axis
+            key = (points[np.arange(len(points)), axis[segment]] - low[split_axis][segment]) \
+                / (extent[split_axis][segment] * (1 + 1e-9) + 1e-300)
+            ranked = np.argsort(segment + key)
+            order[positions] = order[positions[ranked]]
+            half = counts // 2
+            start.append(np.column_stack((starts, starts + half)).ravel())
+            count.append(np.column_stack((half, counts - half)).ravel())
+            level += 1
+        self.order = order
+        self.left, self.right = np.concatenate(left), np.concatenate(right)
+        self.start, self.count = np.concatenate(start), np.concatenate(count)
+        self.depth = np.repeat(np.arange(len(start)), [len(nodes) for nodes in start])
+        self.fit_nodes()
+        self.area = self.surface_area()
+
+    def fit_nodes(self):
+        """Node boxes from the boxes: leaves directly, then every level bottom up"""
+        nodes = len(self.start)
+        self.low, self.high = np.empty((nodes, 3)), np.empty((nodes, 3))
+        if not len(self.boxes):
+            self.low[:], self.high[:] = 0.0, 0.0
+            return
+        # Leaves partition order, so one reduceat over their sorted starts covers them all
+        leaves = np.flatnonzero(self.left < 0)
+        leaves = leaves[np.argsort(self.start[leaves])]
+        sorted_boxes = self.boxes[self.order]
+        self.low[leaves] = np.minimum.reduceat(sorted_boxes[:, 0], self.start[leaves])
+        self.high[leaves] = np.maximum.reduceat(sorted_boxes[:, 1], self.start[leaves])
+        inner = np.flatnonzero(self.left >= 0)
+        for level in range(self.depth.max() - 1, -1, -1):
+            nodes = inner[self.depth[inner] == level]
+            self.low[nodes] = np.minimum(self.low[self.left[nodes]], self.low[self.right[nodes]])
+            self.high[nodes] = np.maximum(self.high[self.left[nodes]], self.high[self.right[nodes]])
+
+    def surface_area(self):
+        size = self.high - self.low
+        return float((size[:, 0] * size[:, 1] + size[:, 1] * size[:, 2] + size[:, 2] * size[:, 0]).sum())
+
+    def refit(self, boxes):
+        """Move the boxes, same count and order, keeping the tree shape while it stays tight"""
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 2, 3)
+        if len(boxes) != len(self.boxes):
+            raise ValueError(f"Cannot refit {len(self.boxes)} boxes to {len(boxes)}")
+        self.boxes = boxes
+        self.fit_nodes()
+        if self.surface_area() > REFIT_LIMIT * max(self.area, 1e-12):
+            self.build()
+
+    def ray(self, origin, direction, t_max=np.inf):
+        """Boxes hit by the ray origin + t direction for 0 <= t <= t_max.
+
+        Returns their indices and the t at which the ray enters each,
+        nearest first.
+        """
+        if not len(self.boxes):
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        origin = np.asarray(origin, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            inverse = 1.0 / np.asarray(direction, dtype=np.float64)
+        hits, entries = [], []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            entry = _slab_entry(self.low[node], self.high[node], origin, inverse, t_max)
+            if entry is None:
+                continue
+            if self.left[node] >= 0:
+                stack += [self.right[node], self.left[node]]
+                continue
+            rows = self.order[self.start[node]:self.start[node] + self.count[node]]
+            enter = _slab_entries(self.boxes[rows], origin, inverse, t_max)
+            hit = np.isfinite(enter)
+            hits.append(rows[hit])
+            entries.append(enter[hit])
+        if not hits:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        hits, entries = np.concatenate(hits), np.concatenate(entries)
+        nearest = np.argsort(entries, kind="stable")
+        return hits[nearest], entries[nearest]
+
+    def frustum(self, planes, contained=False):
+        """Indices of the boxes inside the convex volume where every plane (a, b, c, d)
+        has a x + b y + c z + d >= 0; partly inside too unless contained is set"""
+        planes = np.asarray(planes, dtype=np.float64).reshape(-1, 4)
+        if not len(self.boxes):
+            return np.empty(0, dtype=np.intp)
+        normals, offsets = planes[:, :3], planes[:, 3]
+        positive = normals >= 0
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            low, high = self.low[node], self.high[node]
+            # Corner of the node box furthest along and furthest against each plane normal
+            if (np.einsum("ij,ij->i", normals, np.where(positive, high, low)) + offsets < 0).any():
+                continue
+            first, last = self.start[node], self.start[node] + self.count[node]
+            if (np.einsum("ij,ij->i", normals, np.where(positive, low, high)) + offsets >= 0).all():
+                found.append(self.order[first:last])
+            elif self.left[node] >= 0:
+                stack += [self.right[node], self.left[node]]
+            else:
+                rows = self.order[first:last]
+                low, high = self.boxes[rows, 0, None, :], self.boxes[rows, 1, None, :]
+                corners = np.where(positive, low, high) if contained else np.where(positive, high, low)
+                inside = (np.einsum("bpj,pj->bp", corners, normals) + offsets >= 0).all(axis=1)
+                found.append(rows[inside])
+        return np.concatenate(found) if found else np.empty(0, dtype=np.intp)
+
+
+def _slab_entries(boxes, origin, inverse, t_max):
+    """t at which a ray enters each of boxes (n, 2, 3), inf where it misses"""
+    with np.errstate(invalid="ignore"):
+        t0 = (boxes[:, 0] - origin) * inverse
+        t1 = (boxes[:, 1] - origin) * inverse
+    # 0 * inf from a ray in the plane of a face counts as inside the slab
+    t0, t1 = np.nan_to_num(t0, nan=-np.inf), np.nan_to_num(t1, nan=np.inf)
+    near = np.maximum(np.minimum(t0, t1).max(axis=1), 0.0)
+    far = np.minimum(np.maximum(t0, t1).min(axis=1), t_max)
+    return np.where(near <= far, near, np.inf)
+
+
+def _slab_entry(low, high, origin, inverse, t_max):
+    entry = _slab_entries(np.stack((low, high))[None], origin, inverse, t_max)[0]
+    return None if entry == np.inf else entry
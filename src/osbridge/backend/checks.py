@@ -0,0 +1,176 @@
+"""
+Design check results of Highway Bridge Design held as NumPy arrays.
+Utilization ratios live in one float array indexed
+[member, station, combination, check]; the controlling check of every
+member and station is found with one argmax over the last two axes, and
+re-analysed members only recompute their own rows. Top-K queries use
+those controlling ratios to narrow the search before partial selection.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+
+# Utilization ratios at the stops of the heat map: green, yellow, red
+HEAT_MAP_STOPS = (0.0, 0.8, 1.0)
+HEAT_MAP_COLORS = ((0x5c, 0xb8, 0x5c), (0xf0, 0xad, 0x4e), (0xd9, 0x53, 0x4f))
+
+# One entry of a top-K query
+CheckResult = namedtuple("CheckResult", "member girder station combination check utilization")
+
+
+class DesignChecks:
+    """Utilization ratios of every design check for every member and station.
+
+    utilization  -- array of shape (members, stations, combinations, checks)
+    members      -- member names, e.g. "G1-S1"
+    combinations -- load combination names
+    checks       -- check IDs, e.g. IRC clause numbers
+    stations     -- station positions along each member (m); 0, 1, ... by default
+    girders      -- girder name of each member; the member names by default
+    """
+
+    def __init__(self, utilization, members, combinations, checks, stations=None, girders=None):
+        utilization = np.asarray(utilization, dtype=np.float64)
+        if utilization.ndim != 4:
+            raise ValueError(f"Utilization must be indexed [member, station, combination, check], "
+                             f"got {utilization.ndim} axes")
+        self.utilization = utilization
+        self.members = tuple(str(member) for member in members)
+        self.combinations = tuple(str(combination) for combination in combinations)
+        self.checks = tuple(str(check) for check in checks)
+        if stations is None:
+            stations = np.arange(utilization.shape[1], dtype=np.float64)
+        self.stations = np.asarray(stations, dtype=np.float64)
+        self.girders = self.members if girders is None else tuple(str(girder) for girder in girders)
+        expected = (len(self.members), len(self.stations), len(self.combinations), len(self.checks))
+        if utilization.shape != expected:
+            raise ValueError(f"Utilization shape {utilization.shape} does not match labels {expected}")
+        if len(self.girders) != len(self.members):
+            raise ValueError(f"{len(self.girders)} girders given for {len(self.members)} members")
+        self._controlling = None
+
+    @property
+    def shape(self):
+        return self.utilization.shape
+
+    def member_index(self, name):
+        return self.members.index(name)
+
+    def check_index(self, name):
+        return self.checks.index(name)
+
+    def controlling(self):
+        """Governing check of each member and station.
+
+        Returns (ratio, check, combination) arrays of shape (members, stations):
+        the highest utilization over all combinations and checks, the index
+        into self.checks of the check giving it and the index of its load
+        combination. Computed on first call and kept up to date by update().
+        """
+        if self._controlling is None:
+            self._controlling = self._reduce(self.utilization)
+        return self._controlling
+
+    def _reduce(self, utilization):
+        members, stations, combinations, checks = utilization.shape
+        flat = utilization.reshape(members, stations, combinations * checks)
+        index = flat.argmax(axis=2)
+        ratio = np.take_along_axis(flat, index[..., np.newaxis], axis=2)[..., 0]
+        combination, check = np.divmod(index, checks)
+        return ratio, check, combination
+
+    def controlling_checks(self):
+        """Check ID of each member and station as an object array"""
+        return np.asarray(self.checks, dtype=object)[self.controlling()[1]]
+
+    def member_rows(self, member=None, girder=None):
+        """Indices of the members matching a member name and/or girder name, None for all"""
+        if member is None and girder is None:
+            return None
+        selected = np.ones(len(self.members), dtype=bool)
+        if member is not None:
+            selected &= np.asarray(self.members) == member
+        if girder is not None:
+            selected &= np.asarray(self.girders) == girder
+        return np.flatnonzero(selected)
+
+    def top_k(self, k, member=None, girder=None, check=None):
+        """The k most critical checks, highest utilization first, as CheckResult tuples.
+
+        member, girder and check restrict the query to one member, the
+        members of one girder and one check ID. The k-th highest controlling
+        ratio bounds the answer from below, so only the stations reaching it
+        are searched; np.argpartition then picks the k entries without
+        sorting the rest.
+        """
+        rows = self.member_rows(member, girder)
+        if check is None:
+            column = None
+            values = self.utilization
+            ratio = self.controlling()[0]
+        else:
+            column = self.check_index(check)
+            values = self.utilization[..., column:column + 1]
+            ratio = values[..., 0].max(axis=2)
+        if rows is not None:
+            ratio = ratio[rows]
+        ratio = ratio.reshape(-1)
+        if k <= 0 or not len(ratio):
+            return []
+
+        # Stations whose controlling ratio reaches the k-th highest one
+        if k < len(ratio):
+            threshold = np.partition(ratio, -k)[-k]
+            elements = np.flatnonzero(ratio >= threshold)
+        else:
+            elements = np.arange(len(ratio))
+        members, stations = np.divmod(elements, len(self.stations))
+        if rows is not None:
+            members = rows[members]
+        candidates = values[members, stations].reshape(-1)
+
+        if k < len(candidates):
+            top = np.argpartition(candidates, -k)[-k:]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(-candidates[top], kind="stable")]
+        element, rest = np.divmod(top, values.shape[2] * values.shape[3])
+        combinations, checks = np.divmod(rest, values.shape[3])
+        if column is not None:
+            checks[:] = column
+        return [CheckResult(self.members[m], self.girders[m], float(self.stations[s]),
+                            self.combinations[c], self.checks[i], float(u))
+                for m, s, c, i, u in zip(members[element].tolist(), stations[element].tolist(),
+                                         combinations.tolist(), checks.tolist(), candidates[top].tolist())]
+
+    def update(self, members, utilization):
+        """Replace the ratios of re-analysed members and recompute only their controlling checks.
+
+        members     -- names or indices of the re-analysed members
+        utilization -- their new ratios, shape (len(members), stations, combinations, checks)
+        """
+        rows = np.array([m if isinstance(m, (int, np.integer)) else self.member_index(m) for m in members],
+                        dtype=np.intp)
+        utilization = np.asarray(utilization, dtype=np.float64)
+        if utilization.shape != (len(rows),) + self.utilization.shape[1:]:
+            raise ValueError(f"Utilization shape {utilization.shape} does not match "
+                             f"{(len(rows),) + self.utilization.shape[1:]}")
+        self.utilization[rows] = utilization
+        if self._controlling is not None:
+            for controlling, new in zip(self._controlling, self._reduce(utilization)):
+                controlling[rows] = new
+
+
+def utilization_colors(ratio):
+    """RGBA heat map colours (uint8, shape ratio.shape + (4,)) for utilization ratios.
+
+    Ratios are interpolated between the HEAT_MAP_STOPS colours; ratios
+    above 1 (failing checks) stay red.
+    """
+    ratio = np.asarray(ratio, dtype=np.float64)
+    colors = np.empty(ratio.shape + (4,), dtype=np.uint8)
+    for channel in range(3):
+        colors[..., channel] = np.interp(ratio, HEAT_MAP_STOPS, [c[channel] for c in HEAT_MAP_COLORS])
+    colors[..., 3] = 255
+    return colors
@@ -397,6 +397,54 @@ VALUES_LOAD_CASE = ["Dead Load (DL)", "Super-imposed Dead Load (SIDL)", "Dead Lo
 VALUES_DECKING_PLATE = ["None", "Type A", "Type B"]
 VALUES_NO_OF_LANES = ["1", "2", "3", "4", "5", "6"]
 
+# Additional Inputs keys without a basic-input counterpart
+KEY_DECKING_PLATE = "Decking Plate"
+KEY_DECK_LOAD_CASE = "Deck Load Case"
+KEY_CRASH_BARRIER_LOAD_CASE = "Crash Barrier Load Case"
+KEY_RAILING_LOAD_CASE = "Railing Load Case"
+KEY_WEARING_COAT_LOAD_CASE = "Wearing Coat Load Case"
+KEY_NO_OF_LANES = "No. of Lanes"
+KEY_LANE_WIDTH = "Lane Width"
+KEY_NO_OF_SPANS = "No. of Spans"
+NO_OF_SPANS_MAX = 20
+
+# Carriageway width assumed until the user enters one
+DEFAULT_CARRIAGEWAY_WIDTH = 7.5  # meters
+
+# Plate girder section assumed until the user enters one
+DEFAULT_GIRDER_DEPTH = 1500.0  # mm
+DEFAULT_FLANGE_WIDTH = 500.0  # mm
+DEFAULT_FLANGE_THICKNESS = 32.0  # mm
+DEFAULT_WEB_THICKNESS = 16.0  # mm
+
+# Member Properties selections shown in the Additional Inputs dialog
+VALUES_THICKNESS_MODE = ["Optimized", "All"]
+VALUES_CROSS_BRACING_SECTION = [
+    "Select Section",
+    "ISA 50x50x6", "ISA 65x65x6", "ISA 75x75x6", "ISA 90x90x8",
+    "ISA 100x100x8", "ISA 110x110x10", "ISA 130x130x10",
+    "2-ISA 50x50x6 (LL)", "2-ISA 65x65x6 (LL)", "2-ISA 75x75x6 (LL)",
+    "2-ISA 50x50x6 (SL)", "2-ISA 65x65x6 (SL)", "2-ISA 75x75x6 (SL)",
+    "ISMC 75", "ISMC 100", "ISMC 125", "ISMC 150",
+    "2-ISMC 75", "2-ISMC 100", "2-ISMC 125"
+]
+VALUES_BRACKET_SECTION = [
+    "Select Section",
+    "ISA 50x50x6", "ISA 65x65x6", "ISA 75x75x6", "ISA 90x90x8",
+    "ISA 100x100x8", "ISA 110x110x10",
+    "2-ISA 50x50x6 (LL)", "2-ISA 65x65x6 (LL)", "2-ISA 75x75x6 (LL)",
+    "2-ISA 50x50x6 (SL)", "2-ISA 65x65x6 (SL)", "2-ISA 75x75x6 (SL)",
+    "ISMC 75", "ISMC 100", "ISMC 125",
+    "2-ISMC 75", "2-ISMC 100"
+]
+VALUES_END_DIAPHRAGM_SECTION = [
+    "Select Section",
+    "ISMB 100", "ISMB 125", "ISMB 150", "ISMB 175", "ISMB 200",
+    "ISMB 225", "ISMB 250", "ISMB 300", "ISMB 350", "ISMB 400",
+    "ISWB 150", "ISWB 175", "ISWB 200", "ISWB 225", "ISWB 250",
+    "ISWB 300", "ISWB 350", "ISWB 400"
+]
+
 
 def connectdb(table_name, popup=None):
     """Mock database connection - returns sample data"""
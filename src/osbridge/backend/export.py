@@ -0,0 +1,330 @@
+"""
+Streaming export of the 3D bridge model to binary STL, binary glTF (.glb)
+and a light IFC4 subset. Geometry is written a chunk of instances at a
+time, so memory is bounded by CHUNK_TRIANGLES however large the bridge.
+Where the format has instancing (glTF nodes, IFC mapped items) a
+prototype mesh is written once with a transform per instance; instances
+the format cannot place that way, such as skewed ones, are written out as
+triangles.
+"""
+import datetime
+import json
+import os
+import struct
+import uuid
+
+import numpy as np
+
+from .model3d import transform_points
+
+
+# Triangles held in memory at a time while writing
+CHUNK_TRIANGLES = 1 << 16
+
+# glTF is y-up; the model is z-up
+Z_UP_TO_Y_UP = [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+GLTF_FLOAT = 5126
+GLTF_UNSIGNED_INT = 5125
+GLTF_ARRAY_BUFFER = 34962
+GLTF_ELEMENT_ARRAY_BUFFER = 34963
+GLTF_TRIANGLES = 4
+
+# IFC entity of the instances of each component
+IFC_ENTITIES = {
+    "Girders": "IFCBEAM",
+    "Stiffeners": "IFCPLATE",
+    "Cross Bracing": "IFCMEMBER",
+    "Deck": "IFCSLAB",
+    "Railing Posts": "IFCRAILING",
+    "Railings": "IFCRAILING",
+}
+IFC_DEFAULT_ENTITY = "IFCBUILDINGELEMENTPROXY"
+IFC_GUID_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_$"
+
+
+def instance_chunks(component, chunk_triangles=CHUNK_TRIANGLES):
+    """Index arrays of consecutive instances holding about chunk_triangles triangles each"""
+    step = max(chunk_triangles // max(len(component.mesh.faces), 1), 1)
+    for first in range(0, len(component), step):
+        yield np.arange(first, min(first + step, len(component)))
+
+
+def world_mesh(component, rows):
+    """Model-space vertices (n, 3) and faces of the instances in rows, as one mesh"""
+    mesh = component.mesh
+    vertices = transform_points(component.transforms[rows], mesh.vertices).reshape(-1, 3)
+    offsets = np.arange(len(rows))[:, None, None] * len(mesh.vertices)
+    return vertices, (mesh.faces[None] + offsets).reshape(-1, 3)
+
+
+def decomposable(transforms, tolerance=1e-9):
+    """Which transforms are a rotation, positive scales along the local axes and a translation.
+
+    Only these can be written as glTF node matrices or IFC transformation
+    operators; shear, e.g. from a skewed deck, and mirroring cannot.
+    """
+    linear = transforms[:, :3, :3]
+    gram = linear.transpose(0, 2, 1) @ linear
+    squares = np.diagonal(gram, axis1=1, axis2=2)
+    shear = np.abs(gram - squares[:, :, None] * np.eye(3)).max(axis=(1, 2))
+    return ((shear <= tolerance * squares.max(axis=1)) & (np.linalg.det(linear) > 0)
+            & (transforms[:, 3] == (0.0, 0.0, 0.0, 1.0)).all(axis=1))
+
+
+def export_stl(components, path):
+    """Write every triangle to a binary STL file; STL has no instancing"""
+    components = list(components)
+    record = np.dtype([("normal", "<f4", 3), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")])
+    count = sum(len(component) * len(component.mesh.faces) for component in components)
+    with open(path, "wb") as stream:
+        stream.write(b"osbridge 3D model, m".ljust(80, b" "))
+        stream.write(struct.pack("<I", count))
+        for component in components:
+            for rows in instance_chunks(component):
+                vertices, faces = world_mesh(component, rows)
+                triangles = vertices[faces]
+                normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+                normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+                records = np.zeros(len(triangles), dtype=record)
+                records["normal"] = normals
+                records["vertices"] = triangles
+                stream.write(records)
+
+
+class _GltfLayout:
+    """Meshes, accessors, buffer views and nodes of a glb file, planned before writing.
+
+    blocks lists what goes into the binary chunk in order, as (component,
+    rows) with rows None for a prototype mesh.
+    """
+
+    def __init__(self, components):
+        self.meshes, self.accessors, self.views, self.blocks = [], [], [], []
+        self.length = 0
+        self.nodes = []  # Per component: (component, instanced rows, prototype mesh, baked meshes)
+        for component in components:
+            placeable = decomposable(component.transforms)
+            instanced = np.flatnonzero(placeable)
+            mesh = None
+            if len(instanced):
+                vertices = component.mesh.vertices.astype(np.float32)
+                mesh = self.add_mesh(component.name, vertices, len(component.mesh.faces))
+                self.blocks.append((component, None))
+            baked = []
+            rest = np.flatnonzero(~placeable)
+            for chunk in instance_chunks(component):
+                rows = np.intersect1d(chunk, rest)
+                if len(rows):
+                    vertices = world_mesh(component, rows)[0].astype(np.float32)
+                    baked.append(self.add_mesh(f"{component.name} {len(baked) + 1}", vertices,
+                                               len(rows) * len(component.mesh.faces)))
+                    self.blocks.append((component, rows))
+            self.nodes.append((component, instanced, mesh, baked))
+
+    def add_mesh(self, name, vertices, faces):
+        position = self.add_accessor(len(vertices), "VEC3", GLTF_FLOAT, 12, GLTF_ARRAY_BUFFER,
+                                     vertices.min(axis=0).tolist(), vertices.max(axis=0).tolist())
+        indices = self.add_accessor(3 * faces, "SCALAR", GLTF_UNSIGNED_INT, 4, GLTF_ELEMENT_ARRAY_BUFFER)
+        self.meshes.append({"name": name, "primitives": [
+            {"attributes": {"POSITION": position}, "indices": indices, "mode": GLTF_TRIANGLES}]})
+        return len(self.meshes) - 1
+
+    def add_accessor(self, count, kind, component_type, size, target, low=None, high=None):
+        self.views.append({"buffer": 0, "byteOffset": self.length, "byteLength": count * size, "target": target})
+        accessor = {"bufferView": len(self.views) - 1, "componentType": component_type, "count": count,
+                    "type": kind}
+        if low is not None:
+            accessor.update(min=low, max=high)
+        self.accessors.append(accessor)
+        self.length += count * size
+        return len(self.accessors) - 1
+
+    def json_chunks(self):
+        """The glTF JSON as a stream of text pieces, node by node"""
+        yield '{"asset":{"version":"2.0","generator":"osbridge"},"scene":0,'
+        yield '"scenes":[{"nodes":%s}],"nodes":[' % json.dumps(list(range(len(self.nodes))))
+        child = len(self.nodes)
+        for index, (component, instanced, mesh, baked) in enumerate(self.nodes):
+            children = len(instanced) + len(baked)
+            yield "," if index else ""
+            yield '{"name":%s,"matrix":%s' % (json.dumps(component.name), json.dumps(Z_UP_TO_Y_UP))
+            if not children:
+                yield "}"
+                continue
+            yield ',"children":['
+            for first in range(child, child + children, CHUNK_TRIANGLES):
+                yield ("," if first > child else "") + ",".join(map(str, range(first, min(first + CHUNK_TRIANGLES,
+                                                                                         child + children))))
+            yield "]}"
+            child += children
+        # Instance nodes follow the component nodes in the same list
+        first_node = not self.nodes
+        for component, instanced, mesh, baked in self.nodes:
+            step = max(CHUNK_TRIANGLES // max(len(component.mesh.faces), 1), 1)
+            for start in range(0, len(instanced), step):
+                rows = instanced[start:start + step]
+                matrices = component.transforms[rows].transpose(0, 2, 1).reshape(len(rows), 16).tolist()
+                nodes = ('{"name":%s,"mesh":%d,"matrix":%s}' % (json.dumps(component.ids[row]), mesh,
+                                                               json.dumps(matrix))
+                         for row, matrix in zip(rows.tolist(), matrices))
+                yield ("" if first_node else ",") + ",".join(nodes)
+                first_node = False
+            for mesh_index in baked:
+                yield ("" if first_node else ",") + '{"name":%s,"mesh":%d}' % (
+                    json.dumps(self.meshes[mesh_index]["name"]), mesh_index)
+                first_node = False
+        yield '],"meshes":%s,"accessors":%s,"bufferViews":%s,"buffers":[{"byteLength":%d}]}' % (
+            json.dumps(self.meshes), json.dumps(self.accessors), json.dumps(self.views), self.length)
+
+    def binary_chunks(self):
+        for component, rows in self.blocks:
+            if rows is None:
+                vertices, faces = component.mesh.vertices, component.mesh.faces
+            else:
+                vertices, faces = world_mesh(component, rows)
+            yield vertices.astype("<f4")
+            yield faces.astype("<u4")
+
+
+def export_gltf(components, path):
+    """Write a binary glTF (.glb) file.
+
+    Every component is a node holding one child node per instance, named by
+    its instance ID, which refers to the shared prototype mesh with the
+    instance transform as its matrix. Instances glTF cannot place by a
+    matrix are merged into meshes of their own, chunk by chunk. The model
+    is turned from z-up to glTF's y-up at the component nodes.
+    """
+    layout = _GltfLayout(list(components))
+    with open(path, "wb") as stream:
+        # The file and JSON chunk lengths are filled in once the JSON is written
+        stream.write(bytes(20))
+        for piece in layout.json_chunks():
+            stream.write(piece.encode("utf-8"))
+        json_length = stream.tell() - 20
+        stream.write(b" " * (-json_length % 4))
+        json_length += -json_length % 4
+        stream.write(struct.pack("<I4s", layout.length, b"BIN\0"))
+        for piece in layout.binary_chunks():
+            stream.write(piece)
+        total = stream.tell()
+        stream.seek(0)
+        stream.write(struct.pack("<4sII", b"glTF", 2, total) + struct.pack("<I4s", json_length, b"JSON"))
+
+
+def ifc_guid(name):
+    """22 character IFC GlobalId derived from name, so exports of one model are repeatable"""
+    number = uuid.uuid5(uuid.NAMESPACE_URL, "osbridge:" + name).int
+    chars = []
+    for _ in range(22):
+        number, digit = divmod(number, 64)
+        chars.append(IFC_GUID_CHARS[digit])
+    return "".join(reversed(chars))
+
+
+def _real(value):
+    """STEP real literal, which needs a decimal point"""
+    text = repr(float(value))
+    mantissa, _, exponent = text.partition("e")
+    if "." not in mantissa:
+        mantissa += "."
+    return mantissa + ("E" + exponent if exponent else "")
+
+
+def _reals(values):
+    return "(" + ",".join(map(_real, values)) + ")"
+
+
+class _StepWriter:
+    """Numbers the entities of a STEP file and writes each as soon as it is added"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.count = 0
+
+    def add(self, entity):
+        self.count += 1
+        self.stream.write(f"#{self.count}={entity};\n")
+        return f"#{self.count}"
+
+
+def _ifc_face_set(step, context, vertices, faces):
+    """Tessellated body representation of a mesh"""
+    points = step.add("IFCCARTESIANPOINTLIST3D((" + ",".join(map(_reals, vertices.tolist())) + "))")
+    indices = ",".join("(%d,%d,%d)" % tuple(face) for face in (faces + 1).tolist())
+    face_set = step.add(f"IFCTRIANGULATEDFACESET({points},$,$,({indices}),$)")
+    return step.add(f"IFCSHAPEREPRESENTATION({context},'Body','Tessellation',({face_set}))")
+
+
+def _ifc_text(text):
+    return "'" + str(text).replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+def export_ifc(components, path, project="Bridge"):
+    """Write an IFC4 file with one building element per instance, contained in a site.
+
+    Prototype meshes are triangulated face sets in representation maps,
+    placed per instance by mapped items; instances that need shear get
+    their own face sets. Elements are IfcBeam, IfcPlate and so on by
+    component (IFC_ENTITIES), named by their instance IDs.
+    """
+    stamp = datetime.datetime.now().replace(microsecond=0).isoformat()
+    with open(path, "w", encoding="ascii", errors="replace", newline="\n") as stream:
+        stream.write("ISO-10303-21;\nHEADER;\n"
+                     "FILE_DESCRIPTION(('ViewDefinition [ReferenceView]'),'2;1');\n"
+                     f"FILE_NAME({_ifc_text(os.path.basename(path))},'{stamp}',(''),(''),'osbridge','osbridge','');\n"
+                     "FILE_SCHEMA(('IFC4'));\nENDSEC;\nDATA;\n")
+        step = _StepWriter(stream)
+        origin = step.add("IFCCARTESIANPOINT((0.,0.,0.))")
+        axes = step.add(f"IFCAXIS2PLACEMENT3D({origin},$,$)")
+        context = step.add(f"IFCGEOMETRICREPRESENTATIONCONTEXT($,'Model',3,1.E-05,{axes},$)")
+        units = step.add(f"IFCUNITASSIGNMENT(({step.add('IFCSIUNIT(*,.LENGTHUNIT.,$,.METRE.)')}))")
+        project_id = step.add(f"IFCPROJECT('{ifc_guid(project)}',$,{_ifc_text(project)},$,$,$,$,({context}),{units})")
+        site_placement = step.add(f"IFCLOCALPLACEMENT($,{axes})")
+        site = step.add(f"IFCSITE('{ifc_guid(project + ' site')}',$,'Site',$,$,{site_placement},$,$,.ELEMENT.,"
+                        "$,$,$,$,$)")
+        step.add(f"IFCRELAGGREGATES('{ifc_guid(project + ' aggregates')}',$,$,$,{project_id},({site}))")
+        placement = step.add(f"IFCLOCALPLACEMENT({site_placement},{axes})")
+
+        for component in components:
+            entity = IFC_ENTITIES.get(component.name, IFC_DEFAULT_ENTITY)
+            instanced = decomposable(component.transforms)
+            representation_map = None
+            if instanced.any():
+                shape = _ifc_face_set(step, context, component.mesh.vertices, component.mesh.faces)
+                representation_map = step.add(f"IFCREPRESENTATIONMAP({axes},{shape})")
+            for chunk in instance_chunks(component):
+                elements = []
+                for row in chunk.tolist():
+                    transform = component.transforms[row]
+                    if instanced[row]:
+                        scales = np.linalg.norm(transform[:3, :3], axis=0)
+                        directions = [step.add(f"IFCDIRECTION({_reals(axis)})")
+                                      for axis in (transform[:3, :3] / scales).T.tolist()]
+                        location = step.add(f"IFCCARTESIANPOINT({_reals(transform[:3, 3].tolist())})")
+                        operator = step.add(
+                            f"IFCCARTESIANTRANSFORMATIONOPERATOR3DNONUNIFORM({directions[0]},{directions[1]},"
+                            f"{location},{_real(scales[0])},{directions[2]},{_real(scales[1])},{_real(scales[2])})")
+                        item = step.add(f"IFCMAPPEDITEM({representation_map},{operator})")
+                        shape = step.add(f"IFCSHAPEREPRESENTATION({context},'Body','MappedRepresentation',({item}))")
+                    else:
+                        shape = _ifc_face_set(step, context, *world_mesh(component, [row]))
+                    definition = step.add(f"IFCPRODUCTDEFINITIONSHAPE($,$,({shape}))")
+                    name = _ifc_text(component.ids[row])
+                    elements.append(step.add(f"{entity}('{ifc_guid(component.name + ':' + component.ids[row])}',"
+                                             f"$,{name},$,$,{placement},{definition},{name},$)"))
+                step.add(f"IFCRELCONTAINEDINSPATIALSTRUCTURE('{ifc_guid(f'{component.name} {chunk[0]}')}',"
+                         f"$,$,$,({','.join(elements)}),{site})")
+        stream.write("ENDSEC;\nEND-ISO-10303-21;\n")
+
+
+EXPORTERS = {".stl": export_stl, ".glb": export_gltf, ".ifc": export_ifc}
+
+
+def export_model(components, path):
+    """Write components to path in the format given by its extension (EXPORTERS)"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in EXPORTERS:
+        raise ValueError(f"Cannot export the 3D model to {extension or 'a file without extension'}; "
+                         f"use one of {', '.join(EXPORTERS)}")
+    EXPORTERS[extension](components, path)
@@ -0,0 +1,87 @@
+"""
+Derived bridge geometry computed from the input model.
+Pure functions over any mapping of KEY_* values, usable without Qt.
+"""
+import numpy as np
+
+from .common import *
+
+
+# Footpaths counted across the deck for each footpath option
+FOOTPATH_COUNT = {"None": 0, "Single Sided": 1, "Both": 2}
+
+
+def overall_bridge_width(inputs):
+    """Overall Bridge Width = Carriageway + Footpath + Crash Barrier/Railing"""
+    footpath = inputs.get(KEY_FOOTPATH) or "None"
+    overall_width = inputs.get(KEY_CARRIAGEWAY_WIDTH) or DEFAULT_CARRIAGEWAY_WIDTH
+
+    # Add footpath width
+    if footpath != "None":
+        footpath_width = inputs.get(KEY_FOOTPATH_WIDTH) or 0
+        overall_width += footpath_width * FOOTPATH_COUNT.get(footpath, 0)
+
+    # Add crash barrier width, assuming crash barriers on both edges
+    crash_barrier_width = inputs.get(KEY_CRASH_BARRIER_WIDTH)
+    if crash_barrier_width is None:
+        crash_barrier_width = DEFAULT_CRASH_BARRIER_WIDTH
+    overall_width += crash_barrier_width * 2
+
+    # Add railing width, railings on both sides if footpath exists
+    if footpath != "None":
+        railing_width = inputs.get(KEY_RAILING_WIDTH)
+        if railing_width is None:
+            railing_width = DEFAULT_RAILING_WIDTH
+        overall_width += railing_width * 2
+
+    return overall_width
+
+
+def girder_count(inputs, overall_width=None):
+    """No. of Girders = (Overall Width - 2*Overhang) / Spacing + 1, None if not feasible"""
+    if overall_width is None:
+        overall_width = overall_bridge_width(inputs)
+    spacing = inputs.get(KEY_GIRDER_SPACING)
+    if spacing is None:
+        spacing = DEFAULT_GIRDER_SPACING
+    overhang = inputs.get(KEY_DECK_OVERHANG)
+    if overhang is None:
+        overhang = DEFAULT_DECK_OVERHANG
+
+    # Spacing and overhang should be less than overall bridge width
+    if spacing <= 0 or spacing >= overall_width or overhang >= overall_width:
+        return None
+
+    no_girders = int(round((overall_width - 2 * overhang) / spacing)) + 1
+    return no_girders if no_girders >= 2 else None
+
+
+def girder_spacing_for(inputs, no_girders, overall_width=None):
+    """Spacing = (Overall Width - 2*Overhang) / (No. of Girders - 1)"""
+    if no_girders is None or no_girders < 2:
+        return None
+    if overall_width is None:
+        overall_width = overall_bridge_width(inputs)
+    overhang = inputs.get(KEY_DECK_OVERHANG)
+    if overhang is None:
+        overhang = DEFAULT_DECK_OVERHANG
+    return (overall_width - 2 * overhang) / (no_girders - 1)
+
+
+def overall_bridge_width_columns(columns):
+    """Vectorized overall_bridge_width over column arrays, NaN marking unset values"""
+    footpath = np.asarray(columns[KEY_FOOTPATH])
+    has_footpath = footpath != "None"
+    num_footpaths = np.select([footpath == "Single Sided", footpath == "Both"], [1, 2], 0)
+
+    carriageway = np.asarray(columns[KEY_CARRIAGEWAY_WIDTH], dtype=float)
+    carriageway = np.where(np.isnan(carriageway) | (carriageway == 0), DEFAULT_CARRIAGEWAY_WIDTH, carriageway)
+    footpath_width = np.nan_to_num(np.asarray(columns[KEY_FOOTPATH_WIDTH], dtype=float), nan=0.0)
+    crash_barrier_width = np.nan_to_num(np.asarray(columns[KEY_CRASH_BARRIER_WIDTH], dtype=float),
+                                        nan=DEFAULT_CRASH_BARRIER_WIDTH)
+    railing_width = np.nan_to_num(np.asarray(columns[KEY_RAILING_WIDTH], dtype=float), nan=DEFAULT_RAILING_WIDTH)
+
+    return (carriageway
+            + np.where(has_footpath, footpath_width * num_footpaths, 0.0)
+            + crash_barrier_width * 2
+            + np.where(has_footpath, railing_width * 2, 0.0))
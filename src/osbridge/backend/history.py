@@ -0,0 +1,194 @@
+"""
+Undo and redo of the bridge inputs over persistent snapshots.
+A snapshot holds the input values in BUCKETS buckets chosen by key hash.
+A change copies only the buckets it touches and the tuple of buckets,
+sharing every other bucket with the snapshot before it, so each undo step
+costs memory in proportion to what changed rather than a copy of every
+input. Analysis results are cached per snapshot, so undoing to a state
+that was analysed brings its results back without running it again.
+"""
+import collections
+
+
+BUCKETS = 16
+HISTORY_LIMIT = 10000  # Undo steps kept
+RESULT_STATES = 32  # Snapshots whose analysis results are kept
+RESTORE_PASSES = 3  # Rounds of setting values while listeners derive others
+
+
+def bucket_index(key):
+    return hash(key) % BUCKETS
+
+
+def bucket_hash(index, bucket):
+    return hash((index, bucket))
+
+
+class InputSnapshot:
+    """Immutable input values.
+
+    buckets     -- tuple of BUCKETS tuples of (key, value) pairs sorted by key
+    fingerprint -- sum of the bucket hashes, updated from the buckets that
+                   change, so a new snapshot never hashes the whole input
+    """
+
+    __slots__ = ("buckets", "fingerprint")
+
+    def __init__(self, buckets, fingerprint):
+        self.buckets = buckets
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_values(cls, values):
+        buckets = [[] for _ in range(BUCKETS)]
+        for key, value in values.items():
+            buckets[bucket_index(key)].append((key, value))
+        buckets = tuple(tuple(sorted(bucket)) for bucket in buckets)
+        return cls(buckets, sum(bucket_hash(index, bucket) for index, bucket in enumerate(buckets)))
+
+    def __eq__(self, other):
+        if not isinstance(other, InputSnapshot) or self.fingerprint != other.fingerprint:
+            return False
+        return all(mine is theirs or mine == theirs for mine, theirs in zip(self.buckets, other.buckets))
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    def get(self, key, default=None):
+        for item, value in self.buckets[bucket_index(key)]:
+            if item == key:
+                return value
+        return default
+
+    def to_dict(self):
+        return {key: value for bucket in self.buckets for key, value in bucket}
+
+    def changed(self, values):
+        """New snapshot with values (key -> value) changed, sharing the untouched buckets and pairs"""
+        touched = collections.defaultdict(dict)
+        for key, value in values.items():
+            touched[bucket_index(key)][key] = value
+        buckets, fingerprint = list(self.buckets), self.fingerprint
+        for index, changes in touched.items():
+            old = buckets[index]
+            kept = tuple(pair for pair in old if pair[0] not in changes)
+            buckets[index] = tuple(sorted(kept + tuple(changes.items()), key=lambda pair: pair[0]))
+            fingerprint += bucket_hash(index, buckets[index]) - bucket_hash(index, old)
+        return InputSnapshot(tuple(buckets), fingerprint)
+
+    def differences(self, other):
+        """Values of other that differ from this snapshot, comparing only buckets that are not shared"""
+        changes = {}
+        for mine, theirs in zip(self.buckets, other.buckets):
+            if mine is not theirs and mine != theirs:
+                values = dict(mine)
+                changes.update((key, value) for key, value in theirs if values.get(key, changes) != value)
+        return changes
+
+
+class InputHistory:
+    """Undo steps over a BridgeInputs.
+
+    Every change of the inputs is collected by record(); commit() turns the
+    changes collected since the last commit into one undo step, so callers
+    decide what one step is (the GUI commits once a burst of edits has
+    settled). Values set while undoing or redoing are not recorded.
+    """
+
+    __slots__ = ("inputs", "states", "position", "pending", "restoring", "results")
+
+    def __init__(self, inputs):
+        self.inputs = inputs
+        self.states = [InputSnapshot.from_values(inputs.to_dict())]
+        self.position = 0
+        self.pending = {}  # Changes not committed yet, key -> new value
+        self.restoring = False
+        self.results = collections.OrderedDict()  # Snapshot -> {kind: results}, least recently used first
+        inputs.subscribe(self.record)
+
+    def clear(self):
+        """Forget every undo step and cached result, starting again from the current inputs"""
+        self.states = [InputSnapshot.from_values(self.inputs.to_dict())]
+        self.position = 0
+        self.pending = {}
+        self.results.clear()
+
+    def current(self):
+        """Snapshot of the inputs as of the last commit"""
+        return self.states[self.position]
+
+    def record(self, key, old, new):
+        if not self.restoring:
+            self.pending[key] = new
+
+    def commit(self):
+        """Make the pending changes one undo step; returns False when they changed nothing"""
+        if not self.pending:
+            return False
+        snapshot = self.current().changed(self.pending)
+        self.pending = {}
+        if snapshot == self.current():
+            return False
+        del self.states[self.position + 1:]
+        self.states.append(snapshot)
+        if len(self.states) > HISTORY_LIMIT:
+            del self.states[0]
+        self.position = len(self.states) - 1
+        return True
+
+    def can_undo(self):
+        return self.position > 0 or bool(self.pending)
+
+    def can_redo(self):
+        return self.position < len(self.states) - 1 and not self.pending
+
+    def undo(self):
+        """Restore the inputs before the last step; returns False when there is none"""
+        self.commit()
+        if self.position == 0:
+            return False
+        self.position -= 1
+        self.restore(self.states[self.position + 1])
+        return True
+
+    def redo(self):
+        """Restore the inputs of the step last undone; returns False when there is none"""
+        self.commit()
+        if self.position == len(self.states) - 1:
+            return False
+        self.position += 1
+        self.restore(self.states[self.position - 1])
+        return True
+
+    def restore(self, previous):
+        """Set the inputs from previous to the current snapshot.
+
+        Listeners may derive other inputs from the values being set, so the
+        snapshot is applied again until no value differs from it.
+        """
+        target = self.current()
+        changes = previous.differences(target)
+        self.restoring = True
+        try:
+            for _ in range(RESTORE_PASSES):
+                if not self.inputs.update(changes):
+                    break
+                changes = {key: value for key, value in target.to_dict().items() if self.inputs.get(key) != value}
+        finally:
+            self.restoring = False
+
+    def store_results(self, kind, results):
+        """Keep results (e.g. kind "results" or "checks") for the current inputs"""
+        self.commit()
+        snapshot = self.current()
+        self.results.setdefault(snapshot, {})[kind] = results
+        self.results.move_to_end(snapshot)
+        while len(self.results) > RESULT_STATES:
+            self.results.popitem(last=False)
+
+    def cached_results(self):
+        """Results stored for the current inputs as {kind: results}, {} when none"""
+        stored = self.results.get(self.current(), {})
+        if stored:
+            self.results.move_to_end(self.current())
+        return dict(stored)
@@ -0,0 +1,173 @@
+"""
+Autosave of the bridge inputs to a project file and an append-only journal.
+Every change of BridgeInputs is queued as (key, old, new) and a background
+thread appends it to the journal as one compact JSON line, so edits never
+wait on the disk. After COMPACT_CHANGES changes, or COMPACT_SECONDS after
+the oldest change not yet in the project file, the thread writes the
+inputs to the project file atomically and starts the journal afresh.
+Recovery reads the project file and replays the journal over it.
+"""
+import json
+import os
+import queue
+import threading
+import time
+
+
+PROJECT_VERSION = 1
+JOURNAL_SUFFIX = ".journal"
+COMPACT_CHANGES = 1000
+COMPACT_SECONDS = 30.0
+
+_STOP = object()  # Queue item ending the writer thread
+
+
+def journal_path(path):
+    return path + JOURNAL_SUFFIX
+
+
+def read_project(path):
+    """Input values of a project file, {} when it does not exist"""
+    try:
+        with open(path, encoding="utf-8") as stream:
+            project = json.load(stream)
+    except FileNotFoundError:
+        return {}
+    if project.get("version") != PROJECT_VERSION:
+        raise ValueError(f"{path} is a version {project.get('version')} project; "
+                         f"expected version {PROJECT_VERSION}")
+    return dict(project["inputs"])
+
+
+def write_project(path, values):
+    """Write a project file through a temporary file, so a crash leaves the old or the new one"""
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w", encoding="utf-8") as stream:
+        json.dump({"version": PROJECT_VERSION, "inputs": values}, stream, separators=(",", ":"))
+        stream.flush()
+        os.fsync(stream.fileno())
+    os.replace(temporary, path)
+
+
+def replay_journal(path, values):
+    """Apply the changes in the journal of project path to values; returns how many were applied.
+
+    A line that does not parse can only be the last one, torn by a crash
+    while it was written, and ends the replay.
+    """
+    count = 0
+    try:
+        stream = open(journal_path(path), encoding="utf-8")
+    except FileNotFoundError:
+        return 0
+    with stream:
+        for line in stream:
+            try:
+                key, old, new = json.loads(line)
+            except ValueError:
+                break
+            values[key] = new
+            count += 1
+    return count
+
+
+def recover_inputs(path):
+    """Input values left by an autosaving session that did not close, None when there are none"""
+    if not os.path.exists(path) and not os.path.exists(journal_path(path)):
+        return None
+    values = read_project(path)
+    replay_journal(path, values)
+    return values
+
+
+def discard_autosave(path):
+    """Remove the project file and journal of an autosave"""
+    for name in (path, journal_path(path)):
+        try:
+            os.remove(name)
+        except FileNotFoundError:
+            pass
+
+
+class AutosaveJournal:
+    """Journals every change of a BridgeInputs to the project file at path.
+
+    The project file is written with the current inputs when the journal
+    starts. Only the listener runs in the calling thread: it puts the
+    change on a queue. The writer thread keeps its own copy of the values,
+    updated from the queue, and compacts from that copy, so it never reads
+    the inputs while they are being edited.
+    """
+
+    __slots__ = ("path", "inputs", "queue", "thread", "error")
+
+    def __init__(self, inputs, path):
+        self.path = path
+        self.inputs = inputs
+        self.queue = queue.SimpleQueue()
+        self.error = None  # Last OSError of the writer thread
+        values = inputs.to_dict()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        write_project(path, values)
+        stream = open(journal_path(path), "w", encoding="utf-8")
+        self.thread = threading.Thread(target=self.run, args=(values, stream), name="autosave", daemon=True)
+        self.thread.start()
+        inputs.subscribe(self.on_change)
+
+    def on_change(self, key, old, new):
+        self.queue.put((key, old, new))
+
+    def run(self, values, stream):
+        """Writer thread: append queued changes in batches and compact when due"""
+        changes, deadline = 0, None
+        stopping = False
+        while not stopping:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            try:
+                items = [self.queue.get(timeout=timeout)]
+            except queue.Empty:
+                items = []
+            # Everything queued meanwhile goes out in the same write
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = _STOP in items
+            batch = [item for item in items if isinstance(item, tuple)]
+            for key, old, new in batch:
+                values[key] = new
+            changes += len(batch)
+            if batch and deadline is None:
+                deadline = time.monotonic() + COMPACT_SECONDS
+            try:
+                if batch:
+                    stream.write("".join(json.dumps(change, separators=(",", ":")) + "\n" for change in batch))
+                    stream.flush()
+                    os.fsync(stream.fileno())
+                if changes and (changes >= COMPACT_CHANGES or stopping or time.monotonic() >= deadline):
+                    write_project(self.path, values)
+                    stream.close()
+                    stream = open(journal_path(self.path), "w", encoding="utf-8")
+                    changes, deadline = 0, None
+            except OSError as error:
+                # The values are kept, so the next compaction still writes them
+                self.error = error
+            for item in items:
+                if isinstance(item, threading.Event):
+                    item.set()
+        stream.close()
+
+    def flush(self):
+        """Wait until the writer thread has written every change made so far"""
+        written = threading.Event()
+        self.queue.put(written)
+        written.wait()
+
+    def close(self, discard=False):
+        """Stop journaling after compacting everything into the project file; discard removes both files"""
+        self.inputs.unsubscribe(self.on_change)
+        self.queue.put(_STOP)
+        self.thread.join()
+        if discard:
+            discard_autosave(self.path)
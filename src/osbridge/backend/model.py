@@ -0,0 +1,100 @@
+"""
+Typed input model for Highway Bridge Design.
+Holds every design input keyed by the KEY_* constants, independent of Qt,
+so the backend can read inputs without touching the widget tree.
+"""
+from .common import *
+from .schema import INPUT_SCHEMA
+
+
+def format_value(value):
+    """Text shown in a widget for a model value"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class BridgeInputs:
+    """Typed store of the bridge design inputs with change notifications.
+
+    Values are parsed once when they are set, so consumers read plain floats,
+    ints and strings instead of re-parsing widget text. Listeners are called
+    with (key, old, new) for every effective change; they can subscribe to
+    all keys or to a subset of keys.
+    """
+
+    __slots__ = ("_values", "_listeners", "_key_listeners")
+
+    def __init__(self, values=None):
+        self._values = dict(INPUT_SCHEMA.defaults)
+        self._listeners = []
+        self._key_listeners = {}
+        if values:
+            for key, value in values.items():
+                self._values[key] = INPUT_SCHEMA.parse(key, value)
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def get(self, key, default=None):
+        """Return the value for key, or default when unset"""
+        value = self._values.get(key)
+        return default if value is None else value
+
+    def keys(self):
+        return self._values.keys()
+
+    def items(self):
+        return self._values.items()
+
+    def to_dict(self):
+        """Plain dict copy of all values"""
+        return dict(self._values)
+
+    def set(self, key, value):
+        """Set a value (parsed to the field type); returns True if it changed"""
+        new = INPUT_SCHEMA.parse(key, value)
+        old = self._values.get(key)
+        if new == old and type(new) is type(old):
+            return False
+        self._values[key] = new
+        self._notify(key, old, new)
+        return True
+
+    def update(self, values):
+        """Set several values; returns the list of keys that changed"""
+        return [key for key, value in values.items() if self.set(key, value)]
+
+    def reset(self):
+        """Restore every field to its default value"""
+        self.update(INPUT_SCHEMA.defaults)
+
+    def subscribe(self, callback, keys=None):
+        """Call callback(key, old, new) on changes to keys (all keys if None)"""
+        if keys is None:
+            self._listeners.append(callback)
+        else:
+            for key in keys:
+                self._key_listeners.setdefault(key, []).append(callback)
+
+    def unsubscribe(self, callback):
+        """Remove callback from every subscription"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+        for listeners in self._key_listeners.values():
+            if callback in listeners:
+                listeners.remove(callback)
+
+    def _notify(self, key, old, new):
+        for callback in tuple(self._key_listeners.get(key, ())):
+            callback(key, old, new)
+        for callback in tuple(self._listeners):
+            callback(key, old, new)
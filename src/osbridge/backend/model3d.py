@@ -0,0 +1,484 @@
+"""
+Parametric 3D model of Highway Bridge Design built with NumPy.
+Repeated members (girders, stiffeners, bracing members, railing posts)
+share one prototype mesh and differ only by their 4x4 instance transforms,
+so the model is a handful of small meshes and transform arrays rather than
+one object per member. Detailed prototypes also get a bounding box as a
+coarse level of detail for views. Pure functions over any mapping of KEY_*
+values, usable without Qt.
+
+Axes: x along the span, y across the deck (centred), z up from the
+girder soffit; lengths in m.
+"""
+import re
+from collections import namedtuple
+
+import numpy as np
+
+from .common import *
+from .geometry import overall_bridge_width, girder_count, girder_spacing_for
+
+
+# Geometry used while the corresponding input is unset (mm unless noted)
+DEFAULT_SPAN = 30.0  # m
+DEFAULT_DECK_THICKNESS = 250.0
+DEFAULT_STIFFENER_SPACING = 1500.0
+DEFAULT_STIFFENER_THICKNESS = 12.0
+DEFAULT_CROSS_BRACING_SPACING = 4500.0
+DEFAULT_RAILING_HEIGHT = 1100.0
+CRASH_BARRIER_HEIGHT = 0.9  # m
+CRASH_BARRIER_TOP_RATIO = 0.4  # Top width as a fraction of the base width
+BRACING_SIZE = 0.1  # m, square section of bracing members
+RAILING_POST_SPACING = 2.0  # m
+RAILING_POST_SIZE = 0.1  # m
+RAILING_RAIL_SIZE = 0.08  # m
+
+Mesh = namedtuple("Mesh", "vertices faces")
+Mesh.__doc__ = """Triangle mesh: float vertices (n, 3) and int32 vertex indices (m, 3)"""
+
+
+class Component:
+    """One prototype mesh drawn at many instance transforms.
+
+    name       -- component name, e.g. "Girders"
+    mesh       -- prototype Mesh in local coordinates
+    transforms -- float array (instances, 4, 4) mapping local to model coordinates
+    ids        -- instance IDs, e.g. "G1" or "G1-S3"
+    """
+
+    __slots__ = ("name", "mesh", "transforms", "ids")
+
+    def __init__(self, name, mesh, transforms, ids=None):
+        self.name = name
+        self.mesh = mesh
+        self.transforms = np.asarray(transforms, dtype=np.float64).reshape(-1, 4, 4)
+        if ids is None:
+            ids = [f"{name} {i + 1}" for i in range(len(self.transforms))]
+        self.ids = tuple(ids)
+        if len(self.ids) != len(self.transforms):
+            raise ValueError(f"{len(self.ids)} IDs given for {len(self.transforms)} instances of {name}")
+
+    def __len__(self):
+        return len(self.transforms)
+
+    def __repr__(self):
+        return f"Component({self.name!r}, {len(self.mesh.faces)} faces x {len(self)} instances)"
+
+    def bounds(self):
+        """Model-space bounding box of every instance, shape (instances, 2, 3) as (min, max)"""
+        corners = box_corners(self.mesh.vertices.min(axis=0), self.mesh.vertices.max(axis=0))
+        world = transform_points(self.transforms, corners)
+        return np.stack((world.min(axis=1), world.max(axis=1)), axis=1)
+
+    def world_mesh(self):
+        """All instances merged into one model-space Mesh"""
+        vertices = transform_points(self.transforms, self.mesh.vertices).reshape(-1, 3)
+        offsets = np.arange(len(self), dtype=np.int32)[:, None, None] * len(self.mesh.vertices)
+        faces = (self.mesh.faces[None] + offsets).reshape(-1, 3)
+        return Mesh(vertices, faces)
+
+
+def transform_points(transforms, points):
+    """Apply (k, 4, 4) transforms to (n, 3) points, giving (k, n, 3)"""
+    return points @ transforms[:, :3, :3].transpose(0, 2, 1) + transforms[:, None, :3, 3]
+
+
+def box_corners(low, high):
+    return np.array([[x, y, z] for x in (low[0], high[0]) for y in (low[1], high[1]) for z in (low[2], high[2])])
+
+
+# Triangles of a box over box_corners order, outward facing
+BOX_FACES = np.array([
+    [0, 1, 3], [0, 3, 2], [4, 6, 7], [4, 7, 5],  # x min, x max
+    [0, 4, 5], [0, 5, 1], [2, 3, 7], [2, 7, 6],  # y min, y max
+    [0, 2, 6], [0, 6, 4], [1, 5, 7], [1, 7, 3],  # z min, z max
+], dtype=np.int32)
+
+
+def box_mesh(low, high):
+    """Axis-aligned box between two corners"""
+    return Mesh(box_corners(low, high), BOX_FACES.copy())
+
+
+def prism_mesh(profile, length):
+    """Convex (y, z) profile, counter-clockwise, extruded from x = 0 to x = length"""
+    profile = np.asarray(profile, dtype=np.float64)
+    n = len(profile)
+    vertices = np.concatenate((np.column_stack((np.zeros(n), profile)),
+                               np.column_stack((np.full(n, length), profile))))
+    i = np.arange(n, dtype=np.int32)
+    j = (i + 1) % n
+    sides = np.concatenate((np.column_stack((i, j, j + n)), np.column_stack((i, j + n, i + n))))
+    fan = np.arange(1, n - 1, dtype=np.int32)
+    start = np.column_stack((np.zeros(n - 2, dtype=np.int32), fan + 1, fan))
+    end = np.column_stack((np.full(n - 2, n, dtype=np.int32), fan + n, fan + n + 1))
+    return Mesh(vertices, np.concatenate((sides, start, end)))
+
+
+def coarse_mesh(mesh):
+    """Bounding box of a prototype mesh, its coarse level of detail; None when the mesh is no
+    more detailed than its box"""
+    if len(mesh.faces) <= len(BOX_FACES):
+        return None
+    return box_mesh(mesh.vertices.min(axis=0), mesh.vertices.max(axis=0))
+
+
+def enclosing_instances(container, component):
+    """Index of the container instance whose prototype bounding box encloses each instance of
+    component, -1 where none does. Both are Components; an enclosed instance cannot be seen
+    while its container is drawn as a box."""
+    low, high = component.mesh.vertices.min(axis=0), component.mesh.vertices.max(axis=0)
+    corners = transform_points(component.transforms, box_corners(low, high))
+    # Only instances inside a container's model-space box can be inside the container
+    containers = container.bounds()
+    candidates = ((corners.min(axis=1) >= containers[:, None, 0] - 1e-9)
+                  & (corners.max(axis=1) <= containers[:, None, 1] + 1e-9)).all(axis=2)
+    low, high = container.mesh.vertices.min(axis=0) - 1e-9, container.mesh.vertices.max(axis=0) + 1e-9
+    enclosing = np.full(len(component), -1, dtype=np.intp)
+    inverses = np.linalg.inv(container.transforms)
+    for i in np.flatnonzero(candidates.any(axis=1)).tolist():
+        rows = np.flatnonzero(candidates[i] & (enclosing < 0))
+        local = corners[rows] @ inverses[i, :3, :3].T + inverses[i, :3, 3]
+        enclosing[rows[((local >= low) & (local <= high)).all(axis=(1, 2))]] = i
+    return enclosing
+
+
+def merge_meshes(meshes):
+    """Concatenate meshes into one, offsetting the face indices"""
+    meshes = list(meshes)
+    offsets = np.cumsum([0] + [len(mesh.vertices) for mesh in meshes[:-1]])
+    return Mesh(np.concatenate([mesh.vertices for mesh in meshes]),
+                np.concatenate([mesh.faces + offset for mesh, offset in zip(meshes, offsets)]).astype(np.int32))
+
+
+def translations(points):
+    """Pure translation transforms, shape (len(points), 4, 4)"""
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    transforms = np.tile(np.eye(4), (len(points), 1, 1))
+    transforms[:, :3, 3] = points
+    return transforms
+
+
+def segment_transforms(start, end, side=(1.0, 0.0, 0.0)):
+    """Transforms taking a unit member along local x onto each start-end segment.
+
+    Local x is scaled to the segment length, local y follows side (which
+    must not be parallel to the segments) and local z completes the frame.
+    """
+    start = np.asarray(start, dtype=np.float64).reshape(-1, 3)
+    direction = np.asarray(end, dtype=np.float64).reshape(-1, 3) - start
+    length = np.linalg.norm(direction, axis=1, keepdims=True)
+    u = direction / length
+    w = np.cross(u, np.asarray(side, dtype=np.float64))
+    w /= np.linalg.norm(w, axis=1, keepdims=True)
+    v = np.cross(w, u)
+    transforms = np.zeros((len(start), 4, 4))
+    transforms[:, :3, 0] = u * length
+    transforms[:, :3, 1] = v
+    transforms[:, :3, 2] = w
+    transforms[:, :3, 3] = start
+    transforms[:, 3, 3] = 1.0
+    return transforms
+
+
+def _mm(inputs, key, default):
+    value = inputs.get(key)
+    return (default if value is None else value) / 1000.0
+
+
+def stations(length, spacing):
+    """Evenly spaced positions from 0 to length, at most spacing apart, ends included"""
+    if spacing <= 0:
+        return np.array([0.0, length])
+    count = max(int(np.ceil(length / spacing - 1e-9)), 1)
+    return np.linspace(0.0, length, count + 1)
+
+
+def model_layout(inputs):
+    """Dimensions shared by the component builders, in m"""
+    width = overall_bridge_width(inputs)
+    no_girders = inputs.get(KEY_NO_OF_GIRDERS) or girder_count(inputs, width) or 2
+    spacing = girder_spacing_for(inputs, no_girders, width)
+    return {
+        "span": inputs.get(KEY_SPAN) or DEFAULT_SPAN,
+        "width": width,
+        "girders": no_girders,
+        "girder_y": (np.arange(no_girders) - (no_girders - 1) / 2) * spacing,
+        "depth": _mm(inputs, KEY_GIRDER_DEPTH, DEFAULT_GIRDER_DEPTH),
+        "deck": _mm(inputs, KEY_DECK_THICKNESS, DEFAULT_DECK_THICKNESS),
+        "skew": np.radians(inputs.get(KEY_SKEW_ANGLE) or 0.0),
+    }
+
+
+def girder_mesh(inputs):
+    """I-section prototype along x from 0 to 1, web centred on y = 0"""
+    depth = _mm(inputs, KEY_GIRDER_DEPTH, DEFAULT_GIRDER_DEPTH)
+    top_width = _mm(inputs, KEY_GIRDER_TOP_FLANGE_WIDTH, DEFAULT_FLANGE_WIDTH)
+    top_thickness = _mm(inputs, KEY_GIRDER_TOP_FLANGE_THICKNESS, DEFAULT_FLANGE_THICKNESS)
+    bottom_width = _mm(inputs, KEY_GIRDER_BOTTOM_FLANGE_WIDTH, DEFAULT_FLANGE_WIDTH)
+    bottom_thickness = _mm(inputs, KEY_GIRDER_BOTTOM_FLANGE_THICKNESS, DEFAULT_FLANGE_THICKNESS)
+    web = _mm(inputs, KEY_GIRDER_WEB_THICKNESS, DEFAULT_WEB_THICKNESS)
+    return merge_meshes((
+        box_mesh((0, -bottom_width / 2, 0), (1, bottom_width / 2, bottom_thickness)),
+        box_mesh((0, -web / 2, bottom_thickness), (1, web / 2, depth - top_thickness)),
+        box_mesh((0, -top_width / 2, depth - top_thickness), (1, top_width / 2, depth)),
+    ))
+
+
+def girder_of(instance):
+    """Girder ID ("G1") of a girder or of a part fixed to one, such as stiffener "G1-ST3L"; None otherwise"""
+    match = re.match(r"(G\d+)(?:-|$)", instance)
+    return match.group(1) if match else None
+
+
+def girder_components(inputs, layout):
+    transforms = translations([(0.0, y, 0.0) for y in layout["girder_y"]])
+    transforms[:, 0, 0] = layout["span"]
+    ids = [f"G{i + 1}" for i in range(layout["girders"])]
+    return [Component("Girders", girder_mesh(inputs), transforms, ids)]
+
+
+def stiffener_components(inputs, layout):
+    """Transverse web stiffeners in pairs either side of every girder web"""
+    spacing = _mm(inputs, KEY_STIFFENER_SPACING, DEFAULT_STIFFENER_SPACING)
+    thickness = DEFAULT_STIFFENER_THICKNESS / 1000.0
+    web = _mm(inputs, KEY_GIRDER_WEB_THICKNESS, DEFAULT_WEB_THICKNESS)
+    width = (_mm(inputs, KEY_GIRDER_BOTTOM_FLANGE_WIDTH, DEFAULT_FLANGE_WIDTH) - web) / 2
+    plate = box_mesh((-thickness / 2, web / 2, 0.0), (thickness / 2, web / 2 + width, layout["depth"]))
+
+    x = stations(layout["span"], spacing)
+    girder, station, side = np.meshgrid(np.arange(layout["girders"]), np.arange(len(x)), (1.0, -1.0),
+                                        indexing="ij")
+    transforms = translations(np.column_stack((x[station.ravel()], layout["girder_y"][girder.ravel()],
+                                               np.zeros(girder.size))))
+    # Turn the plate half round about z onto the other side of the web
+    transforms[:, 0, 0] = side.ravel()
+    transforms[:, 1, 1] = side.ravel()
+    ids = [f"G{g + 1}-ST{s + 1}{'L' if d < 0 else 'R'}"
+           for g, s, d in zip(girder.ravel().tolist(), station.ravel().tolist(), side.ravel().tolist())]
+    return [Component("Stiffeners", plate, transforms, ids)]
+
+
+def cross_bracing_components(inputs, layout):
+    """Bracing members between neighbouring girders at every bracing station"""
+    if layout["girders"] < 2:
+        return []
+    bracing_type = inputs.get(KEY_CROSS_BRACING_TYPE) or VALUES_CROSS_BRACING_TYPE[0]
+    x = stations(layout["span"], _mm(inputs, KEY_CROSS_BRACING_SPACING, DEFAULT_CROSS_BRACING_SPACING))
+    left, right = layout["girder_y"][:-1], layout["girder_y"][1:]
+    depth = layout["depth"]
+
+    # Member ends in the (y, z) plane of one bay, as (start, end) pairs
+    bays = []
+    if bracing_type.startswith("X"):
+        bays += [((left, 0.0), (right, depth)), ((left, depth), (right, 0.0))]
+    else:
+        middle = (left + right) / 2
+        bays += [((left, depth), (middle, 0.0)), ((middle, 0.0), (right, depth)), ((left, 0.0), (right, 0.0))]
+    if "top" in bracing_type:
+        bays.append(((left, depth), (right, depth)))
+    if "bottom" in bracing_type and not bracing_type.startswith("K"):
+        bays.append(((left, 0.0), (right, 0.0)))
+
+    starts, ends, ids = [], [], []
+    for member, ((y0, z0), (y1, z1)) in enumerate(bays):
+        station, bay = np.meshgrid(np.arange(len(x)), np.arange(len(left)), indexing="ij")
+        station, bay = station.ravel(), bay.ravel()
+        starts.append(np.column_stack((x[station], np.broadcast_to(y0, left.shape)[bay], np.full(bay.size, z0))))
+        ends.append(np.column_stack((x[station], np.broadcast_to(y1, left.shape)[bay], np.full(bay.size, z1))))
+        ids += [f"CB{b + 1}-{s + 1}-{member + 1}" for s, b in zip(station.tolist(), bay.tolist())]
+    half = BRACING_SIZE / 2
+    member_mesh = box_mesh((0.0, -half, -half), (1.0, half, half))
+    transforms = segment_transforms(np.concatenate(starts), np.concatenate(ends))
+    return [Component("Cross Bracing", member_mesh, transforms, ids)]
+
+
+def deck_components(inputs, layout):
+    width = layout["width"]
+    deck = box_mesh((0.0, -width / 2, layout["depth"]), (layout["span"], width / 2, layout["depth"] + layout["deck"]))
+    return [Component("Deck", deck, np.eye(4), ["Deck"])]
+
+
+def edge_positions(inputs, layout):
+    """Deck edge zones as (left barrier start, right barrier end, left railing start,
+    right railing start, railing width), all y"""
+    footpath = inputs.get(KEY_FOOTPATH) or "None"
+    footpath_width = inputs.get(KEY_FOOTPATH_WIDTH) or 0.0
+    railing_width = inputs.get(KEY_RAILING_WIDTH)
+    railing_width = DEFAULT_RAILING_WIDTH if railing_width is None else railing_width
+    edge = layout["width"] / 2
+    railing = railing_width if footpath != "None" else 0.0
+    left = -edge + railing + (footpath_width if footpath in ("Single Sided", "Both") else 0.0)
+    right = edge - railing - (footpath_width if footpath == "Both" else 0.0)
+    return left, right, -edge, edge - railing_width, railing_width
+
+
+def crash_barrier_components(inputs, layout):
+    width = inputs.get(KEY_CRASH_BARRIER_WIDTH)
+    width = DEFAULT_CRASH_BARRIER_WIDTH if width is None else width
+    if not width:
+        return []
+    left, right = edge_positions(inputs, layout)[:2]
+    top = width * CRASH_BARRIER_TOP_RATIO
+    profile = ((0.0, 0.0), (width, 0.0), ((width + top) / 2, CRASH_BARRIER_HEIGHT),
+               ((width - top) / 2, CRASH_BARRIER_HEIGHT))
+    base = layout["depth"] + layout["deck"]
+    transforms = translations([(0.0, left, base), (0.0, right - width, base)])
+    return [Component("Crash Barriers", prism_mesh(profile, layout["span"]), transforms, ["CB-L", "CB-R"])]
+
+
+def railing_components(inputs, layout):
+    """Posts and a top rail along both outer edges; only bridges with a footpath have railings"""
+    if (inputs.get(KEY_FOOTPATH) or "None") == "None":
+        return []
+    left, right, railing_width = edge_positions(inputs, layout)[2:]
+    height = _mm(inputs, KEY_RAILING_HEIGHT, DEFAULT_RAILING_HEIGHT)
+    base = layout["depth"] + layout["deck"]
+    sides = np.array((left, right)) + railing_width / 2
+
+    x = stations(layout["span"], RAILING_POST_SPACING)
+    side, station = np.meshgrid(np.arange(2), np.arange(len(x)), indexing="ij")
+    half = RAILING_POST_SIZE / 2
+    post = box_mesh((-half, -half, 0.0), (half, half, height))
+    posts = Component("Railing Posts", post,
+                      translations(np.column_stack((x[station.ravel()], sides[side.ravel()],
+                                                    np.full(side.size, base)))),
+                      [f"RP-{'LR'[s]}{i + 1}" for s, i in zip(side.ravel().tolist(), station.ravel().tolist())])
+
+    half = RAILING_RAIL_SIZE / 2
+    rail = box_mesh((0.0, -half, height - RAILING_RAIL_SIZE), (1.0, half, height))
+    transforms = translations([(0.0, y, base) for y in sides])
+    transforms[:, 0, 0] = layout["span"]
+    return [posts, Component("Railings", rail, transforms, ["R-L", "R-R"])]
+
+
+# Inputs deciding the deck width and the girder positions
+WIDTH_KEYS = (KEY_CARRIAGEWAY_WIDTH, KEY_FOOTPATH, KEY_FOOTPATH_WIDTH, KEY_CRASH_BARRIER_WIDTH, KEY_RAILING_WIDTH)
+GIRDER_LAYOUT_KEYS = (KEY_SPAN, KEY_SKEW_ANGLE) + WIDTH_KEYS + (KEY_NO_OF_GIRDERS, KEY_GIRDER_SPACING,
+                                                                KEY_DECK_OVERHANG)
+GIRDER_SECTION_KEYS = (KEY_GIRDER_DEPTH, KEY_GIRDER_TOP_FLANGE_WIDTH, KEY_GIRDER_TOP_FLANGE_THICKNESS,
+                       KEY_GIRDER_BOTTOM_FLANGE_WIDTH, KEY_GIRDER_BOTTOM_FLANGE_THICKNESS, KEY_GIRDER_WEB_THICKNESS)
+DECK_KEYS = (KEY_SPAN, KEY_SKEW_ANGLE) + WIDTH_KEYS + (KEY_GIRDER_DEPTH, KEY_DECK_THICKNESS)
+
+# Component builders in drawing order, each with every input it reads;
+# a builder returns a list of Components and is only rerun when one of its
+# inputs changes
+COMPONENT_BUILDERS = (
+    (girder_components, GIRDER_LAYOUT_KEYS + GIRDER_SECTION_KEYS),
+    (stiffener_components, GIRDER_LAYOUT_KEYS + GIRDER_SECTION_KEYS + (KEY_STIFFENER_SPACING,)),
+    (cross_bracing_components, GIRDER_LAYOUT_KEYS + (KEY_GIRDER_DEPTH, KEY_CROSS_BRACING_TYPE,
+                                                     KEY_CROSS_BRACING_SPACING)),
+    (deck_components, DECK_KEYS),
+    (crash_barrier_components, DECK_KEYS),
+    (railing_components, DECK_KEYS + (KEY_RAILING_HEIGHT,)),
+)
+
+# Every input the 3D model depends on
+MODEL_KEYS = tuple(dict.fromkeys(key for builder, keys in COMPONENT_BUILDERS for key in keys))
+
+
+def skew_transform(skew):
+    """Shear moving each cross-section along the span by y tan(skew)"""
+    transform = np.eye(4)
+    transform[0, 1] = np.tan(skew)
+    return transform
+
+
+def build_components(builder, inputs, layout):
+    components = builder(inputs, layout)
+    if layout["skew"]:
+        skew = skew_transform(layout["skew"])
+        for component in components:
+            component.transforms = skew @ component.transforms
+    return components
+
+
+def model_components(inputs):
+    """Instanced components of the whole bridge for the inputs"""
+    layout = model_layout(inputs)
+    return [component for builder, keys in COMPONENT_BUILDERS
+            for component in build_components(builder, inputs, layout)]
+
+
+ComponentDiff = namedtuple("ComponentDiff", "name component kept_old kept_new added moved removed")
+ComponentDiff.__doc__ = """Instance changes of one component between two models.
+
+component          -- the new Component, None when the component was removed
+kept_old, kept_new -- old and new indices of instances that did not change
+added, moved       -- new indices of instances to tessellate again
+removed            -- old indices of instances that are gone
+"""
+
+
+def _same_mesh(old, new):
+    return (old.vertices.shape == new.vertices.shape and old.faces.shape == new.faces.shape
+            and np.array_equal(old.vertices, new.vertices) and np.array_equal(old.faces, new.faces))
+
+
+def diff_components(old, new):
+    """ComponentDiff turning Component old into new (either may be None), matching instances by ID"""
+    none = np.empty(0, dtype=np.intp)
+    if new is None:
+        return ComponentDiff(old.name, None, none, none, none, none, np.arange(len(old)))
+    if old is None:
+        return ComponentDiff(new.name, new, none, none, np.arange(len(new)), none, none)
+
+    old_index = {instance: i for i, instance in enumerate(old.ids)}
+    matched = np.array([old_index.get(instance, -1) for instance in new.ids], dtype=np.intp)
+    found = matched >= 0
+    new_rows = np.flatnonzero(found)
+    old_rows = matched[found]
+    removed = np.ones(len(old), dtype=bool)
+    removed[old_rows] = False
+    if _same_mesh(old.mesh, new.mesh):
+        same = (old.transforms[old_rows] == new.transforms[new_rows]).all(axis=(1, 2))
+    else:
+        # Every instance of a new prototype has to be tessellated again
+        same = np.zeros(len(new_rows), dtype=bool)
+    return ComponentDiff(new.name, new, old_rows[same], new_rows[same], np.flatnonzero(~found),
+                         new_rows[~same], np.flatnonzero(removed))
+
+
+class ModelCache:
+    """Components of the current model, rebuilt per builder when its inputs change.
+
+    update() reruns only the builders whose inputs differ from the last
+    call and returns a ComponentDiff for every component that changed, so
+    a view can add, remove or move just those instances.
+    """
+
+    def __init__(self):
+        self.components = {}  # name -> Component, in drawing order
+        self.builder_keys = {}  # builder -> input values it was last run with
+        self.builder_components = {}  # builder -> names of the components it built
+
+    def update(self, inputs):
+        """Bring the model up to date with inputs; returns the list of ComponentDiffs"""
+        layout = None
+        diffs = []
+        rebuilt = False
+        for builder, keys in COMPONENT_BUILDERS:
+            values = tuple(inputs.get(key) for key in keys)
+            if builder in self.builder_keys and self.builder_keys[builder] == values:
+                continue
+            if layout is None:
+                layout = model_layout(inputs)
+            built = {component.name: component for component in build_components(builder, inputs, layout)}
+            for name in self.builder_components.get(builder, ()):
+                if name not in built:
+                    diffs.append(diff_components(self.components.pop(name), None))
+            for name, component in built.items():
+                diff = diff_components(self.components.get(name), component)
+                if len(diff.added) or len(diff.moved) or len(diff.removed):
+                    diffs.append(diff)
+                self.components[name] = component
+            self.builder_keys[builder] = values
+            self.builder_components[builder] = tuple(built)
+            rebuilt = True
+        if rebuilt:
+            order = [name for builder, keys in COMPONENT_BUILDERS for name in self.builder_components[builder]]
+            self.components = {name: self.components[name] for name in order}
+        return diffs
+
+    def component_list(self):
+        return list(self.components.values())
@@ -0,0 +1,138 @@
+"""
+NumPy triangle rasterizer shared by the CAD view and the report snapshots.
+Instances are tessellated into model-space triangles, clipped, flat shaded
+and scan converted into a depth buffered ARGB image, without Qt or OpenGL,
+so it also runs in worker processes and on machines without a display.
+"""
+import numpy as np
+
+from .model3d import transform_points
+
+
+COMPONENT_COLORS = {
+    "Girders": "#6b7f99",
+    "Stiffeners": "#8797ad",
+    "Cross Bracing": "#b5835a",
+    "Deck": "#b8b8b0",
+    "Crash Barriers": "#9a9a92",
+    "Railing Posts": "#707070",
+    "Railings": "#707070",
+}
+DEFAULT_COLOR = "#909090"
+
+# Face brightness: ambient plus diffuse from a light near the eye
+AMBIENT = 0.45
+DIFFUSE = 0.55
+OPAQUE = 0xFF000000
+
+
+def rgb(color):
+    """Red, green and blue (0-255) of a "#rrggbb" colour"""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def tessellate(mesh, transforms):
+    """Model-space triangles (instances, faces, 3, 3) and unit normals (instances, faces, 3)
+    of a mesh drawn at (instances, 4, 4) transforms"""
+    vertices = transform_points(transforms, mesh.vertices)
+    triangles = vertices[:, mesh.faces]
+    normals = np.cross(triangles[..., 1, :] - triangles[..., 0, :], triangles[..., 2, :] - triangles[..., 0, :])
+    normals /= np.maximum(np.linalg.norm(normals, axis=-1, keepdims=True), 1e-12)
+    return triangles, normals
+
+
+def clip_near(view, near):
+    """Clip view-space triangles (n, 3, 3) to depth >= near.
+
+    Returns the clipped triangles and the index of the source triangle of
+    each. A triangle with one corner in front becomes one triangle, with
+    two corners in front a quad split in two.
+    """
+    inside = view[..., 2] >= near
+    count = inside.sum(axis=1)
+    triangles, source = [view[count == 3]], [np.flatnonzero(count == 3)]
+
+    def cut(p, q):
+        t = (near - p[:, 2]) / (q[:, 2] - p[:, 2])
+        return p + (q - p) * t[:, None]
+
+    for front in (1, 2):
+        rows = np.flatnonzero(count == front)
+        if not len(rows):
+            continue
+        # Rotate the corner alone on its side of the plane first, keeping the winding
+        first = np.argmax(inside[rows] if front == 1 else ~inside[rows], axis=1)
+        order = (first[:, None] + np.arange(3)) % 3
+        a, b, c = np.take_along_axis(view[rows], order[..., None], axis=1).transpose(1, 0, 2)
+        if front == 1:
+            triangles.append(np.stack((a, cut(a, b), cut(a, c)), axis=1))
+            source.append(rows)
+        else:
+            ab, ca = cut(a, b), cut(c, a)
+            triangles += [np.stack((b, c, ca), axis=1), np.stack((b, ca, ab), axis=1)]
+            source += [rows, rows]
+    return np.concatenate(triangles), np.concatenate(source)
+
+
+def shade(normals, colors, axes):
+    """Flat shaded ARGB (n,) uint32 of faces with unit normals (n, 3) and base RGB colors (n, 3),
+    lit from near an eye with the right, up and forward unit vectors axes"""
+    light = -axes[2] + 0.5 * axes[1] + 0.3 * axes[0]
+    light /= np.linalg.norm(light)
+    brightness = AMBIENT + DIFFUSE * np.abs(normals @ light)
+    values = np.minimum(colors * brightness[:, None], 255).astype(np.uint32)
+    return OPAQUE | (values[:, 0] << 16) | (values[:, 1] << 8) | values[:, 2]
+
+
+def rasterize(x, y, w, colors, width, height):
+    """Depth-buffered scan conversion of screen triangles into a (height, width) uint32 image.
+
+    x, y   -- (n, 3) screen coordinates of the triangle corners (px)
+    w      -- (n, 3) reciprocal depth of the corners; larger is nearer
+    colors -- (n,) uint32 ARGB of each triangle; uncovered pixels stay 0
+
+    Triangles are split into pixel row spans and the spans into pixels,
+    all as flat arrays; the nearest candidate of every pixel wins.
+    """
+    count = len(x)
+    # Pixel rows whose centres each triangle covers
+    top = np.clip(np.ceil(y.min(axis=1) - 0.5), 0, height).astype(np.int64)
+    bottom = np.clip(np.floor(y.max(axis=1) - 0.5), -1, height - 1).astype(np.int64)
+    rows = np.maximum(bottom - top + 1, 0)
+    tri = np.repeat(np.arange(count), rows)
+    row = top[tri] + np.arange(len(tri)) - np.repeat(np.cumsum(rows) - rows, rows)
+    yc = row + 0.5
+
+    # Left and right ends of each row span from the edges crossing it
+    left = np.full(len(tri), np.inf)
+    right = np.full(len(tri), -np.inf)
+    tx, ty = x[tri], y[tri]
+    for i, j in ((0, 1), (1, 2), (2, 0)):
+        y0, y1 = ty[:, i], ty[:, j]
+        crossing = (yc >= np.minimum(y0, y1)) & (yc < np.maximum(y0, y1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xe = tx[:, i] + (yc - y0) * (tx[:, j] - tx[:, i]) / (y1 - y0)
+        left = np.where(crossing, np.minimum(left, xe), left)
+        right = np.where(crossing, np.maximum(right, xe), right)
+    start = np.clip(np.ceil(left - 0.5), 0, width).astype(np.int64)
+    end = np.clip(np.floor(right - 0.5), -1, width - 1).astype(np.int64)
+    lengths = np.maximum(end - start + 1, 0)
+
+    # Reciprocal depth is linear in screen space: start value and step per span
+    ax, ay, bx, by = x[:, 1] - x[:, 0], y[:, 1] - y[:, 0], x[:, 2] - x[:, 0], y[:, 2] - y[:, 0]
+    aw, bw = w[:, 1] - w[:, 0], w[:, 2] - w[:, 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        det = ax * by - ay * bx
+        gx = (aw * by - bw * ay) / det
+        gy = (bw * ax - aw * bx) / det
+    span_w = w[tri, 0] + gx[tri] * (start + 0.5 - x[tri, 0]) + gy[tri] * (yc - y[tri, 0])
+
+    offset = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    pixel = np.repeat(row * width + start, lengths) + offset
+    depth = np.repeat(span_w, lengths) + np.repeat(gx[tri], lengths) * offset
+    nearest = np.zeros(width * height)
+    np.maximum.at(nearest, pixel, depth)
+    front = depth >= nearest[pixel]
+    image = np.zeros(width * height, dtype=np.uint32)
+    image[pixel[front]] = np.repeat(colors[tri], lengths)[front]
+    return image.reshape(height, width)
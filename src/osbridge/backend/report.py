@@ -0,0 +1,390 @@
+"""
+Design report generation for Highway Bridge Design.
+A report is a stream of blocks (headings, paragraphs, tables, figures)
+produced section by section: inputs, 3D model, loads, analysis results
+and design checks. ReportWriter writes each block to HTML or LaTeX as
+soon as it and the blocks before it are ready; tables and figures are
+rendered in a pool of worker processes while later sections are still
+being produced, and their fragments are cached by content, so a rerun
+with unchanged inputs writes them without rendering again. Model views
+come in already rendered from snapshots.SnapshotRenderer, which caches
+them by geometry. PDF reports are the LaTeX report run through pdflatex.
+"""
+import base64
+import collections
+import hashlib
+import html
+import multiprocessing
+import os
+import pickle
+import shutil
+import subprocess
+import tempfile
+from collections import namedtuple
+from concurrent.futures import Future, ProcessPoolExecutor
+
+import numpy as np
+
+from .model import format_value
+from .raster import OPAQUE, rgb, rasterize
+from .schema import INPUT_SCHEMA
+from .snapshots import encode_png
+
+
+Heading = namedtuple("Heading", "level text")
+Paragraph = namedtuple("Paragraph", "text")
+Table = namedtuple("Table", "caption header rows")  # rows: sequence of sequences of str
+Figure = namedtuple("Figure", "caption render args")  # render(*args) returns PNG; a module-level function
+Image = namedtuple("Image", "caption png")  # Figure rendered and cached elsewhere, e.g. a model snapshot
+
+# Tables with fewer cells are rendered in the writing process, where they
+# cost less than sending them to a worker
+INLINE_CELLS = 4000
+# Blocks the writer may run ahead of the last written one, per worker
+LOOKAHEAD = 8
+CACHE_BYTES = 64 * 2 ** 20  # Rendered fragments kept for reruns
+
+DIAGRAM_SIZE = (900, 260)  # px
+DIAGRAM_COLORS = ("#428bca", "#d9534f")  # Fill of the max and the min envelope
+DIAGRAM_MARGIN = 12  # px
+TOP_CHECKS = 25  # Rows of the most critical checks table
+
+
+def render_diagram(stations, upper, lower, size=DIAGRAM_SIZE):
+    """PNG of a max/min envelope along a member, filled between each curve and zero"""
+    width, height = size
+    stations = np.asarray(stations, dtype=np.float64)
+    span = max(stations[-1] - stations[0], 1e-9) if len(stations) else 1.0
+    extent = max(float(np.abs(upper).max(initial=0.0)), float(np.abs(lower).max(initial=0.0)), 1e-9)
+    scale_x = (width - 2 * DIAGRAM_MARGIN) / span
+    scale_y = (height / 2 - DIAGRAM_MARGIN) / extent
+    triangles, colors = [], []
+    for values, color in zip((upper, lower), DIAGRAM_COLORS):
+        x = DIAGRAM_MARGIN + (stations - stations[0]) * scale_x
+        y = height / 2 - np.asarray(values, dtype=np.float64) * scale_y
+        x0, x1, y0, y1 = x[:-1], x[1:], y[:-1], y[1:]
+        axis = np.full_like(x0, height / 2)
+        # Two triangles per interval between the curve and the axis
+        triangles += [np.stack((np.column_stack((x0, x0, x1)), np.column_stack((axis, y0, y1))), axis=-1),
+                      np.stack((np.column_stack((x0, x1, x1)), np.column_stack((axis, y1, axis))), axis=-1)]
+        red, green, blue = rgb(color)
+        colors.append(np.full(2 * len(x0), OPAQUE | (red << 16) | (green << 8) | blue, dtype=np.uint32))
+    # Zero line, one pixel high, over the fill
+    left, right, middle = DIAGRAM_MARGIN, width - DIAGRAM_MARGIN, height / 2
+    triangles.append(np.array([[(left, middle - 0.5), (right, middle - 0.5), (right, middle + 0.5)],
+                               [(left, middle - 0.5), (right, middle + 0.5), (left, middle + 0.5)]]))
+    colors.append(np.full(2, OPAQUE | 0x333333, dtype=np.uint32))
+    triangles, colors = np.concatenate(triangles), np.concatenate(colors)
+    # Later triangles are drawn nearer, so the zero line stays on top
+    depth = np.repeat(np.arange(1, len(triangles) + 1, dtype=np.float64)[:, None], 3, axis=1)
+    image = rasterize(triangles[..., 0], triangles[..., 1], depth, colors, width, height)
+    return encode_png(np.where(image != 0, image, OPAQUE | 0xFFFFFF).astype(np.uint32))
+
+
+def number_cells(values, decimals=2):
+    """Text of every value of an array, formatted at once"""
+    return np.char.mod(f"%.{decimals}f", np.asarray(values, dtype=np.float64))
+
+
+def input_section(inputs):
+    yield Heading(1, "Design Inputs")
+    rows = [(spec.label, format_value(inputs.get(spec.key))) for spec in INPUT_SCHEMA
+            if inputs.get(spec.key) not in (None, "")]
+    yield Table("Design inputs", ("Input", "Value"), rows)
+
+
+def model_section(snapshots):
+    yield Heading(1, "3D Model")
+    for view, png in snapshots.items():
+        yield Image(f"Bridge model, {view}", png)
+
+
+def load_section(results):
+    yield Heading(1, "Loads")
+    yield Paragraph(f"{len(results.combinations)} load combinations were analysed over "
+                    f"{len(results.members)} members.")
+    peaks = np.abs(results.values).max(axis=(0, 1))
+    rows = np.column_stack((results.combinations, number_cells(peaks)))
+    yield Table("Peak member actions of each load combination (absolute)", ("Combination",) + results.components,
+                rows.tolist())
+
+
+def analysis_section(results):
+    yield Heading(1, "Analysis Results")
+    envelope = results.envelope()
+    header = ("Member",) + tuple(f"{component} {label}" for component in results.components
+                                 for label in ("max", "min"))
+    peaks = np.stack((envelope[:, :, 0].max(axis=1), envelope[:, :, 1].min(axis=1)), axis=2)
+    rows = np.column_stack((results.members, number_cells(peaks.reshape(len(results.members), -1))))
+    yield Table("Envelope of member actions over all load combinations", header, rows.tolist())
+    plotted = "Mz" if "Mz" in results.components else results.components[0]
+    component = results.components.index(plotted)
+    stations = number_cells(results.stations)
+    for member, member_envelope in zip(results.members, envelope):
+        yield Heading(2, member)
+        upper, lower = member_envelope[:, 0, component], member_envelope[:, 1, component]
+        yield Figure(f"{member}: {plotted} envelope, max {upper.max():.2f}, min {lower.min():.2f}",
+                     render_diagram, (results.stations, upper, lower))
+        cells = number_cells(member_envelope.reshape(len(results.stations), -1))
+        yield Table(f"{member}: envelope at each station", ("Station (m)",) + header[1:],
+                    np.column_stack((stations, cells)).tolist())
+
+
+def check_section(checks):
+    yield Heading(1, "Design Checks")
+    ratio, check, combination = checks.controlling()
+    member_ratio = ratio.max(axis=1)
+    failing = int((member_ratio > 1.0).sum())
+    yield Paragraph(f"Maximum utilization {member_ratio.max(initial=0.0):.3f}; "
+                    f"{failing} of {len(checks.members)} members exceed a utilization of 1.")
+    header = ("Member", "Girder", "Station (m)", "Combination", "Check", "Utilization")
+    rows = [(result.member, result.girder, f"{result.station:.2f}", result.combination, result.check,
+             f"{result.utilization:.3f}") for result in checks.top_k(TOP_CHECKS)]
+    yield Table(f"The {len(rows)} most critical checks", header, rows)
+    station = ratio.argmax(axis=1)
+    members = np.arange(len(checks.members))
+    rows = [(member, girder, f"{checks.stations[at]:.2f}", checks.combinations[load], checks.checks[clause],
+             f"{value:.3f}", "Fails" if value > 1.0 else "OK")
+            for member, girder, at, load, clause, value in zip(
+                checks.members, checks.girders, station.tolist(), combination[members, station].tolist(),
+                check[members, station].tolist(), member_ratio.tolist())]
+    yield Table("Controlling check of each member", header + ("Status",), rows)
+
+
+def design_report(inputs, snapshots, results=None, checks=None):
+    """Blocks of the design report, section by section; sections without data are left out.
+
+    snapshots -- PNG of each view of the 3D model as {view: bytes}, as from
+                 BackendOsBridge.model_snapshots()
+    """
+    yield from input_section(inputs)
+    yield from model_section(snapshots)
+    if results is not None:
+        yield from load_section(results)
+        yield from analysis_section(results)
+    if checks is not None:
+        yield from check_section(checks)
+
+
+class HtmlFormat:
+    """Single-file HTML; figures are embedded as PNG data"""
+
+    extension = ".html"
+
+    @staticmethod
+    def begin(title):
+        return (f"<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>{html.escape(title)}</title>\n"
+                "<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;margin:1em 0}"
+                "th,td{border:1px solid #999;padding:2px 6px;text-align:right}th:first-child,td:first-child"
+                "{text-align:left}caption{font-weight:bold;text-align:left}img{max-width:100%}</style>\n"
+                f"</head>\n<body>\n<h1>{html.escape(title)}</h1>\n")
+
+    @staticmethod
+    def end():
+        return "</body>\n</html>\n"
+
+    @staticmethod
+    def heading(level, text):
+        return f"<h{level + 1}>{html.escape(text)}</h{level + 1}>\n"
+
+    @staticmethod
+    def paragraph(text):
+        return f"<p>{html.escape(text)}</p>\n"
+
+    @staticmethod
+    def table(caption, header, rows):
+        head = "".join(f"<th>{html.escape(str(cell))}</th>" for cell in header)
+        body = "\n".join("<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + "</tr>"
+                         for row in rows)
+        return f"<table>\n<caption>{html.escape(caption)}</caption>\n<tr>{head}</tr>\n{body}\n</table>\n"
+
+    @staticmethod
+    def figure(caption, image, directory, number):
+        data = base64.b64encode(image).decode("ascii")
+        return (f"<figure><img src=\"data:image/png;base64,{data}\" alt=\"{html.escape(caption, quote=True)}\">"
+                f"<figcaption>Figure {number}: {html.escape(caption)}</figcaption></figure>\n")
+
+
+LATEX_SPECIAL = {"&": r"\&", "%": r"\%", "$": r"\$", "#": r"\#", "_": r"\_", "{": r"\{", "}": r"\}",
+                 "~": r"\textasciitilde{}", "^": r"\textasciicircum{}", "\\": r"\textbackslash{}"}
+LATEX_ESCAPE = str.maketrans(LATEX_SPECIAL)
+
+
+class LatexFormat:
+    """LaTeX article; long tables break across pages and figures are PNG files next to the .tex file"""
+
+    extension = ".tex"
+
+    @staticmethod
+    def begin(title):
+        return ("\\documentclass[a4paper,10pt]{article}\n\\usepackage[margin=2cm]{geometry}\n"
+                "\\usepackage{graphicx}\n\\usepackage{longtable}\n\\usepackage{booktabs}\n"
+                f"\\title{{{title.translate(LATEX_ESCAPE)}}}\n\\date{{\\today}}\n"
+                "\\begin{document}\n\\maketitle\n")
+
+    @staticmethod
+    def end():
+        return "\\end{document}\n"
+
+    @staticmethod
+    def heading(level, text):
+        command = ("section", "subsection", "subsubsection")[min(level, 3) - 1]
+        return f"\\{command}{{{text.translate(LATEX_ESCAPE)}}}\n"
+
+    @staticmethod
+    def paragraph(text):
+        return text.translate(LATEX_ESCAPE) + "\n\n"
+
+    @staticmethod
+    def table(caption, header, rows):
+        columns = "l" + "r" * (len(header) - 1)
+        head = " & ".join(str(cell).translate(LATEX_ESCAPE) for cell in header)
+        body = "".join(" & ".join(str(cell).translate(LATEX_ESCAPE) for cell in row) + " \\\\\n" for row in rows)
+        size = "\\footnotesize\n" if len(header) > 8 else ""
+        return (f"{{{size}\\begin{{longtable}}{{{columns}}}\n\\caption{{{caption.translate(LATEX_ESCAPE)}}}\\\\\n"
+                f"\\toprule\n{head} \\\\\n\\midrule\n\\endhead\n{body}\\bottomrule\n\\end{{longtable}}}}\n")
+
+    @staticmethod
+    def figure(caption, image, directory, number):
+        name = f"figure-{number}.png"
+        with open(os.path.join(directory, name), "wb") as stream:
+            stream.write(image)
+        return ("\\begin{figure}[htbp]\n\\centering\n"
+                f"\\includegraphics[width=\\linewidth]{{{name}}}\n"
+                f"\\caption{{{caption.translate(LATEX_ESCAPE)}}}\n\\end{{figure}}\n")
+
+
+REPORT_FORMATS = {".html": HtmlFormat, ".tex": LatexFormat}
+
+
+def render_table(format_name, table):
+    """Markup of a Table; runs in the worker processes for large tables"""
+    return REPORT_FORMATS[format_name].table(*table)
+
+
+def render_figure(figure):
+    """PNG of a Figure; runs in the worker processes"""
+    return figure.render(*figure.args)
+
+
+def block_key(format_name, block):
+    """Cache key of the rendered fragment of a table or figure: a digest of its content"""
+    data = pickle.dumps((format_name, block) if isinstance(block, Table) else block, protocol=5)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ReportWriter:
+    """Writes report blocks to HTML, LaTeX or PDF, rendering tables and figures concurrently.
+
+    workers -- worker processes, None for one per CPU; 0 renders in the
+               writing process
+    Rendered tables and figures are kept by content in an LRU cache of up
+    to CACHE_BYTES, shared by every report this writer produces; Images
+    are written as given, their cache being the renderer's. Worker
+    processes are spawned on first use, as for snapshots.SnapshotRenderer.
+    """
+
+    __slots__ = ("workers", "cache", "cache_size", "pool")
+
+    def __init__(self, workers=None):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.cache = collections.OrderedDict()  # Key -> str or PNG bytes, least recently used first
+        self.cache_size = 0
+        self.pool = None
+
+    def write(self, blocks, path, title="Design Report"):
+        """Write blocks to path, in the format given by its extension (.html, .tex or .pdf)"""
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".pdf":
+            self.write_pdf(blocks, path, title)
+            return
+        if extension not in REPORT_FORMATS:
+            raise ValueError(f"Cannot write a report to {extension or 'a file without extension'}; "
+                             f"use one of {', '.join(REPORT_FORMATS)} or .pdf")
+        directory = os.path.dirname(os.path.abspath(path))
+        report_format = REPORT_FORMATS[extension]
+        with open(path, "w", encoding="utf-8") as stream:
+            stream.write(report_format.begin(title))
+            for text in self.fragments(blocks, extension, directory):
+                stream.write(text)
+            stream.write(report_format.end())
+
+    def write_pdf(self, blocks, path, title):
+        compiler = shutil.which("pdflatex")
+        if compiler is None:
+            raise OSError("PDF reports need pdflatex (TeX Live or MiKTeX); save the report as .tex or .html instead")
+        with tempfile.TemporaryDirectory() as directory:
+            self.write(blocks, os.path.join(directory, "report.tex"), title)
+            # Twice, so longtable settles its column widths
+            for _ in range(2):
+                run = subprocess.run([compiler, "-interaction=nonstopmode", "-halt-on-error", "report.tex"],
+                                     cwd=directory, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            if run.returncode != 0:
+                raise OSError("pdflatex failed: " + run.stdout.decode("utf-8", "replace")[-2000:])
+            shutil.copyfile(os.path.join(directory, "report.pdf"), path)
+
+    def fragments(self, blocks, format_name, directory):
+        """Markup of each block, in order, while later blocks are still rendering"""
+        report_format = REPORT_FORMATS[format_name]
+        pending = collections.deque()  # (block, key, future or finished fragment)
+        figures = 0
+        limit = LOOKAHEAD * max(self.workers, 1)
+
+        def finish(block, key, result):
+            nonlocal figures
+            value = result.result() if isinstance(result, Future) else result
+            if key is not None:
+                self.remember(key, value)
+            if isinstance(block, (Figure, Image)):
+                figures += 1
+                return report_format.figure(block.caption, value, directory, figures)
+            return value
+
+        for block in blocks:
+            pending.append(self.submit(block, format_name))
+            while pending and (len(pending) > limit or not isinstance(pending[0][2], Future)
+                               or pending[0][2].done()):
+                yield finish(*pending.popleft())
+        while pending:
+            yield finish(*pending.popleft())
+
+    def submit(self, block, format_name):
+        """(block, cache key, fragment or future) of a block, rendering it or starting its render"""
+        report_format = REPORT_FORMATS[format_name]
+        if isinstance(block, Heading):
+            return block, None, report_format.heading(block.level, block.text)
+        if isinstance(block, Paragraph):
+            return block, None, report_format.paragraph(block.text)
+        if isinstance(block, Image):
+            return block, None, block.png
+        key = block_key(format_name, block)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return block, key, self.cache[key]
+        if isinstance(block, Table):
+            cells = len(block.rows) * len(block.header)
+            if cells < INLINE_CELLS or self.workers == 0:
+                return block, key, render_table(format_name, block)
+            return block, key, self.executor().submit(render_table, format_name, block)
+        if self.workers == 0:
+            return block, key, render_figure(block)
+        return block, key, self.executor().submit(render_figure, block)
+
+    def executor(self):
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self.pool
+
+    def remember(self, key, fragment):
+        if key in self.cache:
+            return
+        self.cache[key] = fragment
+        self.cache_size += len(fragment)
+        while self.cache_size > CACHE_BYTES and len(self.cache) > 1:
+            self.cache_size -= len(self.cache.popitem(last=False)[1])
+
+    def close(self):
+        """Stop the worker processes; they are started again when needed"""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
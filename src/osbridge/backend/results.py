@@ -0,0 +1,57 @@
+"""
+Analysis results of Highway Bridge Design held as NumPy arrays.
+All force, moment and deflection values live in one float array indexed
+[member, station, combination, component]; views such as the results table
+read from it through index arrays instead of per-value Python objects.
+"""
+import numpy as np
+
+
+COMPONENTS = ("Fx", "Fy", "Fz", "Mx", "My", "Mz", "Dx", "Dy", "Dz")
+
+# Load combination choices besides the individual combinations
+ENVELOPE = "Envelope"
+ENVELOPE_LABELS = ("Max", "Min")
+ALL_COMBINATIONS = "All Combinations"
+
+
+class AnalysisResults:
+    """Member results for every station, load combination and component.
+
+    values       -- array of shape (members, stations, combinations, components)
+    members      -- member names, e.g. "G1"
+    combinations -- load combination names
+    stations     -- station positions along each member (m); 0, 1, ... by default
+    """
+
+    def __init__(self, values, members, combinations, stations=None, components=COMPONENTS):
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 4:
+            raise ValueError(f"Results must be indexed [member, station, combination, component], got {values.ndim} axes")
+        self.values = values
+        self.members = tuple(str(member) for member in members)
+        self.combinations = tuple(str(combination) for combination in combinations)
+        self.components = tuple(components)
+        if stations is None:
+            stations = np.arange(values.shape[1], dtype=np.float64)
+        self.stations = np.asarray(stations, dtype=np.float64)
+        expected = (len(self.members), len(self.stations), len(self.combinations), len(self.components))
+        if values.shape != expected:
+            raise ValueError(f"Results shape {values.shape} does not match labels {expected}")
+        self._envelope = None
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def member_index(self, name):
+        return self.members.index(name)
+
+    def combination_index(self, name):
+        return self.combinations.index(name)
+
+    def envelope(self):
+        """Max and min over all combinations, shape (members, stations, 2, components)"""
+        if self._envelope is None:
+            self._envelope = np.stack((self.values.max(axis=2), self.values.min(axis=2)), axis=2)
+        return self._envelope
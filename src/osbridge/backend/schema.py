@@ -0,0 +1,235 @@
+"""
+Input schema registry for Highway Bridge Design.
+Field specifications are compiled once at import into an immutable registry
+shared by UI building, the input model, validation and batch input parsing.
+"""
+from collections import namedtuple
+from types import MappingProxyType
+
+from .common import *
+
+
+# Material grades are looked up once, not on every input_values() call
+MATERIAL_VALUES = tuple(connectdb("Material"))
+
+VALIDATOR_NONE = 'No Validator'
+VALIDATOR_DOUBLE = 'Double Validator'
+VALIDATOR_INT = 'Int Validator'
+
+
+FieldSpec = namedtuple(
+    "FieldSpec",
+    "key label type values default minimum maximum decimals",
+    defaults=(None, None, None, None, None),
+)
+FieldSpec.__doc__ = """Specification of one input: type, allowed values or bounds and default"""
+
+
+def field(key, label, value_type, values=None, default=None, minimum=None, maximum=None, decimals=None):
+    """Build a FieldSpec; combobox fields default to their first value"""
+    if values is not None:
+        values = tuple(values)
+        if default is None:
+            default = values[0]
+    return FieldSpec(key, label, value_type, values, default, minimum, maximum, decimals)
+
+
+FIELD_SPECS = (
+    # Basic inputs
+    field(KEY_STRUCTURE_TYPE, KEY_DISP_STRUCTURE_TYPE, str, VALUES_STRUCTURE_TYPE),
+    field(KEY_PROJECT_LOCATION, KEY_DISP_PROJECT_LOCATION, str, VALUES_PROJECT_LOCATION),
+    field(KEY_SPAN, KEY_DISP_SPAN, float, minimum=SPAN_MIN, maximum=SPAN_MAX, decimals=2),
+    field(KEY_CARRIAGEWAY_WIDTH, KEY_DISP_CARRIAGEWAY_WIDTH, float, minimum=CARRIAGEWAY_WIDTH_MIN, maximum=100.0, decimals=2),
+    field(KEY_FOOTPATH, KEY_DISP_FOOTPATH, str, VALUES_FOOTPATH),
+    field(KEY_SKEW_ANGLE, KEY_DISP_SKEW_ANGLE, float, default=SKEW_ANGLE_DEFAULT,
+          minimum=SKEW_ANGLE_MIN, maximum=SKEW_ANGLE_MAX, decimals=1),
+    field(KEY_GIRDER, KEY_DISP_GIRDER, str, MATERIAL_VALUES),
+    field(KEY_CROSS_BRACING, KEY_DISP_CROSS_BRACING, str, MATERIAL_VALUES),
+    field(KEY_DECK_CONCRETE_GRADE_BASIC, KEY_DISP_DECK, str, VALUES_DECK_CONCRETE_GRADE),
+
+    # Typical section details: layout
+    field(KEY_GIRDER_SPACING, "Girder Spacing (m)", float, default=DEFAULT_GIRDER_SPACING,
+          minimum=0.01, maximum=50.0, decimals=3),
+    field(KEY_NO_OF_GIRDERS, "No. of Girders", int, minimum=2, maximum=100),
+    field(KEY_DECK_OVERHANG, "Deck Overhang Width (m)", float, default=DEFAULT_DECK_OVERHANG,
+          minimum=0.0, maximum=10.0, decimals=3),
+    field(KEY_NO_OF_SPANS, "No. of Spans", int, default=1, minimum=1, maximum=NO_OF_SPANS_MAX),
+
+    # Typical section details: deck
+    field(KEY_DECK_THICKNESS, "Deck Thickness (mm)", float, minimum=0.0, maximum=500.0, decimals=0),
+    field(KEY_DECKING_PLATE, "Decking Plate", str, VALUES_DECKING_PLATE),
+    field(KEY_FOOTPATH_WIDTH, "Footpath Width (m)", float, minimum=MIN_FOOTPATH_WIDTH, maximum=5.0, decimals=3),
+    field(KEY_FOOTPATH_THICKNESS, "Footpath Thickness (mm)", float, minimum=0.0, maximum=500.0, decimals=0),
+    field(KEY_SAFETY_KERB_THICKNESS, "Safety Kerb Thickness (mm)", float, minimum=0.0, maximum=500.0, decimals=0),
+    field(KEY_SAFETY_KERB_WIDTH, "Safety Kerb Width (m)", float, minimum=MIN_SAFETY_KERB_WIDTH, maximum=2.0, decimals=3),
+    field(KEY_DECK_LOAD_CASE, "Deck Load Case", str, VALUES_LOAD_CASE),
+
+    # Typical section details: crash barrier
+    field(KEY_CRASH_BARRIER_TYPE, "Crash Barrier Type", str, VALUES_CRASH_BARRIER_TYPE),
+    field(KEY_CRASH_BARRIER_WIDTH, "Crash Barrier Width (m)", float, default=DEFAULT_CRASH_BARRIER_WIDTH,
+          minimum=0.0, maximum=2.0, decimals=3),
+    field(KEY_CRASH_BARRIER_DENSITY, "Crash Barrier Material Density", float, minimum=0.0, maximum=100.0, decimals=2),
+    field(KEY_CRASH_BARRIER_AREA, "Crash Barrier Area (m2)", float, minimum=0.0, maximum=10.0, decimals=4),
+    field(KEY_CRASH_BARRIER_LOAD_CASE, "Crash Barrier Load Case", str, VALUES_LOAD_CASE, default=VALUES_LOAD_CASE[1]),
+
+    # Typical section details: railing
+    field(KEY_RAILING_WIDTH, "Railing Width", float, minimum=0.0, maximum=1000.0, decimals=1),
+    field(KEY_RAILING_HEIGHT, "Railing Height (mm)", float, minimum=0.0, maximum=2000.0, decimals=1),
+    field(KEY_RAILING_LOAD, "Railing Load (kN/m)", float, minimum=0.0, maximum=100.0, decimals=2),
+    field(KEY_RAILING_LOAD_CASE, "Railing Load Case", str, VALUES_LOAD_CASE, default=VALUES_LOAD_CASE[1]),
+
+    # Typical section details: wearing course
+    field(KEY_WEARING_COAT_MATERIAL, "Wearing Course Material", str, VALUES_WEARING_COAT_MATERIAL),
+    field(KEY_WEARING_COAT_DENSITY, "Wearing Coat Density (kN/m^3)", float, minimum=0.0, maximum=100.0, decimals=2),
+    field(KEY_WEARING_COAT_THICKNESS, "Wearing Coat Thickness (mm)", float, minimum=0.0, maximum=500.0, decimals=1),
+    field(KEY_WEARING_COAT_LOAD_CASE, "Wearing Coat Load Case", str, VALUES_LOAD_CASE, default=VALUES_LOAD_CASE[2]),
+
+    # Typical section details: lanes
+    field(KEY_NO_OF_LANES, "No. of Lanes", str, VALUES_NO_OF_LANES),
+    field(KEY_LANE_WIDTH, "Lane Width (m)", float, minimum=0.0, maximum=20.0, decimals=2),
+
+    # Member properties: girder section
+    field(KEY_GIRDER_DEPTH, "Total Depth (mm)", float, default=DEFAULT_GIRDER_DEPTH,
+          minimum=300.0, maximum=5000.0, decimals=0),
+    field(KEY_GIRDER_WEB_THICKNESS, "Web Thickness (mm)", float, default=DEFAULT_WEB_THICKNESS,
+          minimum=6.0, maximum=50.0, decimals=0),
+    field(KEY_GIRDER_TOP_FLANGE_WIDTH, "Width of Top Flange (mm)", float, default=DEFAULT_FLANGE_WIDTH,
+          minimum=100.0, maximum=2000.0, decimals=0),
+    field(KEY_GIRDER_TOP_FLANGE_THICKNESS, "Top Flange Thickness (mm)", float, default=DEFAULT_FLANGE_THICKNESS,
+          minimum=6.0, maximum=100.0, decimals=0),
+    field(KEY_GIRDER_BOTTOM_FLANGE_WIDTH, "Width of Bottom Flange (mm)", float, default=DEFAULT_FLANGE_WIDTH,
+          minimum=100.0, maximum=2000.0, decimals=0),
+    field(KEY_GIRDER_BOTTOM_FLANGE_THICKNESS, "Bottom Flange Thickness (mm)", float,
+          default=DEFAULT_FLANGE_THICKNESS, minimum=6.0, maximum=100.0, decimals=0),
+
+    # Member properties: stiffeners
+    field(KEY_STIFFENER_DESIGN_METHOD, "Stiffener Design Method", str, VALUES_STIFFENER_DESIGN),
+    field(KEY_STIFFENER_PLATE_THICKNESS, "Stiffener Plate Thickness (mm)", str, VALUES_THICKNESS_MODE),
+    field(KEY_STIFFENER_SPACING, "Stiffener Spacing (mm)", float, minimum=0.0, maximum=100000.0, decimals=2),
+    field(KEY_LONGITUDINAL_STIFFENER, "Longitudinal Stiffener", str, VALUES_YES_NO),
+    field(KEY_LONGITUDINAL_STIFFENER_THICKNESS, "Longitudinal Stiffener Thickness", str, VALUES_THICKNESS_MODE),
+
+    # Member properties: cross-bracing
+    field(KEY_CROSS_BRACING_TYPE, "Type of Bracing", str, VALUES_CROSS_BRACING_TYPE),
+    field(KEY_CROSS_BRACING_SECTION, "Bracing Section", str, VALUES_CROSS_BRACING_SECTION),
+    field(KEY_BRACKET_SECTION, "Bracket Section", str, VALUES_BRACKET_SECTION),
+    field(KEY_CROSS_BRACING_SPACING, "Cross-Bracing Spacing (mm)", float, minimum=0.0, maximum=100000.0, decimals=2),
+
+    # Member properties: end diaphragm
+    field(KEY_END_DIAPHRAGM_TYPE, "End Diaphragm Type", str, VALUES_END_DIAPHRAGM_TYPE),
+    field(KEY_END_DIAPHRAGM_SECTION, "End Diaphragm Section", str, VALUES_END_DIAPHRAGM_SECTION),
+    field(KEY_END_DIAPHRAGM_SPACING, "End Diaphragm Spacing (mm)", float, minimum=0.0, maximum=100000.0, decimals=2),
+)
+
+# Basic input panel layout: section titles followed by their field keys
+INPUT_LAYOUT = (
+    (KEY_MODULE, KEY_DISP_FINPLATE, TYPE_MODULE),
+    (None, DISP_TITLE_STRUCTURE, TYPE_TITLE),
+    KEY_STRUCTURE_TYPE,
+    (None, DISP_TITLE_PROJECT, TYPE_TITLE),
+    KEY_PROJECT_LOCATION,
+    (None, DISP_TITLE_GEOMETRIC, TYPE_TITLE),
+    KEY_SPAN,
+    KEY_CARRIAGEWAY_WIDTH,
+    KEY_FOOTPATH,
+    KEY_SKEW_ANGLE,
+    (None, DISP_TITLE_MATERIAL, TYPE_TITLE),
+    KEY_GIRDER,
+    KEY_CROSS_BRACING,
+    KEY_DECK_CONCRETE_GRADE_BASIC,
+)
+
+
+def parse_value(value_type, value):
+    """Convert raw widget text or a python value to the field type; None if not parseable"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        if value == "":
+            return None
+    try:
+        if value_type is int:
+            return int(float(value))
+        return value_type(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def compile_check(spec):
+    """Return a function value -> bool for the spec's bounds or allowed values"""
+    if spec.values is not None:
+        allowed = frozenset(spec.values)
+        return lambda value: value is None or value in allowed
+    low = float("-inf") if spec.minimum is None else spec.minimum
+    high = float("inf") if spec.maximum is None else spec.maximum
+    return lambda value: value is None or low <= value <= high
+
+
+def widget_validator(spec):
+    """Validator name used in the input_values() tuples"""
+    if spec.type is float:
+        return VALIDATOR_DOUBLE
+    if spec.type is int:
+        return VALIDATOR_INT
+    return VALIDATOR_NONE
+
+
+class InputSchema:
+    """Immutable registry of the compiled field specifications.
+
+    Lookups by key are plain dict accesses; parsers, bound checks, defaults
+    and the input_values() tuples are all built once when the registry is
+    created.
+    """
+
+    __slots__ = ("specs", "types", "defaults", "checks", "input_values")
+
+    def __init__(self, specs, layout):
+        self.specs = MappingProxyType({spec.key: spec for spec in specs})
+        self.types = MappingProxyType({spec.key: spec.type for spec in specs})
+        self.defaults = MappingProxyType({spec.key: spec.default for spec in specs})
+        self.checks = MappingProxyType({spec.key: compile_check(spec) for spec in specs})
+        self.input_values = tuple(self.compile_layout(layout))
+
+    def compile_layout(self, layout):
+        for entry in layout:
+            if isinstance(entry, tuple):
+                key, label, entry_type = entry
+                yield (key, label, entry_type, None, True, VALIDATOR_NONE)
+                continue
+            spec = self.specs[entry]
+            entry_type = TYPE_COMBOBOX if spec.values is not None else TYPE_TEXTBOX
+            yield (spec.key, spec.label, entry_type, spec.values, True, widget_validator(spec))
+
+    def __getitem__(self, key):
+        return self.specs[key]
+
+    def __contains__(self, key):
+        return key in self.specs
+
+    def __iter__(self):
+        return iter(self.specs.values())
+
+    def parse(self, key, value):
+        """Parse value to the type of key (str for unknown keys)"""
+        return parse_value(self.types.get(key, str), value)
+
+    def check(self, key, value):
+        """True if an already parsed value is within the field's bounds or values"""
+        check = self.checks.get(key)
+        return check is None or check(value)
+
+    def parse_record(self, record):
+        """Parse a mapping of raw values into a complete typed record with defaults"""
+        parsed = dict(self.defaults)
+        for key, value in record.items():
+            parsed[key] = self.parse(key, value)
+        return parsed
+
+    def parse_records(self, records):
+        """Parse an iterable of raw records (e.g. csv.DictReader rows)"""
+        return [self.parse_record(record) for record in records]
+
+
+INPUT_SCHEMA = InputSchema(FIELD_SPECS, INPUT_LAYOUT)
@@ -0,0 +1,198 @@
+"""
+Offscreen snapshots of the 3D bridge model for design reports: plan,
+elevation and isometric views, rendered orthographically with the NumPy
+rasterizer of backend.raster, so they need neither a display nor a GPU.
+Missing views are rendered in a pool of worker processes and encoded as
+PNG. Images are cached by a hash of the geometry and the view, in memory
+and optionally on disk, so a batch of reports over a design sweep only
+renders the views whose geometry changed.
+"""
+import collections
+import hashlib
+import multiprocessing
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .raster import COMPONENT_COLORS, DEFAULT_COLOR, OPAQUE, rgb, tessellate, shade, rasterize
+
+
+# Right and up unit vectors of each view, looking along up x right
+SNAPSHOT_VIEWS = {
+    "plan": ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0)),
+    "elevation": ((1.0, 0.0, 0.0), (0.0, 0.0, 1.0)),
+    "isometric": ((2 ** -0.5, -2 ** -0.5, 0.0), (6 ** -0.5, 6 ** -0.5, 2 * 6 ** -0.5)),
+}
+SNAPSHOT_SIZE = (1200, 600)  # px
+SNAPSHOT_MARGIN = 0.04  # Fraction of the image left around the model
+BACKGROUND = 0xFFFFFF
+# zlib level of the PNG data: level 1 compresses flat shaded images about 2.5x
+# faster than the default 6, for files about twice the size
+PNG_COMPRESSION = 1
+
+CACHE_LIMIT = 64  # Images kept in memory
+CACHE_VERSION = b"2"  # Bump when rendering changes, so disk caches are not reused
+
+
+def geometry_hash(components):
+    """Digest of the names, meshes and instance transforms of components"""
+    digest = hashlib.blake2b(CACHE_VERSION, digest_size=16)
+    for component in components:
+        digest.update(component.name.encode("utf-8"))
+        for array in (component.mesh.vertices, component.mesh.faces, component.transforms):
+            digest.update(struct.pack("<I", array.size))
+            digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+def snapshot_key(geometry, view, size):
+    """Cache key of one view of a geometry_hash at size (width, height)"""
+    return f"{geometry}-{view}-{size[0]}x{size[1]}"
+
+
+def render_view(components, view, size=SNAPSHOT_SIZE):
+    """ARGB image (height, width) uint32 of components in one of SNAPSHOT_VIEWS, fitted to size"""
+    width, height = size
+    right, up = (np.array(axis) for axis in SNAPSHOT_VIEWS[view])
+    axes = np.stack((right, up, np.cross(up, right)))
+    triangles, normals, colors = [], [], []
+    for component in components:
+        if not len(component):
+            continue
+        component_triangles, component_normals = tessellate(component.mesh, component.transforms)
+        triangles.append(component_triangles.reshape(-1, 3, 3))
+        normals.append(component_normals.reshape(-1, 3))
+        colors.append(np.tile(rgb(COMPONENT_COLORS.get(component.name, DEFAULT_COLOR)), (len(normals[-1]), 1)))
+    pixels = np.full((height, width), OPAQUE | BACKGROUND, dtype=np.uint32)
+    if not triangles:
+        return pixels
+    triangles, normals, colors = np.concatenate(triangles), np.concatenate(normals), np.concatenate(colors)
+    view_points = triangles @ axes.T
+    low, high = view_points.reshape(-1, 3).min(axis=0), view_points.reshape(-1, 3).max(axis=0)
+    facing = normals @ axes[2] < 0
+    view_points, normals, colors = view_points[facing], normals[facing], colors[facing]
+
+    scale = (1 - 2 * SNAPSHOT_MARGIN) * min(width / max(high[0] - low[0], 1e-9),
+                                            height / max(high[1] - low[1], 1e-9))
+    centre = (low + high) / 2
+    x = width / 2 + scale * (view_points[..., 0] - centre[0])
+    y = height / 2 - scale * (view_points[..., 1] - centre[1])
+    # Orthographic depth is linear on screen; rasterize keeps the largest value
+    nearness = high[2] - view_points[..., 2] + 1.0
+    image = rasterize(x, y, nearness, shade(normals, colors, axes), width, height)
+    covered = image != 0
+    pixels[covered] = image[covered]
+    return pixels
+
+
+def encode_png(pixels):
+    """PNG file contents of an ARGB image (height, width) uint32, as opaque RGB"""
+    height, width = pixels.shape
+    channels = np.stack(((pixels >> 16) & 0xFF, (pixels >> 8) & 0xFF, pixels & 0xFF), axis=-1).astype(np.uint8)
+    # Filter type 0 (none) at the start of every row
+    rows = np.concatenate((np.zeros((height, 1), dtype=np.uint8), channels.reshape(height, -1)), axis=1)
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(rows.tobytes(), PNG_COMPRESSION)) + chunk(b"IEND", b""))
+
+
+def render_png(job):
+    """PNG of one (components, view, size) job; runs in the worker processes"""
+    components, view, size = job
+    return encode_png(render_view(components, view, size))
+
+
+class SnapshotRenderer:
+    """Renders and caches PNG snapshots of models.
+
+    workers   -- worker processes, None for one per CPU; 0 renders in the
+                 calling process
+    directory -- folder of PNG files shared between runs, or None
+    Worker processes are spawned, not forked, so they do not inherit the
+    Qt state of the application, and are started on first use.
+    """
+
+    __slots__ = ("workers", "directory", "cache", "pool")
+
+    def __init__(self, workers=None, directory=None):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.directory = directory
+        self.cache = collections.OrderedDict()  # Key -> PNG, least recently used first
+        self.pool = None
+
+    def render(self, components, views=tuple(SNAPSHOT_VIEWS), size=SNAPSHOT_SIZE):
+        """PNG of each of views of one model, as {view: bytes}"""
+        return self.render_batch([components], views, size)[0]
+
+    def render_batch(self, models, views=tuple(SNAPSHOT_VIEWS), size=SNAPSHOT_SIZE):
+        """PNGs of views of several models, one {view: bytes} per model.
+
+        Models with the same geometry share their images, and views missing
+        from the caches are rendered concurrently.
+        """
+        models = [list(components) for components in models]
+        keys = [{view: snapshot_key(geometry_hash(components), view, size) for view in views}
+                for components in models]
+        images, jobs = {}, {}
+        for components, model_keys in zip(models, keys):
+            for view, key in model_keys.items():
+                if key in images or key in jobs:
+                    continue
+                image = self.cached(key)
+                if image is None:
+                    jobs[key] = (components, view, tuple(size))
+                else:
+                    images[key] = image
+        if len(jobs) > 1 and self.workers > 0:
+            if self.pool is None:
+                self.pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+            rendered = self.pool.map(render_png, jobs.values())
+        else:
+            rendered = map(render_png, jobs.values())
+        for key, image in zip(jobs, rendered):
+            images[key] = image
+            self.store(key, image)
+        return [{view: images[key] for view, key in model_keys.items()} for model_keys in keys]
+
+    def cached(self, key):
+        """Cached PNG of key, None when it has not been rendered"""
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        if self.directory is not None:
+            try:
+                with open(os.path.join(self.directory, key + ".png"), "rb") as stream:
+                    image = stream.read()
+            except OSError:
+                return None
+            self.remember(key, image)
+            return image
+        return None
+
+    def store(self, key, image):
+        self.remember(key, image)
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            # Written under a temporary name, so concurrent runs never read half a file
+            path = os.path.join(self.directory, key + ".png")
+            with open(f"{path}.{os.getpid()}.tmp", "wb") as stream:
+                stream.write(image)
+            os.replace(f"{path}.{os.getpid()}.tmp", path)
+
+    def remember(self, key, image):
+        self.cache[key] = image
+        self.cache.move_to_end(key)
+        while len(self.cache) > CACHE_LIMIT:
+            self.cache.popitem(last=False)
+
+    def close(self):
+        """Stop the worker processes; they are started again when needed"""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
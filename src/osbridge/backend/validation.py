@@ -0,0 +1,279 @@
+"""
+Declarative validation of Highway Bridge Design inputs.
+Each IRC 5 / IRC 6 / IRC 24 requirement is a rule over input keys; the same
+rules validate a single input model or thousands of batch records at once.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .common import *
+from .geometry import overall_bridge_width_columns
+from .schema import INPUT_SCHEMA
+
+
+SEVERITY_ERROR = "error"
+SEVERITY_WARNING = "warning"
+
+# Derived quantities rules can depend on, with the input keys they are computed from
+DERIVED_OVERALL_WIDTH = "Overall Bridge Width"
+DERIVED_VALUES = {
+    DERIVED_OVERALL_WIDTH: (
+        (KEY_CARRIAGEWAY_WIDTH, KEY_FOOTPATH, KEY_FOOTPATH_WIDTH, KEY_CRASH_BARRIER_WIDTH, KEY_RAILING_WIDTH),
+        overall_bridge_width_columns,
+    ),
+}
+
+
+Rule = namedtuple("Rule", "rule_id title clause keys requires applies check message severity")
+Rule.__doc__ = """A validation rule.
+
+keys     -- inputs (or derived values) the rule reads; the first key is the field it reports on
+requires -- numeric keys that must be set for the rule to apply
+applies  -- columns -> bool array, precondition for the rule (None: always)
+check    -- columns -> bool array, True where the inputs are acceptable
+message  -- text, or values -> text for a single record
+"""
+
+Diagnostic = namedtuple("Diagnostic", "rule_id title clause keys message severity")
+
+
+def rule(rule_id, title, clause, keys, check, message, requires=None, applies=None, severity=SEVERITY_ERROR):
+    """Build a Rule; by default every numeric key it reads must be set"""
+    keys = tuple(keys)
+    if requires is None:
+        requires = tuple(key for key in keys if INPUT_SCHEMA.types.get(key) in (int, float))
+    return Rule(rule_id, title, clause, keys, tuple(requires), applies, check, message, severity)
+
+
+def has_footpath(v):
+    return v[KEY_FOOTPATH] != "None"
+
+
+IRC_RULES = (
+    rule("span_required", "Missing Input", "Basic Inputs", (KEY_SPAN,),
+         requires=(), check=lambda v: ~np.isnan(v[KEY_SPAN]),
+         message="Span is required."),
+    rule("span_range", "Invalid Span", "Scope of design", (KEY_SPAN,),
+         check=lambda v: (v[KEY_SPAN] >= SPAN_MIN) & (v[KEY_SPAN] <= SPAN_MAX),
+         message=f"Span must be between {SPAN_MIN} m and {SPAN_MAX} m."),
+    rule("carriageway_required", "Missing Input", "Basic Inputs", (KEY_CARRIAGEWAY_WIDTH,),
+         requires=(), check=lambda v: ~np.isnan(v[KEY_CARRIAGEWAY_WIDTH]),
+         message="Carriageway width is required."),
+    rule("carriageway_min", "Invalid Carriageway Width", "IRC 5 Clause 104.3.1", (KEY_CARRIAGEWAY_WIDTH,),
+         check=lambda v: v[KEY_CARRIAGEWAY_WIDTH] >= CARRIAGEWAY_WIDTH_MIN,
+         message=f"Carriageway width must be at least {CARRIAGEWAY_WIDTH_MIN} m as per IRC 5 Clause 104.3.1."),
+    rule("skew_angle", "Skew Angle", "IRC 24 (2010)", (KEY_SKEW_ANGLE,),
+         check=lambda v: (v[KEY_SKEW_ANGLE] >= SKEW_ANGLE_MIN) & (v[KEY_SKEW_ANGLE] <= SKEW_ANGLE_MAX),
+         message=f"Skew angles beyond ±{SKEW_ANGLE_MAX:g}° require detailed analysis as per IRC 24 (2010).",
+         severity=SEVERITY_WARNING),
+    rule("footpath_width_min", "Footpath Width Error", "IRC 5 Clause 104.3.6", (KEY_FOOTPATH_WIDTH, KEY_FOOTPATH),
+         applies=has_footpath,
+         check=lambda v: v[KEY_FOOTPATH_WIDTH] >= MIN_FOOTPATH_WIDTH,
+         message=f"Footpath width must be at least {MIN_FOOTPATH_WIDTH} m as per IRC 5 Clause 104.3.6."),
+    rule("railing_height_min", "Railing Height Error", "IRC 5 Clauses 109.7.2.3 and 109.7.2.4", (KEY_RAILING_HEIGHT,),
+         # Railing height is entered in mm
+         check=lambda v: v[KEY_RAILING_HEIGHT] / 1000.0 >= MIN_RAILING_HEIGHT,
+         message=f"Railing height must be at least {MIN_RAILING_HEIGHT} m as per IRC 5 Clauses 109.7.2.3 and 109.7.2.4."),
+    rule("safety_kerb_width_min", "Safety Kerb Width Error", "IRC 5 Clause 101.41", (KEY_SAFETY_KERB_WIDTH,),
+         check=lambda v: v[KEY_SAFETY_KERB_WIDTH] >= MIN_SAFETY_KERB_WIDTH,
+         message=f"Safety kerb width must be at least {MIN_SAFETY_KERB_WIDTH} m (750 mm) as per IRC 5 Clause 101.41."),
+    rule("crash_barrier_type", "Crash Barrier Type Not Permitted", "IRC 5 Clause 109.6.4",
+         (KEY_CRASH_BARRIER_TYPE, KEY_FOOTPATH),
+         applies=lambda v: ~has_footpath(v),
+         check=lambda v: (v[KEY_CRASH_BARRIER_TYPE] != "Flexible") & (v[KEY_CRASH_BARRIER_TYPE] != "Semi-Rigid"),
+         message=lambda v: (f"{v[KEY_CRASH_BARRIER_TYPE]} crash barriers are not permitted on bridges "
+                            f"without an outer footpath per IRC 5 Clause 109.6.4.")),
+    rule("girder_spacing_width", "Invalid Girder Spacing", "Bridge Layout", (KEY_GIRDER_SPACING, DERIVED_OVERALL_WIDTH),
+         check=lambda v: v[KEY_GIRDER_SPACING] < v[DERIVED_OVERALL_WIDTH],
+         message=lambda v: (f"Girder spacing ({v[KEY_GIRDER_SPACING]:.2f} m) must be less than overall bridge "
+                            f"width ({v[DERIVED_OVERALL_WIDTH]:.2f} m).")),
+    rule("deck_overhang_width", "Invalid Deck Overhang", "Bridge Layout", (KEY_DECK_OVERHANG, DERIVED_OVERALL_WIDTH),
+         check=lambda v: v[KEY_DECK_OVERHANG] < v[DERIVED_OVERALL_WIDTH],
+         message=lambda v: (f"Deck overhang ({v[KEY_DECK_OVERHANG]:.2f} m) must be less than overall bridge "
+                            f"width ({v[DERIVED_OVERALL_WIDTH]:.2f} m).")),
+    rule("no_of_girders_min", "Invalid Number of Girders", "Bridge Layout", (KEY_NO_OF_GIRDERS,),
+         check=lambda v: v[KEY_NO_OF_GIRDERS] >= 2,
+         message="Number of girders must be at least 2."),
+)
+
+# Schema bounds the IRC rules already enforce (or tighten), so the generated
+# range check of the field leaves them out instead of reporting them twice
+IRC_BOUNDS = {
+    KEY_SPAN: ("minimum", "maximum"),
+    KEY_CARRIAGEWAY_WIDTH: ("minimum",),
+    KEY_SKEW_ANGLE: ("minimum", "maximum"),  # Only a warning beyond the IRC 24 limits
+    KEY_FOOTPATH_WIDTH: ("minimum",),
+    KEY_RAILING_HEIGHT: ("minimum",),
+    KEY_SAFETY_KERB_WIDTH: ("minimum",),
+    KEY_NO_OF_GIRDERS: ("minimum",),
+}
+
+
+def range_rules(schema, enforced_bounds):
+    """Bound checks for numeric fields, leaving out bounds an IRC rule already enforces"""
+    rules = []
+    for spec in schema:
+        if spec.type not in (int, float):
+            continue
+        enforced = enforced_bounds.get(spec.key, ())
+        low = -np.inf if spec.minimum is None or "minimum" in enforced else spec.minimum
+        high = np.inf if spec.maximum is None or "maximum" in enforced else spec.maximum
+        if low == -np.inf and high == np.inf:
+            continue
+        if low == -np.inf:
+            message = f"{spec.label} must be at most {high:g}."
+        elif high == np.inf:
+            message = f"{spec.label} must be at least {low:g}."
+        else:
+            message = f"{spec.label} must be between {low:g} and {high:g}."
+        rules.append(rule(
+            f"range:{spec.key}", "Input Out of Range", "Input limits", (spec.key,),
+            check=lambda v, key=spec.key, low=low, high=high: (v[key] >= low) & (v[key] <= high),
+            message=message,
+        ))
+    return tuple(rules)
+
+
+class Columns(dict):
+    """Input columns keyed by KEY_*, computing derived values on first access"""
+
+    def __init__(self, source, size):
+        super().__init__()
+        self.source = source
+        self.size = size
+
+    def __missing__(self, key):
+        if key in DERIVED_VALUES:
+            value = DERIVED_VALUES[key][1](self)
+        else:
+            value = column_array(key, self.source(key), self.size)
+        self[key] = value
+        return value
+
+
+def column_array(key, values, size):
+    """Array for one input across records; unset numbers become NaN"""
+    value_type = INPUT_SCHEMA.types.get(key, str)
+    if isinstance(values, np.ndarray):
+        array = values
+    elif size == 1 and not isinstance(values, (list, tuple)):
+        array = np.array([values], dtype=object)
+    else:
+        array = np.array(values, dtype=object)
+    if value_type in (int, float):
+        if array.dtype == object:
+            array = np.array([np.nan if value is None else value for value in array], dtype=float)
+        return array.astype(float, copy=False)
+    return array
+
+
+class BatchResult:
+    """Outcome of validating many records: a rules x records violation matrix"""
+
+    def __init__(self, rules, violations):
+        self.rules = rules
+        self.violations = violations
+        is_error = np.array([r.severity == SEVERITY_ERROR for r in rules], dtype=bool)
+        self.errors = violations[is_error] if len(rules) else violations
+        self.valid = ~self.errors.any(axis=0)
+
+    def __len__(self):
+        return self.violations.shape[1]
+
+    def invalid_indices(self):
+        return np.flatnonzero(~self.valid)
+
+    def violated_rules(self, index):
+        """Rule ids violated by the record at index"""
+        return [self.rules[i].rule_id for i in np.flatnonzero(self.violations[:, index])]
+
+    def counts(self):
+        """Number of records violating each rule, keyed by rule id"""
+        return {r.rule_id: int(n) for r, n in zip(self.rules, self.violations.sum(axis=1)) if n}
+
+
+class ValidationEngine:
+    """Evaluates all rules in one pass over column arrays.
+
+    The key -> rules index (expanded through derived values) lets the engine
+    re-evaluate only the rules that depend on the inputs that changed.
+    """
+
+    def __init__(self, rules=IRC_RULES, schema=INPUT_SCHEMA, enforced_bounds=IRC_BOUNDS):
+        self.rules = tuple(rules) + range_rules(schema, enforced_bounds)
+        self.rules_by_key = {}
+        for index, r in enumerate(self.rules):
+            for key in r.keys:
+                for dependency in DERIVED_VALUES.get(key, ((key,),))[0]:
+                    self.rules_by_key.setdefault(dependency, set()).add(index)
+                self.rules_by_key.setdefault(key, set()).add(index)
+
+    def violations(self, columns, indices, size):
+        """Boolean matrix (len(indices) x size), True where a rule is violated"""
+        result = np.zeros((len(indices), size), dtype=bool)
+        for row, index in enumerate(indices):
+            r = self.rules[index]
+            failing = ~np.asarray(r.check(columns), dtype=bool)
+            if r.applies is not None:
+                failing &= np.asarray(r.applies(columns), dtype=bool)
+            for key in r.requires:
+                failing &= ~np.isnan(columns[key])
+            result[row] = failing
+        return result
+
+    def evaluate(self, values, indices=None):
+        """Validate one record (mapping or BridgeInputs); returns the list of Diagnostics"""
+        if indices is None:
+            indices = range(len(self.rules))
+        indices = sorted(indices)
+        columns = Columns(values.get, 1)
+        with np.errstate(invalid="ignore"):
+            failing = self.violations(columns, indices, 1)[:, 0]
+        return [self.diagnostic(self.rules[i], columns) for i, bad in zip(indices, failing) if bad]
+
+    def reevaluate(self, values, changed_keys, previous):
+        """Re-check only the rules depending on changed_keys, reusing previous diagnostics"""
+        affected = set()
+        for key in changed_keys:
+            affected |= self.rules_by_key.get(key, set())
+        affected_ids = {self.rules[i].rule_id for i in affected}
+        kept = [d for d in previous if d.rule_id not in affected_ids]
+        order = {r.rule_id: i for i, r in enumerate(self.rules)}
+        return sorted(kept + self.evaluate(values, affected), key=lambda d: order[d.rule_id])
+
+    def evaluate_field(self, values, key):
+        """Diagnostics reported on one field, i.e. from the rules whose first key is key"""
+        return self.evaluate(values, [i for i in self.rules_by_key.get(key, ()) if self.rules[i].keys[0] == key])
+
+    def diagnostic(self, r, columns):
+        message = r.message
+        if callable(message):
+            message = message({key: columns[key][0] for key in r.keys})
+        keys = tuple(key for key in r.keys if key not in DERIVED_VALUES)
+        return Diagnostic(r.rule_id, r.title, r.clause, keys, message, r.severity)
+
+    def evaluate_columns(self, columns, size):
+        """Validate column arrays (KEY -> array of length size) in one vectorized pass"""
+        if not isinstance(columns, Columns):
+            source = columns
+            columns = Columns(lambda key: source.get(key, np.full(size, INPUT_SCHEMA.defaults.get(key), dtype=object)), size)
+        with np.errstate(invalid="ignore"):
+            return BatchResult(self.rules, self.violations(columns, range(len(self.rules)), size))
+
+    def evaluate_batch(self, records):
+        """Validate a list of raw records (mappings of KEY -> value or text)"""
+        records = INPUT_SCHEMA.parse_records(records)
+        size = len(records)
+        columns = Columns(lambda key: [record.get(key) for record in records], size)
+        with np.errstate(invalid="ignore"):
+            return BatchResult(self.rules, self.violations(columns, range(len(self.rules)), size))
+
+    def valid_records(self, records):
+        """Records passing every error rule, for handing to the solver"""
+        records = list(records)
+        result = self.evaluate_batch(records)
+        return [record for record, ok in zip(records, result.valid) if ok]
+
+
+VALIDATION_ENGINE = ValidationEngine()
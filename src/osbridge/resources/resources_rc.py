@@ -1,370 +1,943 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.9.2
+# Created by: The Resource Compiler for Qt version 6.12.0
 # WARNING! All changes made in this file will be lost!
 
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x16H\
-\x00\
-\x00\x98\x93x\xda\xe5=ko\xdb\xb8\xb2\xdf\xf3+\x88\
-\xe6\xc3\xb6\x8b$\x95\xdf\x8e\x8b\xbd\x80\x938\xd9\xe0\xa4\
-I\x9b\xb8g\xb1\xb7\xb80d\x8b\xb6\xb5U,\x1dI\
-N\x9aS\xf4\xbf\x1f\x92\x22%R\xe2Kr\xdam\xcf\
-\x8d\xd04\x96)\xcep8\x9c\x17g\xa8\xd7\xbf\x82\xdf\
-j\xfd\xec\x01\x00n\xee\xce\xc6\x17\xe0\xe2\xc3%\xb8\x9b\
-\xfey5\xb9\xfb}2\x99\x82Cps{1\xbe\xbe\
-\xfc\xdf\xc9\x198\xf9\x13\xdc\xbd\x9b\x9c^\x9e_\x9e^\
-N\xff\xc4\x8f\xd4\x03\x02~}\xbd\xb7\xf7\xba\x09j\xad\
-#pqus2\xbe\xa2\xa8\x81\x97W\xd0MRp\
-\x17\xc1\x85\xbf\xf4\x17\xaf\x9a!\xf3+\xf8\x82\x1f\x04\xcb\
-p\x93\x1e.\xdd{?x\x1a\x81\x17\x1f\xe6\xdbM\xba\
-\x05w\xee&y\xf1f\xef\xeb\xde\xfb\xb7\xae\xbf\xf9\xc3\
-\xdfx\xe1#m?w\x17\x9fVq\xb8\xddx\x87\x8b\
-0\x08\xe3\x11\xd8_v\xf1\xf5&\xfb:\x8c=\x88n\
-\xb6\xa2\xcf \x09\x03\xdf\x03\xfb\xc7\x8e\xbblu\xb2\xaf\
-\xef\xddx\xe5oF\xc0\x89>g7\x22\xd7\xf3\xfc\xcd\
-\x8a\xde\xf9\xba\xb7\xf7~\x1a\x86\xc1\xd4\x8f\xd4\xe0\xce\xc9\
-O\xf68\xbb\xe7\x90\x1f\x0d\x0a\xe3s\x86B\x0e\xb1\x8d\
-\xbeo3<\x08\x19\x12\xff\xdf\x10=\x97\xdf\xccz:\
-\x8c]\xcf\xdf&\x1c\xd2\xff\x8a\xe20\x82q\xfat\xe8\
-\x06\xfejs\x0f7\xe9\x08\x8c\xf1\x9f\xff<E\x7f\xc3\
-\x98\x90\xee.\x0a\xfc\x14}\x18\x8d\xd6\xee\xc6\x0b\xa0z\
-Dg\x0e\xbe\xc8\xf0\x1b\xb1H\xfb\x08Lo\xc7\xd7w\
-\xef\xc6\xb7\x93\xeb)8\x19\x9f\xfe\xe3\xe2\xf6\xe6\xc3\xf5\
-\xd9]3\xdex\xff\x87\xef\xad`\xba\x9f@7^\xac\
-g\xe1\x03\x8c\x03\xf7i\x96,\xe20\x08f\x0bD*\
-4\xca\x83\xa2\xd9\xc3j\xb6pco\xe6\xc6\xd0-n\
-\xfb\x9bh\x9b\xce\xbcp\xf1\xa9\xb8\x17nSv3\xbf\
-\xb7\x0e\xef\xe1,\x0d\xa3Y\xec\xaf\xd6)\xe9\x1e1\x1d\
-\x8c\x8b\xa7\xee}\x8f4\xc0\x800\x22\x8f\xb1\x1bE|\
-\x83(\x9e\xa1I\xd8\xca\x9e\xc5\xcf<\x92?g\x05\xe5\
-\xb9\xaf\xe1\xa2\xfa\xe8y\xec\xde\xc3}w\x91\xfa\xe1&\
-!\x1f*s7\x02i\x8c\x16I\x84\x86\xbcI3\xc6\
-\xbd#\xe4\x19#\x1a`\xa0\xa7\x98 \x94b\x98.\x86\
-\x0ex\xc6\xdd\x84\x1b\x98q\x10\xd7\xa3l*p\xbf\xa0\
-v\xc7\x12\xce.X\x9e-\xd0N\xb6\x1c\x1b\xb1c\x07\
-I\xac\xc9\xf5\xe4\x16\x89\xac\x93\x0f\xd3\xe9\xcdu.\xb9\
-N\xdc\x04\x82+\xf8\x00\x83\x86R\xeb\xfd\xbbm\xb2>\
-\xd9\xa6i\xb8Q.\xa7\xc7\xb5\x9fBA<\xcc\x03\xd4\
-\x88[\xe7\x8f\x10s\x1a\xba\x1f\x06\xde\x1b #HO\
-\x14\x01\xbc0\xe1:\xcbE\x09j\x0eZ]\xf6L\x0a\
-?\xa7\x99d\x18\x81E.\x0fx\xdcGk<\x91j\
-\x81\xc0\xcb+\x838\x13\x07]\x02\x13\xc50I\xa0G\
-\x01U\xa9\xa1%\x9er\xe8M\xc5T\xf7(\xd7\xa1e\
-\xc6\xb8A\xe4\x88}\x0f\x82\x0b\x88\x96\xa0\xdb\x94=0\
-^T[\x9d\xa2\x89Fk\x04d\x94HJ\xcc\xb3\xff\
-HZ\x91U\x8fZ\xcd\xe6\xe4\xee\x81\xd0d\x11\x84\x09\
-\xa4\xdf\xd8)?\x15\x0d\xab\x1a\xa4\xba\x22\xab\x8a\xd0\x84\
-\xad\x89\x89\xbcco\xe0\x0d,\xfb\x129E\xd2\xdbb\
-\x89\xafJo<\x91L\x08M\x86\xadV\xbb\xa3\xef\xc2\
-\x88\xc7yk\xe0\x0c\xc6\x8c\x09\xa7k\x88\x84\xf34\x5c\
-\xad\x90~\xa5r\xa14\xd3)nB[<\x87\xacl\
-\xcb&\x88\x03b\xa0B\xbc\x9a\xbb/\xdb\xbd\xde\x01(\
-~\xb5\x1c\xe7\x15\x1b\xd1\xb5\xfb0wc\xc5X6\xe4\
-K3O\x92\x1f\xb5\x85\x94\xf3\x1a\x12Y\xe4\xdf0\xfb\
-'\x11\x91\x9b0\xbew\x83\xba\xccL[\x22\x9d-\xc8\
--\x1e/\xdad\x1e\xa2\xa1\xdc+[\xf1\xa24\x80\xcb\
-\xb4Bx\x81\x22\x06\xd2W\xe6Z-n+\xa8K\x9a\
-HPg\xadtH~LR7\x85\xbf\xbd\xc0\xe6\xc5\
-\x03|\xf1\x7fvZ@6\xb5\x0d\x84\x8bt\xc2\x9fe\
-\xc8\xca\xd9B<\xfd\x16\x19X\x0a\x8e&\xb6\x97\xc0\xcf\
-\xbc%\x9e\xabTd\xc1\xa5k|#\x1fdCe\xd6\
-.0\x9f\xf4\xf0\xf5F\xab\xfes\xc2\x0d3\xc2\x89F\
-R\x8by\x10\xa5\xf9\xe6\x06%\xb2d\x15\x09\x05\xc7\xf0\
-=\x18E\xa2\xccZh\xd7\xb7\x16x\xa0\x1f\x13\x18\xc0\
-E\x0a\xbd\xdf^\xa4\xf1\xb6\xe0R\x09a\x1b\xe3\x93\xf1\
-\xc6\x19r\x05\xc0\xe96A|\xa5`\x11\xec,\xcc\x16\
-\xa4\x85Q\xf2\xc9@;\x0aw\xae:\xc9-\xc7\xde\x84\
-\x93\xa0e\x9e\xa9\x81w<h\xe5\x8e\xde\x1d\xb1\xe9\xc1\
--L\xb6A\x0a\xde\xc5\xe1_\x88\xe4\x0a\x22P\xfb?\
-&mg\xc8\xff\xfck6O-U\x80\xd2\xd8g\x8d\
-\xdb^g\xd0\x1d*\xcd\xcd\x05\xf9\x91H\x92\x9e\xcc{\
-v\xa4z\xa4\xef8\x15\x0a\xca\xc7d\xb2\x22\x96\xce\xb2\
-\x0bE\xb1\x94\xcf\xfe\xc9i\xafsf\x0b\xc78[^\
-\x1f\xf6\xe7\xb0\xb9\xbd\xdb;\x02\xd7\x93\xbb\xe9\xe4\x0c\xfc\
-qyv1\x99\xe6\xd6\xee\xdbp\xf7\xf8\x8db\xed\x9c\
-\xae\xfd\xc0C\x1a\xceb\x11\xbd\xbfr\xe70\xd8\xcf>\
-!\xbf\x1a}\xb01\x90\xb4\x22D\x06\xe6\xeeaE\x9d\
-m\x0a\xca_H\x96p\xd5\xa1nD\xf3\xfe\x11\x98\x8e\
-O\xc0\xc9\xf8\x96R\xbb\xa1\x9f9u\xe7'n\xbc\x7f\
-\xef\xfa\x9bY\xea\xce\x93\xd1\x08\xfd\x96 \xbd\x7f\xde\xc5\
-\x97\xc0\x8eX\xf5\x09\x0b\x88Y\xe2\xfcb\xcc\x96\x85\xbe\
-QY#K`I42\xdf*_\xae}\xec\xa1b\
-%\xc6\xfeP[\x87\xfcbn\x89*\x8f\x0e\xad\x88\xd5\
-\xc9\xa84b\xbaCF.\x93ij\xf0v\xed\xacF\
-\xdd\xa8\xd5hW5\xb5\x8dIT\x99lI\x9b\xead\
-\xf3j\xbf\x8a\x0d\xf1\x88\x0e\x05]\xe7\xdf\xbb+4!\
-\xdb8x9z\xfd\x80\xc8\x1b\xc6\xc9k\xe6\xca\x11\x07\
-*\xc0@\x8e\x92\x87\xd5\xab\x0cv\xb2\x9dS\x1f\xef0\
-D\x08`{\x85\xd2\xa5\xf2}\x14&>\x8eu1]\
-\x07\x08\xc26\xd8\x09D3\xe3HZS\x1c\x1b\x06\x97\
-\x06G\xe0\xfcv\xfcv\xb2\xdb\xf2\xa6\x02\xe9\x84\xf0\xd1\
-\x95\xbf\x81:\x93\x22\x0b_cbd\x81Aj\xce\xaf\
-\xa1\xebi\x15\x15\xe5\xc8\xe2A\x1a\xbd\x93G\x14\xed\x8c\
-V\xd8\x86\xc3\xa5#\xd7\xeb=\xc6\xdf\x19\xb4\xbb,\x08\
-)rt\xd5\x08\x90\xba\xa8\xa2\x87\xfa\xcahCW\xa0\
-2/\xc7\x83K\x17i\xdd\xc2\xcd\xf9{\xd0`\x22I\
-\xe3nap\xadn\x17y\xe3\x03\xec\x92\x1f\xbf\xb22\
-\xa8\xa5\xe3Q\xa2A\xf8\xff{\xe3 \x9a?\x88\xb9\xee\
-%\x82Y\x1b\xf7S\x07\xb4ZU#\x1a\x1b\x86f\x14\
-\xa4~\x11/ \xa9)WQ g\xbdI\xf7\xf8\xa4\
-\xb9\x810<\x02W\xe3\x93\xc9\xd5n\xf2#3\x9d\xd0\
-\x08\x12\xbfd;\xd1\x99\x5c\xc5\xeeSF\x81\xac\xe9}\
-\xe8m\x038K \xd9T\x90=\xa1\xd4\xc1}\xed\x12\
-\xa9\x06\x93z\xce+\xc9N\x97\xf3\xac\xde~10\xb6\
-\xd5\x91\xfai\x1e`\xab\x06\xd9\xcdf%?\xe2N\xc9\
-\xea \xb8\xe6\xd2-\x83\x8bz\x81\xf1\xcc\x83\x0f\xf5i\
-YE>\x8c\xa0\xca\x026\xed*\x00\x9bm\x052\x00\
-n\xf5\x0e\xe6n\xaf\xdd\x13\xdbd\xd4&\xf6\x84\xb8\x94\
-e\xad\x88\x82\x96HQ1\x8a\x5c\xd9q\xd5\x8d\x5c)\
-\xb1\xff\xff\x91\xc2\xe0\x82f\xe3\x07\xca\x10\xe2\x7f\x113\
-X\xe8M\x095\xec\xf7\xdb~ Z\x14\x01\x99\x9b\xcc\
-L\x03\x848\x09'\xef\xa3,D\x93\xfc\xce[~\xb2\
- \x8a4\x9b@!\x15\x85\x10#'\xec\xed\x0d\xa5\xfd\
-\xe5`\xe9.\x17&\xd9\xcdL\xc7\xb2R\xfa\x19\x86S\
-\xd6V\x123\xd8j\xc4\x9b0\x8b\xb6%\xa5\xd1\x0eZ\
-C\xe7\xb8\xaf\xd1D\x85.\xed\x8ak'\x8a\x91\xdb\x13\
-?M\xe1\xe7\xb4\xd4g\xcbm;\xed\x85\xa6\xcfj\x80\
-\xcc\x98c@\xd7+D\x9e\x9b'\x87\xaa\x1a\x89\x84\xe0\
-\xca\xfe=\xb4\xf6%]\xbb\x8e\x0b\x17NM]\xde\x12\
-\xc9\x85c?W\x12\x85\xadb\xb7\xbe\x11m\x05/6\
-\xb5\x0f\x8f\x8f\xc0\xdd\xe9\xed\xcd\xd5\xd5\xce!$\xab\xec\
-\x0d\xda\x0a\xb9\xd8#\xf4e\xea/\xdc\xa0d\x14s\xbb\
-jB \x85[$twDj6\x0dK7\xd92\
-\xc9\x83!u\xd1\xa4\xd9L\x15ty\xe4\x16s\xaf\x07\
-\xe5^j\x91i\x82\x90Y\xd3)+\xf6Tw\xc5F\
-\xa1\xba9\xeem\x04\x05\xad\xfe\xc3\xc0\xdf\x14p\x0e@\
-\x83^\x92\xed\x5c\xec\xc5j\xaaY:PC\xb4#\x1c\
-\x94\xd9\x19m\xa1\x17\x09y\xa5H\xc6\x10\xc7\x93\x92\x9d\
-\xd2\xa0$\x1b4TY\x93N\xf1^\xb9\x9f\x223e\
-Y^s\x12\xe0;\xac6\x07_\xc2j\x1bJ\x0c\x09\
-\xfe\x1f\xc3\xf3\xf7,\xf9\xaf\x1evV\x8b\xcc\xc1\x97t\
-\x91u\xb5\x8b\xac@*\xdc\x80l\xbd\xec\x86\x9dv\xd1\
-\xa1\xab\x04\xf5q\x0d7\x80\xed\xbe\xec\x08Y\xb5\x89\x83\
-`\x0f\x1d|\xbd\x01\x08\xf0\xe4\x01AD\x0a\xf3\x13\xc2\
-r\x15\xc3\xa7\x0a\x0a\x19~\xb7\xf0\x1e\x0d\x04 n{\
-\x8dx\x1e\xe0\xa5\x0a\xe64\x7f\xe8\xa5\x1b\xc7\xe1c\xf2\
-\xaa.\xc2\x12\xc9\xf1\x8c\x22\x01\xaf\x83\xf4\x09u\xb0\x02\
-\xe9\x1a\x02\xbcJ\x01A\xe1%\xfe\x88\x96\xd6\xe2\x13\xfa\
-\x8c\x1f\x22\xdfg\xd4k4\x86\x92\x18i$\x1f\xf0T\
-\xbcu?\xc1\x12\xae\x9c\x048\x00\x01LS6\x9c\x02\
-\x08\xd7\x17H\xd6\xe1#\xfa\x1a}X\xad\x8b\xb9;\xcb\
-\xdcV:_ AT\x81\xe5M\xb0i\x18)r\x07\
-\xb3p\xad]Z\x05g`\xf2a\x06.\xf4P5c\
-\xeao5\xe3\xe5BV\x95\xd5\x80>\x92\x15X\xda\xac\
-\x17\x86gH)\x1c\x8eO\xda\x9dq%\xd7\xe4\x8d:\
-%Cn\xbd\xd6\x1a\xe0;\xba\x00\xed\x86H\x97\xabn\
-\x90\xfc(~\x94A\x9e\xc5a\xe4\x85\x8f\x1b\x80\xd3+\
-\xb81\x92\xa4\x183\x1f*\x83tR|\xabY\x84\x18\
-\xcch\xc4E}\x15\x0e\x1a\xa3G\xa7\xd3Q\xa9a.\
-\xed\xa5\xdc\xb7v\xcfO\x91\xc7\xa46\x0fq\xdfB\x0a\
-\xfa)K\xce\xa6\xdd\xab6GZ\xb0\x07\x8f\xdf\x94\x9a\
-\x14}\xe7d\xd2D\xbf\xcbZ\xb3;\xe4\x1f\xe2\xe9\xcb\
-Lh\x05\xaa\x1f\x97\xe1b+\xe1W1e\xe1tx\
-6\x1c\xb7I7x\x1bj\xe2\xf9\xac\xa3K\x9c>o\
-\xa5\x0d\xb4\xfe\x97|\x82\x15\xe0F\x04g\x0a4\xdc\xa6\
-D3U\xf2\xfa\xb8\x0cu\xea\x8f\xae\xc38]l\xd3\
-\x7f\xc0\xa7\x03\xb0\x1f\xa0\xff\xa4\x8c\xdd\xc3\x97\x92\xb7=\
-\xcf\xd3\xdb2l\x00\xfd~_\xb3QmX\xb1m\x96\
-\xc7\x95#\x1f\x05\xdbD\xe6\x91\x0e\x87\xd6\xd1\x8f\x1eK\
-n\xc9v;h\x98\xe8\x12\xad\x0b\x19\x19\x86\xcb\xe3\xa5\
-\xab$\x03\x1f\xd9`\x0b\x8e\x22Mv\xb1\xbb\xaa\x88\x0a\
-]\xf1U\x1c2\xeb\xec\x8bz+E\x9bIS\xedO\
-\x95\x1b\xd6\xa0o!\xacv\x8d\xe0\xd4\x88\xa0\x14\xdc\xb7\
-\x9dg\x81,\xdc\x01vp\x8a \x86l^U\x01\x92\
-R\xa0\x02\xd9D\x08m\x92\xab\x22\xec\x0c(\xc2^&\
-\x94\xfb\x924\xc1\xcc\xec\xb2N\xe6\x02\xb5\xb2\xb9\x80!\
-\x9d\x0b\xc8\xf3\xb9\x804\xa1\x0b\xc8\xd7\x16 \xb3\xa0\x1e\
-\x91]*\x17\xd0p\x89\x11\x82e\x12\x17\xe0\xd7g\xc6\
--\x97\xf2\x8d\xd0\xef\xb4>\x0b\x1c\xd4\xceS\x9d5T\
-\xac\x00\xd0p\x0d\xbd%=\x90\x8f\x07`\xd75\xc4\xb6\
-}\xc9n\xa7\xaa\x82J\x92\xa4\xa8T\xe7ej\x0eE\
-\xf43@8\x90\x8d}\x07Ye\xe3)2\xce\xe6\xb1\
-\xff\xe2\x00$H[\x1e&0\xf6%\x86\xdf\xd0\x10\xdd\
-\x96\xa6,\xe9T1om\x09\xc6\x02\xf1l\xcavM\
-\xcd\xb8\x08\xcf\x7fm\xca\x7fm-\x9c\x19\xbc\x8f\xd2\xa7\
-gd{\x01\xac\x8e\xed)>wQ\xe0&k\xe4\xd7\
-A\xb8\x99\xe1b\xc9\xd8\x0d\xb2\xaft9\xd2E\x01\xa9\
-\xb2N\xabX\xf9B\x1aRq?y\x9d\x10\xd8\xb3\xf9\
-\xea\xe8\xaf\x88eIq\xcf\xc50\x82.)y\xa0\x7f\
-VZ\x94\xf3\xa4x\x0e\xcc\xfa\x0eB\xc2\x81\x82\xc60\
-l\xdd\xb3\x7f\xceQ\x87\x15\x81\xfc\xb6\xdbO\xc6\xa9\xae\
-\x07\x1e|\xf8\xc8\x02\x18{;vZr\xcbP\xf73\
-\xdc\xfd\x8c\xc5G\xbe\xecPP&\xf3\xbaUY\xfe\x85\
-\x05\xae\x09\xfd\xeb0\xfd\x86\xb5wZ\xb0&M\xa5%\
-\x94\x0cl^\x8d\xb73\xc3\xe0tbI\x85\xee\xcc\xdf\
-x\xfe\xc2M\xc3XV\xd4[|k\x1a\x92\x8e\xa7\xa7\
-H \x05H\xcb\x1c\xbeC\x8b\xd6\x12\xc5\x94>3#\
-!$\xab\x14xc\xdd9\xeb;/\x8bK7\xb4l\
-XS\x8a&K\xb4e\xfda\xdf\x18'N\x0a\xc8f\
-\xa5\xc68fm\xd5\xa9\xb6v\xcb\x0e\x90\xdc\xf5'\xf5\
-\xaa\x8e\xd5\xd6\x9a,\x1af\x09U\x1b\x14`U\xfc\xb6\
-}i\x02\xbd\x93!\xbel\xa8.\x0f\xbaHO\x16\x90\
-\xacAV\xa6\xafsR\xeb\xf2\x81&>\xd3\xab\x95\xa4\
-]\x0b\x94zf\x8ab\xcd\xfe\xb9#\xd2\x22\x1fl\xa7\
-\x16\xbc\x04\x22v\xe2\xc4\x04\x0b\xac\xb4d\xec\xb7\x8f\x80\
-\xa2K\x92s^\xaaPg9\xd5m\xd9\x9e\xa7\xa3\xd8\
-\xf3\xac7'Y*\x09\x09\xfbS\xd4\xcb;?l(\
-%\xdb.%u\xa0\xb3$\x8du\xc7X\x1cw\xe7\xc3\
-V\xbf\xac6\xf8g\x8d\xd5N\xfd\xc5\xb0\xeb\x0cU\xb5\
-\xc7\x8d\xb26\x14E\x84F$MZ\xb5\x07\x07]g\
- \x84\xf6\xb0\x86\xa4\xa5\x22\x19;\xe6,\x22,\x01 \
-\xfe\xf0\xb2Z\xd2\xc1\xfb\xd35\x5c|:\x09?k\x12\
-\x02\x992(\x15\xf9\x1f\x92\xd8\xec([\xed\xc2\x17\xac\
-\xfa\xb0\xd4^VVj\x89\xdd\xc8\xf3\x13w\x1e\x94K\
-\xf3\xb3=\xab\xfe\x8f\x83\xa6\xa4&\xa2\x22\xf2\x9e\x15-\
-K\xbcFe\xe3\x83\x01i\x97\xd7f\xab\x1cQ\xb6\xed\
-x\xb4\xc0\xf7`)\x7f\xbe\xe1(\xff\x85#\xa9h>\
-1\xf1\xd0H_\xe6\x8eA\x82\xf4\x9a\xeb\x8d\x10\xc7\x1f\
-\x80\xcf\xad\x91s\xd4;\x00O\xadQ\x0b}j\xd3O\
-\xe8\xff\x83\xa2=\x16pN\xe6=\xb4\xda\xce\x01(~\
-\xe1\x0c\xf9R\xc3\x16m8\xc4m\xf2_\xb8!i\xf7\
-J\x95\x82\xf5\xf7\xa2\xdbv\xf0\xd7\xc5/\x0e\xdd&\xf3\
-\xb8\xdd\xfc\xf83\xd9\xc7T\xc9\x7f5\x22\x8d\xb1\x0a\x85\
-\xb7\xc1\x97\xc8Q\xc5\xdb\xac\x87Y-\x8b\x95\xf7G\xe9\
-\xce\x1e%&\xf2B\x19\xc0\xb05\xaa\xe4\xb5\xf7b\xb6\
-g\xaf\x9a\xbb^J\xf4,\xb7\x90\xe5\x8c*\xdaH:\
-\x12\xb5\x1d?\xe0FI\xd2\xd6\x85\xc8\xc2\xe1;\xe2F\
-\xa3\x1dZ\x16\xe9\xba\xfb^k\xd9\xea\xbbo\xacN\xbd\
-q\x9e\x0d3\xf3i\x07\xdf\x06/\xa5\xe3y\x15\xae\x92\
-C\x5c@k\xc7\xf5\x01jN\xdc^\x1a\x1a\xd5\xf0{\
-\x1b_\x16\x0e\x5c\xc7`\x93U\xec\xb7\xaf2lp\x9e\
-&\xde\xc6\xd3 4\xc4\x97\x95W#\x84L\x7f9\x0d\
-\xb7\xb1\x8f\x96\xf65|\xfc\xe5\x00\xdc\x87\x9b\x10)\xea\
-\x85\xce\xba4\xfb.\xd21\xa8\xb3\xb2\x047\xcf\xc1\x17\
-I\x22\xb9\xc2\xb4\xca2y\x96H\xec\xe3\x5c\x91$O\
-\x07\xcb\xb2^\xd0\xdc\xd9&ku\x14\xebRM\xf4z\
-\x89Zc\x07_Y\xf6\x0bD]\xdf\xab0_\xe7\xa9\
-b\xe5]\xe8\x8e\xf3\x8c8\xaaw\x1c\x06\x0e\xbe\x08\xa6\
-g\x5c\xb6T\x9e&\xc6P.\x105\x81n\x98\xfe\xc4\
-\xc6\x8d\x87\x8d\xb1\xf9\xdd\xf7`B@o\xa3\xd7$\x9b\
-\x22K\xc7\xb2E\xe1\xb9\xb2\x97\x0a<H\xe6\xd2\x1c\xa6\
-\x8f\x10n\x18=\xd0o\x01/\xb5\xf4!\xbb\xed\x16\xe2\
-GH\xd3\x22\xb1\xb7d\xf6P\xa4i\x1e\x08\xdfg\xa1\
-;\xa1\x81\xba\xc0nr\x8e\xae\xd37\xb6G\xe5\x88R\
-\xeb\xab\x01/\xd9\x926\xe3ZO\x0e<\xdb\xf2\xb6\x1e\
-Iy\x1d\xd5\x1aQ\x0dAQ\x7f\xf57\x1eB&\x0a\
-v\x1a\x88Q\x9a\xd4C\xd0\x94imx\xbc\x22P\xea\
-\x8d\xcd\x04\xdd\xf4\xbc\x8d<\xabO\x0f]\x0a\xb7\x05=\
-\xc4\xc7k\xd3C\x07\xdd\x86\x1e\xd6\xa9\xe3l,\xb9S\
-a\xf4)\xbeV\x9fA>`x?\x0f\x91\x0f\xf8\xa5\
-\x92\xf9S\x7f\x1b\xaa\xa7.SR\x1e3\xa9Ej4\
-\xf2b\xe4\xbd`\x15\xf6\xa5\xf91\x0d\xc8\x01bg4\
-T\x8e\xa2\xa0,\xa6\xc7\x01\x81\xcf\x22\x9b\x92\x93\x1b\xc8\
-\x87\x84h\xd9\x19iC\x8f\x96\x886l\xd3\x94y\xc8\
-\xbdJ\xb0\xa5'\x8f\xd2\xf6\x8c8\x81\xf7\xe3y\x82-\
-7\x92b\xf4O\x1f>\xee\xba\xa1XJ_\xab\x09=\
-\x8b\x93\xeftnf5m\xce\xa6\xa2^\x92\xb0\xd6\x10\
-y!\xef\xcb\xe0x[\x1d>g\xc3\xdfJd\x98k\
-\xfa\xa5>@\xc3\x00v\xc3G\x9e\x1d\xb7\x03V,\xac\
-\x0fdh\xb1\xa4\xcbr\xa0\x1bw0\xd0%\x9a\x13]\
-*e\x98~\x1d\x11U\xddC*\x1f\xf4(\xa5\xe6\x05\
-\xea6\xcaE\xaa]\x14\xa7Z\x8b\xc2\xef\xd0\x1c\x0d\xe1\
-\xbdf\x03_\x83\xc3hD\x8e\x1aPJOz<\xb5\
-Azf\xc7\x13\xe2&\xf4\x00\x1f\xc9\xce\xb0\x1c\xf5C\
-]\xed*w*\x96\xb0\x9f\x9e\xccp\xbbHv@5\
-kPG\xeb\xedU\x9fR\xf3V\xbb9ou\x9f\x9d\
-\xb7$x\xb3\x89\x05\xdf\x8f\xbb4XP\xf6\x02?8\
-\x7f\xc9\x86P9\x1b\x9bw\xda\xc0\xb1\xa6\xe2:\xcfu\
-\xae\x1f\xbc\x14J\xcd\x98a\xe0p\x01\xba\xcf\xf9\xdd\xb6\
-\xa3<m\xdf4\xa0\xf2~\x99\xec\x80b\xee\x94Bn\
-\x5cdh\xa5\xc4[*\x5cd\x87>3,\x8c\x07M\
-R1/%\x91b/Vr\x22\x8a)\x8b`\x90\x1f\
-,\x9eG9\x00E\x9f\x98{\x91\xbb1\x9fYRH\
-#\xc0\xc6\x97\x19f\xd6O\x9f\xf9n\x10\xae\xf6\xe9v\
-\xcb\xbd\x9b\xc2\x18\xdd\x99Ea\xb4\x8d\x9a\x1fC\xac\xd7\
-\xe9r`Y\xf4\xf5 G\x09G$q\xa8y\xe1\xe2\
-?\xd2\xa7\x99\x07\x11\xf7\x04\x89\xb2\xa1G>\x8aQ\xdc\
-j\x90R\x09]\x94\xb1\xcf3hM!\xa7\xe4\xfc\x81\
-\xa2\x80\xc1\x84\xe4G\xbc!u\xb3\x09\x9e\x94\x89\xfa|\
-&\xb6\xb3\xb4\x1a\xb9P\x22\xa2y\xdb\x87\xba'\x8b#\
-\xfc\x85\x94O\x19e\xc5\x13\xfeT\xa7Lt\xd4'\x22\
-\xcb\xf5\x82\x11cS\x9a\xc3\xc0=v[m\xcb\xbe\x8c\
-\xb9\xeb\xbd\xe5\xc0u\xaae\xd5T|\xadMq\xc0\xb5\
-2\x0ehQG\xf4\xd5\x00\x92w\xf3\xd7H7\xfe\x1b\
-\x8b\xed\xc0\x8c\x88\xf41S\x98OH\xb4)\xed\xfb\x88\
-5\xd7\xb5\x82dk}\x84\xab\xe1\xb0\xaa\x8f\xdb\xc4\xfa\
-\xd8\x19\x0e\xdfp\x14\xba`_\xcdNj\x87\xfb\xd6\xa6\
-\x80\x1bGlyD\xad\xe9l4\x81 &\x958\xb5\
-I\x9f\x87\xcdt0\xcb\x0dj\x8f\xaa.\x04]\xecM\
-\xb9S\x91\xe9\xcb\xc4\xb0Kj\xd4\xc6\xc5\xd0\xd4\x19\x87\
-\xdc\x82\x97l\x1b*\xf4x\xd1\xb1Z\xd7\x0b\xb5\x104\
-\xad\xb7\xd1\xeb\xa5\x0a4\xa6\xdb4\xc4b=\xc9>\x17\
-\xb0\xc7\xc9\xa7\xf7[\x98\x90W\x07qw\xe7hBo\
-\x12\xcf]\x95\xdb\x7f\x88p\x91M\xf9nv\xa8s\xf9\
-\xae\x07\x13\x7f\xb5\x99\xc50\x0a\xe34S(\x07%\xe3\
-\x0c\xd9\xd4\xde\x8cp\xa7\x8a\x1c\xbb&j|5\xcf\xb6\
-\xd5\x14\xebA\xd0)\xcb\xe80\xc5\x1e\x19>\x05\xe0\x0b\
-0\xbd\x86\xe5k\xcd\xb3]s\x80\xb4\x8c\x0aid\x9c\
-\x0b\x1a\xcc\x83\x96\xee}\x04\x86\xf2\xa0.\xf9\x91\xf7\xdb\
-\x96\xf4[\xa9\xe1\xeb\x91\x1f\xae\x03B\x82+\xc3I\x87\
-\x92,N\x8dz\xcf:\xbe\x0aW\xe1U\xcd\xb3\xbf\x05\
-S\xacB\x1f\xf6\x127\xeaQ\xbd\xf57>fK\x83\
-\xc9\xa7\x84%3\x9e\x1d\xd3\x1b\xda\xe4GHIS\xd9\
-5\xc8\x1a\xeb\x17[\xf82ub4\xf3\xdc>\xbe\xaa\
-\xdd\xb8\x9fo\x91 \x09\xe3\x9f\x84t%t\x9b\x12\xaf\
-\xdcMS\xf2\x9d\xe2\x13\xa7\x7f\x0a\xcaq\x98\x9a\x88\x06\
-\x07\xddEg!_\x8c\x9a^\xcdowr:\xc7\xed\
-\xb9\xe0\xec\x97UV\xaeFO\xb3\x00X\xf6I\xae\xc8\
-Lm\xcb\xbaJ\xde\xde\xe6hm5\xb681\xea\x04\
-\xe7b\x10\x93W\x8a$\xd7\xa4\xce\x9b4\xc4\xc2H\x07\
-_\xfap\x8e\x98V5\xc6v\xc3/\xda:\xd4a\xa4\
-*\x1fU\x0e\xb7\xf0+U\xa3\xb5\xf3\xbbU\xd5mV\
-\xef\xc6\xea\xc9\x12\xc1\x80&\xee\xa7\xae\xe0S\x9b<\xf2\
-\xb1\xaaM\xcf\x9f\xf7\x95\x816\xb3\x9d;u\x8697\
-F.\xc6\xc7\xfdV\xcb\x1a*\x95(\x16p\x8d\xb2\xa7\
-\x7f2\xec9\xe75&\xbd\xf9\xabaw\x9fJ\xb9\xbd\
-Ug2\x0d\x83+\xcf\xa7\x0d_\x7f\xcb\x92VK\xac\
-+\xfc`\x85\xf7\xb7z?\xa5\x16k\x16\xc9\xc4\xa9,\
-\xbav,\xb3V\x13Cn\xb8\xe36\xee\xe3\xeb\xfb\xec\
-\xb8\xe5\xfe\x10\x1d\x1cS\xbd.9\x87\x9e\x96\xb8\xbe\x9f\
-\xc6\x10J\xcb\xf0\xedv\xe1\xfa\xba\xd3|9\xfd\x89\x8f\
-n;\xf4\xf0\xc9*\x04\xfca\xbe\x09\x0fZ\xbc\xebf\
-\x89\xaa\xbcl\x92\x1e\xc4\xa1\xc6\xe7\x18_\xc6\xa3\x83\xa9\
-Zo\x88\x94E\x81\xa5w\x0c\x8f\x17\x03S\x96t=\
-\xa8&\xeb\x11.{\xb0\xdf\xac{E\xbdU\xb7\x92\x02\
-$\xeeV5\x80\xa0(\xd8\x11\xa6\x87\xf9\xc7\xca#E\
-vB\xa09x~\x8d\xd0\xa4\xaa\xbc\x80\xd2\x06\x9f\xec\
-(\xee,M\x85\x1ej\xa2\x99\xce\x16\xbe\x8c\x95\x064\
-/\xacgr_T\xd57}c\xf5M\xbf\xd1\x94\xf3\
-\xa3\xad\xbcv\xa9!\x0a\xa50f\xe1g\x1cf\x11[\
-c\x04\xb3\xea\x99da\x92@\xdcM\xd46\x9b\xb5\xf5\
-gEI\x0f\x03\xe7\x8eg\xcb\x8f\xe0+'\x81\x99\xa0\
-o\xc2\x14\x1a^c!\x11\x7f\xb6\xee\x8c\xee}\x89\xe5\
-\xb8\x95\xaa~E=\x00?1y}\xfa\x032<\x07\
-_\xf6^\x89-:\x82\x92\x11\x12-\x8b\x13j\xaa\x87\
-&4\x8b4TK\x83JG.\xda#lq\xf4\xd6\
-\xa0D.\xb2\xe2\xaao\xbd\xaa\x01\xd3\xac\xf4\xe0p\xd9\
-]\x0c\xf5\xe9t\x15\xf2JB\xcf5\x901\xbe&{\
-\x08\xbb\xf3\xa1\x9a\x12\xc5\x96n\x0d\xe0\x8a\xf2\xeec\xf2\
-\xa36M\xe8\x09\x89:Pv5\x12\x92\xf3\xaa[\xd5\
-7_\xa8W\x8b\x1d\x06uO\xa9\xb6\xaai\xd8\x01\xbe\
-zo\xd2\x86\x83\xb8,\xa0H\x12`\xb0|`\xd6\xae\
-\xffH\xa7\xfe#\xdd\xfa\x8f\xf4\x9a\x86},\xd4X\xd7\
-T\xda\xaa9\xd4\xdd8\xe1\xd2\xe1\x94\xfdd\xeb\xe9i\
-\xfa`\xa7\xe9\x83\xdd\xa6\x0f\xf6\xec\xb3M\xea\x12\xaf\xe2\
-\xae\xdb\x93\xaf\xf1\xa3\x9d\xe6\x8fv\x9b?\xda\xab\x93f\
-S\x97\x8cL\xcc7\xa1c\xf3g;;<\xdb\xdd\xe1\
-\xd9\x9eE\x16&o\x86U\xb30\x95Y\x06c$\x0b\
-\xb0\x9b\xe0\x06\x87\x97\x1aC]g\xb9\x17]d=<\
-\xc3>7\xf5g\xa6x\xcc\xccgA\x1f\xd8\x9f\x7f\xe8\
-\x13\x09\xaa\xae\xa8\xa2\xa3\xffa]\xc9\xfej\xba/\xc1\
-\xca\xba\xbf\xeeU(\x03\xe8K]k\xbc\xd3X\xf9\xa6\
-\xe2&/\x18\x96\xbdKX\x8f\xe4s\xbfR\xb8\xfa\xf5\
-n\xaf\x146`ox\xd7e\x11\xf5y\xfd+(z\
-\x02\xd9\x09\xe0\xdc\xfb\xe0\x15\x9c\xfe_\xb1\xc5\xa1\x19\xd3\
-w\x08ok\xc1\x7f\xeb(u\x15\xf8\xcf\x10XVc\
-\xaf.\xc0\xfc.\xc8[\xd0\xf7\xbbWcZ\xa1\xf2\xf7\
-\x14e\x9aQ\xfb\x0e\xb5\x99M\x90\xf8\xd1J4\x9b\x8f\
-\xe1\xdbUj\xee\x80\xd3\xb7,\xd8|\x06\xb4\xbeY\xdd\
-&y1\x0d9\x92\xf6\xc2\xc7\xad\xc0\x099=\x1a\xd0\
-\xadmN\x0fg_\xdc\xd1\xc3\xc7\xe8\xf7\xcfx\x0eV\
-\xf9\xccU\x1dX\x8b\xca\x14\x03\x02\xa7\xe4\xc7\xb2.\xa9\
-\xc7^\x7fb\xccdd\xf1l[\xfc\x8d/\x06\xa7!\
-4\xeb\xfe\x8c\xf5*\xda\xc5u\xdeC4\xb3\x01\xa7+\
-'\xfa\x0f\xdfM\xba\xd4\
+\x00\x00\x1c\xbd\
+(\
+\xb5/\xfd`g\xe9\x9d\xe5\x00*\x83(\x18-\xc0\xac\
+\xaa\x1e(\xf3\x14\x9c\x10)@\xd5\xed\x87[(\x9f\xe4\
+\xa8\xac\xdfq\xcd\xb1$\xb9\x0aj\xd3\xd0u\xbd*\x85\
+W\x0du\x80e\x11\x04\x9a\xa6r\x01\x7f\x01u\x01o\
+\x01\x0fe\x99\xa4\xe9q\x9d\xb0\x81]\xf0\xe20\xe0\x9e\
+\xf5fZ)\x0e\xd3\xef\xd3\x97\xe8\x8f\xf2Z<$\x0a\
+bb\x12:>\xc6\x7f\xedg\xb9q\xb6\x0av\x953\
+>K\xcf\x94a\xa7\x86\x88\xb3b]=\x87\xd6\x9c\xbb\
+\xc9\x86;\x03\x0e\xf37\x8f\xe9\xc7>\xa9\xb0\xd0h\x0e\
+L\x1acaX*,Q\xd4O+\xa5\xf8_+s\
+\xa1\x80i\x95\x19:\xc3s~/\xf0/NG\x9f\xbb\
+\xae\xb5\xd6/'J\xee~\xde4y/[\xf3\xf5\x5c\
+\xdd\x1a\xfe\xd7\xafx\x1d^\xda&\xd3\xbfn1\xf5\x9b\
+\xbb\xa2\x9fi\x85\xd7\x9c\xf5B|u|\xde\xdf\xd4k\
+\x83\xd7\x1f3\x5cd*\x15\x07,0$\x0aP\xacI\
+k*,\x18\x96\x81L\x85\x85\xa1\xe9\x07t?\xd3\xa7\
+ \xb0\xba\xca\xf49\xaa\xc9\xe9\x8eN\xbeo\xeb\xb5\x10\
+p'\xa3_\xc7G\x90\x18\x82^eb\xa5f\xd6\x1a\
+\xe5\xd7\xa2L\x80\xb9F\xa32F\xb7\x19\xf6uE\xa5\
+v\x9d{P%2\x810t\x94\xb3\xe2\xce\xb0OW\
+\xf7\xe3\xad\x10\x14\xc4\xd0\xd5\xad\xb3BG\xa4]\xbd\xda\
+\x03\xe8\x18\xa7F*\x13P\xe9\x14\x17\x0a\x0a\x13\x14 \
+\x160\xf5Lw\x99v\xd8\x81\x85\xae:Sr\x9e9\
+2\xadYKh\x01\x0ePf\x12\xbe\xcdt\xc6\xfe\x98\
+\x86\xc6X\x13\x0b\x8cD?\x1e\x05\x85\x07\x01\xdd\xad\xa0\
+@3A\x99\xb8LP,\x062\xad`\xd2\x15\xcb\x82\
+\x89\x0aK\x02\xc3\xa2\x1d\xad\xb1X\x08d,\x18\x05\x9a\
+LO\x1c\x90h\x09\xab\x92\xb1\xe8n\x85\x88\x16\xf0\x10\
+\xfd\x9b\xca=F\xe7\xaf\xd6\xf47\x96\x86xT\xd3\xdf\
+8M\xab\xf4\x08P/\x9b\x8f\xb3\xc4\x7f5\xb7\xdd\xa0\
+r:\x1e\xb4\xbd\x9f\x22\x06\x7fF\xea[E\xc1\xcc\xb3\
+H\xe6Pf\x0c\xc6\x02\x83\x92\xe9\x87\x04\x03\xdf\x9f\x7f\
+\xf6\x18i\x85\x9f3^\xd3\x91\x12D\xf2\xa8'\x82+\
+}\x17\xca\x02Y\x08`\x8b\xdb\xa2\xbb\xdf\xd6\xcd\xc7\xeb\
+~\x94e~O7\xa8\xe8\x81d\xf8\xf8\xfa\xd9\xc5\xca\
+u\xfcj\x12c,\x13\x0b\xd3\x0f\xaa\xe2>\xcb\x06\x0b\
+yv\x9e}\xcc\xbc\x8cz\xe8\xefG\xff\xed\xa9\xc4L\
+,\x14\x16\xc6\xa5\x1f\x91\xc6\xd5\xca[\x1dX\x87\xb5\x0d\
+~<\xb8\x1e\x1f\xf0\xad\x19\xfe\xe6\xa1j\x98\xb7\xeb\xea\
+5\xe7\xa4\xa3z\x1e\x88\xc3\xf4<\xddx\xa0\xa7\xc1\x81\
+y\xae\xaa\xeb\x13\x0ck\xd2\x13K\xd3\x0f\x08\xadPj\
+\x9b\xcc\xbc\x18\xe6c\x8e\xb9\xf8\x1b\xa7\xdc(\x95Bc\
+\x91\xa8L$\xe8\x8aE\x93\xb1T\xf4cz\x0c\xf2\x90\
+X\x89&\xcaD\x12\xbd\x94\xbd\xecA\x1e\x94\x22Q\xb4\
+\xd7\x85\xef\xa0^\x03\x9dg\x87\x1f\xa33OD\x12#\
+\xef\x81W\xe4j\xc6\x1d\xa5\x1f\xc0Z\xe9n^\x88\x88\
+\x9f\xe1\xcf\x87 \x0ab\xb2@[\xee\xe8Sd\x0d\x16\
+~\xb3\x10\xf1\xd93f\x10=\x17\xebI\xb2\x9f\x5c\xcd\
+\xb9b\xb6\xe6\xe9\xdc\xad\x94\xa2\xd7\xb1\x8dWd\xec\x92\
+\x97\xe7\xce\xd2\x89\x9e.c\xb4\x1c\xde{\xba1MP\
+\x83c\xda\x85r\xff\xd4\xb4\xaa\xe9\xe7~\xd3X\x91\x17\
+y.\x11\xf4\x04\xdc\xe3[3\x0ct\x8b+\xad\xdc\xc4\
+Z\xc5D\xcf\x92i\x8d o\xdd\xb6\x7f\x1e\xc9&\xe8\
+q\x89G\xa2\xcc;\x93Z0\xe8l\xb5\xd7ty?\
+;\xc7\xa0\xd5\xe9\xb2\x12\x812\x1e%\xe9n\x09\xb2\xb9\
+\xb3pT\x15\xf7\xd4\xc3J@\x22\xcdy\x89\xc0o\xc6\
+\x98u\xd1\xd34Q{=`[\xb3\x04\x87\xad7B\
+\x19uR1\xaeR\xde\x8b\xbc(zVcs\xe1\xa7\
+nq\xc7\xbf9\xcbi\xb1\xc3\xe1uf\x10\xda=\x88\
+z\x1c\x1e\xf4\x1a\xd0S=\x9dnL\x8fW=\x19\xdd\
+\x88n\xab\xe8\x7f-n\x80\x00+\xa8\x9a\x98c\x19\xab\
+j\xca\xa8\x93\x07\xf07\xcaE\xdf\x1ayR\xe4'\xc8\
+Ca\x92\xe4f|\xe5\x07=\xd7\xed\xe3H\xf2\xa6n\
+H\x11t}\xc2\xb9h\xb6W~\xcd\x0d8>\xfb\xb4\
+\xdck\xa8\xac\xd9\xa1\x8cT\xe6\xae^\x97\x02\xe7\xe5\xa6\
+\xa3GD\x8fWg\xf6\xb7\x7f\x1d\x02h\xd6\xc1C\xc3\
+.\xfc\x80\x1f\xaa\x00S\xe6\x93>\xe5\xa2\xff\x17f6\
+\xec\xd3f\xb2\xe5\xfe\x82\xa0L\xde\xc7\x0eL\x1dwc\
+A^LN\xa7P\x92\x9f\xfe\xf9nPtwww\
+ww\x03\xeb* \xcd}\x9ex\x13\xee\xe6d\xe8F\
+\xe7\x0b\xe4\x0e\xe6[\xb7\xdc\xd5JF\xcbE\x07k\xc6\
+\x80\x92(U\xd5\x94S\xa3\xad\xb7b@b\xf0\xd8\xaa\
+y\xdc\x95M\xe3\xd4\x0dw\xce?\xbb\xf1\x0f\xbc\xbdo\
+n\xe8\xfe-\xb7\xd6\xc9\x0e\x98S\xef\xf5\x06\xac\x1b\xeb\
+\xf0C\x8c\x1e\x0a\x13\x14  \x8fG^\x88?B\xd0\
+\x03%\x11\xee\xb2g\xfc \x0a\xca7I\x90\xc7\xdd\x9a\
+e*\xb7Kf|eVm\xbc\xc2\xf3\xc6)~\xf9\
+\x1e\x00\x15\xf6Y\x0dh\xaa\xaa0\xe6\xf9\x8a\xa6\xce\xcd\
+\xcf\xd5\xd7(\xe8i\x15\xd3\xf1i\xb1\x8c\xf5\x89<\x94\
+\xc9BY\x90\x04\x81LX\x97\xb1\x16\xd0\xb2$j\x12\
+YO\x9eX\x9a\x8b\xb4m\x14\xd6A\xd8\xfa\x8c\xa6\xe9\
+o\x97aw3\xe5\xd0cYS\x03OLan\xba\
+X\x14L\xbf\xb2,\xe9\xe3\xac\xdbC\x9f\xf6\xb2\xee\xb7\
+V8y,HD\xd9\xca\xd0\x80u^\x14\x06Y\xd2\
+\x04Q.\xc94*\xe9uN\x06eP\x14\x1b,\xdc\
+z\xef/D\xb8o \xcbbA\xd6d=\x10\x0a%\
+b]\xa8\x09\xbaPV\xa4mGkE=\xa8\xa1\xc4\
+\x8e-Dd\x0cp\x9c//\x9c_\xcdet\xdc\x09\
+v\xe8\xc635T2\x8d'-%f\xf7\x00M\x04\
+v\xbc(E\x93\x14MR4I\x11t\xd9I\x82I\
+\x914a\xf9\xae\xcf\x95B\xd7\xc4\x0e\xc84I\xd4\x13\
+#H;n\x85\x1f\x1d\xff\xd7\xbbqy\x13\xf5<\x10\
+\x89\xd5S\x00+\xc0\xfdI7\x06I\xa2\x07a\x04\xa5\
+\xc8\xe3:)\xb7f\xfc\x18\x19\x0e\x91TRT\xe8\x99\
+\xd8\xc4\xf8{\xa2\x89\x8d|\xab\xfd{QM~\xf6h\
+\x0fh\x1e\xb1E\xee*\x86\xbf\xbbx\x80-\x5cs\xa7\
+i4\x9e\xd2\xf3\xc7\xab\x93\x1d\xba\x8c\xf4\x9f\x93\x1f\xc3\
+m;\xfcQ\x12\xa8\x04\x89\x82\xa8\x04XG%\xc9\xa4\
+\xaa\x01\xc1\x00\x08\x00\x02\xf3P(\x0c\x0a\x8d\x8c\x8aR\
+\xb9\x5c\x1a\xa6\x0f\xf4\xc0\x84E\x85\xc7\x02\x02\xc2\xc1\xce\
+\xc0\x80\xc2\x00\x01\xca\xa0P \x88\x00\x08\x86\x8a\x00 \
+\xa0\x00\x04H`H\x0cb\xd9\x0c\xb9\x03!\x84qK\
+*\x8a\x0f\xd6\x86_\x96\x974\xbb\xf53o\x12\xcb\x03\
+G\x0a\x87x\xe4\x81<F\xa5\xb7\xdcV\x16L\xda\x9f\
+O\xa5\xd3\xa5\x05\xdc-\x03\xf96\xc23c\xbe\xd0m\
+\xe1\xcc\x0b\xbe\x18\x86\xe0\x00\x8e\xd8nM>\xb8VT\
+5\x96\x9eLn~\xba\xeb\x01R\xca\x03\xe3\x02f\x09\
+(\x1d\xbf\x83B\x91\x87\xd9p\xa8\x93m<\xec\xf8\x22\
+\xdf\xd7gN\xccU\x0f\xa1\xf3\xe1\x8b\xad\xa2\xb4\xc0\xe6\
+):\xf1V\xa8\xa7\x98\x99a\xaa\xf54\x09VB\xee\
+\xed\xff\xa8,\xc3\xd3)[\x80\x9f\xa0\x80\xe2\xe6\xe2\xfd\
+Zm\x86\xd6\x08\x9a\xc1\x02\x7fp;Qtu{\xe7\
+Qi\xdc\x10\xc0t\xcd\xf79\x16*\x5c\x1a`\xbbW\
+\x9eRu\x0c\xcdRo$\x92]\xce\xaf|\xf3\xa5\x1f\
+\xcc\x16 I\xef\xb3d7\xc7\xc0bI\xcd\x0d\xc8\xe5\
+\xed\xbf\x0d\x1b\x85}\xd8\xa68\x95\xca_\xc4\xb5t\xa0\
+q0\xe3\x86](r\xb6\xa3: Z#\x96(\x82\
+\xaa\x1fkZ\xf4\xb2?\xc60\xba\xcbXw\xcd@.\
+5i\x82\xc9,J\xd6\x91&\x17\x11Q\xb3\x5c\x05\xd8\
+\xc8w\x10\xd2\xc3\xc0\xdf\xf6\xff\x97\xde\x95\xf3b\xa3\x0d\
+d\x8d\x1f\xbfB}Oc/\xe1\x8b\xef\xb5\x94e\xb0\
+\xec\x83`\x96\xf1W\x9e\x12\x10\x0e\xf44I\xa8\x85\xc6\
+<\x02G\x88\xdb\xe7\xa7\xfb\x0cS\xd0\xcbR\xe9\xb6\xac\
+\xd9\x13|\xff\x97)x\xe9!\xb3\x00\xdbU>}\xfd\
+\xf2\x89-.\x18\x0c\xab\x18\x85}\x16$s318\
+\xe9\x14\xc9+4T{_\x8d\x9a\xd8\x5cc\xce\x85\xa2\
+\xf1\xaa\xe4\x8a\x22\x99\x82\xbbo\xc4\xe5\x04I\xe0\xdd\xe2\
+\x98\xc7~\xec\xd3\xea<~M\xcb\x05\x8b\xfc\xde\xa2:\
+\xef\x8a\xfb\xd0\x1d\xd8\xf4x\xefG\xba\xb3?\x7fV\xd9\
+C\x09\xd2=\xe4J\x92\xf1\xde6\x90\xe3\x19\x80!q\
+m$\xc0\xecq\xa1\x01\xfd\xf0\xa20\xee\xea\xf3\xea\xc4\
+K\xeba\xe1\xdf\x07\x05\x9c\x14\x06\x95:#\xd61]\
+4\xc9<\x93\x8aa~\x8d\x10\xa7\xe2g\xba\xc2\xed\xfa\
+\xaf8\xd9\xb7N\x1cX`\xaf\xf1/\x94|\xf2>a\
+)[\xb0\xfa\x9d{\x7f\xcd\xe2\xa4\xb2c\x18\x96\xaa\x8a\
+\xe9E\x94/A\x86o\xe4U4\x80\xbb\xab.\xbf\xfe\
+\xa8\x90~\x95\x92:yw\xcbT\x0b\xc4\xc9Q\x9d\xed\
+\x17\xee\xb3\xa8T/\x1a\x82>\xc1A\xe5iWI\xd5\
+\xbc\xe15|F\x11\x0d\x15\xf3BJ\x07\xce\xb0\xf4\xae\
+\xeao8\xc4\x95\xe5\xd2\x83\xec\xf5\x22\xb6\x13~\xf2\x81\
+\x5cN\x97\xfd\xe7\xc9\xf4\x87(buZB\xfc\xef\x07\
+H\xcb\xf7e:'\xf3\xdb\xc0Kf(1\x86\xc2D\
+!j\xc6\xd7\xd2Nm%\x04)fO\xe9Z\xd9\x1a\
+\xd7\x13Q\xc9\xdcun\x8dVRS\x14LmQ\x95\
+\x8a\x00\xfch\xd1\x9e\x80\x82\x14\xf4#H\xdc\xc6\x8e\xa4\
+d\xfb\xadI\x8f\x91\x97\xab\xf6\x84\x22\xe9i\xad\x83\x97\
+\xb6\xfa\xb0\xca\xc6\x11s\xc7G\x09\x02\x16\xa1\xa8R\xef\
+\x0b<\xeai\xe7\x03\x1f\xbc\xa2m\x1c\xb5\xfd1b6\
+\xb8P\xc7o\x8b\x08}\xee\xff8\xc1~\xd7M\xbdl\
+\x03\xa3\xa3\xcb\x0d\x1a\x9d\x09Z\xb1\x9fNH\x98\xa8\xb1\
+\xc7y\xa5\x13\x03\xc3\xf4\x0e2s\x94G\xac\xe5\x96>\
+\x8d\x01c\xd0\xbd:\x11\x864\xef\xff\xb1\x85S\xa9\x8c\
+\xe6\xf1crx\xda\xb4\xd8\xf1\xfaE>4\x87h\xe0\
+\x17s\xda\xa9\xf6\xce\x85\xc6Tu(\xf2\xfc\x11\xf6\xda\
+\xc9\x9d$%\xb8\x07\x10\x8b\x19\xc3\x9d\x00\x9a\xb3\xe5(\
+M\xbc\xcb\xb4\xe6\x8e,_&\x08\xaci\xdc}\x9f\xa7\
+\x16T\xe5\x8c\x22\xdd\xb6E&\xc0\xac\xd5\xc6n\x94\xe1\
+\x9f\xe4v?2\xf5H)\x0az\x0e\xa7E\xcfu\xb1\
+\x91J\x07\x93H)\x1e\xa7i\x00\xfb\xd4\xf1\xd3A\x0e\
+\xa2[1\x92\x9f\xea\xb6\xc99\xc8\x06\xa8\x04I\xe6\xb2\
+\xa6Y<\xbd\xd4\xed:\x9d\x86\xbb\xec\x11\xe9\xd4\xaf\xa1\
+)\xfa\xf4\x19\xc2\xcc\x0a\xd1\x15$\x0b\xe8TjG\xe9\
+D\x10\xedY\x19\x19&af\xf6\xf5\x00\x01N\x00&\
+\x89\xb0\xeb\x06:+\xc5\xf8\xae\x9a\xe8\x22\xf3&\x82\x8d\
+\xce\xe6\xedR\x87\x0e\xda\x10l[}e\xafpc\xfa\
+\x89\xf7\xf0\x0dkiK\x85T\xf8.\x80\xc8\x12\xec\xa7\
+.\x0b\x0eG\x90\xb0NM\xab_@\x86\xbe\xcb\xe3\xa0\
+\x94MBa\x7f(2\xa8@kr\x8dM\x14a7\
+\x1e\xc9UC\xfd\x02/El\xee\xfd\xf7#\xf6\x91\xf4\
+\x8c\xabP\x84\x9c\xc5G\x81\x867\x17[m\xc1l.\
+4h\xff.^\xbe_\xc9\x9d\xe1\xe6\x8f\xfa\x90\xec4\
+\x187\xc2Cy{\x18\xb5s\x944\xdd\x9e\xb9(\x1d\
+F\xeb\x88z10\x9a\x18B\x01\x17!>\x87WV\
+\xe5C\x06\x0d\x99b\x19\xdf\x16\x01\xab\xae\x17\xc7d\xdc\
+Lw\x1d\xfc\x0bc!\x5c\x00\xc2?\xaa\xe4q\x93K\
+\xb7\xf1cy\x16\xb4$\xd2\x05k\x5cLU|\xb6b\
+\xb0\xa5\x1a\xef\xb9\xf7\xd3\xe8\xc1-S\x1b\x97\x17 w\
+\x00\x5c\xcf\xea\x1c\xed\x86`\x8e\xe7/\xae\x1d\x06\x8fG\
+\xcc\x14\xed \xfdR\xca||\xaf\xe3\x0d\x17\xd2- \
+%\xea=c\xca\xa7\xd2\x5c\x1c\xc0M\xad\x89\xc6\xcdB\
+\xacLI+\x9ft\xd3\xa2\xa0\x19\xb9\xf74\xd1\xf3\x06\
+\x00\xd1P\x17+\x00\xfb\xfco*\xe6\x03\xac),\x9f\
+\x85\xe2\x0eb\xa2\xe9h\xfe\xed{\xce\xca1U\xe5\x03\
+<\xd7\xb4\xb4\xa7~\xde\xbf\xe7g\xe1=\x15\xd0\xa2K\
+3\x8ek\xb1)H-\xdeT\xce\x80\x17\xef\x9ew\x08\
+\x02\x9d\xcf\x91\xab\xedM\x5c\x98N\x99\x9f\xe0\xe0_k\
+\xa18\x82\xf1&\xf9}\x1cv]\x05\xed\xd8c\x87m\
+\xf8~\x10O\x02q\xcc/A\xc5\x18\xd7c \x22G\
+mx\xf2<\x08\xb9\xeaS\x18+\xe8\xe3\x87lT\x99\
+\x14\xb5\xb4\x13\x5c\xe2\xea\xf8I\x8fU\x84\x80E\xe9\xfc\
+V\xf0U\xfbiP34_\x88\xe2|!\x94\xef\xe8\
+\xcbI\xb8\x99\xfco\xca\xfb\x22\x09\x1brs)\xa0\xa8\
+\xc3\x0b\xb7Z\x8e\x0ddg,\x90\xbc\xd2\xfc=\xd8Y\
+\xd7\x0e\x1f\x14\x0809:fR\x9c\x00e2\xd2C\
+\xc2772\x8b(\xd2\xbdD^\x01{8\xc5/j\
+\x9f\xad\x91\xc7>'\x12\xf5!p\x9f\x1a\x8b'\xaa\xe7\
+n\x92K9r,\xcc9\xf1\xed\xd1\xdcmd\x9ah\
+k\x98\xd8\x81zQ\xff^<l,P\x04V\x92\xae\
+\xdem\xe6\xb4_\x0c\xd4\xfbL\x14\xd5\xdf\x9d|\xc6\xf0\
+\x12\xb9\xac\x8a\xb1\xfa\xecI\x0b\x1d\xedv\xe6\x01\x9c\x9a\
+JB.\x06\xd1\x91M\x8a\x8f%\x92\xdf\xa2\x15js\
+\x92\xbb\xad\xab,(\x1a\x9f\x05\xc2\xa0\xa1\x0c\xca\xb1\xbc\
+C\xe2\xaf\xbe%^\x22\xa9Z\x05\xaa\xe3\xda\x1a\x8c\xb7\
+U\xf1b\xc8(\x17\x90\x13\xee|I\xc0TC)\xb2\
+\x7f\xc2\xfaJ\xdc\xc1r\xcdQ\x19\x0d\x92\x81\xbdIQ\
+f\x1d\xdb\x1c\x0f}\xff\xc4jd\xde\x89\xd4,\xd9D\
+\x85\x8a\x8d,fR\x1b\xba\xb3\xfb\xa5\x8d\xba\xc9\x80\xe4\
+:\xba\xa1L\xcdn\x5c\xe0[x\xc6d\xc8\x95I&\
+\x94+\x86\xd0\x09O\xad\x16\x22zj\x99PB\xa5(\
+P9\xd1\x16t\xbdl\x0a\xa3K\xb1\x02\x87\xeeoJ\
+CC\x12\x97\x8b\xb9<\xa7\x8aK\x96\x84\x5cd\x06)\
+\xb19y\x81wAM\x9c\xeb\x9d\xeczW\x01\x1ct\
+\x13hV\xcc\xd2d2\xb7\xd3\x8f\x8e\xe6\xc1\xa6\xb8`\
+\xce\xfcJ\x0e\x9f\x92\xee\xad\xe7\xf0\xfd\x9b2?\xea%\
+\xe2\xc5\x1d\xa6\x1f\xc6\xd3\xcf$w;<\xbc$\xd2\xa5\
+\x94w\x07\x83\xca\x1fb\xb8K\xfb\x95\xee{\x8f\xc8f\
+\x10%\xe736(\xc0\xab\xf1\xd7\x18\xce\xe3\x1eN%\
+F\xef^\x16\xd9\xa7\xa9\x16\xa1wn\x0d\x87\xf9\x19\x8e\
+\xbeZ\xe1\xff/qi\xcd\xe0Q\xcd\x8f\x0b\xa5F\xd3\
+\x08+\xf0\x971\x06\xecD\xf2\xef\xdf3\xee\xde\xf7\x1d\
+\xea#\xb2\xef\xd8\x81\x04\xd0{\x97\xe3\x84qp\xe6\xf5\
+\x05\xf3\xfegO*\x15\x95C\xd1\xb7L\xce3\xa8\x89\
+\xb5\xd8\xd0\x0a0<\x19\xa5Vt\xb1\xafz\xdb\x0b\xa2\
+\xf4\x88\xde5\xc4\x95\xe62D9?(\xa0\x93\xe2\x94\
+B\xe49\xea\xf9?\xce\xb8D\x9b\x22\x7f\xf5\x94k\x9d\
+9Wv\xc4\xc7c\x16\x09\xaabwf\x06\xb5\x5c\xb7\
+\x8b\x9b\x15\xd68\x87j\x91;\xde\xe7\xe6\xde<\xaa\xb1\
+\xe1;E\x1f\x1c\x9e>\xaa\x03\xc2\xfe\x9f\xcc`K\x01\
+3\xfb9EJ\xa9\x85\xd1\xffR[\xda\x9b\x1e\x15\x94\
+\xc2\xea\xb7\x03\xb2\xcb\xdc\xc1\xdeC\x95\x90\xdc\x0d,\xc0\
+#\x1c\xec\x8ch:1\x95^.\x1c\xa2\x12\xef\x14\xe9\
+\xf4\x98\xe7\x88\xa4C'\xc2\xcfd\x07Pc\x91\x8a\x18\
+\xd4\xa0\xf3\xc6\x93J[\xc5\xa6w\xcez\xc2t\xb2%\
+\x22\xfaA^{\x80\x06\xaf\xd7@n\x11\xe1+L\xe6\
+\x07\xe2\xe6\xe6\xe0\xe0\xa3\xc2%\xd0\xe4\x8b\xbb\xed }\
+0\xc4\xb9\x83\x867\xc4\x85DL\xa2\x22\x968g-\
+X\xd0\x97{\x87\xa6\x18\xd6\xb2C\x03\xe1L;f\x92\
+\x0a\xfc\xfa\xb2)\xd8\x81\xce\xadv(\xf9Z\xc5\xcf$\
+\x93\x82\xb8q\x9c\xc4\xe7\x88wW@\xdc\xd0$\x1b\xc5\
+=\x16\xcbl\x1c']q\x0d\xf6\x0d(iP\x8a\xc4\
+\xc1M\x08\xed\x93WXT\xd4\xe2\xc6u\x08\xbb\x81<\
+\x90\x169\xdb\x8aO<\xe1\x94\x10\x1b~\xdcn\xbcX\
+\xec\xc3\x0b\xbd\xa1\xd6B%\xae)\xd3)*A*-\
+\xc6\xdb\x13\x9b\x85\x97W\x13K\xc7\xe17)D\x11\xbc\
+YJ\xbfSq\xb8\xf2D\x05\x10I\xa8n\x1c\xf2\xfb\
+\xc3`\xd4\x8fK\xe5\x176\x98|X\xc3\x11\xa9\x0d\xdb\
+1~\xe7\x89\xc8\xce>\xa4\x0b\xfd\x03\x8b\xa0\xe00\x17\
+B\xa4\xdc\xd7\x89\xfa\xf9\xc1\xd9\xb9|.\x81H\xe5\xe2\
+y\x03\xd8\x160\x86t\x88\xc2\x13f0\xa6\xaf!\x9d\
+Md\x88\xd1\xf8\xb5\xb1\xfb\x9d\xb6;9\xcb\x91F\xba\
+Mr@\xce*\xbe\x7f,U\xa1E.\xe2p\xf5Z\
+\xdd\x1b\x0c\x193\xd6\xb1\x81|\xdf\xeex9\xffOi\
+\xfe\xbc\x09A\xa6\xee3\x008\x14\x08\xe0\xe2\x09\x17\x00\
+h\x03\xcf?\xbe\xdd\xd7\xb5\xebq\x9b\x0d\xc1\x22y\x1a\
+b\xb1'\x1c%\xdau\xd7\x00\xa8\xf4\x98\xa7\xd8\xa3\x9e\
+r!\x98\x8f\xfd=P\xef;\xeb\x86\x99\x89\xb6\xd6[\
+E\xa1#V\xcaa\xfc\xdf\x13(\xf9\xc9B\xf6k\xee\
+\x80V\xdb\x11\x94\x7fV)nL\x17\x95W\xdf\x90\x01\
+\x8a\xa5\x96\xc8Qp(\x06\x84\xea49UN\xa2?\
+a\xa3\x88\x8a%g\x16\xc4\x98=\xbe\x93\xf0]9J\
+\xce\x02\x1e\xed\x84\x8c\xd3\xb6&\x15\x81z\xa4U\x88U\
+f;\x90\x91\x95\x96:\xf2\x09\x15\xdf\xa5\xa2\x1e!D\
+\x11\xa3v`\x92\x1b\xc6K8\x8a\xee\x11\x82}\xde\xcb\
+\xb00k\x9bcm\x16\x1cbp\x06\x09\xb0\x16\xd0\x90\
+8\xae\x01(\x03\xe2\x15\xe4\x80\x9cD\xf7%\x83\x8e\xc4\
+RI\xfd\xadm\x9c\xf7\xe9\xb6j\xed\xb6\x85\xacf\xad\
+|\xa0\xd8\x09G[\xc4\xc6\x99\x87\x0c\x17\xf3=\x10,\
+\xb7\xb2\xf3:\xe5\x07J\xa2k\xbf\x8fJ\xe7\xa7\xc0\xd9\
+\x15\x06\xa1=9+\x88\xc5\xa5\x1a@w\xad\xdd\xa8\x00\
+\xa8\xd54\xc1\xf4|\xa6Z%\xb9n\xaa\x13Is\xa4\
+\xb0\xd4\x12\x0cdT\x9d\xf8\xec~\x06\xe0\xee\xc7\x9e#\
+\xf0\xb2\x0et.\xb5\x1d3\x0e\x1a\xd1\x94@\x8ee#\
+~\x90\xd7\xe2\x12;\xe10VXo9\xa6M\x8a\xa5\
+\x92\xe1\xc4E\xae\x98Ev\x92\xd73\x180\x12D\x01\
+\x17L\xeb?D^/\x96\xfa\xbd\x0a\xff5\x8b\xa8\xcd\
+\xca\x12\xa0\xe4X~T\x8b\xff\x06\xf0\xd3\xe41\xf5>\
+\xc1O\xe4\xd5\xa3\x7f^\x91\x9f\xcb\x93,\xf9\xb4\xdd\xc7\
+55\x83m\xa0\xe7L\xb2\x01\xe0\x1dU\xb8\x03\xe4>\
+\x1b\xc8\xc6\x10G\xb6\xd4\x14\xa6\x9dp\xfd\xa19\xdf\x12\
+!\xb2\x1d\xcf1\x13\xb5\xf7(\xb5\xc3\xdb\x91U\x8e\xc9\
+\xde\x964G\xed\xe3\xdc\xa6l\xcb\xe5\x08$JU\x07\
+\xa0\x13\xde&C\xc0\xcf=(/A\x08x\xfe\xb9,\
++\x85*\x00>\xbd\x0ex\xa4\xd2@\xa3\x97d\x8eb\
+\x18\xa3e\x10\x910*\x01\x98$\xe4\xd3\x18\x8c\xa2\x15\
+\xee\xda\xb7%\xc5gN\x5c.\xe2\x10j\x82(@\x88\
+\x22\xc3d\x85\x8c\xcev\xa4\xa1\xdc\xa4\x8a\x94\x11\xbdf\
+\x11\xb7\xc9\x1bQ\x00\x84\x8fvm\x92\x96\xe9\x87/\xd9\
+p\x0dG\xdas\x80\xd7C.\xfd\xec\x9a\x8c0\xf4V\
+b\xc7\xe7\xfd\xc2/\xe8ssw\x04&a\x95\x16\xbf\
+\xc6\xd2\xe292j\xdf\xb0Q,\xfc\xd7\x8dvX\x22\
+0\xac\xb2\xcd\x0d\x0a\x0a\x0a\xd8\xac\xc2\x87\xf7T\xb3+\
+\xb5,\xd5K\xd3\x13\xb3\x1c7,\x14K~\xd7\xed\x0f\
+\xb9NO\xb2j\xf9\x93\x99\xf8\x80Y\xc6o\xe8\xac\xfd\
+(\x9d\xf7M\xc4Q\x95\x98\x9d\xc8\xaeQ\x08z\xf95\
+\xc5\x89\x8a\x0cQB:>\x12\x14\xe1\x0d\xe9\xd9<F\
+\xe1\xd1\xad\x15\xdd\x9d\x94\x9a\x00\xd2\xebj\x16R+<\
+w^.\x9d\x90\x0c\xe7\xbbw\xaf\xfal\xf7\x1d,D\
+Q\x8f\xdd\x01\x06H9\xf1\xa3O\xa6\xab\xcdZ\xb0\xd6\
+\x12\x118\xf6\xbb:\xc5{\xf3^D2;\xf4I\x81\
+y\x15\xc2$|\xccW\xa7\xaa\x993\xcb\x18\x00\xd6Q\
+Q\xd83\x9b\x0f+U\x08\x22f\x14\xf1K\xdcl\x09\
+\xe6\xac\x9aq1S!Q\x9d\xd1s\xfe6\x0b\x8b\x88\
+\xfe\xe4\xc8\xf91\xa1C\xe3L3\xca\x94\x8frB#\
+\x06\xd0\x9d\x0c\x8cT\xf5C\xa0l\xd2\xbe\x82F\xb8\xce\
+\x15g1FW\xdd\x08\x8a\xed \xff\x85O\x0aO\xa6\
+{z\x9eSh\x0d\x8e35B\xd4\xcc\x5cZ#\x80\
+\xc2,$\xaa\x91T\x81\xd3\x0dni\x5c:~\xe9\x9e\
+\xddyzp\xa9C_\xda\x8b{\x81\xed\x00\x17\x04\xc0\
+<\xb6\xdd\x99\xe7\xeej>\xd7\x03N\x8a:\x1by\xe8\
+\xfaO\x91\x81\xe7Z(\x8f\xce\x9d\x1aH@m\x96\x83\
+lb\xd1\x1cI\x9a\xfbi\x0e\x1f\xb1>\xe5\xf1U\x8d\
+\xbd\x00\x1a,\xe0\x9a\x89\x0c\xbe\xa0J\x8b\xe3\xe5\xac@\
+\xdb0\x05\xf8\xa8\xcf\xeb\xd4\x22H\xef\xf4!\x91&\xba\
++\xce\x18\xcc%\x17\x83\x01\xc6\xb8\xed\xf6\xf1\xb2X\x8c\
+\xcc\xaf\x06\x89'I\xf3\xa6\xec\xd8\xb5C\x00\xcc\xeby\
+\xc1'S8\xf2r[J\x22\x9b\x9f\xf8d\xd4\xe58\
+J\x98\xe2d\x9f>\xdb\x93#\xb3\xe1#\x01\x1b\xb6\x96\
+\x09\xcd\x86\xe8\xa9\x83\xea\xa6\xe2\xb4\xbe8\xa0\xc5U(\
+bG\xec\x83\xba\x04V\xa5\x84\x9aW6q\xa7\x95\xdf\
+\x1eV\x1bZ\xc5N\xf1|\x89\xba\xc1\x1a\x04\x85v\xb4\
+\xb5*\x03\xf3\x95\x89\xe7\x90\xd1\xbc\x10\x99\x1c\xd5\xc9g\
+\xf6\xc0j\x0dB7\x8c\x17)\xd3\x7fn\xc6)\xdar\
+\x1c\xfa'\x01)\xc8\xbe\xa20*\xa8\xe20\xc3\xf8\x17\
+)!\xfd,\xa0>7\xb1\xf9\x14B\x09\xf4\xe5b\x22\
+mF\x8aX\xfd\x01\x0e\xca\xe9ai(\x8d\x04\xf5\xa7\
+\xf9o\xcb9\xc7\x1e\xd2+g\x81\x8c\x8f\xa3\xbe\x0fx\
+$z\xa2\x1c\xc9\xc0\xb4\xe8\xa2\x12CU&F+&\
+%\xe7\xe25\x93s2\xc7\xbe\x7fD\x00\x8c\xa1j\x9b\
+\x0cH\xd04\x9f\xda\x8a\xa8\xe9P\xa5\xed\xb3\xf3\x06G\
+\xdcJ\x91\xcf\xb4\xa0\x8a\xf9&4\xb6Y\x995\xf8~\
+\xc0\xb3\xe1,\xa8|\xe2\x15\xf600\x8e)\xb4\xa86\
+\xcd\xb0\xf9\x17%\xaezr\x12\xf8\xc96\xd7\x13{\x02\
+#E6\xb6\x90\x82\x10zG\xb2x\xf2\x03\x0dOe\
+\xd2\xee\x91\xceB\xb3\xe9\x00M|\xbb\xd7(\xdb\x16~\
+\xfc\xf3a\xc6j\x04P\xa5\xff\xbe\x10\xaelP\x0d'\
+\xd1\xc2\x07\xee\xc2>\xdd\xce\xffF\xe1|\x18\x1a\xcc\x8a\
+(\x0caO\xe3n\xed1\x9d\xc9\xad\x85K\x0b@\xeb\
+9%\xdd\x08Dzh/\xd63\x8bH\xde\xd4{\xb8\
+\x93\xfd\x15}\xc8^\xcad\xeeFbt@\x1aK\xd8\
+R\x89Suy_'\xe38!\x12d\x10\x17\xbf\xa8\
+\xe4\xedh\x9c\xecmy\x5c\x98\xaa>\xba\x03\x88c \
+\x9c\xdf\xe5\xcc\xc4\xc4\xfdt\x225\x80\x85mm\xaf0\
+BA\x82\x89\xddSa\xe1\xd8& \xf3\xb1\xc3`\xfe\
+]\xae\x9bz\x1d\xfb\xf1\xcf\xc4PA\x86g(\xdct\
+@\x11H)\xe3u1\xa8\xf4\x1a\xf81\xed\x8d\x1d@\
+\xa1\xa6\x8aQ\x17\x07^6\x1d\x9d.\x01\xe8:\x9b\xb0\
+.t\x12\x88\xcd\xcek$\x19N\x9d\xa73\xbdr\xa8\
+J)\xbdl \xfc,.\xb9\x92\xa6\x8b\xf4v\xb5\xf6\
+\xc4\x92E\xaa8\xa9m\xb5Hbm`\xe9\x00\xf6\x8a\
+<\xe1H3\xc2\x94\xcflI\x7f\xd2\xd7\x8dY\x1eS\
+\xc0\xe5\x10\x11\xc0)\x91V\xd8\xc0\x95h\xd9A\x0ez\
+\x19\x0d(\x81\x85\x11\xfe$o#m\xa8\xc4\xee\x5c\x09\
+.\xb7\xef\x97(\xe9\xec\xa4G\x1fo=K\xba\xea\xc7\
+\x8dkx2\x07\xc9NQ\xe2\x9e2\xb2-<\x80\x0b\
+\xb3vMh\x89&\x0f\x87\x18\xbdl\x8d\x84&\xed\xbb\
+9f\x0b\x85$\xdaF%\x01\xa0H\x0f\xc2\x8a\xa6\x99\
+\xd9|w\xd7\x08q!YM\xe3+\x08\xf4\xa3\x1a(\
+\xe6P\xc5\x97\x9e\xe0\x0cx\x0ci\xa3\xab)pI\x97\
+\xdd>.Sa\x5c\xcc\xad\xc1\xca\xc2\x10\xcbB\x99\x0b\
+\xf0h\xb9PH\xb9\xc4U&\x17\x0a}\x0aD.\xb4\
+\x9d\x99\xc1\xb7XE_\x91\x94d\xc2\xe3T\xf8#\x0a\
+\x9d\x94<\xc3\xd4\xc8L\xbc\xa3\xb0\x0e\xe6\x04_\xbf\x0b\
+PED\xa1\x85\x01\xacL\xf6\x0d:\xbf\xf7\x85\x91\xd5\
+\xe9\xd2\x94hFK\xe2\xf8\x0f\x8e\x05\x8d\x15&\x19\x86\
+\xcb\x8e\xa0\xf0B\x1b\xfc\x1d\xeb_\xbcI\xbcv\xc3\xba\
+\x89$\xdeA\xa8\x80\x86)\xbf\x12\x88J\xf2MT\xba\
+%;n\xc5\x93:E\xeb\xed\xc1\x17T\xb7\xd5^J\
+\x88\x0bOV\xb7\xea\xd8k\xea\xe8\xd7]\xb3\xbb5\xeb\
+\x85b\x0e\xf1\xb4\x04g\xce\x91\xd4\xd14=\x86\x8c\xc4\
+`\x0f\xd8p\xba\x06\x03\xaf\xd5R\xbd\xea\x9c\xab\xf3_\
+\xae\x09\xbb\x03o\xc9\x1a\x8a\xefi48\x15Uo\x14\
+\x5cc\x97{uQ=\x5c\x10.\xc9\x9b\x918[<\
+\x19b\xf7\xd6\xbb\x88rl1\xd9\x9e\x97$\xfd\xa2\x96\
+\xea5\xd0P\xa0\xe9\xf5Q<\xc8v\xea\xb0\xd6\xb5[\
+\xa8\xf4o\x1a#\xdf\x19\x05eMPB>i\x0c\x9b\
+o\xf1\x8d}qt\xd4\x9a_O\xe1T}\x92\x0fC\
+\xa3\xaax\x00\x9fM\xc8\x8e\x1dC\xc6\xa7u\xe2n\xdd\
+8\x19\x85f\x9d%\xec\xb4\xc0o\xd1`\xf9\xa5H\xf5\
+ \x12z\xb1RV\x01T\xc8/x\xa2\xffA#\xd8\
+(A\x1c-\x836\x19r'6\x9a_\xed*\x85\x0c\
+\xe9bj8\x8d -\xc4#-\xb0\xe8\x01P\x22\x9a\
+\xbb4\x98\x1f&\xae\x15F\xfe\x98\x06\xa4\xd4\x5c\xb1P\
+\x1d6\xdf\x19/\xb0\x1f\xa3\xb8L{\x1el\x95M\xc8\
+\x0b\x15\xc5x\xdf\xd0,:\xf3c\x82\x16ha\xe9r\
+\x19\xed\x0b\xcd\x18\xa9\xbf\xab\xa0\xf3\x9d\x99\xf0$\x8e\xb0\
+\xd7\x22n$ \xef\x11!<\xd6z\xd1\xbb /-\
+S}\x1b\xdd\xef\x08\x89\xf2\xb2$o\x1d!\xff:\x9e\
+\x12W\xee[\x80\xbc\x02\x87\x90\xf4\xae\xae\x0c\x01`\xc8\
+\xb4u\xb0c\xc2\x8f\xe5\x8a\x9c\xdf\xd6\x00R\xc9\xc4\x1e\
+\x9b\xe1!\x0c\x82\xa9\xb2\xa6U\xc7qh\x93\xca]\x1f\
+\x06a\x14\xcd/\xf5Q\xb9\xb29\x99MY\x1d3\x02\
+\xb9\xd3ENa\xb3\x1cO\xabqC\xa4<\xa4\xf1G\
+1}\xbf\x01\x9eE\x1d\xb6\x98K\x07`\xf6\xa9\x08\x90\
+=a\xc4\xa5{\xcdPGy\xb4\xb5'\xd6\x0c\x9e/\
+\x99K\xed\x14E`\x93\xb2\x0b\x07\x07\x1d\xbc\x9d5*\
+\xd3\xdd\x8f\xbf\x8b\xd1 t\x9d>\xcbW\x1c\xccH_\
+_\x5c7\xbe\xf3\xbcI\x0a\x10V\xef\x90\x9d\x03\xc2p\
+[\x10\x81p\xcf\xaf{adM\xd8\x92\x083l\xc6\
+\x98\x16\xb6SE\x80>\xc3\xa3\x17B>\xd7\x7f\xb4\xd0\
+\x97\x1c}\xe4\x91\xa4\xf2Nz\xaf\x97\xe0\x9fF> \
+\xf5\xa27B\xe4w\xaa0\xe1\xc0\x9c2\xffw&\x0a\
+\xaa\x96\x080m\x5c\xc4\xd6\x0djZ%\xf37\xae\x1a\
+jX\xc4c\xde\x13\xf7\xc1\x9c\xc3\xccPA\xdb\xc0\x95\
+ 4\xa2&\xbb\x87\x7f\x1a'\x87R=\xaa'\xd75\
+\xa3\xeay\xcaX\x92\x06\xab\xf0\x10\xd2\x1f\x5c\x95\xc1\xfc\
+r3*\x88+\xc1\xa8j\x86\xb2\x91\x1ejM\xf6y\
+\x88\x18+\x0av\xf426\xda\x9b\xaa\xc7\x06\x1f\xdee\
+\xd6\x11-\x13R\x14:zs\xa5\xbe\x10\x0d\xa2\xa7\x9b\
+#\x07(}h\xcd\xee~\x0e\xa3j\x8d\x8c\xe9\xa3\xc0\
+\xdf\x1d2\x7f\x0fw\x91\xa9\xe5\xfe\xc6u\x077\xcb\xcc\
+\x0a\xf1\xbeg\x08~\xa8srw\xd8/\xad\xb8\xf0\xbe\
+\x19\xd7\x97\xee\xb6\x070\x0bm\xfe\xeb\xa0\x94-j\x0c\
+l\xe9\xb6\xf1\x9e\x22\xffv:\x8f\x15\xe7Q\x0c\xd5-\
+\xfbL!\xc9-,\xf0\xcd\xff\x0f3\x83{\x1c(\x90\
+`\xf2W\x11(\x96\x9d|5\xd3\xd8wU\xbb\xb5\xc4\
+\xb7{p\x85\x0e\xce\xd3\x1c\xb3\xfc=!\x85#\xcc\xb1\
+\x0a{\xde\x14?\x02O3BH\x8fT\xfb_U\x13\
+\xa4\xa7\x86<\x83\xb6\xd3\xbfG\x81E\xdc\x05\xb3N\x06\
+VK-/8\xf4\xcdH\xe0\xb9p\xfe\x95\x0ew\x0a\
+6^+#\xab\xbf%4\x86\x8f\xaeS\x1f|\x13\xc6\
+\xcb\x0d\xdbu2\x12.\x0b\x8b\x9f\x88\xe3\xed\xbb\x8b\xb3\
+uw\xa9\x0a\x5ct\xa6\xd6\x8d\x106cg\x06b\xf2\
+\x88D\xcbDJ\xfc\xe79\xcb\x8fGD\x05\xe6\x5c\xd9\
+\x8fN\x5c\xec\xd0\x88U\xb9\x1d\x1f\xf4\xce\xff\xb86'\
+t|\xf3I\xf8\xee\xcc.R\xa3\x80\xf7\xb1\xbb\x85\xea\
+\x0d,\x9f\x01_\xbb\xc7j\xf5\xf9\xa2\x0c\xf8\xf6\x0c\x98\
+\xc80\xfa\xad\xbe\xae8\xbb\xdf\xd5z\xd3\xd4\xe8\xa8~\
+\xe8|\x1f\xc1>\x17\x90\xd4K~\x8a\xc8\xaf\x8a\xd3\x8f\
+\xaa=\xb9\x0dk+\xb5b`\xf5\x82/w\xc9'f\
+\xe1J\x11\x90\xe3\x8bx\xcf\xdc!2\xd0\xe7\xc0G\x99\
+EV\x02\x85\xf3p\x92>q\xca$\xf9\x1bs\x9b\x8c\
+~si\xc7\xe05\xe0\x05\x93\xa9E\xd34{\xdbV\
+\xaa\xe9\x5c\x1b\x8c\xa5\x22v\x0bz\xf5Nr\xfap]\
+\x8f\xb7\x19g\xf2R\x17\xa3\xca%{\x91\x0e\xc0\xe1\xab\
+\xc3\x87\x02\xfcG\x1e\x04+\xe2wZd'\xf2$\xa7\
+z\x8do\x13Xm\x03Z1\xa1`\x08.@\x1fa\
+\xf9\x19\x8f\xfbP\xfeJ;\x96\xaaG\xe4G\xe4\xa6\x01\
+\xb9E}\x9f\x9e\xca\xc5U.\xebG9\xe9\xfb\x0f\x93\
+4\x09kq\x9c{\x1f%-(L\x01G\xd9\xa0k\
+\xe8\x8a\xaeZ\xa3\xbb@s\x82?::\xd2\xbd\x09\x9d\
+\xa8\xdf\x98f\x0a\xdb\x1d<N\xdb=\xa2'\x17;\xd0\
+pP\xcaPd\x0d\xc8\x1e\xd1G\x8c\xf4\xb9Va0\
+\x09\x183h\xac=\xe8\xd1\x09\x93&}\xc9\x1e\x9d\xde\
+j\xed\xe5k\x93|x\xea\xa2\x93\xd8\x8d\x92\xb8\xfe\x08\
+\xcc_m7N7\x8bZh\x8b\x89\x1e\xb3\xd5\xe4^\
+\xa2\xd4\x0f\xa1\xbe\xeb\xb4\x8e6Z\x99\xe3Z+\xa6r\
+\xda[99\xfa\xd8mY\xe0\xd3V\xb1DB\xf79\
+u\xbe\xfe,'\xa5\xbbe\xa9q\xc0`Q\xc5\x0c\xb5\
+\x93\xd3l6$zQ\xf5%\xa9\xffiI\xc7\x1ba\
+,\xab\xcbl]\xa4\xe6\xed4\xd5\x5cOPj(\xe7\
+j#\xc4pKe\xcc\xa2\xfd\xa1F\xc8\xce\x8d-\x1e\
+\xb2\x1b\x14G\xa9i\xfc\xd0I\x12\x80X\xf7\xe6)\xb4\
+ib\x11\xbb\x16_\x18\xfem\xee\x1a\xc1H\xc0\x84\xc9\
+\x18\xb7\xc0y\xcf\xb0\x84\x96\xbb\xfd\x0a\x0c\x05\x86\x82\xb6\
+\xf6\xaau\xe0\x1eIw\xb8\x15\xba&c\x1c5\x83\xcc\
+\x8d\xeb\xe4\xf1\xc4\x0dz\xd1\xbdv\xcf,Yi\xd9S\
+\xa3\xaf\xfd\x8cFD8\xbaHG\xbcc#C\x18\x22\
+\xcc\x09\xf7y\xe9\xee5\x9d\xf4\x8a\xe7\x03E\xb9\xc1A\
+\x14\xfdv\xcc\xb2\xfeQF\x9bG\x5c?\x88\xf5>\x1a\
+\x93\x87\xe5}\x06\xba\xe4Zi/\xef\x03\
+\x00\x00\x1d;\
+(\
+\xb5/\xfd`\x95\xe5\x8d\xe9\x00z\x8c\xbc\x19-\xc0\xac\
+\xaa\x1e(\xf3\x14\x9c\x10)\x00J\xa1\x0f\xb7P>\xc9\
+Q\xb9\x99\xc1\x16RGQ\xdb\xf5\xaeh\xdbvP\x0a\
+\x1f\x12\xe0\x00\xcb\x22\x084M\xe5\x02\x99\x01\x8c\x01\x8b\
+\x01\xd4\xa3\x1c\x09\xe8q\x9c\x8a\xa2A*R\x11\x12\x1f\
+\xd7\x09\x1b\x19\x061M\x03\xeeYo\xa6U\xe20\xfd\
+>\xfd\x89\xfe(\xaf\xc5#\xa2\xd0\xf11\xfek1\x16\
+l+g|\x8e\x1cIj\x888\xebkf\xf6Yb\
+4\xb4\xe6\xdcE0\xb8C\xe00?\xf3\x95~\xec\x91\
+\x0a\x8b\xcbEA\xa4+\xd7\x05\xa5\x82\x02A\xfd\xb4R\
+\x89\xff\xbd,\x99\xfeu\x8b\xa9\xdf\xdc\x16\xa6Uf\xe8\
+\x0d\xcf\xf9\x95\x80\x8fi:\xfa\x1cv\xad\xb5~5Q\
+r\xf73f\x93\x17\xb35c\xcfUL\xee*\x06\xac\
+\x11\xcb\x9d\xa5\xd2\xff:\x16\xafCl\xcb42\xfdL\
++\xc4\xe6\xac\x17bl\xe3\xf3~\xa6b\x18x\xfdq\
+C\xfe-J\x06\x09,\x93\x0a\x05\x16\x17\x13\x06$W\
+\xa4/\x15\x94\x8b\x0b\x81\xa5\xe2\xba\xb8\xf4\xe3y\x93\x9f\
+\x91:\xc6\xb2\xee\xe7,\xa7\xb5\xdc\xcf\xf4%\x0b\xae\xb6\
+2}\x8enr\xbac\x93\xef\xdbz\xad\x04\xdc\xc9\xe8\
+\xd7\xf1\x13$\x86\xc8\xb0\x8f\xc4\xf5$\xac\xbc\xccZ/\
+\x09\x166*ct\x9ba_[Tn\xd79\xc8\xd1\
+\xfcA\x1a:\xcaYqgX\xa7\xad\xfb\xf1V\x88H\
+kh\xeb\xd6Y\xa1#\xd2\xae\xde\x0d\x03z\xa6\xa9\x91\
+J\x06T\xfa\x81\x04\x0b\x15\x16 \x180uKw\x99\
+v\x99\x02\x86\xb66Sr\xae92\xadZS\xe8\x01\
+\x0ePj\x12\xbe\xb5t\xc6\xfe\x15\x01]\xb9\x22\x16\x95\
+\x89~8\x0b\x0b\x0f\x03\xba{\xa1\xc1\x85BB!A\
+!\xa1 \xb0t\x83HO(\x0e(*\xae\x89\x0b\x8b\
+v\xf4\x85B)`\xa1T\x1a\x5c,M\xa1`\xa2'\
+\xae\x89\xc5\xa2\xbb\x17\x22z\xc0C\x8d\xc7\xf0\x03\xde7\
+\x0b\xe8~L\xeem\x93\x1d\xb0\xa6\xde\xeb\x02\xb2\xee\xac\
+\xc3\x0f1z\x7f\xa6r\x7f\xb1\xf9\xbb\xf5}\x8c\xeb\xb1\
+\xe9g(\x0d\xf1\xaa\xa6\x8f\xd14\xad\xd1+P=m\
+>\xce\x12g\xfa\xf0\xef\xe66\xebp7\xa8\x9c\x8e\x18\
+\xfd=\x98\x97b\x06+\x872[\xd7#\x95\x8a\xc5\x85\
+\xc4\xd2\x0f\xc8\x04\xdf\x9f\x7f\xf6\x18i\x85\x0f\x9f\xf7\xb8\
+\x933\xfe\xb2\x91\xd1\x04y\x95C\xe1J\xa1\xe6\x1aU\
+\x00[\xdc\x16-=\x92g\xd4\xd3ok\xe6#v\x1f\
+\xca2?i\xca\xf01\xf6\xb3\x8b\x95\xdb\xf8\xdd$\xae\
+P\x22W\xa5\x1fU\x04\x12Q\xa4\x09\xf7Y:@(\
+\xa7\x1bQ\xe4\xe4\xd9\xb9\xf6\xd1\xc1\xe2<\xad\xfa\xe7\xef\
+G\x7f\x0c\x95\x95\x08\xe5\xc0u!\xd1\x0f\xaa\xab\xcc\x12\
+W+oud\x1dv\xd82\xf81\x1f\xf0\xad\x19~\
+\xe6\xc1\x120o\xd7\xd6o\xceI\x87\xe5LQ\xe6\xd9\
+\xb2p\xe6\x19\xa3\xd2\xb9\x86\xeb\x91\xcc/\x17W\xa4#\
+\xd7\xa5\x1f\x13\xadPn\x19\xcb\xc4\x1a\xe6g^I\xf0\
+7N\x89\x91\xd4\x03\x17\xca\xc4\x84\x82AO(\x17\x0b\
+\xa5\xa2\x1f\xd2g\xd3Oq\x02I\x92\xc8G\xda\xd3\xde\
+\xf4$XE\x14\x14\x9f\x9ca\x16\xbb\x19~\x84z\x11\
+t\x9e\x1d\xfe\x8b\xb6<\x87\x82D\xea9\x10\xe3j\xc6\
+\x9d\xa41`\x9dt73D\xc4\xcf\xf0\xe7?O%\
+Q\x1eL\xee\xe8\x1f\x80\xc0\xf0\x19\x86\x88\xcf\x9e\xf1\x03\
+\xed'Ws\xae\x99\xady:w+\xad\xe8\xf5,\xe3\
+\x15\x0e\xef9\xdd\x90\xa4G\x80g\xdb}\xf2\xcfm\xab\
+\x97~\xee1\x97+\xb8\xe6\xee\x82\xa1L\xeb\x04y+\
+\xa6\x02\xe69\xa5I\x8f\xe3\x10\xa7\xa0\xcd\xa4\x16\x0f\x22\
+\x9e\xd2\xf3Gl\x93\x1d6lg\xab\xc5\xeeg\xe7\x1a\
+\xb6:]N\x9a\xbam\xea\xc9x\x0f\xd2\xdd\xd1\xb3`\
+\x1f\xc7aY\xdcW\x0f;1Q\xady\xb9\xc0o\xc6\
+\xd9\x95\xa0%I\xa2\x16\xc3\xb6f\x0a\x0e[o\xb4\xac\
+\xa7f\x5c\x95HP\x1a\x19\x0c\xd3\x7fM\xfe\xec\xc1v\
+\xf8\xa3,0y\xd4\x83\xb8\x7f\x17\x84o\xd5*\x0f\xba\
+\xc5\x95V\xae\x1b\x014_\xd1\xf7\xe5\xed\xaa$@U\
+\xe1\x99\x0e\xbc\xd5\x8aO\x8e\xe6\xc4\x06\x87\xd7\xa9M\xb4\
+{O\xe5t\xe3=\xcek<\x8e\xe5l\xba!=\x9e\
+\xe5dt#\xba\xb5\xa2\xff\xb5X\x80\x04h=\xd64\
+3\xc72Z\x96\x94Q#\x18\xf01\x92\x04}kt\
+\xeaE\xd4K\xd5\x8b*8MN\x95EV\xde\x8c\xb1\
+\xfc\x9ew\xdd>\x86\x9e\xc4\xf4\xa4\xeb\x19\xcdX\xfe\xcd\
+\x118>\xfb\xb4\xdc_n\xcd\x0ee\xa4\x12\xc3\xb0\x88\
+\x05\xcd\xcbLG\x8f\x80\x1e\xaf\xce\xeco\xff:l6\
+\xc2c\xcb0\xfc\x80'}\x09F\xff/\xb4`\xb0O\
+k\xd9d\xcb=\xf6<\x9a\xbc\x8f\x1d\x98:\xee\x06\x83\
+\xbc\x99\x9c.\xa9\xbaq\xa0\xbb\xbb\xbb\xbb{\x8a\xb7\xc2\
+\xbf\xdd\xc8\xba\x8a\xa9]\x83h\x15\xf7\x99B\xaa*\xdc\
+\xcdi\x9ab\x8c\xd2l\xe8\xc6\xe6\x0d\xe4\x0e\xe6[1\
+\xb9\xab\x16\x85\x8c\x94\xe7\xaa&\x95\xa4\x83U{\x10A\
+^zG\x02A\x90e5\xd5\xd4h\xeb\x9d \xb8\xa0\
+'rU\x0fl\xbd<\xee\x09f\xd3T\x0c\xee\x9c\x7f\
+v\x0b\x15\x16 \xa6\x87\xf3\xc8\x0b\xf1\xc7\xe7q \x04\
+\xc2]\xf6\x8c\xdfSU\x11\x94\x91\x13\x1d\xf2\x93\xf6<\
+\xeeV-S\x89\xc1d\xc6WjV\x8ed\xbc\xc2\xb3\
+%\xe3\x14\xbf|\x00,\x0a\x9d\xb1O\x8b@W\xd2\xb4\
+\xb9\xf9\xb9\xfa\xdb\xf3\xb6Z\xd9\xf8\xb4X\xc6\xea<\xc7\
++\x9f\xa8\x8a\xca\xa6\x09\xc2\xecEZ\xd4`\xe4U\xd6\
+Y\xac\x05\xbc \xc7\xa98E':\x14\x9f\x88\xaab\
+\xd4^\x05\xc9\x22'G\xaeK\x05!\x91\x8aU\xcc\x9d\
+\x05\x06Se\x1d\xb6>!\xe9o\x97aws\xe5\x8f\
+\x9350\x06\xf6\xaa\xf7T\x98{\x92\xc4%\xb9\x13}\
++\xce\x8ay\xe8\xd3b\xd6\x9d\xcaxk\x85/\xabl\
+mh\xc0:\xb1\x0a\x22\xa3f\xceW\xd2S9D\xdb\
+\xa8\xa4\xd75\xfe\xf0\xa3\xf6h\x0f\x14!0\xdcz\xef\
+3D\xb8g2\x88\xe6<\x9a3Q\x9eQ\x1eeO\
+\x95E\x8f\xb7\xedh\xb5\xaa\xf74\x94\xd83\x86\x08\xed\
+\x01\x8e\xf3\xa5\x04\xe7ws\x19\x1d7\x82-$\x89J\
+bi\x1ci9\xd1M\xe0B\xe1\x98\x1e\xe3%E\x90\
+\x14AR\x04ER\x04=\x98u U\x16}U\xc1\
+H\xab\x9ez^\xc4\xf2s\xa5\x106\xb1c\x9a$'\
+\x9a^\xd2\x9e\x82\x90\x87DH;n\x85\x1f\x1d\xff\xb7\
+\xca\xec\xd3\xd5\x0d\x89'U\x91\xc9q&\xc8e\xab\x00\
+\xd7\xbb\x1f\xe9\xec\x81@\x0fB0\xa2\x1e\xd7)\xb95\
+\xe3\xbf\xc8\xf0\xc9\x9dIRy\xa0JO\xe4\xcclb\
+\xfc\x1d\xb9`\xb1\x91o\xb5\x7f1\xbaI\xfc\xf1\xb3G\
+\xab`\xf3\x88-2\xfc]\x02\x0c|\x05\x89u\xa8\xb4\
+Wg)()\xa3\x11@\x80\x02 \x00\xd3P8\x0c\
+\x0c\x8dK\x8aB\xb9h\x98\xa6\x0f\xc4\xa0D\x07\x86C\
+\x85\x01\x8c\x01B\xc1\xc0\x03\xc1\x80\x0a\x01\x84a`\x00\
+\xcc\x10\x0c\x82\x02\xa0\x02(\xf0\x80\xc1\x11G\xc1\xce\xa8\
+\x07\x0c|\x8d\x95-\xd2\x94\x9d\x961v\xe7\xbf@\xe8\
+\x81\x14\xc2\xfd\x05\x1aS\xf2\xb6\x0c\x88R\xe9\xfc1\xd5\
+\xc5B\xe6\xd7\xd1\xc7\x86\x9cV\x0c\x8a\x9ca7\x1e\xaf\
+{\xa3\xf8]\x1a\xe9I\xe1aZ\x80\x93\xcb2Mn\
+\xcav\x16}\x95\x84/\xce\xafEO\x0a\x81x\xd1\x1a\
+n'\xe0\x0b\xfe\x0f\x7f<q:\x1f\xc29\xa2\x0e\x5c\
+]\xa2\x9a3u\xf5\x8e\x91E\xb3qV\xad\x95\xd9\xfb\
+\x1a\xe5\xee\xe1\xe8\xe0-\x1f`U\xe0*\xff\x18\xe6?\
+\xdc\xf7\xbcq1\x90x\x14\x7f\x94AS\xc5\xe7\xf4q\
+\xc6\x8f0z\xceDRx\xf6m\xach\x0dL\xfa\x5c\
+!\x9e\xd1\x7f\xe0sV\xa1[\x04n'\xa6\xa7\xaa\xb4\
+](u\xdd8\xe4E:\xff\xe9V\xd0Mb\x88\xe9\
+q\x95~\xee\x88\x01\x94V\xf4\x93\x0d\x9bR\xe9:\x8d\
+\xc2W\xd9\x8c@\xdc\x1c+R_\xf0Td\xaf^\x8a\
+\xf25g\xcb*\xa1\xeb\xab\xc0772\xca\xdd\xadB\
+\xca*1/\xba\x92x\x7f\xc0,S\xd8\x9dkV \
+\xb4F\x131lC\xfd\xd7j\xb1r\xd6S\xc7\xe4{\
+\xe1\x87\x16\x5c\x88D\xbb\xb2m\x8c\xb5$\xdcAl\xde\
+\xd9\x83F\xc6\xb2\xcf\xea5\xd9\x8esV_\xb3\xd7k\
+\x0c\xa7\x1e\xfcz\xf4WS<\x13e\xa2'F\xb1\x9b\
+v\xba\xe0\xb4\xe4K\xe8\xb1\xf0\x84%\xce\xbc\x83\x18j\
+?T\x07H\xf7P^\x95T\x89A#MU2\x07\
+\xf3\x0f \x81\x0c\xa5w\x8dU\xf1\xcc\xc3|\x9cmj\
+\x86W\xf3qR\xdeN\xd9\xb1\x17\x95\xdc\xcdN\xa6V\
+\x88\xa0R\x06I\xc0\xf9\x03\xf8S\x0b\x92C\xab\xbe\xae\
+Ow4\xc2\xaf\xf2~\xe4\xa2\x0c\x15nY\xed\x15\x11\
+\xf3\x84\xcb\xbe\x04\xae\xc7A\xe4tO`t\x90\xa1_\
+R\x97<\xf3[\xd8\xbf\xea\x13\xcbF&\x9eR\x00\xa3\
+\x19\xb1\xca\x91\xd2\xb4op\x93He-O\xe4\x13\x90\
+\x07Gd2ssi\xedK\xc7\x83\xae\x90 L\x1e\
+\x0c\x18?+\xdc\xbc\xb2\xbc\xc0\xc92\xa6\x83\xf7\xf9F\
+\xf6k\x97\xeb\x10u\x09K\xadY\x98\x8c\x1f\x1c\x09q\
+dx\x00=Dd\xf0\xc4\xc9\x1b\x04A\xb2\x0a\x0a\xe6\
+\x08\xd8\xe9`\x0eB\xc2\xbd\x0b\xf6\xbb\x1d\xfby$\xc4\
+|\xccO{VW\x05\x03!\x8a\x0f\x07\xd5|\x08\x7f\
+\x85KV\xc4\xd2\xc1\x09\xe5\xab8\xd9\xab\xf4\x033\xd9\
+\x9c2\xfcXUE\x02DB\x1e\x98\xd8z!W\xe8\
+\xe7\xc6*\xedi\xda\xe3%\x03\xc5\x9fofM\x9c\x1f\
+\xa7e!\x12o\x19\x0b\x87\x9d\x8b{\x17\xb7\xa5\x04\x09\
+\xce|\xa0\x11\x94\x98\x15.9#\xc9\xfe\xfe\xf4Y\xbe\
+\xda\x13\xa9\x8dI\xc1\x22\xdeTk\xde\xfei\xf7\xc2\xea\
+\x85\xd6kH>\xbb\x97\x8e\xb9@r\xe6\x17S6\xac\
+\x0dG\x17a\xaffoC\xc9\x08\xc8=\x1b\xba\xe3N\
+\x83vX/b\xc1\x8b\x9e\xf0\xd0\xaa\x1c+/F\xbc\
+8},T\xe1\xa2\xd8\x13\x87\x0c \x0b\xf5\xaa\xd80\
+\xa1_6\x8c\xcd\xa1\xb4B\xae\xdc\xa8\x9fC\xa1D \
+\xed7\xd6c\xff\xf1\xe3,\xdd\x87\xaf\xb1@\x04\x97\xc3\
+\xd12\xcbE\x9c\x0d\xe2+f\xb3h\xc7t\x816\x1e\
+\xd0\x8d\xc4\xe9\x22a\xd8\xf4*\xfe\xc6sPk\xc7\xce\
+j\x07\x83\x1f\x08g\xc8\x03\xdc5\xda9@\xe8\xb8\xc8\
+\xab\x05\xddr\xa8B\x8bf6ec\x83\x22\x97\xbd\x89\
+\xe6n\x88\xa1+\x8c*o\x11\xbbp\x18F\xd5\x80\xcd\
+\x0c\x99\xf8\x0c\xa7V\x19\xe9>q\x03\xf5\x03\x92\xca\x15\
+\xc8\x9e\x99,\x84\x14s\xf7X\xeby\xac\xac}.\xcf\
+A\x075\xf9\xdf\xad\xfe\xe5\xe93\xa7\x8c\xe1d\xb9|\
+\xfa\xaf\xb9\x9f)*\x12\xdb\x04\x0fZv\xab\xda\xf6\xf4\
+\xc0\xef\xf8\x0a\x9e7\xa9\x87j\x84\x8b4\xe6\x06.I\
+\x80\x8b\xfbo\xbf\xac\x85\x98S\xd7)\xb8|~\x9df\
+\x85p\xc8\xba%\xab5W\x0b\xc4\xcaq\xef\xd6rX\
+\xf8F\xa7/s9\x0a0\xb8\xbb\x0bq\xd3\x84i{\
+\xcd\x1bp<8-p\x90\x07q\x00\x0f\xe9,\x9d}\
+\xae\x09\x99?\x16B\x1a\xdc\x8c\xbf\xf4\xbeQ\xb2\x9a\xf4\
+H\x0fP\x95\x83\xef\xb1\xb7\x0eC\x5cI\xccdl\xf2\
+\xf1s\x11\xea\xaf\xc1\x00\x91\xa0\xc47\xe1y\x8f\x8c/\
+`\xaeK\xe9\xdcI\x9b\x8b/\x9b\xe6R7k\xdcI\
+\xa7\xfc\x1d\xda\xa4\xa9\xa3s3\xb9o\x18\xb8Y\xd2\xcf\
+\xea\xa6\x02E\xca\x0c\x0fE\xa8\xdc\xfc\x22x\xddk\x9f\
+\x8a\x9e\x88j@&\x84\xb0\xe3O\x94\xd2\xc6Dv}\
+\xd3\xe6\x00\xb1\xf8\x0bZ=\x85\xc1\x09\xf5;\x91\xaf\xd0\
+\x01\xa8\xb6\x84=\xd1\xba\xb7,\xe8\x81\x85\xae\xb4\xd0\x10\
+\xa3\xc7\x18[\x1c\x0a \x18\xc9x\xa8\xb7\x08\xf1\x7f\xd4\
+{xE\xe1\x0c\xa4B\x9f\xa1\xc2T\x03\xd5\xe8(\x89\
+\x89l\x14\x0bRa\x93\x9c\x92\xfa\x97\xaf\x05J\xde\xdf\
+S\x14\xaf\x12\x05\xcc\x82X^\x1aj\xe4\xe5C\x0c\xe0\
+s\xbc\x0b:\x09\xd7ug\x08]\xcf\xc5xt_\xd8\
+\xc08#\xfa9z1\xffU\xa9\x0f\x94\x82z{w\
+H\xea\x16\x86lA\xf9\xd08,\xbdu\xd9\x89:m\
+\x9b\x8f\xf0b\x9f\x09,\x97\xafg\xc2\x86\x8fZA\xf9\
+\x9er\x9e\x8a\x8b\xf5\x8d\x13\xa8Mn\x01{.\x13\x0b\
+\x13\xf7\x80\x9f\xca\xb2\xda\x805\xae\xa5\xf7MKK\xea\
+\x02\xcf`Co\xd4\x82e\x80\xa8\xf2\xdd\xcc_\xa2\xd6\
+\x04\x00\xa1\x95\xa1\x12\x17m\x85\x10p\xa08\x8c\x8f\x84\
+\xa5f\x228 5B\x1c\x99\xec\xaa\xfd~\x00\xc4\xf4\
+Z\x19\x1a\x98\x81w\xff\x92\x03\xbayE\xbd\x1d\x87\xa7\
+\xbce\x93J\xfb\x10\xabl\x02\xa7\xd3\x0e0\xb0o\x17\
+\xfdo\xa89\xa0\xc5\xed\x9c\x18\x01\xac\xde\x7fX\xffD\
+\xf9\x8e\xb5$>]9d\xd8\xa7\x9a\x96wC\xad\xeb\
+\x1a0\xae\xaa\xc4\xc4F}7\x90\xe4e|\x09\x03%\
+Xh(\x04\xcf\xef\xc5z1\x86N\xce\xcf\x1f\xff\xde\
+\x063.=y\x83\x1e\xa8\xe1\xc73%#\x98s6\
+\x04z`\x16\x7f(\xed\xb2\xe9\xd7\xf3\x9c\x8d\x0958\
+_H\x0d$\xd7l \xd7\xca\x00\x07\x22\xf7\xb3{\xf9\
+e\x85\x8f \xe4\x96\x80\x90o\x9c\xd9\xff#\xec\x95\xee\
+QP\x07\xaaq)Kkc\xf9\xee\xecRA(U\
+\x0c\x8c\x92L-9%*\x02\x09\x86t\x1bF\x88W\
+\x12\x09\xc1\x86\xb3\xe3\xe2]\xb2+\x19a\x0f\xd1DD\
+P\xefS\xb1\xc5\x90\x86\xb8E\x83\x9b\x12y<\x0d\x95\
+w\xfc\xa3\x81\xab\x83\xc8q\x94\xe5\x11<\xfc8H \
+\x9d\x9af\xd1\xad]\x00\xf5`jg[\xb7K\x1d.\
+\x01\xe3\xb4\x02\xce\xcd\x9c`\xbcP\xb0\xc9\xb6V\x807\
+\xbb\xc5C\xad&D\x90\xbf\xfc:\xb4\x9d\xf1ygI\
+\xc9k\x19;\xb7\xd5Z\xd6W\xf3\x16K\xc7N\x94(\
+\xde\xd1\xe8p<x\xcf\x9eB\xf6\x15\xa5\xa1\xca\x00D\
+\x84\x9d\xc5\x90\x14Y;\xc4\x18P\xd1n\x1f\x9c\xf7\xac\
+\x8a\xd8F\x0b\xf0\xc9\x00,3\x8dq\x81\x86\xb8iM\
+\x8e\x97g\xceb\xa4\x11\xfbKp@m\x9aj\xcab\
+\x038/\xd3~\x04\xf5\x1f\x01\x9eP:u\xab\x0dS\
+QX\xac\x9f\x15B\x98b\xae\xb3\x89\x9fG\xeb1\x9a\
+IY\xb9\x93\xe6_H\xcbl\xc7\xb7\x10\x96\xa6\x5c\x01\
+\xf8\xb5C\xe5f\x84\x83w2\x0e\xa1 \xe2\x01\x91\x0e\
+i\x81\xafe?\xc8\xb7\x0f\xaeE\xd6T\x07\xc1>\xec\
+\xd3\x88\x90\x1c\x0eB%\xb0!\xd8\xe5\xa0\x0b\xc7z\xc1\
+0\xc2\x91\xeds\xca\x01\xc7a|\x95\x8b\x83\xcalO\
+\xb0g\x1a\x08\x85!{;\xeb\xbbj~.\xa4(\xb7\
+\x0c;\xde\xc0\x1b,\xe5\xacD\x98\xb6\xf0X\x0e~\xee\
+\xe1\xdf\xb4\xb5-;\xb0\xbd\xcf\x16\xcc\x941\x10\xe1\xf7\
+\xc8\x8d:\xf1\x86\xa8_=\x052\xf2\x05 \xc35N\
+\xb4\xf8\xd9\xb0\xd10G\x81\x09\x82\xa5\xa5\x8a\xd3\x94\xc4\
+\xde\xcd\x8d\x06\xda\x926\x13\x17%x\xadY>Z\xf4\
+c\x9aUD\xf0\xff3O\x9e\xd4.f\x1ev\x84\xc3\
+\x22\xf3\xfaX\xa2\x09\x9c\xf5WAP\x99\x22.{\x03\
+ \xb8\xa9\xe6\x174y\xe2\xd6\xbe>\x9b3\xc7n\xbb\
+\x10\x13\xbe\x98\x9ce\xe3\xac\xe2>E\x98T\xce\x05\x17\
+\xf0\xb0\x80\xdb\xb7\xc2\xc5Q\x86'\xbc*\x90\xe1\xdcV\
+|D\xb8\xc6\x97\x18\xbb\x96\xf4\x8e\xf3\xae\x14\xcf\xdd\xc4\
+\x03\xb5b9{2\x1e\xc3\x83\xc0\x98\x00X\xcc@\xf2\
+\x96\x88\xeeyE\xf4\x07\x85F\xb7\xce\xc8\xee\x9d\x12@\
+\xc0\xackD@\xab-\x0d\xe4yO1i\x13S\x88\
+\x8d\xa4$\xfe\xfeq\xd8\x12\x5c=\x8c(\xf9\xfdj\x83\
+\xf3\xfe2\xaf\xb2g\x19BU\xd9\xdf\x10\x88h\xc6\x09\
+V\xb5~\x9ahy\x02\x88\x8e\xdeiR\x1a\xc8:\x14\
+\x86%\xa0C*\x0b\x8f\xd0\x0f\xe0\xd7\xa3\xa5\xa3\xb5[\
+h\xd3\xd2\x93\xc1\xb5\x04\x82@\x15\xc1\xc6\x116\x06\xd3\
+kHL\xa9\x9a[P\xc7<\xa4~11\xab\xdd\x9d\
+\xc4\x9d\x5c\xd3J\xa2'O|.v\x89w3\xeeg\
+\xdd\xe4\xa3\x01gTv\xd1A\xdc>\xd4\x14\x8b\x03\xdb\
+\xba<\xf0u\xdf\xa7\x09[\x94\xcd\x07\x99?\xc3o\x19\
+?\x9a-\xbb\xa8\xf4\xa0\xb1m )\x01\xb9\x01\xcfl\
+\xe9\x82f\xc2\x12\xa93\xf9\xa7fA2l\xba\xfc\xc6\
+\xc4a\xf5\xd5\xae\xd4f\xe2\x0bi\x1a\x02\xa13~\x04\
+<\x03\x8d\x11\x0c\x7f\x81\x82h\xd3p\xc7\xb8\xc9<\xb4\
+\x15*\x10\xc5\xaaU\xe2\xea$B\x8a\xe9\x1b\x82kD\
+\xca\xc7\xc4mP\xd1h\xe3\xc2X\xf6\xd0\xe5&pn\
+J\x98\xc46L\xcb\xda`\xf6\xc5\x97\xd2x\xb1\x09)\
+U\xe1\xbb\xe3fp\x02\x00\x93\x13V\xc1>\x99`\x01\
+u\x11\x94V\x04\xe4\x91\xc3\x8f\xaaig\xaaJ7\xca\
+1A\xccUU\x11\xd1\xafA\xf2\xea\xfc);\x0d\x91\
+,\xf7\x06\xc3\xad\xbds>X+\xf3\xe8\x93\xfb\xa2\xd5\
+t\xb2x\xb9\xdc\xf7!a#\xfe\xd2\x08\xb8\xf96\xd0\
+\xa1\xf9\x0e}\x9c\xb8\xa8\xf9\xea\xff\x1e:\xe6\xfa!\xbf\
+\xb7\xc0\xc0\x8cl^\x02\xb8\xef\xf9\xba%e\xaaq\xd7\
+\x02\x19\xba4\xcdT\xcf\xf1$\x1b\x95\xf9]b\x82\x95\
+#\x9b/%\xeb\xb7E\xa6c\xf0|@{KU\xdd\
+\xb9\xaf=l\x187\xf8\xef\xff\xb0v\x15R\x85\x8d\xe6\
+\xfa^P\xf5\xbeH\x0d\xf3\xf8\x88\xb0\xd9\xc0,$\x88\
+\xff\xe6\xc3\x1er9>q\x7f\xde6\xdaS\xa6\xffn\
+\xdd\x97\xc7\xf3\xde\x87\x8b\x97\xb7,\xa1\xbcc\x09\xe9\xf7\
+hQ3\xb1\x03\x12\xd6*=\xe9x\xd3\xc68\xb2\xf0\
+\xaf\xa5\x8dj\xa1\xbex\x0c\x1b8J\x14k\xb6\x7fY\
+Z?\xd5W\xf5\xdf,\xb3B\x06z\x82\xe9\xd0.[\
+m\xb5\xac\xfe\x87\xa7\x04g\xc66\xc8w\x1c\x94\x16\x0a\
+\x91\xa8\x87\xbaB\xfe\x94\x92@]\x99\xeb\xbe\x18\x9fQ\
+EWZQO.\x22\xb6M\x0dc}\x98}\x10\xba\
+d\xd6A\xfa$c\xbc3\xfb\x88\x085\x81\xa8*f\
+\xc8\xadq\xa4\xe0\x98\xd3\x15\xeb\xad\xf3B\x10\xe0<\xe2\
+\x0b>\x5c\xd5\xad\xfc\x1a\x08B\xe8\xc7\xc5\xc7\xd7\xcbw\
+\xdbP\x0d1\x11*\xdcO\x82\xb3\xf1A\xb9\x94j\x9a\
+v\xf8]\xd9\xc2\xdf\xbab\xb9ONsLe_-\
+h\xd9\x92M\x1d6\xdf\xe2I{\xe6\xe1#W\x89\xff\
+!\xd4\xf4\xd5\x96\x09hNvP9\xd4\xc0ag\xed\
+,}\x0e\xcd\xb4H\xeas8\xc3\x0d\x1f\xb4\xef\xb7N\
+\xe3\x10i\xd7\x8b\x029\x0b\xd4j\xafh\xf8\x10\xeb\xf7\
+\x13s\xf4\xf2:+w\x80>=\x9e\x15\x11GN\xb0\
+Tq\xd8\x99\xb5l\xc5\xf5\xbfy\xb5\x96P6!Q\
+\xbf\xdb\x85\x9b\x1aw\xca\xc6\x12\xab\xf19GN%h\
+\xa1\x5c\xdbQa\xf91\x91\xcfj`8\x12\x93\xfb>\
+s\xefc\x17\x01k\xa1^KU(\xf3\xff>\x83\xfd\
+\x84g\x1b~\xf5\x09i\x8b\xbc\x86\x81\xa8~*\xda\xf3\
+z\x89JK\x18\xbe@\x18\xf6\xcf\xd4\x1b\xce\x7f]\xf3\
+6\x1fA\x1d\xbck\xc5\x94U\x0a\x0d@\xd2\x04\x88\xf2\
+\xe7\xffI\x86\x84\xd7\xf8\xb3S\x83\x18?B5\x91\x02\
+f:\xae\xa5r\x1e\xc7\xfa$@\xa9|\xa1hb\xc8\
+\x19o\x1fsn7\xf1\xe0\xb36\x03<\x902\xb9T\
+\xad\xac\x96\xc0\x92?J\xb9\x19L%\xd9\xa1\x85Y`\
+\xc9\x01c^\xcf\x0dK\x11+jP\xd9prY\x0d\
+\x06D\x9c)\xf3\xb8\x89\xe4\x9e{\xa4\x5c\xf9\x10Z\xc8\
+H\x87\xbepq\x08I`m>\xdcI\xde&\xc0\xe0\
+\xb6\xf1\x81\xc4\xed\xf8Y\x1b\x18\x11\x93o\xad\xc0\xb1}\
+*\x152\x87\xac\x9f\xd9\x97j\x0f$=\x01\xaeI\x12\
+t-9\xa0\xebf\xf9\x07&b\xbd\xb3Yd\x18\xe3\
+\x16\xf4\xc7&2*\x8c\x9b1Gb\x04\x09X`\xc2\
+\xd8\xe6\xb6v\xa0u\x17\xf3\xf3\xbf`.o[\xbe\xc2\
+\xc9\xb4H\xb5\xe6\x85\xaad\xeb\xa9\x92\xbdVW\x00_\
+t:\xfcq\xe2Cy3}I`\x98D\xb5rP\
+\xc1\xe6\x06\xdc\xf5\xc09\x03.-M8\x8f\xa5\x82\x82\
+\xedC\x8f\xb5\x19\x8aR\xb1GE\x8b%\xcc\x94B\xd0\
+\xa0}z\xdf\xca\xe6\x0a\x10\x89\xec\xa6\x07/\xa5\x90&\
+\xd4>\x13$S\x94\x22\x98\x13y\xa2\x97\xbe\xae\xb2\x0e\
+q\x90\xd08\x8bB\x07\xe0;g\xbf\xc0\x03\x84_Z\
+\xc3E\xd5\xcf\xb4\xaf\x99\x9d\xc9\xe1\xcaQ`\xe0C\xd8\
+\x9c\xd6\x81\x8a\xd1\x143\x12\x07^\xba\xaa\xd4j\xda\xc3\
+\xe1\xa2g\x0e\xc1Kh\xd4\xe2K\xdb\x0d\x90To\xf0\
+\xb8\x9b>\x05\xf2A\x1ct\x80\xe3z>\xa7\xc1\xb2\xaf\
+\x1aH&\xc6bb\x04\x099:\xc6$\xb3\x8e\xfc\x9f\
+\xe4\x14\x09\xfe\x81+\xc5\xe6\xf1`?\xb1\xc8\xfd\xe4{\
+>\xee~\xc8X\x8d\x85\xe9\xe3\x0b\xa6\x9d`\x98\xd3\xf0\
+Cg\xa0\x87\x8a\xa1\x02)\xa8\xd3\x80'\xb1\x98(T\
+\xe6\xda\x01\xca\x19e\x01,$\x0bQu\xb14\xd8t\
+s\xc4\xfb\xe4\x0b\x90/`\xeb\x167D\x00P\xb8\x8c\
+7\xaa\x83\xc5L\xc1Cv\xff\x22\x9b|\x07\xb6\x0cF\
+\xa6\x9a\xb6\xfe\x86g\xa5\x12!H\x84\xb8\xc7]_\xc8\
+\x9b2\x121\xc2DS/\x09\x0b\x00\xdf`\xc2\x0cZ\
+I\x16\x0d\x16\x15\x02\x1c\x7f\x8f\xbc^h_W\x81\xc2\
+\x8b/\xb0\x22mB\x15\xc3IL\xc9mY\xb0\x0c\xb2\
+\xc5\x80\x81\x13[\x89.\xfa\xf8=\x93o\xef\x7fy\xf1\
+\x80\xf1\x98\x0a<X\xcb\x03<\xf8\xb5\x99`\xd8\x82\xf5\
+oj\xbe\x807\x09\xd3i^D\xdc\xe6a\xeb\x97R\
+$A%=\xd4\x9b\xbe\xcc\xc2x\xd4\xfc\x12\x9e\x81\xc3\
+D]6\xb5\xcd&\x9b6\x15\xc5\xa4\xbczVS\xf0\
+#\xd1\xe1x/3z;\x12W.\x16\xd2<\xef<\
+\xea\xaf\xef9Q\xca\xd3|\xbe\x1c\xd1V\xf8Lf\xde\
+\xb0\xe2\x01V\xefDk\x12\x8f\xe1\x84\xec:5O\x19\
+\xef\x06<\xb0\xc8\xc8\x97\x84\xd2b\xa6\x17\xc4\x0b`b\
+\x9f\xea\x8d\x12Y,\x07\x00\x96\xdc\xe9\x8f\x81\xbft\x7f\
+\xbf@\xb1\xe2\x9dstL\xc6=?\xeefjq]\
+\xf1,]U\xb5>R\xe1\x22\x09{\xd0\x83;\xa00\
+\xd9\xc5\xa7\xb9\xf5-_\xa5\x03\xe5@C\x02\x19\xd1A\
+\x1f\xf5`\xbc\x08oD\xd9fvJ^\x05\x1e\xb4\x1d\
+\xc4.9V\x9c\xc9\xc6\x04\xd0\xd8\xb0\x88l\x93\x83e\
+\xed\x92@\xaa\xa7\x09l\xaa\x08=m/m\x93\x1dB\
+\xdc%\xe5\x9c\x7f\x8e\xa0\x9d4@\x18\xdbH\xca\x1a1\
+{\xcc\xd9\x84\xd8\xa0\xda\xebV%\x19\xcf\x1fK\xe8O\
+K\x8b}\xb2\x04\xe2!\xc9Q/>\xe7\xb3\x9c~+\
+<\x08\x07\x22\x14\xa8\x8a\x08\xb5&f\x84ycp\xb3\
+$\x12v\x91\x03\xb7\xeea\xd7\xff\xceBy\x91\xf0\x7f\
+\xe7\x06\xea~4\xd3\xe3)\xc5\xfeaXG#\xe45\
+w]\xd0\x8d\xbe\xb3\xe5\x14\xf6\xe7Y\x9fW\xff:9\
+\x09\xfe\xbe,da\xfe\x9e\xbb\x5c5\xa6R\x9f\xd9w\
+\xce\xdc\x07\xd1\x80\xcf-\xe7\x0a\x89k\x15\xe2\x9e3\x11\
+\x0e\x0a<\x18\xc2f\xaa\xb3\xdcu\x05CmW\xa8\xa0\
+\x15\xa7\xe8\x0e\xd5\x10\xd5\x9f\xa6\xc3\xe1]\xc0\xec\xc1R\
+\xe6U\xbc\xac-,\x13:\xee\xf3\x99\xfcw1\x80\x08\
+9\xf5fz^kJ \xf1\x7f\x95\xd8\xfe8\xf5:\
+\xc6\xe3\xc65\x0e\x0b\xf2\xa4\xc5\x8f'L\x12\xb6u$\
+yg\x1d\xfe\x84\xc6\xe5\xfb \xb3\xe7\xe9rB\x83\x91\
+l\x83n\x1a\xd3]8K\xba6\xb3\x8e\x0f\x12\x22\xb0\
+\xf7\xff\xd2M\xf7]}\x1a\x89\xc8\xdb\x1f:,U\xad\
+Z\xea\x07]\x7f\xb7R\x0bX\xfc/\x08\xe5d\x1f\xf3\
+\x08y\xa7\x9a\xca\x16\xbf'\x15\xe8\xac\x8afh\x16\xfd\
+w\xaf\xee\xc4\xc0\xdb*hy\xc4g\x04)\xc1G\xf8\
+\xfe\xa15\xda\x08)~\xd1RH\x09+\x05\x5c\x15\xcd\
+b\x91?\xd6\x14\x1a[\x87\xfe\x91]\xd8\x14\xc9\xa1?\
+\xd4j\xedG\xa4\xc3'\xcd\xb1p\x0fX\xd2\xee\x04\xfe\
+\x97\x8e`Y_\xe6\xb8\xd2x\xebA\xbb\xd5\x09\x11<\
+\xd8\xadu`02\x16\xe8xq\xfe9\xd5+hG\
+\x07\xc4\xb5\xdd\xf8\xed\x87'\xcc\xe6\x9e\x85\xabP\x8cE\
+\xf9\x95\xde\x18\x82l\x0bY\xc7s\x09\xfd\x9c|5'\
+(\x1e\xd1D\xa8`V\x8e*F\x11\x07\x15F\x9b\x90\
+\xb3$1T\xe8h\xf6\x83\x5c\xb6\xd2\xf1J\x81}\xe7\
+B\xdd\x1fV\xe7\xfb\xebk\x9b\xba\x94\x8a\xd3%-\xe9\
+bD\x19]FF\xe8\x12X/XUP\x9a\xed\xd4\
+\x97f\x07F\xe9W\x91$+\xec$q\xa8\xadm \
+\x83\x80@M\xcc\xa2\x04\xaa,\x8a\xe27VJ\xb5\x06\
+\x84_\xe7\xc3h'7Mc\x9eS2Vah\x84\
+\x83\xc8c\xcfTL\x00T\x82\xf3\xa3;\xef\x06\xbf\x0f\
+l\xad\xd0DE$\xf1HY\x95<\x8f\x80(L+\
+\x1d\xfd?\x8a\xcfO\x0c\xd1\xdaT\x8b\xd5m'\x12\xe1\
+3d\xbe\x01\x982\xe7\xe6]\x14U\xf2\xa4!\xa5.\
+6\xef\xbe\x9d\x8a\xc5\xc7\xde\x82\xcb\xda\x90\xcf\x07\xeb\x15\
+\xa1\x15\x85^\x5c\xc6x\x15\x15\xf9R\x5c\xb6`\xea=\
+k5\xd7$\xa3}b\x8c\x97_\x9f\x129[$\xe0\
+>\xaa\x22\xe9;H\xcb\x18\x90\x84_,\x09h\xd3g\
+\xe8\x5c|*\x11I,\x93y\xef\x97\xe2#\xa0/\x9e\
+\x9e\xe2\xc6\x09\x0e\xd2\xa2\x91\xfc\x22U\x09R\xef3c\
+\xe0\xb0\x9dEa\x8cQ\xc4y\x02T,\xd0\x02\xc2\x9a\
+\xecCkTv\x08\xb3\x05\x84M6y\x0b\x96d\xcb\
+0\xa9X\x05\xe3\xb4B)\xe2\x0a\xf6[_8\xccR\
+\x0b\xb3\xd2\xcb4\xfcn\x9e*\x83{?\xc8\xa8\x01\xb5\
+\x03\x9aj\x85\xb4eD\x09U\x08\x8f\xb0\x10%\x03\x87\
+\xb3\xea\xea\xda\xa2\xbf!\x0b\xcb_\x22\x92\xe7(\xba\xd7\
+\xd2\xa3\x15 '\xbd\xca8\xea5\xc2\xa0\x12\xf1\x115\
+\xe8\xf1`\x158\xa7{M\x9f\x00o8\xd8\xa9\x1f5\
+1c!\xdbh\xc1x\x0f)\x9e4tk\x88\xc8\x91\
+q=1\xda\xd2+\x06\xba:OP}\xfc\xbdU\x82\
+`O\x12\x05&\xf4y\x81\x1e\x18/\x0a\xe1\xf73\xcf\
+\x98\xb3\x04c\x81E\x1f\x85\x16\x19\xc2\x0f\xa9\xc3\xea\xc6\
+\xb6\x9c\x09\xa1\xfa\xc9\xb39\xe2~\x00\xb1\xd6\xdd\xcb\x13\
+b\x04\xd8\x0fH3\x07\x12\x14J\x8ej\x19&\x83\xe7\
+O\xbf\xce\xea\xb9\xb3{\xd5\x02\xb8\x90$\xdb\xb5\xd9\xd2\
+l\xb0M\xfb\x8e\x91U\xa4llUB\x06m\x82\xbc\
+s\xaaY\xa0\x9e2p\xd1$\xa5\xa9\xd2\x10a\xa8\xca\
+h\x08\xd3\xd2ImHNP\xf6\x19<\x9b\x9c\x92\xb9\
+\xa3\xc8\x08\xc80\xbd\x09\x0e>\xe4\xd1H\xaevD\xdb\
+G\x19\xd2\x15B\x0e#*\xff\x1f\xb0\xaf\xd9\x22\xf8[\
+)\xfe\x98\xdejt\x09\x1d\xd0t\xcc<\xb4f\xcb\xa5\
+l!\x99\xffS\x8er-L\x93\xad\x0bt\x9d\xe1\xe7\
+\xd3\x1c\xaeQ\x18\xc5\x8b.n\xe4\xb8>\xfb\xbc_\x81\
+\xc7F\xba\xc7\x94n\x1fmk\xbf\xb9\xda\xe4\xc7\xbe\x8d\
+\x94y3\x9a8TG\x016RPg\x7fR0\x8d\
+s\xd0|\xa5\x810\x8fj \xca\xa0\xc3Y\x89$\xa4\
+FH;\x03\x10X\x00\x1d#\xda\x1f\xb0\x0d\x8a\xd5\xdf\
+\x0e\xfc\xda8\xf7\x81\xeb\xda0\xc9\x86S\x17\xd2]\x9b\
+\xa0\xc0\xb9\xfc\x14\xd6\xe2\xc0\xf1\xe9\xd3\x00\xae\xa9h\xa1\
+\xf0\xb3\x90\x14^\x02\x81\xfe\x5c?-\x9c\xec\xf7\xe36\
+\xef\xaf\xaf\xceC\xc3zAK\x95\xa3\xdd\x8c#\x9b#\
+\xee\xb8r\xf9<\x8d?\xa6]O\x1al\xa0\x04J\x09\
+\x0eWwC\xad\xa0sb\xd4c\xcd\x95\xf2'\x17\x8b\
+\xfb>\xc1\x09\xbb!\xf2\xd0\x93\xe0\x83\xc8\x8ds\xf0\xa3\
+\x96\xe0!\x1b69\x84\xbe\xd3\x0d\xd0\xd9\x9f\xbe\x1d\x83\
+_\x02Q\x8b\x1d>\x1e\xf8\x14\x9b)\x05F,\xdd\x84\
+\xe5\xcf\xf2\xcd\xa2\xd0\x12pM\x05\x0d\xabS\x84tz\
+\x95\x7f\xed\xd1\xa2\xfaoS3F\xc0=\xab\xa3\x88\xa4\
+\x89a%\xb9q\xc2\xc6\xb8\x0aWEh\x07\x0f!\xcf\
+(\xc3\xc1I\xcf\x9b\x83l\xcb\x166\x00\x03\xb4\xe4^\
+\xd2!\xa7\xe3\x14\x10O6\x98x\x0c6\x22O\x0dq\
+\x94C\xd6\xd0\xa4\xb2\xbc;\x12F\xd3\x0dH5\x8b\xbd\
+\xe0y\x1f\x84\xff&t\x12Q\xabl:\x17\x01\xfb\xee\
+dE'\x8e\x14\xa0\x0a8\xe7\x1c\x1ea\x91\xfd\x1e&\
+\x1d\x9c_r$\x10o\x1b<\xb5S\x06\x00?Z\x99\
+b\xd7\x94\xb7w\xaff/o\xe8L!\xb2\xe6\x14#\
+\xab\xa4\xd4\xb8e\xbb&%\xae\xd7\xadr\x85Q\xe1\x1d\
+.\xff45.o\xa2\xbd\xfeRA\x12\xa9\xcf\xc7\xa4\
+\x02`q4\xb9f)\xae\xe2J}\x87\xcb\xb7]\xbb\
+\xe1\x0ew\xfdU=#@H\xe2aa=x\xb8\xe9\
+R\xa4\xc1\xff\xc9\xd4\xfep\xf8\xd1B\xbc\x8e\xfb\xcf\xcb\
+\x18\x1bXX\x0f\x04H[j.l\x12\x9c\xab!\xf4\
+\x02\xcc\x92\xa3\x0e\xfa\xcc5\xd1\xb1\xb8\x119\x85\x87\x81\
+\xf0\x13\x03\x18\xd8\xd2g\xa07i\x80\xa5\x14\x81\x10\xe6\
+\xeb\x19l\xbf\xabu\xb2fA\x8d#B/\xd9\xa8\xe5\
+7\xd2\x8f*\x96z0\x84M\x86\x89\xe2\x1f|?\xf1\
+\xe2\x1a\xc7Ie\x0eU\x00_\xb85\x069\x8bVE\
+G\x0d\x18\x82\xf92lQ\x11\x80)T\x82\x92\x7f\xdb\
+y\xb6\x04`\xdeW\x17\xb5\x17wh'\xa3\xd1\x0a\x91\
+R\x1c\xd4\xea\xc84.\x99\xd6\xf5\x17\x5cv\xd5\x8a\xaf\
+y\xc4\x9e)\xf6\x9a~U\x93\x9f\xde\x10#L\x10\xb7\
++\x86SQ\xd8I\x82\xb5\x99>:r\xf9\xdf9\x13\
+:\xad\x80\xa1m\x1b\xe6\xd4\xf2\x95\xea\x8d\xbd\xf9s \
+\x84\xa6U\xe3\x08\xed\xbcM\xb2u}\x0fg\x0b\xd9\x1b\
+FI\x5cer\xe9\x86\xc1\xae\xf7\xc9\xd1To\xd5\x08\
+\x95\x84\x86\xa0\xe3%\x95E^\x1al\xf27\x9a\xf9-\
+\x14\xddG>\x22\xdf\x82\xd8\xd9 Q\x92C9 U\
+\x05;\xf2h\x013\x9f\x05\x89\xa1\xd8f\x86\xcd\x95\xcd\
+\x8a\x1c?\xa6\x00\x86I\xa8\x91Ec\xf0\x07\x925\x9c\
+l\x0fH\xe6\xb3A@\xacPC\xbd\xec^$!@\
+\x0e\xe6\xf8\xa3\xc7\xaa\x8a\xd1/\x06\x04\xf9\x8a\xc8H}\
+\x08\xbe\x96\x06\xee,r\xd1\x8b\x98w\xfe\xd6\x08N\xe0\
+Z:\x18?\xde\x99\xb38\xf1\x0dM\xa0\x00\x89\x892\
+\x14\x05Dn\xb0iC\xdbzs\x1d\xd2\xb6\x15\xe1j\
+Bj\xc0\x1b\xec\x94\xe5\xff^\xac\xaa\x96\x1d'I\xfb\
+\x92\x09\xd2&\xec\x85\xbbe\xec\xb86[,G\xd1\xf6\
+\xc5\xb4l\xe6u\x1aA\xdbX\xb3\xe6\xe7\x14\x88\x88\x7f\
+\x90\x08\xaa_^\x0a~\x95f\x01\x0a\xed\xc5-\xde\xe8\
+\xcb\x09\xb6\xec\x82\xb0\xfeU\xf1\x150Zl)\x91\xc0\
+r\xae\x0d\xcf\x01N\x91\xa5\xde{1f\x91[}C\
+\xdd\xfc[\x0d\xe0w\x1f~\xcfD\x1e\xae\x06G\x87.\
+\xd5\xc7\x9eOE>p#=\xae\xdb\x5c\x0e\x1d\xb4\xf6\
+D\x0am\xfb'ud\x81\x83\x81\xa2L\xf6\xc3\x19\xbb\
+\x12\x91\x8a\x1c\x8e\xe6\x01\x14\x05b+\xf3\x9f\xd7\x14\xd8\
+vl\xf2\xfd\x9aR7\xff\xcay\x10\xe3\xbdL\xb4<\
+v\xec3P\xdf\xdaU\x17\xd0%\
 \x00\x00\x02\xfe\
 <\
 svg xmlns=\x22http:\
@@ -856,6 +1429,10 @@ qt_resource_name = b"\
 \x07\xae\xc3\xc3\
 \x00t\
 \x00h\x00e\x00m\x00e\x00s\
+\x00\x0d\
+\x0d6\x0cc\
+\x00d\
+\x00a\x00r\x00k\x00s\x00t\x00y\x00l\x00e\x00.\x00q\x00s\x00s\
 \x00\x0e\
 \x03\x9b1c\
 \x00l\
@@ -906,30 +1483,32 @@ qt_resource_name = b"\
 qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x01\x00\x00\x00\x0c\
+\x00\x00\x00\x14\x00\x02\x00\x00\x00\x02\x00\x00\x00\x0c\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x09\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xda\x00\x00\x00\x00\x00\x01\x00\x00#\xaa\
-\x00\x00\x01\x9a\xbaP\xcf{\
-\x00\x00\x00\xfa\x00\x00\x00\x00\x00\x01\x00\x00&\x8c\
-\x00\x00\x01\x9a\xb4\xb2\x08\xc2\
-\x00\x00\x01(\x00\x00\x00\x00\x00\x01\x00\x00(\xc1\
-\x00\x00\x01\x9a\xb4\xbe\x94N\
-\x00\x00\x01P\x00\x00\x00\x00\x00\x01\x00\x00.\x11\
-\x00\x00\x01\x9a\x0f\xf20:\
-\x00\x00\x01x\x00\x00\x00\x00\x00\x01\x00\x000\xd0\
-\x00\x00\x01\x9a\x0f\xf20\xf8\
-\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x1eZ\
-\x00\x00\x01\x9a\xb4\xbe\xd7\xa7\
-\x00\x00\x00j\x00\x00\x00\x00\x00\x01\x00\x00\x19N\
-\x00\x00\x01\x9a\xb4\xb1\xf3c\
-\x00\x00\x00H\x00\x00\x00\x00\x00\x01\x00\x00\x16L\
-\x00\x00\x01\x9a\xbaP\xb8\xcc\
-\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x83\
-\x00\x00\x01\x9a\x0f\xf20\x18\
-\x00\x00\x00&\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9a\xb4\xfd=\x83\
+\x00\x00\x00\xfa\x00\x00\x00\x00\x00\x01\x00\x00G^\
+\x00\x00\x01\x9a\xdd]q\x80\
+\x00\x00\x01\x1a\x00\x00\x00\x00\x00\x01\x00\x00J@\
+\x00\x00\x01\x9a\xdd]q\x80\
+\x00\x00\x01H\x00\x00\x00\x00\x00\x01\x00\x00Lu\
+\x00\x00\x01\x9a\xdd]q\x80\
+\x00\x00\x01p\x00\x00\x00\x00\x00\x01\x00\x00Q\xc5\
+\x00\x00\x01\x9a\xdd]q\x80\
+\x00\x00\x01\x98\x00\x00\x00\x00\x00\x01\x00\x00T\x84\
+\x00\x00\x01\x9a\xdd]q\x80\
+\x00\x00\x00\xd0\x00\x00\x00\x00\x00\x01\x00\x00B\x0e\
+\x00\x00\x01\x9a\xdd]q\x80\
+\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x00=\x02\
+\x00\x00\x01\x9a\xdd]q\x80\
+\x00\x00\x00h\x00\x00\x00\x00\x00\x01\x00\x00:\x00\
+\x00\x00\x01\x9a\xdd]q\x80\
+\x00\x00\x00\xb6\x00\x00\x00\x00\x00\x01\x00\x00?7\
+\x00\x00\x01\x9a\xdd]q\x80\
+\x00\x00\x00F\x00\x04\x00\x00\x00\x01\x00\x00\x1c\xc1\
+\x00\x00\x01\xa1Q\xe4\xadK\
+\x00\x00\x00&\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1Q\xe4\xadL\
 "
 
 def qInitResources():
@@ -1,3 +1,4 @@
+import os
 import sys
 from PySide6.QtWidgets import (
     QApplication,
@@ -12,60 +13,81 @@ from PySide6.QtWidgets import (
     QCheckBox,
     QScrollArea,
     QFrame,
+    QFileDialog,
+    QMessageBox,
 )
 from PySide6.QtCore import Qt
 
 #from input_dock import InputDock, NoScrollComboBox, apply_field_style
 #from backend import BackendOsBridge
 #from common import *
-from PySide6.QtCore import Qt, QFile, QTextStream
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, QFile, QTextStream, Signal, QStandardPaths
+from PySide6.QtGui import QIcon, QActionGroup, QKeySequence
 
 # Import resources to register them
 from osbridge.resources import resources_rc
 
 from osbridge.ui.input_dock import InputDock, NoScrollComboBox, apply_field_style
 from osbridge.ui.output_dock import OutputDock
+from osbridge.ui.log_dock import LogDock
+from osbridge.ui.theme import THEME_LIGHT, THEME_DARK, theme_manager
+from osbridge.ui.lazy import LazyWidget
+from osbridge.ui.results_table import ResultsTableModel, ResultsTableDialog
+from osbridge.ui.diagram_view import DiagramView
+from osbridge.ui.cad_view import CadView
+from osbridge.ui.scheduler import CoalescingScheduler
+from osbridge.backend.results import ENVELOPE, ALL_COMBINATIONS
+from osbridge.backend.model3d import MODEL_KEYS, girder_of
 from osbridge.backend.backend import BackendOsBridge
+from osbridge.backend.journal import AutosaveJournal, recover_inputs
 from osbridge.backend.common import *
 
+# File dialog filters of the 3D model export formats, see backend.export.EXPORTERS
+EXPORT_FILTERS = "glTF binary (*.glb);;STL (*.stl);;IFC (*.ifc)"
+# File dialog filters of the design report formats, see backend.report.ReportWriter
+REPORT_FILTERS = "HTML (*.html);;LaTeX (*.tex);;PDF (*.pdf)"
+# Autosave project file in the application data folder, see backend.journal
+AUTOSAVE_NAME = "autosave.osbridge"
+# Input edits made within this time of each other are undone together, e.g. typing a value
+UNDO_GROUP_MS = 500
 
-class DummyCADWidget(QWidget):
-    """Placeholder for CAD widget"""
-
-    def __init__(self):
-        super().__init__()
-        layout = QVBoxLayout(self)
-        label = QLabel("CAD Window\n(Placeholder)")
-        label.setAlignment(Qt.AlignCenter)
-        label.setStyleSheet(
-            """
-            QLabel {
-                background-color: #f0f0f0;
-                border: 1px solid #999;
-                padding: 40px;
-                font-size: 18px;
-                color: #666;
-            }
-            """
-        )
-        layout.addWidget(label)
+class OutputDock(QWidget):
+    """Output dock styled to match the provided mockup.
 
+    Section bodies are built the first time they are expanded, from the
+    factories in section_factories. Results passed to set_results are only
+    rendered into sections that are expanded; the others are marked dirty
+    and rendered when the user opens them.
+    """
 
-class OutputDock(QWidget):
-    """Output dock styled to match the provided mockup."""
+    results_changed = Signal(object)  # Emitted with the new AnalysisResults
+    components_changed = Signal(list)  # Emitted with the checked components, e.g. ["Fx", "Mz"]
+    filter_changed = Signal(object, str)  # Emitted with the member (None: all) and combination
+    utilization_changed = Signal(object)  # Emitted with the DesignChecks to colour by, or None
+    checks_changed = Signal(object)  # Emitted with the new DesignChecks
+    report_requested = Signal()  # Emitted when Generate Report is clicked
 
     def __init__(self):
         super().__init__()
         self.setObjectName("outputDock")
-        self.setStyleSheet(
-            """
-            QWidget#outputDock {
-                background-color: #fdfdf8;
-                border-left: 2px solid #d7d9c8;
-            }
-            """
-        )
+        # Section name -> callable filling the body layout on first expand
+        self.section_factories = {}
+        # Section name -> callable showing the current results in the built body
+        self.section_renderers = {}
+        self.section_bodies = {}
+        self.dirty_sections = set()
+        self.results = None
+        self.checks = None
+        self.selected_member = None  # Member chosen in the Member selector, None for all
+        self.utilization_check = None
+        self.results_model = ResultsTableModel(parent=self)
+        self.results_table_window = None
+        self.register_section("Analysis Results", self._populate_analysis_section,
+                              self._render_analysis_results)
+        self.register_section("Design", self._populate_design_section)
+        self.register_section("Superstructure",
+                              lambda layout: self._populate_design_buttons(layout, ["Steel Design", "Deck Design"]))
+        self.register_section("Substructure", self._populate_design_buttons)
         self.init_ui()
 
     def init_ui(self):
@@ -76,19 +98,11 @@ class OutputDock(QWidget):
         title_bar = QWidget()
         title_bar.setFixedHeight(40)
         title_bar.setObjectName("outputHeader")
-        title_bar.setStyleSheet(
-            """
-            QWidget#outputHeader {
-                background-color: #90AF13;
-                border-radius: 12px;
-            }
-            """
-        )
         title_layout = QHBoxLayout(title_bar)
         title_layout.setContentsMargins(14, 0, 14, 0)
 
         title_label = QLabel("Output Dock")
-        title_label.setStyleSheet("color: white; font-size: 13px; font-weight: bold;")
+        title_label.setObjectName("outputTitle")
         title_layout.addWidget(title_label)
         title_layout.addStretch()
         main_layout.addWidget(title_bar)
@@ -96,60 +110,54 @@ class OutputDock(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+        scroll.setObjectName("outputScroll")
 
         scroll_content = QWidget()
         scroll_layout = QVBoxLayout(scroll_content)
         scroll_layout.setContentsMargins(0, 0, 0, 0)
         scroll_layout.setSpacing(14)
 
-        analysis_frame, analysis_body_layout = self._create_section_frame("Analysis Results")
-        self._populate_analysis_section(analysis_body_layout)
-        scroll_layout.addWidget(analysis_frame)
-
-        design_frame, design_body_layout = self._create_section_frame("Design")
-        self._populate_design_section(design_body_layout)
-        scroll_layout.addWidget(design_frame)
+        scroll_layout.addWidget(self._create_section_frame("Analysis Results"))
+        scroll_layout.addWidget(self._create_section_frame("Design"))
 
         scroll_layout.addStretch()
         scroll.setWidget(scroll_content)
         main_layout.addWidget(scroll)
 
-        button_style = """
-            QPushButton {
-                background-color: #90AF13;
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 14px;
-                padding: 10px 16px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #7b980f;
-            }
-        """
-
         results_btn = QPushButton("Generate Results Table")
-        results_btn.setStyleSheet(button_style)
+        results_btn.setObjectName("outputActionBtn")
+        results_btn.clicked.connect(self.show_results_table)
         main_layout.addWidget(results_btn)
 
         report_btn = QPushButton("Generate Report")
-        report_btn.setStyleSheet(button_style)
+        report_btn.setObjectName("outputActionBtn")
+        report_btn.clicked.connect(self.report_requested)
         main_layout.addWidget(report_btn)
 
-    def _create_section_frame(self, title: str):
+    def register_section(self, name: str, factory, renderer=None):
+        """Register the body factory, and optionally the results renderer, of a section"""
+        self.section_factories[name] = factory
+        if renderer is not None:
+            self.section_renderers[name] = renderer
+
+    def _create_section_body(self, name: str, spacing: int):
+        """Placeholder body that runs the section factory when first shown"""
+        def build():
+            body_widget = QWidget()
+            body_layout = QVBoxLayout(body_widget)
+            body_layout.setContentsMargins(0, 0, 0, 0)
+            body_layout.setSpacing(spacing)
+            self.section_factories[name](body_layout)
+            return body_widget
+
+        body = LazyWidget(build)
+        body.built.connect(lambda widget: self.render_dirty_sections())
+        self.section_bodies[name] = body
+        return body
+
+    def _create_section_frame(self, title: str, expanded: bool = True):
         frame = QFrame()
         frame.setObjectName("outputSection")
-        frame.setStyleSheet(
-            """
-            QFrame#outputSection {
-                border: 1px solid #cdd874;
-                border-radius: 18px;
-                background-color: white;
-            }
-            """
-        )
 
         outer_layout = QVBoxLayout(frame)
         outer_layout.setContentsMargins(16, 12, 16, 16)
@@ -159,56 +167,42 @@ class OutputDock(QWidget):
         header_layout.setContentsMargins(0, 0, 0, 0)
 
         title_label = QLabel(title)
-        title_label.setStyleSheet("font-size: 11px; font-weight: bold; color: #2d2d2d;")
+        title_label.setObjectName("sectionTitle")
         header_layout.addWidget(title_label)
         header_layout.addStretch()
 
-        toggle_btn = QPushButton("-")
+        toggle_btn = QPushButton("-" if expanded else "+")
         toggle_btn.setObjectName("sectionToggle")
         toggle_btn.setCheckable(True)
-        toggle_btn.setChecked(True)
+        toggle_btn.setChecked(expanded)
         toggle_btn.setFixedSize(22, 22)
-        toggle_btn.setStyleSheet(
-            """
-            QPushButton#sectionToggle {
-                background-color: white;
-                border: 1px solid #93ad1d;
-                border-radius: 11px;
-                color: #6d7a13;
-                font-weight: bold;
-            }
-            QPushButton#sectionToggle:hover {
-                background-color: #f5f5f5;
-            }
-            """
-        )
         header_layout.addWidget(toggle_btn)
         outer_layout.addLayout(header_layout)
 
         accent_line = QFrame()
         accent_line.setFixedHeight(2)
-        accent_line.setStyleSheet("background-color: #90AF13; border: none;")
+        accent_line.setObjectName("sectionAccent")
         outer_layout.addWidget(accent_line)
 
-        body_widget = QWidget()
-        body_layout = QVBoxLayout(body_widget)
-        body_layout.setContentsMargins(0, 0, 0, 0)
-        body_layout.setSpacing(10)
+        body_widget = self._create_section_body(title, 10)
+        body_widget.setVisible(expanded)
         outer_layout.addWidget(body_widget)
 
         def on_toggle(checked):
             body_widget.setVisible(checked)
             toggle_btn.setText("-" if checked else "+")
+            if checked:
+                self.render_dirty_sections()
 
         toggle_btn.toggled.connect(on_toggle)
 
-        return frame, body_layout
+        return frame
 
     def _populate_analysis_section(self, layout: QVBoxLayout):
         member_row = QHBoxLayout()
         member_row.setSpacing(10)
         member_label = QLabel("Member:")
-        member_label.setStyleSheet("font-size: 10px; color: #333;")
+        member_label.setObjectName("outputOption")
         member_label.setMinimumWidth(90)
         self.member_combo = NoScrollComboBox()
         self.member_combo.addItems(["All"])
@@ -220,63 +214,126 @@ class OutputDock(QWidget):
         load_row = QHBoxLayout()
         load_row.setSpacing(10)
         load_label = QLabel("Load Combination:")
-        load_label.setStyleSheet("font-size: 10px; color: #333;")
+        load_label.setObjectName("outputOption")
         load_label.setMinimumWidth(90)
         self.load_combo = NoScrollComboBox()
-        self.load_combo.addItems(["Envelope"])
+        self.load_combo.addItems([ENVELOPE])
         apply_field_style(self.load_combo)
+        self.member_combo.currentTextChanged.connect(self.filter_results_table)
+        self.load_combo.currentTextChanged.connect(self.filter_results_table)
         load_row.addWidget(load_label)
         load_row.addWidget(self.load_combo)
         layout.addLayout(load_row)
 
         forces_grid = QHBoxLayout()
         forces_grid.setSpacing(12)
+        self.component_checks = {}
         for items in (("Fx", "Mx", "Dx"), ("Fy", "My", "Dy"), ("Fz", "Mz", "Dz")):
             column = QVBoxLayout()
             column.setSpacing(6)
             for text in items:
                 cb = QCheckBox(text)
-                cb.setStyleSheet("font-size: 10px; color: #333;")
+                cb.setObjectName("outputOption")
+                cb.toggled.connect(self.on_component_toggled)
+                self.component_checks[text] = cb
                 column.addWidget(cb)
             forces_grid.addLayout(column)
         layout.addLayout(forces_grid)
 
         display_label = QLabel("Display Options:")
-        display_label.setStyleSheet("font-size: 10px; color: #333;")
+        display_label.setObjectName("outputOption")
         layout.addWidget(display_label)
 
         display_row = QHBoxLayout()
         display_row.setSpacing(12)
         for text in ("Max", "Min"):
             cb = QCheckBox(text)
-            cb.setStyleSheet("font-size: 10px; color: #333;")
+            cb.setObjectName("outputOption")
             display_row.addWidget(cb)
         display_row.addStretch()
         layout.addLayout(display_row)
 
         utilization_check = QCheckBox("Controlling Utilization Ratio")
-        utilization_check.setStyleSheet("font-size: 10px; color: #333;")
+        utilization_check.setObjectName("outputOption")
+        utilization_check.toggled.connect(self.on_utilization_toggled)
         layout.addWidget(utilization_check)
+        self.utilization_check = utilization_check
+
+    def _render_analysis_results(self, results):
+        """Offer the members and load combinations of results in the selectors"""
+        for combo, items, current in (
+                (self.member_combo, ["All", *results.members], self.selected_member or "All"),
+                (self.load_combo, [ENVELOPE, ALL_COMBINATIONS, *results.combinations], self.load_combo.currentText())):
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(items)
+            combo.setCurrentIndex(max(combo.findText(current), 0))
+            combo.blockSignals(False)
+        self.filter_results_table()
+
+    def select_member(self, member):
+        """Choose member (None: all) in the Member selector, e.g. when it is picked in the CAD view.
+
+        A member without results is kept and chosen once results for it are
+        shown.
+        """
+        self.selected_member = member
+        body = self.section_bodies.get("Analysis Results")
+        if body is not None and body.is_built():
+            index = self.member_combo.findText(member or "All")
+            if index >= 0:
+                self.member_combo.setCurrentIndex(index)
+
+    def set_checks(self, checks):
+        """Show new design check results; call again after DesignChecks.update()"""
+        self.checks = checks
+        self.checks_changed.emit(checks)
+        if self.utilization_check is not None and self.utilization_check.isChecked():
+            self.utilization_changed.emit(checks)
+
+    def on_utilization_toggled(self, checked):
+        self.utilization_changed.emit(self.checks if checked else None)
+
+    def on_component_toggled(self, checked):
+        self.components_changed.emit([text for text, cb in self.component_checks.items() if cb.isChecked()])
+
+    def filter_results_table(self, *args):
+        """Show the member and load combination chosen in the dock in the results table and diagrams"""
+        member = self.member_combo.currentText()
+        member = None if member == "All" else member
+        self.selected_member = member
+        self.results_model.set_filter(member, self.load_combo.currentText())
+        self.filter_changed.emit(member, self.load_combo.currentText())
+
+    def show_results_table(self):
+        """Open the results table; the dialog is kept and reused"""
+        if self.results_table_window is None:
+            self.results_table_window = ResultsTableDialog(self.results_model, self)
+        self.results_table_window.show()
+        self.results_table_window.raise_()
+        self.results_table_window.activateWindow()
 
     def _populate_design_section(self, layout: QVBoxLayout):
-        super_frame = self._create_design_subframe("Superstructure", ["Steel Design", "Deck Design"])
+        super_frame = self._create_design_subframe("Superstructure", expanded=False)
         layout.addWidget(super_frame)
 
-        sub_frame = self._create_design_subframe("Substructure")
+        sub_frame = self._create_design_subframe("Substructure", expanded=False)
         layout.addWidget(sub_frame)
 
-    def _create_design_subframe(self, title: str, button_labels=None):
+    def _populate_design_buttons(self, layout: QVBoxLayout, button_labels=None):
+        if button_labels:
+            for text in button_labels:
+                btn = QPushButton(text)
+                btn.setObjectName("designActionBtn")
+                layout.addWidget(btn)
+        else:
+            placeholder = QLabel(" ")
+            placeholder.setMinimumHeight(28)
+            layout.addWidget(placeholder)
+
+    def _create_design_subframe(self, title: str, expanded: bool = True):
         frame = QFrame()
         frame.setObjectName("designSubSection")
-        frame.setStyleSheet(
-            """
-            QFrame#designSubSection {
-                border: 1px solid #e0e8a4;
-                border-radius: 14px;
-                background-color: #fcfdf4;
-            }
-            """
-        )
 
         outer_layout = QVBoxLayout(frame)
         outer_layout.setContentsMargins(12, 8, 12, 12)
@@ -286,94 +343,57 @@ class OutputDock(QWidget):
         header_layout.setContentsMargins(0, 0, 0, 0)
 
         title_label = QLabel(title)
-        title_label.setStyleSheet("font-size: 10px; font-weight: bold; color: #333;")
+        title_label.setObjectName("designTitle")
         header_layout.addWidget(title_label)
         header_layout.addStretch()
 
-        toggle_btn = QPushButton("-")
+        toggle_btn = QPushButton("-" if expanded else "+")
         toggle_btn.setObjectName("designToggle")
         toggle_btn.setCheckable(True)
-        toggle_btn.setChecked(True)
+        toggle_btn.setChecked(expanded)
         toggle_btn.setFixedSize(22, 22)
-        toggle_btn.setStyleSheet(
-            """
-            QPushButton#designToggle {
-                background-color: white;
-                border: 1px solid #bcc66d;
-                border-radius: 11px;
-                color: #6d7a13;
-                font-weight: bold;
-            }
-            QPushButton#designToggle:hover {
-                background-color: #f5f5f5;
-            }
-            """
-        )
         header_layout.addWidget(toggle_btn)
         outer_layout.addLayout(header_layout)
 
-        body_widget = QWidget()
-        body_layout = QVBoxLayout(body_widget)
-        body_layout.setContentsMargins(0, 0, 0, 0)
-        body_layout.setSpacing(6)
+        body_widget = self._create_section_body(title, 6)
+        body_widget.setVisible(expanded)
         outer_layout.addWidget(body_widget)
 
-        if button_labels:
-            for text in button_labels:
-                btn = QPushButton(text)
-                btn.setObjectName("designActionBtn")
-                btn.setStyleSheet(
-                    """
-                    QPushButton#designActionBtn {
-                        background-color: white;
-                        color: #3b3b3b;
-                        border: 1px solid #c7c7c7;
-                        border-radius: 14px;
-                        padding: 8px;
-                        font-size: 10px;
-                        font-weight: bold;
-                    }
-                    QPushButton#designActionBtn:hover {
-                        background-color: #f7f7f7;
-                    }
-                    """
-                )
-                body_layout.addWidget(btn)
-        else:
-            placeholder = QLabel(" ")
-            placeholder.setMinimumHeight(28)
-            body_layout.addWidget(placeholder)
-
         def on_toggle(checked):
             body_widget.setVisible(checked)
             toggle_btn.setText("-" if checked else "+")
+            if checked:
+                self.render_dirty_sections()
 
         toggle_btn.toggled.connect(on_toggle)
 
         return frame
 
+    def is_section_expanded(self, name: str):
+        """True when the body of section name is built and not collapsed, here or in a parent"""
+        body = self.section_bodies.get(name)
+        return body is not None and body.is_built() and body.isVisibleTo(self)
 
-class DummyLogDock(QWidget):
-    """Placeholder for log dock."""
+    def set_results(self, results):
+        """Show new AnalysisResults.
 
-    def __init__(self):
-        super().__init__()
-        layout = QVBoxLayout(self)
-        label = QLabel("Log Window\n(Placeholder)")
-        label.setAlignment(Qt.AlignCenter)
-        label.setStyleSheet(
-            """
-            QLabel {
-                background-color: #fff3e0;
-                border: 2px dashed #ff9800;
-                padding: 20px;
-                font-size: 14px;
-                color: #e65100;
-            }
-            """
-        )
-        layout.addWidget(label)
-        self.hide()
+        The results table model is updated at once; it only reads the rows
+        on screen. Every section with a renderer is marked dirty and only
+        the expanded ones are rendered now.
+        """
+        self.results = results
+        self.results_model.set_results(results)
+        self.results_changed.emit(results)
+        self.dirty_sections = set(self.section_renderers)
+        self.render_dirty_sections()
+
+    def render_dirty_sections(self):
+        """Render the current results into the dirty sections that are expanded"""
+        if self.results is None:
+            return
+        for name in [name for name in self.dirty_sections if self.is_section_expanded(name)]:
+            self.dirty_sections.discard(name)
+            self.section_renderers[name](self.results)
 
 
 class CustomWindow(QWidget):
@@ -381,29 +401,12 @@ class CustomWindow(QWidget):
         super().__init__()
         self.parent = parent
         self.backend = backend()
+        self.autosave = None
 
         self.setWindowTitle(title)
-        self.setStyleSheet(
-            """
-            QWidget {
-                background-color: #ffffff;
-                margin: 0px;
-                padding: 0px;
-            }
-            QMenuBar {
-                background-color: #F4F4F4;
-                color: #000000;
-                padding: 0px;
-            }
-            QMenuBar::item {
-                padding: 5px 10px;
-                background: transparent;
-            }
-            QMenuBar::item:selected {
-                background: #FFFFFF;
-            }
-            """
-        )
+        self.setObjectName("template_page")
+        # Styles come from the theme stylesheet, set before any child is polished
+        theme_manager().add_window(self)
 
         self.init_ui()
 
@@ -413,12 +416,21 @@ class CustomWindow(QWidget):
         main_v_layout.setSpacing(0)
 
         self.menu_bar = QMenuBar(self)
+        self.menu_bar.setObjectName("template_page_menu_bar")
         self.menu_bar.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
         self.menu_bar.setFixedHeight(28)
         self.menu_bar.setContentsMargins(0, 0, 0, 0)
-        self.menu_bar.addMenu("File")
-        self.menu_bar.addMenu("Edit")
-        self.menu_bar.addMenu("Graphics")
+        file_menu = self.menu_bar.addMenu("File")
+        file_menu.addAction("Export 3D Model...").triggered.connect(self.export_3d_model)
+        edit_menu = self.menu_bar.addMenu("Edit")
+        self.undo_action = edit_menu.addAction("Undo")
+        self.undo_action.setShortcut(QKeySequence.Undo)
+        self.undo_action.triggered.connect(self.undo)
+        self.redo_action = edit_menu.addAction("Redo")
+        self.redo_action.setShortcuts([QKeySequence.Redo, QKeySequence("Ctrl+Y")])
+        self.redo_action.triggered.connect(self.redo)
+        graphics_menu = self.menu_bar.addMenu("Graphics")
+        self.init_theme_actions(graphics_menu)
         self.menu_bar.addMenu("Help")
         main_v_layout.addWidget(self.menu_bar)
 
@@ -436,9 +448,32 @@ class CustomWindow(QWidget):
         input_dock.setMaximumWidth(450)
         main_splitter.addWidget(input_dock)
 
-        # CAD widget
-        cad_widget = DummyCADWidget()
-        main_splitter.addWidget(cad_widget)
+        # Central area: CAD widget above the log dock
+        central_splitter = QSplitter(Qt.Vertical)
+        cad_widget = CadView()
+        cad_widget.set_components(self.backend.get_3d_components())
+        central_splitter.addWidget(cad_widget)
+        # Input edits rebuild only the affected components, once per event loop pass
+        self.model_scheduler = CoalescingScheduler(self.update_model, delay_ms=0, parent=self)
+        self.backend.inputs.subscribe(lambda key, old, new: self.model_scheduler.schedule(), MODEL_KEYS)
+
+        # Diagrams of the components checked in the output dock
+        diagram_view = DiagramView()
+        diagram_view.hide()
+        central_splitter.addWidget(diagram_view)
+
+        log_dock = LogDock()
+        central_splitter.addWidget(log_dock)
+        central_splitter.setStretchFactor(0, 1)
+        central_splitter.setStretchFactor(1, 0)
+        central_splitter.setStretchFactor(2, 0)
+        central_splitter.setSizes([600, 250, 150])
+        main_splitter.addWidget(central_splitter)
+
+        # Validation results are listed in the log dock as they arrive
+        input_dock.validation.diagnostics_changed.connect(log_dock.show_diagnostics)
+        log_dock.field_requested.connect(input_dock.validation.focus_field)
+        log_dock.show_diagnostics(input_dock.validation.diagnostics)
 
         # Output dock
         output_dock = OutputDock()
@@ -446,6 +481,22 @@ class CustomWindow(QWidget):
         output_dock.setMaximumWidth(450)
         main_splitter.addWidget(output_dock)
 
+        output_dock.results_changed.connect(diagram_view.set_results)
+        output_dock.filter_changed.connect(diagram_view.set_filter)
+        output_dock.components_changed.connect(self.show_diagrams)
+        output_dock.utilization_changed.connect(cad_widget.set_utilization)
+        cad_widget.selection_changed.connect(self.on_model_selection)
+        output_dock.report_requested.connect(self.write_report)
+        input_dock.design_requested.connect(self.design)
+
+        # Edits become an undo step once they settle, together with the inputs derived from them;
+        # results are kept with the state they were computed for, so undoing brings them back
+        history = self.backend.history
+        self.history_scheduler = CoalescingScheduler(self.commit_history, delay_ms=UNDO_GROUP_MS, parent=self)
+        self.backend.inputs.subscribe(self.on_input_edited)
+        output_dock.results_changed.connect(lambda results: history.store_results("results", results))
+        output_dock.checks_changed.connect(lambda checks: history.store_results("checks", checks))
+
         body_layout.addWidget(main_splitter)
 
         # Set stretch factors for main splitter
@@ -467,13 +518,176 @@ class CustomWindow(QWidget):
         self.input_dock = input_dock
         self.output_dock = output_dock
         self.cad_widget = cad_widget
+        self.diagram_view = diagram_view
+        self.log_dock = log_dock
+
+        # Values the docks set while they were built are the starting state, not an edit
+        self.backend.history.clear()
+        self.update_history_actions()
+
+    def flush_edits(self):
+        """Apply every queued consequence of recent edits, so designs and exports see the settled inputs"""
+        self.input_dock.flush_edits()
+        self.model_scheduler.flush()
+        self.history_scheduler.flush()
+
+    def update_model(self):
+        """Apply the component changes caused by input edits to the CAD view"""
+        diffs = self.backend.update_3d_components()
+        if diffs:
+            self.cad_widget.apply_diffs(diffs)
+
+    def on_input_edited(self, key, old, new):
+        if not self.backend.history.restoring:
+            self.history_scheduler.schedule()
+            self.update_history_actions()
+
+    def commit_history(self):
+        self.backend.history.commit()
+        self.update_history_actions()
+
+    def update_history_actions(self):
+        self.undo_action.setEnabled(self.backend.history.can_undo())
+        self.redo_action.setEnabled(self.backend.history.can_redo())
+
+    def undo(self):
+        """Restore the inputs before the last edit, with their analysis results if they were kept"""
+        self.history_scheduler.cancel()
+        if self.backend.history.undo():
+            self.restore_results()
+        self.update_history_actions()
+
+    def redo(self):
+        """Restore the inputs of the edit last undone, with their analysis results if they were kept"""
+        self.history_scheduler.cancel()
+        if self.backend.history.redo():
+            self.restore_results()
+        self.update_history_actions()
+
+    def restore_results(self):
+        cached = self.backend.history.cached_results()
+        if "results" in cached:
+            self.output_dock.set_results(cached["results"])
+        if "checks" in cached:
+            self.output_dock.set_checks(cached["checks"])
+
+    def save_path(self, title, name, filters):
+        """Path chosen in a save dialog, given the extension of the chosen filter if it has none"""
+        path, selected = QFileDialog.getSaveFileName(self, title, name, filters)
+        if path and not os.path.splitext(path)[1]:
+            path += selected[selected.index("*") + 1:selected.index(")")]
+        return path
+
+    def export_3d_model(self):
+        """Ask for a file and export the 3D model to it, in the format of the chosen filter"""
+        path = self.save_path("Export 3D Model", "bridge.glb", EXPORT_FILTERS)
+        if not path:
+            return
+        self.flush_edits()
+        try:
+            self.backend.export_3d_model(path)
+        except (OSError, ValueError) as error:
+            QMessageBox.warning(self, "Export 3D Model", str(error), QMessageBox.Ok)
+
+    def design(self):
+        """Analyse and check the girders for the current inputs and show the results, unless they have errors"""
+        self.flush_edits()
+        errors = self.backend.func_for_validation(self.backend.inputs)
+        if errors:
+            QMessageBox.warning(self, "Design", "\n".join(errors), QMessageBox.Ok)
+            return
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            results = self.backend.analyse()
+            checks = self.backend.check_design(results)
+        except ValueError as error:
+            QMessageBox.warning(self, "Design", str(error), QMessageBox.Ok)
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.output_dock.set_results(results)
+        self.output_dock.set_checks(checks)
+
+    def write_report(self):
+        """Ask for a file and write the design report of the current inputs and results to it"""
+        path = self.save_path("Generate Report", "design_report.html", REPORT_FILTERS)
+        if not path:
+            return
+        self.flush_edits()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            self.backend.write_report(path, self.output_dock.results, self.output_dock.checks)
+        except (OSError, ValueError) as error:
+            QMessageBox.warning(self, "Generate Report", str(error), QMessageBox.Ok)
+        finally:
+            QApplication.restoreOverrideCursor()
+
+    def start_autosave(self):
+        """Journal input changes from now on, first offering the inputs left by a session that crashed"""
+        folder = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        path = os.path.join(folder, AUTOSAVE_NAME)
+        try:
+            values = recover_inputs(path)
+        except ValueError:
+            values = None
+        if values and QMessageBox.question(
+                self, "Recover Inputs", "The last session did not close normally. Restore its inputs?",
+                QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
+            self.backend.inputs.update(values)
+        try:
+            self.autosave = AutosaveJournal(self.backend.inputs, path)
+        except OSError as error:
+            QMessageBox.warning(self, "Autosave", f"Inputs will not be autosaved: {error}", QMessageBox.Ok)
+
+    def closeEvent(self, event):
+        # The retained Additional Inputs dialog goes with the window that owns its inputs
+        self.input_dock.release_additional_inputs()
+        # A normal close leaves nothing to recover
+        if self.autosave is not None:
+            self.autosave.close(discard=True)
+            self.autosave = None
+        super().closeEvent(event)
+
+    def on_model_selection(self, instances):
+        """Select the girder of the first picked girder part in the output dock and girder details"""
+        girder = next(filter(None, map(girder_of, instances)), None)
+        if girder is not None:
+            self.output_dock.select_member(girder)
+            self.input_dock.select_girder(girder)
+
+    def show_diagrams(self, components):
+        """Show the diagram pane while any component is checked"""
+        self.diagram_view.set_components(components)
+        self.diagram_view.setVisible(bool(components))
+
+
+    def init_theme_actions(self, menu):
+        """Light/Dark theme actions; switching re-styles the live widgets in place"""
+        manager = theme_manager()
+        group = QActionGroup(self)
+        group.setExclusive(True)
+        for theme, text in ((THEME_LIGHT, "Light Theme"), (THEME_DARK, "Dark Theme")):
+            action = menu.addAction(text)
+            action.setCheckable(True)
+            action.setChecked(manager.theme == theme)
+            action.setData(theme)
+            action.triggered.connect(lambda checked, theme=theme: manager.set_theme(theme))
+            group.addAction(action)
+        self.theme_actions = group
+        manager.theme_changed.connect(self.on_theme_changed)
+
+    def on_theme_changed(self, theme):
+        for action in self.theme_actions.actions():
+            action.setChecked(action.data() == theme)
 
 
 def main():
     app = QApplication(sys.argv)   
+    app.setApplicationName("osbridge")  # Names the data folder holding the autosave
     window = CustomWindow("Osdag Bridge", BackendOsBridge)
     window.showMaximized()
     window.show()
+    window.start_autosave()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
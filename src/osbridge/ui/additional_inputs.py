@@ -4,125 +4,30 @@ Provides detailed input fields for manual bridge parameter definition
 """
 import sys
 import os
+from functools import partial
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QLabel, QLineEdit,
     QComboBox, QGroupBox, QFormLayout, QPushButton, QScrollArea,
-    QCheckBox, QMessageBox, QSizePolicy, QSpacerItem, QStackedWidget,
-    QFrame, QGridLayout
+    QCheckBox, QSizePolicy, QSpacerItem, QStackedWidget,
+    QFrame, QGridLayout, QDialog
 )
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QDoubleValidator, QIntValidator
 
 from osbridge.backend.common import *
-
-
-def get_combobox_style():
-    """Return the common stylesheet for dropdowns with the SVG icon from resources."""
-    return """
-        QComboBox {
-            padding: 6px 42px 6px 14px;
-            border: 1px solid #b8b8b8;
-            border-radius: 8px;
-            background-color: #ffffff;
-            color: #2b2b2b;
-            font-size: 12px;
-            min-height: 34px;
-        }
-        QComboBox:hover {
-            border: 1px solid #909090;
-        }
-        QComboBox:focus {
-            border: 1px solid #4a7ba7;
-        }
-        QComboBox::drop-down {
-            subcontrol-origin: padding;
-            subcontrol-position: center right;
-            width: 26px;
-            height: 26px;
-            width: 26px;
-            height: 26px;
-            border: none;
-            background: transparent;
-            right: 8px;
-        }
-        QComboBox::down-arrow {
-            image: url(:/vectors/arrow_down_light.svg);
-            width: 16px;
-            height: 16px;
-        }
-        /* when popup is open show the up arrow */
-        QComboBox::down-arrow:on {
-            image: url(:/vectors/arrow_up_light.svg);
-            width: 16px;
-            height: 16px;
-        }
-        QComboBox QAbstractItemView {{
-            border: 1px solid #b8b8b8;
-            background: #ffffff;
-            selection-background-color: #e7f2ff;
-            selection-color: #1f1f1f;
-        }}
-        QComboBox QAbstractItemView::item {{
-            padding: 6px 10px;
-            font-size: 12px;
-        }}
-    """
-
-
-def get_lineedit_style():
-    """Return the shared stylesheet for line edits in the section inputs."""
-    return """
-        QLineEdit {
-            padding: 6px 12px;
-            border: 1px solid #b8b8b8;
-            border-radius: 8px;
-            background-color: #ffffff;
-            color: #2b2b2b;
-            font-size: 12px;
-            min-height: 34px;
-        }
-        QLineEdit:hover {
-            border: 1px solid #909090;
-        }
-        QLineEdit:focus {
-            border: 1px solid #4a7ba7;
-        }
-        QLineEdit:disabled {
-            background-color: #f0f0f0;
-            color: #9b9b9b;
-        }
-    """
+from osbridge.backend.geometry import overall_bridge_width, girder_count, girder_spacing_for
+from osbridge.backend.model3d import DEFAULT_SPAN
+from osbridge.backend.validation import VALIDATION_ENGINE
+from osbridge.ui.binding import bind_children, subscribe_widget
+from osbridge.ui.lazy import LazyWidget, add_lazy_tab, lazy_pages
+from osbridge.ui.scheduler import CoalescingScheduler
+from osbridge.ui.validation_status import ValidationMonitor
 
 
 def apply_field_style(widget):
     """Apply the appropriate style to combo boxes and line edits."""
     widget.setMinimumHeight(34)
-    if isinstance(widget, QComboBox):
-        widget.setStyleSheet(get_combobox_style())
-    elif isinstance(widget, QLineEdit):
-        widget.setStyleSheet(get_lineedit_style())
-
-
-SECTION_NAV_BUTTON_STYLE = """
-    QPushButton {
-        background-color: #f4f4f4;
-        border: 2px solid #d2d2d2;
-        border-radius: 12px;
-        padding: 20px 16px;
-        text-align: left;
-        font-weight: bold;
-        font-size: 12px;
-        color: #333333;
-    }
-    QPushButton:hover {
-        border-color: #b5b5b5;
-    }
-    QPushButton:checked {
-        background-color: #90af13;
-        border-color: #7da523;
-        color: #ffffff;
-    }
-"""
+    # Styled by the [field="additional"] rules of the application stylesheet
+    widget.setProperty("field", "additional")
 
 
 class OptimizableField(QWidget):
@@ -173,11 +78,21 @@ class BridgeGeometryTab(QWidget):
     
     footpath_changed = Signal(str)  # Signal when footpath status changes
     
-    def __init__(self, footpath_value="None", carriageway_width=7.5, parent=None):
+    # Inputs whose changes feed the overall width and girder layout
+    RECALC_KEYS = (
+        KEY_CARRIAGEWAY_WIDTH, KEY_GIRDER_SPACING, KEY_DECK_OVERHANG,
+        KEY_FOOTPATH_WIDTH, KEY_CRASH_BARRIER_WIDTH, KEY_RAILING_WIDTH,
+    )
+    
+    def __init__(self, inputs, parent=None, validation=None):
         super().__init__(parent)
-        self.footpath_value = footpath_value
-        self.carriageway_width = carriageway_width
+        self.inputs = inputs
+        self.bindings = []
         self.updating_fields = False  # Flag to prevent circular updates
+        # Coalesces rapid edits of the layout fields into one recalculation
+        self.recalc_scheduler = CoalescingScheduler(self.run_scheduled_recalculation, parent=self)
+        # Rule violations are shown inline on the fields rather than in dialogs
+        self.validation = validation or ValidationMonitor(inputs, parent=self)
         self.init_ui()
     
     def style_input_field(self, field):
@@ -186,24 +101,7 @@ class BridgeGeometryTab(QWidget):
     
     def style_group_box(self, group_box):
         """Apply consistent styling to group boxes"""
-        group_box.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #d0d0d0;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 15px;
-                background-color: #f9f9f9;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 10px;
-                padding: 0 5px;
-                background-color: white;
-                color: #4a7ba7;
-            }
-        """)
+        group_box.setObjectName("geometry_group_box")
     
     def init_ui(self):
         main_layout = QVBoxLayout(self)
@@ -212,12 +110,7 @@ class BridgeGeometryTab(QWidget):
         
         # TOP: Diagram placeholder
         diagram_widget = QWidget()
-        diagram_widget.setStyleSheet("""
-            QWidget {
-                background-color: #d9d9d9;
-                border-bottom: 1px solid #b0b0b0;
-            }
-        """)
+        diagram_widget.setObjectName("geometry_diagram")
         diagram_widget.setMinimumHeight(150)
         diagram_widget.setMaximumHeight(200)
         diagram_layout = QVBoxLayout(diagram_widget)
@@ -227,107 +120,76 @@ class BridgeGeometryTab(QWidget):
         # Diagram image placeholder
         diagram_label = QLabel("Bridge Geometry\nDiagram")
         diagram_label.setAlignment(Qt.AlignCenter)
-        diagram_label.setStyleSheet("""
-            QLabel {
-                background-color: transparent;
-                border: none;
-                padding: 20px;
-                font-size: 13px;
-                color: #333;
-            }
-        """)
+        diagram_label.setObjectName("geometry_diagram_label")
         diagram_layout.addWidget(diagram_label, 0, Qt.AlignCenter)
         
         main_layout.addWidget(diagram_widget)
         
         # BOTTOM: Tabbed Input Interface
         input_container = QWidget()
-        input_container.setStyleSheet("""
-            QWidget {
-                background-color: white;
-            }
-        """)
+        input_container.setObjectName("geometry_inputs_container")
         input_layout = QVBoxLayout(input_container)
         input_layout.setContentsMargins(10, 10, 10, 10)
         input_layout.setSpacing(0)
         
         # Create sub-tabs for different input categories
         self.input_tabs = QTabWidget()
-        self.input_tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #b0b0b0;
-                border-top: none;
-                background-color: white;
-                border-radius: 0px 0px 8px 8px;
-            }
-            QTabBar::tab {
-                background-color: #e8e8e8;
-                color: #555;
-                padding: 8px 20px;
-                border: 1px solid #b0b0b0;
-                border-bottom: none;
-                border-right: none;
-                font-size: 11px;
-                min-width: 80px;
-            }
-            QTabBar::tab:last {
-                border-right: 1px solid #b0b0b0;
-            }
-            QTabBar::tab:selected {
-                background-color: #90AF13;
-                color: white;
-                font-weight: bold;
-                border: 1px solid #90AF13;
-                border-bottom: none;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #d0d0d0;
-            }
-        """)
-        
-        # Create each sub-tab
-        self.create_layout_tab()
-        self.create_deck_tab()
-        self.create_crash_barrier_tab()
-        self.create_railing_tab()
-        self.create_wearing_course_tab()
-        self.create_lane_details_tab()
+        self.input_tabs.setObjectName("geometry_input_tabs")
+        
+        # Sub-tabs are built the first time they are selected; their values live in the model
+        add_lazy_tab(self.input_tabs, self.create_layout_tab, "Layout")
+        add_lazy_tab(self.input_tabs, self.create_deck_tab, "Deck")
+        add_lazy_tab(self.input_tabs, self.create_crash_barrier_tab, "Crash Barrier")
+        add_lazy_tab(self.input_tabs, self.create_railing_tab, "Railing")
+        add_lazy_tab(self.input_tabs, self.create_wearing_course_tab, "Wearing Course")
+        add_lazy_tab(self.input_tabs, self.create_lane_details_tab, "Lane Details")
         
         input_layout.addWidget(self.input_tabs)
         
         main_layout.addWidget(input_container, 1)
         
-        # Connect deck thickness to footpath thickness
-        self.deck_thickness.textChanged.connect(self.update_footpath_thickness)
+        # Derived values follow the input model rather than widget signals
+        subscribe_widget(self, self.inputs, self.on_inputs_changed, keys=self.RECALC_KEYS + (
+            KEY_NO_OF_GIRDERS, KEY_FOOTPATH, KEY_DECK_THICKNESS))
         
         # Initialize calculations with default values
-        self.recalculate_girders()
+        self.update_footpath_value(self.inputs[KEY_FOOTPATH])
+    
+    def bind_inputs(self, container):
+        """Bind every input widget in container named after a model key"""
+        bindings = bind_children(container, self.inputs)
+        self.validation.watch_bindings(bindings)
+        self.bindings.extend(bindings)
+    
+    def on_inputs_changed(self, key, old, new):
+        """Dispatch model changes to the geometry handlers"""
+        if key in self.RECALC_KEYS:
+            self.schedule_recalculation()
+        elif key == KEY_NO_OF_GIRDERS:
+            self.on_no_of_girders_changed()
+        elif key == KEY_FOOTPATH:
+            self.update_footpath_value(new)
+        elif key == KEY_DECK_THICKNESS:
+            self.update_footpath_thickness()
     
     def create_layout_tab(self):
         """Create the Layout tab with girder spacing and deck overhang"""
         layout_widget = QWidget()
-        layout_widget.setStyleSheet("background-color: white;")
+        layout_widget.setObjectName("geometry_page")
         layout_layout = QVBoxLayout(layout_widget)
         layout_layout.setContentsMargins(25, 25, 25, 25)
         layout_layout.setSpacing(20)
         
         # --- Inputs Group ---
         inputs_group = QGroupBox()
-        inputs_group.setStyleSheet("""
-            QGroupBox {
-                background-color: white;
-                border: 2px solid #a0a0a0;
-                border-radius: 10px;
-                margin-top: 10px;
-            }
-        """)
+        inputs_group.setObjectName("geometry_input_group")
         inputs_layout = QVBoxLayout(inputs_group)
         inputs_layout.setContentsMargins(20, 20, 20, 20)
         inputs_layout.setSpacing(15)
         
         # Title inside the group
         title_label = QLabel("Inputs:")
-        title_label.setStyleSheet("font-size: 12px; font-weight: bold; color: #000; border: none;")
+        title_label.setObjectName("geometry_group_title")
         inputs_layout.addWidget(title_label)
         
         # Create grid for inputs
@@ -339,59 +201,56 @@ class BridgeGeometryTab(QWidget):
         
         # Row 0: Girder Spacing and No. of Girders
         girder_spacing_label = QLabel("Girder Spacing (m):")
-        girder_spacing_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        girder_spacing_label.setObjectName("geometry_field_label")
         girder_spacing_label.setMinimumWidth(150)
         self.girder_spacing = QLineEdit()
-        self.girder_spacing.setValidator(QDoubleValidator(0.01, 50.0, 3))
-        self.girder_spacing.setText(str(DEFAULT_GIRDER_SPACING))
+        self.girder_spacing.setObjectName(KEY_GIRDER_SPACING)
         self.style_input_field(self.girder_spacing)
-        self.girder_spacing.textChanged.connect(self.on_girder_spacing_changed)
         
         no_girders_label = QLabel("No. of Girders:")
-        no_girders_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        no_girders_label.setObjectName("geometry_field_label")
         no_girders_label.setMinimumWidth(150)
         self.no_of_girders = QLineEdit()
-        self.no_of_girders.setValidator(QIntValidator(2, 100))
+        self.no_of_girders.setObjectName(KEY_NO_OF_GIRDERS)
         self.style_input_field(self.no_of_girders)
-        self.no_of_girders.textChanged.connect(self.on_no_of_girders_changed)
         
         grid.addWidget(girder_spacing_label, 0, 0, Qt.AlignLeft)
         grid.addWidget(self.girder_spacing, 0, 1)
         grid.addWidget(no_girders_label, 0, 2, Qt.AlignLeft)
         grid.addWidget(self.no_of_girders, 0, 3)
         
-        # Row 1: Deck Overhang Width
+        # Row 1: Deck Overhang Width and No. of Spans
         deck_overhang_label = QLabel("Deck Overhang Width (m):")
-        deck_overhang_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        deck_overhang_label.setObjectName("geometry_field_label")
         deck_overhang_label.setMinimumWidth(150)
         self.deck_overhang = QLineEdit()
-        self.deck_overhang.setValidator(QDoubleValidator(0.0, 10.0, 3))
-        self.deck_overhang.setText(str(DEFAULT_DECK_OVERHANG))
+        self.deck_overhang.setObjectName(KEY_DECK_OVERHANG)
         self.style_input_field(self.deck_overhang)
-        self.deck_overhang.textChanged.connect(self.on_deck_overhang_changed)
+        
+        no_spans_label = QLabel("No. of Spans:")
+        no_spans_label.setObjectName("geometry_field_label")
+        no_spans_label.setMinimumWidth(150)
+        self.no_of_spans = QLineEdit()
+        self.no_of_spans.setObjectName(KEY_NO_OF_SPANS)
+        self.style_input_field(self.no_of_spans)
         
         grid.addWidget(deck_overhang_label, 1, 0, Qt.AlignLeft)
         grid.addWidget(self.deck_overhang, 1, 1)
+        grid.addWidget(no_spans_label, 1, 2, Qt.AlignLeft)
+        grid.addWidget(self.no_of_spans, 1, 3)
         
         inputs_layout.addLayout(grid)
         layout_layout.addWidget(inputs_group)
         
         # --- Overall Bridge Width Group ---
         width_group = QGroupBox()
-        width_group.setStyleSheet("""
-            QGroupBox {
-                background-color: white;
-                border: 2px solid #a0a0a0;
-                border-radius: 10px;
-                margin-top: 10px;
-            }
-        """)
+        width_group.setObjectName("geometry_input_group")
         width_layout = QHBoxLayout(width_group)
         width_layout.setContentsMargins(20, 20, 20, 20)
         width_layout.setSpacing(40)
         
         overall_width_label = QLabel("Overall Bridge Width (m):")
-        overall_width_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        overall_width_label.setObjectName("geometry_field_label")
         overall_width_label.setMinimumWidth(150)
         
         self.overall_width_display = QLineEdit()
@@ -405,33 +264,29 @@ class BridgeGeometryTab(QWidget):
         layout_layout.addWidget(width_group)
         layout_layout.addStretch()
         
-        self.input_tabs.addTab(layout_widget, "Layout")
+        self.overall_width_display.setText(f"{self.get_overall_bridge_width():.3f}")
+        
+        self.bind_inputs(layout_widget)
+        return layout_widget
     
     def create_deck_tab(self):
         """Create the Deck tab with deck and footpath parameters"""
         deck_widget = QWidget()
-        deck_widget.setStyleSheet("background-color: white;")
+        deck_widget.setObjectName("geometry_page")
         deck_layout = QVBoxLayout(deck_widget)
         deck_layout.setContentsMargins(25, 25, 25, 25)
         deck_layout.setSpacing(20)
         
         # --- Deck Inputs Group ---
         inputs_group = QGroupBox()
-        inputs_group.setStyleSheet("""
-            QGroupBox {
-                background-color: white;
-                border: 2px solid #a0a0a0;
-                border-radius: 10px;
-                margin-top: 10px;
-            }
-        """)
+        inputs_group.setObjectName("geometry_input_group")
         inputs_layout = QVBoxLayout(inputs_group)
         inputs_layout.setContentsMargins(20, 20, 20, 20)
         inputs_layout.setSpacing(15)
         
         # Title
         title_label = QLabel("Deck Inputs:")
-        title_label.setStyleSheet("font-size: 12px; font-weight: bold; color: #000; border: none;")
+        title_label.setObjectName("geometry_group_title")
         inputs_layout.addWidget(title_label)
         
         # Create grid for inputs
@@ -443,16 +298,17 @@ class BridgeGeometryTab(QWidget):
         
         # Row 0: Deck Thickness and Decking Plate
         deck_thickness_label = QLabel("Deck Thickness:")
-        deck_thickness_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        deck_thickness_label.setObjectName("geometry_field_label")
         deck_thickness_label.setMinimumWidth(150)
         self.deck_thickness = QLineEdit()
-        self.deck_thickness.setValidator(QDoubleValidator(0.0, 500.0, 0))
+        self.deck_thickness.setObjectName(KEY_DECK_THICKNESS)
         self.style_input_field(self.deck_thickness)
         
         decking_plate_label = QLabel("Decking Plate:")
-        decking_plate_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        decking_plate_label.setObjectName("geometry_field_label")
         decking_plate_label.setMinimumWidth(150)
         self.decking_plate = QComboBox()
+        self.decking_plate.setObjectName(KEY_DECKING_PLATE)
         self.decking_plate.addItems(VALUES_DECKING_PLATE)
         self.style_input_field(self.decking_plate)
         
@@ -463,18 +319,17 @@ class BridgeGeometryTab(QWidget):
         
         # Row 1: Footpath Width and Footpath Thickness
         footpath_width_label = QLabel("Footpath Width (m):")
-        footpath_width_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        footpath_width_label.setObjectName("geometry_field_label")
         footpath_width_label.setMinimumWidth(150)
         self.footpath_width = QLineEdit()
-        self.footpath_width.setValidator(QDoubleValidator(MIN_FOOTPATH_WIDTH, 5.0, 3))
+        self.footpath_width.setObjectName(KEY_FOOTPATH_WIDTH)
         self.style_input_field(self.footpath_width)
-        self.footpath_width.textChanged.connect(self.on_footpath_width_changed)
         
         footpath_thickness_label = QLabel("Footpath Thickness :")
-        footpath_thickness_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        footpath_thickness_label.setObjectName("geometry_field_label")
         footpath_thickness_label.setMinimumWidth(150)
         self.footpath_thickness = QLineEdit()
-        self.footpath_thickness.setValidator(QDoubleValidator(0.0, 500.0, 0))
+        self.footpath_thickness.setObjectName(KEY_FOOTPATH_THICKNESS)
         self.style_input_field(self.footpath_thickness)
         
         grid.addWidget(footpath_width_label, 1, 0, Qt.AlignLeft)
@@ -484,17 +339,17 @@ class BridgeGeometryTab(QWidget):
         
         # Row 2: Safety Kerb Thickness and Safety Kerb Width
         safety_kerb_thickness_label = QLabel("Safety Kerb Thickness (mm):")
-        safety_kerb_thickness_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        safety_kerb_thickness_label.setObjectName("geometry_field_label")
         safety_kerb_thickness_label.setMinimumWidth(150)
         self.safety_kerb_thickness = QLineEdit()
-        self.safety_kerb_thickness.setValidator(QDoubleValidator(0.0, 500.0, 0))
+        self.safety_kerb_thickness.setObjectName(KEY_SAFETY_KERB_THICKNESS)
         self.style_input_field(self.safety_kerb_thickness)
         
         safety_kerb_width_label = QLabel("Safety Kerb Width (m):")
-        safety_kerb_width_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        safety_kerb_width_label.setObjectName("geometry_field_label")
         safety_kerb_width_label.setMinimumWidth(150)
         self.safety_kerb_width = QLineEdit()
-        self.safety_kerb_width.setValidator(QDoubleValidator(MIN_SAFETY_KERB_WIDTH, 2.0, 3))
+        self.safety_kerb_width.setObjectName(KEY_SAFETY_KERB_WIDTH)
         self.style_input_field(self.safety_kerb_width)
         
         grid.addWidget(safety_kerb_thickness_label, 2, 0, Qt.AlignLeft)
@@ -504,9 +359,10 @@ class BridgeGeometryTab(QWidget):
         
         # Row 3: Load Case
         load_case_label = QLabel("Load Case:")
-        load_case_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        load_case_label.setObjectName("geometry_field_label")
         load_case_label.setMinimumWidth(150)
         self.deck_load_case = QComboBox()
+        self.deck_load_case.setObjectName(KEY_DECK_LOAD_CASE)
         self.deck_load_case.addItems(VALUES_LOAD_CASE)
         self.style_input_field(self.deck_load_case)
         
@@ -517,33 +373,28 @@ class BridgeGeometryTab(QWidget):
         deck_layout.addWidget(inputs_group)
         deck_layout.addStretch()
         
-        self.input_tabs.addTab(deck_widget, "Deck")
+        self.bind_inputs(deck_widget)
+        self.update_footpath_fields(self.inputs[KEY_FOOTPATH])
+        return deck_widget
     
     def create_crash_barrier_tab(self):
         """Create the Crash Barrier tab"""
         crash_widget = QWidget()
-        crash_widget.setStyleSheet("background-color: white;")
+        crash_widget.setObjectName("geometry_page")
         crash_layout = QVBoxLayout(crash_widget)
         crash_layout.setContentsMargins(25, 25, 25, 25)
         crash_layout.setSpacing(20)
         
         # --- Inputs Group ---
         inputs_group = QGroupBox()
-        inputs_group.setStyleSheet("""
-            QGroupBox {
-                background-color: white;
-                border: 2px solid #a0a0a0;
-                border-radius: 10px;
-                margin-top: 10px;
-            }
-        """)
+        inputs_group.setObjectName("geometry_input_group")
         inputs_layout = QVBoxLayout(inputs_group)
         inputs_layout.setContentsMargins(20, 20, 20, 20)
         inputs_layout.setSpacing(15)
         
         # Title
         title_label = QLabel("Inputs:")
-        title_label.setStyleSheet("font-size: 12px; font-weight: bold; color: #000; border: none;")
+        title_label.setObjectName("geometry_group_title")
         inputs_layout.addWidget(title_label)
         
         # Create grid for inputs
@@ -555,35 +406,33 @@ class BridgeGeometryTab(QWidget):
         
         # Row 0: Crash Barrier Type
         crash_type_label = QLabel("Crash Barrier Type:")
-        crash_type_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        crash_type_label.setObjectName("geometry_field_label")
         crash_type_label.setMinimumWidth(180)
         self.crash_barrier_type = QComboBox()
+        self.crash_barrier_type.setObjectName(KEY_CRASH_BARRIER_TYPE)
         self.crash_barrier_type.addItems(VALUES_CRASH_BARRIER_TYPE)
         self.style_input_field(self.crash_barrier_type)
-        self.crash_barrier_type.currentTextChanged.connect(self.on_crash_barrier_type_changed)
         
         grid.addWidget(crash_type_label, 0, 0, Qt.AlignLeft)
         grid.addWidget(self.crash_barrier_type, 0, 1, 1, 3)
         
         # Row 1: Crash Barrier Width
         crash_width_label = QLabel("Crash Barrier Width (m):")
-        crash_width_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        crash_width_label.setObjectName("geometry_field_label")
         crash_width_label.setMinimumWidth(180)
         self.crash_barrier_width = QLineEdit()
-        self.crash_barrier_width.setValidator(QDoubleValidator(0.0, 2.0, 3))
-        self.crash_barrier_width.setText(str(DEFAULT_CRASH_BARRIER_WIDTH))
+        self.crash_barrier_width.setObjectName(KEY_CRASH_BARRIER_WIDTH)
         self.style_input_field(self.crash_barrier_width)
-        self.crash_barrier_width.textChanged.connect(self.recalculate_girders)
         
         grid.addWidget(crash_width_label, 1, 0, Qt.AlignLeft)
         grid.addWidget(self.crash_barrier_width, 1, 1, 1, 3)
         
         # Row 2: Crash Barrier Material density
         crash_density_label = QLabel("Crash Barrier Material density")
-        crash_density_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        crash_density_label.setObjectName("geometry_field_label")
         crash_density_label.setMinimumWidth(180)
         self.crash_barrier_density = QLineEdit()
-        self.crash_barrier_density.setValidator(QDoubleValidator(0.0, 100.0, 2))
+        self.crash_barrier_density.setObjectName(KEY_CRASH_BARRIER_DENSITY)
         self.style_input_field(self.crash_barrier_density)
         
         grid.addWidget(crash_density_label, 2, 0, Qt.AlignLeft)
@@ -591,10 +440,10 @@ class BridgeGeometryTab(QWidget):
         
         # Row 3: Crash Barrier Area
         crash_area_label = QLabel("Crash Barrier Area (m2 ):")
-        crash_area_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        crash_area_label.setObjectName("geometry_field_label")
         crash_area_label.setMinimumWidth(180)
         self.crash_barrier_area = QLineEdit()
-        self.crash_barrier_area.setValidator(QDoubleValidator(0.0, 10.0, 4))
+        self.crash_barrier_area.setObjectName(KEY_CRASH_BARRIER_AREA)
         self.style_input_field(self.crash_barrier_area)
         
         grid.addWidget(crash_area_label, 3, 0, Qt.AlignLeft)
@@ -602,9 +451,10 @@ class BridgeGeometryTab(QWidget):
         
         # Row 4: Load Case
         load_case_label = QLabel("Load Case:")
-        load_case_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        load_case_label.setObjectName("geometry_field_label")
         load_case_label.setMinimumWidth(180)
         self.crash_load_case = QComboBox()
+        self.crash_load_case.setObjectName(KEY_CRASH_BARRIER_LOAD_CASE)
         self.crash_load_case.addItems(VALUES_LOAD_CASE)
         self.crash_load_case.setCurrentText("Super-imposed Dead Load (SIDL)")
         self.style_input_field(self.crash_load_case)
@@ -616,33 +466,27 @@ class BridgeGeometryTab(QWidget):
         crash_layout.addWidget(inputs_group)
         crash_layout.addStretch()
         
-        self.input_tabs.addTab(crash_widget, "Crash Barrier")
+        self.bind_inputs(crash_widget)
+        return crash_widget
     
     def create_railing_tab(self):
         """Create the Railing tab"""
         railing_widget = QWidget()
-        railing_widget.setStyleSheet("background-color: white;")
+        railing_widget.setObjectName("geometry_page")
         railing_layout = QVBoxLayout(railing_widget)
         railing_layout.setContentsMargins(25, 25, 25, 25)
         railing_layout.setSpacing(20)
         
         # --- Inputs Group ---
         inputs_group = QGroupBox()
-        inputs_group.setStyleSheet("""
-            QGroupBox {
-                background-color: white;
-                border: 2px solid #a0a0a0;
-                border-radius: 10px;
-                margin-top: 10px;
-            }
-        """)
+        inputs_group.setObjectName("geometry_input_group")
         inputs_layout = QVBoxLayout(inputs_group)
         inputs_layout.setContentsMargins(20, 20, 20, 20)
         inputs_layout.setSpacing(15)
         
         # Title
         title_label = QLabel("Inputs:")
-        title_label.setStyleSheet("font-size: 12px; font-weight: bold; color: #000; border: none;")
+        title_label.setObjectName("geometry_group_title")
         inputs_layout.addWidget(title_label)
         
         # Create grid for inputs
@@ -654,34 +498,32 @@ class BridgeGeometryTab(QWidget):
         
         # Row 0: Railing Width
         railing_width_label = QLabel("Railing Width (mm):")
-        railing_width_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        railing_width_label.setObjectName("geometry_field_label")
         railing_width_label.setMinimumWidth(180)
         self.railing_width = QLineEdit()
-        self.railing_width.setValidator(QDoubleValidator(0.0, 1000.0, 1))
+        self.railing_width.setObjectName(KEY_RAILING_WIDTH)
         self.style_input_field(self.railing_width)
-        self.railing_width.textChanged.connect(self.recalculate_girders)
         
         grid.addWidget(railing_width_label, 0, 0, Qt.AlignLeft)
         grid.addWidget(self.railing_width, 0, 1, 1, 3)
         
         # Row 1: Railing Height
         railing_height_label = QLabel("Railing Height (mm):")
-        railing_height_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        railing_height_label.setObjectName("geometry_field_label")
         railing_height_label.setMinimumWidth(180)
         self.railing_height = QLineEdit()
-        self.railing_height.setValidator(QDoubleValidator(0.0, 2000.0, 1))
+        self.railing_height.setObjectName(KEY_RAILING_HEIGHT)
         self.style_input_field(self.railing_height)
-        self.railing_height.editingFinished.connect(self.validate_railing_height)
         
         grid.addWidget(railing_height_label, 1, 0, Qt.AlignLeft)
         grid.addWidget(self.railing_height, 1, 1, 1, 3)
         
         # Row 2: Railing Load
         railing_load_label = QLabel("Railing Load (kN/m)")
-        railing_load_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        railing_load_label.setObjectName("geometry_field_label")
         railing_load_label.setMinimumWidth(180)
         self.railing_load = QLineEdit()
-        self.railing_load.setValidator(QDoubleValidator(0.0, 100.0, 2))
+        self.railing_load.setObjectName(KEY_RAILING_LOAD)
         self.style_input_field(self.railing_load)
         
         grid.addWidget(railing_load_label, 2, 0, Qt.AlignLeft)
@@ -689,9 +531,10 @@ class BridgeGeometryTab(QWidget):
         
         # Row 3: Load Case
         load_case_label = QLabel("Load Case:")
-        load_case_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        load_case_label.setObjectName("geometry_field_label")
         load_case_label.setMinimumWidth(180)
         self.railing_load_case = QComboBox()
+        self.railing_load_case.setObjectName(KEY_RAILING_LOAD_CASE)
         self.railing_load_case.addItems(VALUES_LOAD_CASE)
         self.railing_load_case.setCurrentText("Super-imposed Dead Load (SIDL)")
         self.style_input_field(self.railing_load_case)
@@ -703,33 +546,27 @@ class BridgeGeometryTab(QWidget):
         railing_layout.addWidget(inputs_group)
         railing_layout.addStretch()
         
-        self.input_tabs.addTab(railing_widget, "Railing")
+        self.bind_inputs(railing_widget)
+        return railing_widget
     
     def create_wearing_course_tab(self):
         """Create the Wearing Course tab"""
         wearing_widget = QWidget()
-        wearing_widget.setStyleSheet("background-color: white;")
+        wearing_widget.setObjectName("geometry_page")
         wearing_layout = QVBoxLayout(wearing_widget)
         wearing_layout.setContentsMargins(25, 25, 25, 25)
         wearing_layout.setSpacing(20)
         
         # --- Inputs Group ---
         inputs_group = QGroupBox()
-        inputs_group.setStyleSheet("""
-            QGroupBox {
-                background-color: white;
-                border: 2px solid #a0a0a0;
-                border-radius: 10px;
-                margin-top: 10px;
-            }
-        """)
+        inputs_group.setObjectName("geometry_input_group")
         inputs_layout = QVBoxLayout(inputs_group)
         inputs_layout.setContentsMargins(20, 20, 20, 20)
         inputs_layout.setSpacing(15)
         
         # Title
         title_label = QLabel("Inputs:")
-        title_label.setStyleSheet("font-size: 12px; font-weight: bold; color: #000; border: none;")
+        title_label.setObjectName("geometry_group_title")
         inputs_layout.addWidget(title_label)
         
         # Create grid for inputs
@@ -741,9 +578,10 @@ class BridgeGeometryTab(QWidget):
         
         # Row 0: Wearing Course Material
         wc_material_label = QLabel("Wearing Course Material:")
-        wc_material_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        wc_material_label.setObjectName("geometry_field_label")
         wc_material_label.setMinimumWidth(180)
         self.wc_material = QComboBox()
+        self.wc_material.setObjectName(KEY_WEARING_COAT_MATERIAL)
         self.wc_material.addItems(VALUES_WEARING_COAT_MATERIAL)
         self.style_input_field(self.wc_material)
         
@@ -752,10 +590,10 @@ class BridgeGeometryTab(QWidget):
         
         # Row 1: Wearing Coat Density
         wc_density_label = QLabel("Wearing Coat Density (kN/m^3):")
-        wc_density_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        wc_density_label.setObjectName("geometry_field_label")
         wc_density_label.setMinimumWidth(180)
         self.wc_density = QLineEdit()
-        self.wc_density.setValidator(QDoubleValidator(0.0, 100.0, 2))
+        self.wc_density.setObjectName(KEY_WEARING_COAT_DENSITY)
         self.style_input_field(self.wc_density)
         
         grid.addWidget(wc_density_label, 1, 0, Qt.AlignLeft)
@@ -763,10 +601,10 @@ class BridgeGeometryTab(QWidget):
         
         # Row 2: Wearing Coat Thickness
         wc_thickness_label = QLabel("Wearing Coat Thickness (mm):")
-        wc_thickness_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        wc_thickness_label.setObjectName("geometry_field_label")
         wc_thickness_label.setMinimumWidth(180)
         self.wc_thickness = QLineEdit()
-        self.wc_thickness.setValidator(QDoubleValidator(0.0, 500.0, 1))
+        self.wc_thickness.setObjectName(KEY_WEARING_COAT_THICKNESS)
         self.style_input_field(self.wc_thickness)
         
         grid.addWidget(wc_thickness_label, 2, 0, Qt.AlignLeft)
@@ -774,9 +612,10 @@ class BridgeGeometryTab(QWidget):
         
         # Row 3: Load Case
         load_case_label = QLabel("Load Case:")
-        load_case_label.setStyleSheet("font-size: 11px; color: #555; border: none;")
+        load_case_label.setObjectName("geometry_field_label")
         load_case_label.setMinimumWidth(180)
         self.wc_load_case = QComboBox()
+        self.wc_load_case.setObjectName(KEY_WEARING_COAT_LOAD_CASE)
         self.wc_load_case.addItems(VALUES_LOAD_CASE)
         self.wc_load_case.setCurrentText("Dead Load of Wearing Course (DW)")
         self.style_input_field(self.wc_load_case)
@@ -788,19 +627,20 @@ class BridgeGeometryTab(QWidget):
         wearing_layout.addWidget(inputs_group)
         wearing_layout.addStretch()
         
-        self.input_tabs.addTab(wearing_widget, "Wearing Course")
+        self.bind_inputs(wearing_widget)
+        return wearing_widget
     
     def create_lane_details_tab(self):
         """Create the Lane Details tab"""
         lane_widget = QWidget()
-        lane_widget.setStyleSheet("background-color: white;")
+        lane_widget.setObjectName("geometry_page")
         lane_layout = QVBoxLayout(lane_widget)
         lane_layout.setContentsMargins(25, 25, 25, 25)
         lane_layout.setSpacing(20)
         
         # Title
         title_label = QLabel("Inputs:")
-        title_label.setStyleSheet("font-size: 12px; font-weight: bold; color: #000;")
+        title_label.setObjectName("geometry_group_title")
         lane_layout.addWidget(title_label)
         
         # Create grid for inputs
@@ -811,9 +651,10 @@ class BridgeGeometryTab(QWidget):
         
         # Row 0: No. of Lanes
         no_lanes_label = QLabel("No. of Lanes:")
-        no_lanes_label.setStyleSheet("font-size: 11px; color: #555;")
+        no_lanes_label.setObjectName("geometry_field_label")
         no_lanes_label.setMinimumWidth(150)
         self.no_of_lanes = QComboBox()
+        self.no_of_lanes.setObjectName(KEY_NO_OF_LANES)
         self.no_of_lanes.addItems(VALUES_NO_OF_LANES)
         self.style_input_field(self.no_of_lanes)
         
@@ -822,10 +663,10 @@ class BridgeGeometryTab(QWidget):
         
         # Row 1: Lane Width
         lane_width_label = QLabel("Lane Width (m):")
-        lane_width_label.setStyleSheet("font-size: 11px; color: #555;")
+        lane_width_label.setObjectName("geometry_field_label")
         lane_width_label.setMinimumWidth(150)
         self.lane_width = QLineEdit()
-        self.lane_width.setValidator(QDoubleValidator(0.0, 20.0, 2))
+        self.lane_width.setObjectName(KEY_LANE_WIDTH)
         self.style_input_field(self.lane_width)
         
         grid.addWidget(lane_width_label, 1, 0, Qt.AlignLeft)
@@ -834,199 +675,105 @@ class BridgeGeometryTab(QWidget):
         lane_layout.addLayout(grid)
         lane_layout.addStretch()
         
-        self.input_tabs.addTab(lane_widget, "Lane Details")
+        self.bind_inputs(lane_widget)
+        return lane_widget
     
     def update_footpath_value(self, footpath_value):
         """Update visibility based on footpath selection"""
-        self.footpath_value = footpath_value
-        # Update visibility of footpath-related fields in Deck tab
+        self.update_footpath_fields(footpath_value)
+        self.recalculate_girders()  # Recalculate when footpath changes
+        self.footpath_changed.emit(footpath_value)
+    
+    def update_footpath_fields(self, footpath_value):
+        """Enable footpath-related fields in the Deck tab once it is built"""
         if hasattr(self, 'footpath_width'):
             self.footpath_width.setEnabled(footpath_value != "None")
             self.footpath_thickness.setEnabled(footpath_value != "None")
-        self.recalculate_girders()  # Recalculate when footpath changes
-        self.footpath_changed.emit(footpath_value)
     
     def get_overall_bridge_width(self):
         """Calculate Overall Bridge Width = Carriageway + Footpath + Crash Barrier/Railing"""
-        try:
-            overall_width = self.carriageway_width
-            
-            # Add footpath width
-            if self.footpath_value != "None":
-                footpath_width = float(self.footpath_width.text()) if self.footpath_width.text() else 0
-                # Count footpaths: "Single Sided" = 1, "Both" = 2
-                num_footpaths = 2 if self.footpath_value == "Both" else (1 if self.footpath_value == "Single Sided" else 0)
-                overall_width += footpath_width * num_footpaths
-            
-            # Add crash barrier width
-            crash_barrier_width = float(self.crash_barrier_width.text()) if self.crash_barrier_width.text() else DEFAULT_CRASH_BARRIER_WIDTH
-            # Assuming crash barriers on both edges
-            overall_width += crash_barrier_width * 2
-            
-            # Add railing width (if footpath present)
-            if self.footpath_value != "None":
-                railing_width = float(self.railing_width.text()) if self.railing_width.text() else DEFAULT_RAILING_WIDTH
-                # Railings on both sides if footpath exists
-                overall_width += railing_width * 2
-            
-            return overall_width
-        except:
-            return self.carriageway_width
+        return overall_bridge_width(self.inputs)
     
     def recalculate_girders(self):
         """Recalculate based on the formula: (Overall Bridge Width - Deck Overhang) / Girder Spacing = No. of Girders"""
         if self.updating_fields:
             return
         
+        overall_width = self.get_overall_bridge_width()
+        
+        # Update the display field if it exists
+        if hasattr(self, 'overall_width_display'):
+            self.overall_width_display.setText(f"{overall_width:.3f}")
+        
+        self.updating_fields = True
         try:
-            overall_width = self.get_overall_bridge_width()
-            
-            # Update the display field if it exists
-            if hasattr(self, 'overall_width_display'):
-                self.overall_width_display.setText(f"{overall_width:.3f}")
-            
-            spacing = float(self.girder_spacing.text()) if self.girder_spacing.text() else DEFAULT_GIRDER_SPACING
-            overhang = float(self.deck_overhang.text()) if self.deck_overhang.text() else DEFAULT_DECK_OVERHANG
-            
-            # Validate: spacing and overhang should be less than overall bridge width
-            if spacing >= overall_width or overhang >= overall_width:
-                self.no_of_girders.setText("")
-                return
-            
-            # Calculate: No. of Girders = (Overall Width - 2*Overhang) / Spacing + 1
-            if spacing > 0:
-                no_girders = int(round((overall_width - 2 * overhang) / spacing)) + 1
-                if no_girders >= 2:
-                    self.updating_fields = True
-                    self.no_of_girders.setText(str(no_girders))
-                    self.updating_fields = False
-        except:
-            pass
-    
-    def on_girder_spacing_changed(self):
-        """When user changes girder spacing, recalculate number of girders"""
-        if not self.updating_fields:
-            try:
-                overall_width = self.get_overall_bridge_width()
-                spacing_text = self.girder_spacing.text()
-                if spacing_text:
-                    spacing = float(spacing_text)
-                    if spacing >= overall_width:
-                        QMessageBox.warning(self, "Invalid Girder Spacing", 
-                            f"Girder spacing ({spacing:.2f} m) must be less than overall bridge width ({overall_width:.2f} m).")
-                        return
-                self.recalculate_girders()
-            except:
-                pass
+            self.inputs.set(KEY_NO_OF_GIRDERS, girder_count(self.inputs, overall_width))
+        finally:
+            self.updating_fields = False
     
-    def on_deck_overhang_changed(self):
-        """When user changes deck overhang, recalculate number of girders"""
+    def schedule_recalculation(self):
+        """Queue a coalesced recalculation; programmatic updates are ignored"""
         if not self.updating_fields:
-            try:
-                overall_width = self.get_overall_bridge_width()
-                overhang_text = self.deck_overhang.text()
-                if overhang_text:
-                    overhang = float(overhang_text)
-                    if overhang >= overall_width:
-                        QMessageBox.warning(self, "Invalid Deck Overhang", 
-                            f"Deck overhang ({overhang:.2f} m) must be less than overall bridge width ({overall_width:.2f} m).")
-                        return
-                self.recalculate_girders()
-            except:
-                pass
+            self.recalc_scheduler.schedule()
     
-    def on_no_of_girders_changed(self):
-        """When user changes number of girders, recalculate girder spacing"""
-        if not self.updating_fields:
-            try:
-                no_girders_text = self.no_of_girders.text()
-                if no_girders_text:
-                    no_girders = int(no_girders_text)
-                    if no_girders < 2:
-                        QMessageBox.warning(self, "Invalid Number of Girders", 
-                            "Number of girders must be at least 2.")
-                        return
-                    
-                    overall_width = self.get_overall_bridge_width()
-                    overhang = float(self.deck_overhang.text()) if self.deck_overhang.text() else DEFAULT_DECK_OVERHANG
-                    
-                    # Calculate spacing: Spacing = (Overall Width - 2*Overhang) / (No. of Girders - 1)
-                    if no_girders > 1:
-                        new_spacing = (overall_width - 2 * overhang) / (no_girders - 1)
-                        self.updating_fields = True
-                        self.girder_spacing.setText(f"{new_spacing:.3f}")
-                        self.updating_fields = False
-            except:
-                pass
-    
-    def on_footpath_width_changed(self):
-        """When footpath width changes, recalculate girders"""
-        if not self.updating_fields:
+    def run_scheduled_recalculation(self):
+        """Deferred handler for a burst of layout edits, runs on the latest values"""
+        if self.check_layout_inputs():
             self.recalculate_girders()
     
-    def validate_footpath_width(self):
-        """Validate footpath width meets minimum IRC 5 requirements"""
-        try:
-            if self.footpath_width.text():
-                width = float(self.footpath_width.text())
-                if width < MIN_FOOTPATH_WIDTH:
-                    QMessageBox.critical(self, "Footpath Width Error", 
-                        f"Footpath width must be at least {MIN_FOOTPATH_WIDTH} m as per IRC 5 Clause 104.3.6.")
-        except:
-            pass
-    
-    def validate_railing_height(self):
-        """Validate railing height meets minimum IRC 5 requirements"""
-        try:
-            if self.railing_height.text():
-                height = float(self.railing_height.text())
-                if height < MIN_RAILING_HEIGHT:
-                    QMessageBox.critical(self, "Railing Height Error", 
-                        f"Railing height must be at least {MIN_RAILING_HEIGHT} m as per IRC 5 Clauses 109.7.2.3 and 109.7.2.4.")
-        except:
-            pass
+    def check_layout_inputs(self):
+        """False if girder spacing or deck overhang exceed the overall bridge width"""
+        return not any(VALIDATION_ENGINE.evaluate_field(self.inputs, key)
+                       for key in (KEY_GIRDER_SPACING, KEY_DECK_OVERHANG))
     
-    def validate_safety_kerb_width(self):
-        """Validate safety kerb width meets minimum IRC 5 requirements"""
+    def on_no_of_girders_changed(self):
+        """When user changes number of girders, recalculate girder spacing"""
+        if self.updating_fields:
+            return
+        # The girder count is now the latest edit; drop any pending recalculation
+        self.recalc_scheduler.cancel()
+        no_girders = self.inputs[KEY_NO_OF_GIRDERS]
+        if no_girders is None:
+            return
+        if VALIDATION_ENGINE.evaluate_field(self.inputs, KEY_NO_OF_GIRDERS):
+            return
+        
+        # Calculate spacing: Spacing = (Overall Width - 2*Overhang) / (No. of Girders - 1)
+        new_spacing = girder_spacing_for(self.inputs, no_girders)
+        self.updating_fields = True
         try:
-            if self.safety_kerb_width.text():
-                width = float(self.safety_kerb_width.text())
-                if width < MIN_SAFETY_KERB_WIDTH:
-                    QMessageBox.critical(self, "Safety Kerb Width Error", 
-                        f"Safety kerb width must be at least {MIN_SAFETY_KERB_WIDTH} m (750 mm) as per IRC 5 Clause 101.41.")
-        except:
-            pass
+            self.inputs.set(KEY_GIRDER_SPACING, round(new_spacing, 3))
+        finally:
+            self.updating_fields = False
     
     def update_footpath_thickness(self):
         """Pre-fill footpath thickness with deck thickness"""
-        if self.deck_thickness.text() and not self.footpath_thickness.text():
-            self.footpath_thickness.setText(self.deck_thickness.text())
-    
-    def on_crash_barrier_type_changed(self, barrier_type):
-        """Warn if flexible/semi-rigid barrier without footpath"""
-        if (barrier_type in ["Flexible", "Semi-Rigid"]) and (self.footpath_value == "None"):
-            QMessageBox.critical(self, "Crash Barrier Type Not Permitted", 
-                f"{barrier_type} crash barriers are not permitted on bridges without an outer footpath per IRC 5 Clause 109.6.4.")
+        deck_thickness = self.inputs[KEY_DECK_THICKNESS]
+        if deck_thickness is not None and self.inputs[KEY_FOOTPATH_THICKNESS] is None:
+            self.inputs.set(KEY_FOOTPATH_THICKNESS, deck_thickness)
 
 
 class SectionPropertiesTab(QWidget):
     """Sub-tab for Section Properties with custom navigation layout."""
 
-    def __init__(self, parent=None):
+    def __init__(self, inputs, parent=None, validation=None):
         super().__init__(parent)
+        self.inputs = inputs
+        self.validation = validation
         self.nav_buttons = []
+        self.selected_girder = None
         self.init_ui()
 
     def init_ui(self):
         """Initialize styled navigation and content panels."""
-        self.setStyleSheet("background-color: #f0f0f0;")
+        self.setObjectName("section_properties")
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(10)
 
         # Top navigation bar (horizontal)
         nav_bar = QWidget()
-        nav_bar.setStyleSheet("background-color: transparent;")
+        nav_bar.setObjectName("section_nav_bar")
         nav_bar_layout = QHBoxLayout(nav_bar)
         nav_bar_layout.setContentsMargins(0, 0, 0, 0)
         nav_bar_layout.setSpacing(0)
@@ -1036,76 +783,53 @@ class SectionPropertiesTab(QWidget):
         # Content frame
         content_frame = QFrame()
         content_frame.setObjectName("sectionContentFrame")
-        content_frame.setStyleSheet("""
-            QFrame#sectionContentFrame {
-                background-color: #f0f0f0;
-                border: none;
-            }
-        """)
         content_inner_layout = QVBoxLayout(content_frame)
         content_inner_layout.setContentsMargins(0, 0, 0, 0)
         content_inner_layout.setSpacing(0)
 
         self.stack = QStackedWidget()
         self.stack.setObjectName("sectionStack")
-        self.stack.setStyleSheet("QStackedWidget#sectionStack { background-color: transparent; }")
         content_inner_layout.addWidget(self.stack)
 
         main_layout.addWidget(content_frame, 1)
 
         sections = [
-            ("Girder Details:", GirderDetailsTab),
-            ("Stiffener Details:", StiffenerDetailsTab),
-            ("Cross-Bracing Details:", CrossBracingDetailsTab),
-            ("End Diaphragm Details:", EndDiaphragmDetailsTab),
+            ("Girder Details:", lambda: GirderDetailsTab(self.inputs)),
+            ("Stiffener Details:", lambda: StiffenerDetailsTab(self.inputs)),
+            ("Cross-Bracing Details:", lambda: CrossBracingDetailsTab(self.inputs)),
+            ("End Diaphragm Details:", lambda: EndDiaphragmDetailsTab(self.inputs)),
         ]
 
-        for i, (label, widget_class) in enumerate(sections):
+        for i, (label, factory) in enumerate(sections):
             btn = QPushButton(label)
             btn.setObjectName("sectionNavBtn")
             btn.setCheckable(True)
-            btn.setStyleSheet("""
-                QPushButton#sectionNavBtn {
-                    background-color: white;
-                    color: #333;
-                    border: 1px solid #b0b0b0;
-                    border-right: none;
-                    padding: 10px 20px;
-                    text-align: center;
-                    font-size: 11px;
-                    font-weight: normal;
-                    min-height: 30px;
-                }
-                QPushButton#sectionNavBtn:first {
-                    border-top-left-radius: 5px;
-                    border-bottom-left-radius: 5px;
-                }
-                QPushButton#sectionNavBtn:last {
-                    border-right: 1px solid #b0b0b0;
-                    border-top-right-radius: 5px;
-                    border-bottom-right-radius: 5px;
-                }
-                QPushButton#sectionNavBtn:checked {
-                    background-color: #90AF13;
-                    color: white;
-                    font-weight: bold;
-                    border: 1px solid #90AF13;
-                }
-                QPushButton#sectionNavBtn:hover:!checked {
-                    background-color: #f5f5f5;
-                }
-            """)
             btn.clicked.connect(lambda checked, idx=i: self.switch_section(idx))
             self.nav_buttons.append(btn)
             nav_bar_layout.addWidget(btn)
 
-            section_widget = widget_class()
+            # Pages are built when first switched to
+            section_widget = LazyWidget(factory)
+            section_widget.built.connect(self.on_section_built)
             self.stack.addWidget(section_widget)
 
         if self.nav_buttons:
             self.nav_buttons[0].setChecked(True)
             self.stack.setCurrentIndex(0)
 
+    def on_section_built(self, widget):
+        if self.validation is not None:
+            self.validation.watch_bindings(getattr(widget, "bindings", ()))
+        if isinstance(widget, GirderDetailsTab) and self.selected_girder is not None:
+            widget.set_girder(self.selected_girder)
+
+    def select_girder(self, girder):
+        """Show girder in Girder Details, now or once that page is built"""
+        self.selected_girder = girder
+        page = self.stack.widget(0)
+        if page.is_built():
+            page.widget.set_girder(girder)
+
     def switch_section(self, index):
         """Switch the stacked widget page and update navigation states."""
         self.stack.setCurrentIndex(index)
@@ -1116,9 +840,47 @@ class SectionPropertiesTab(QWidget):
 class GirderDetailsTab(QWidget):
     """Tab for Girder Details"""
     
-    def __init__(self, parent=None):
+    def __init__(self, inputs, parent=None):
         super().__init__(parent)
+        self.inputs = inputs
         self.init_ui()
+        # Section dimensions are shared by every girder and span
+        self.bindings = bind_children(self, self.inputs)
+        # One Span entry per span of the continuous girders
+        subscribe_widget(self, self.inputs, lambda key, old, new: self.update_spans(),
+                         keys=(KEY_NO_OF_SPANS, KEY_SPAN))
+        self.span_combo.currentTextChanged.connect(self.on_span_selected)
+        self.select_girder.currentIndexChanged.connect(self.on_span_selected)
+        self.update_spans()
+    
+    def set_girder(self, girder):
+        """Choose girder "G<n>" in Select Girder, adding entries up to it if the list is shorter"""
+        number = int(girder[1:])
+        while self.select_girder.count() < number:
+            self.select_girder.addItem(f"Girder {self.select_girder.count() + 1}")
+        self.select_girder.setCurrentIndex(number - 1)
+    
+    def update_spans(self):
+        """List "Span 1" to "Span <No. of Spans>", keeping the chosen span if it still exists"""
+        current = self.span_combo.currentText()
+        self.span_combo.blockSignals(True)
+        self.span_combo.clear()
+        self.span_combo.addItems(["Custom"] + [f"Span {n + 1}" for n in range(self.inputs.get(KEY_NO_OF_SPANS) or 1)])
+        self.span_combo.setCurrentIndex(max(self.span_combo.findText(current), 0))
+        self.span_combo.blockSignals(False)
+        self.on_span_selected()
+    
+    def on_span_selected(self, *args):
+        """Fill the extent and member ID ("G1-S2") of the chosen span; Custom leaves them to the user"""
+        text = self.span_combo.currentText()
+        if not text.startswith("Span "):
+            return
+        number = int(text.split()[1])
+        span = self.inputs.get(KEY_SPAN) or DEFAULT_SPAN
+        self.dist_start.setText(f"{(number - 1) * span:.3f}")
+        self.dist_end.setText(f"{number * span:.3f}")
+        self.length_input.setText(f"{span:.3f}")
+        self.member_id.setText(f"G{self.select_girder.currentIndex() + 1}-S{number}")
     
     def init_ui(self):
         """Initialize the UI"""
@@ -1130,10 +892,7 @@ class GirderDetailsTab(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            "QScrollArea > QWidget > QWidget { background: transparent; }"
-        )
+        scroll.setObjectName("details_scroll")
         main_layout.addWidget(scroll)
 
         container = QWidget()
@@ -1143,19 +902,9 @@ class GirderDetailsTab(QWidget):
         container_layout.setContentsMargins(10, 10, 10, 10)
         container_layout.setSpacing(10)
 
-        # Common label style
-        label_style = "QLabel { color: #333333; font-size: 11px; background-color: transparent; }"
-        title_style = "QLabel { color: #333333; font-weight: bold; font-size: 12px; margin-bottom: 10px; background-color: transparent; }"
-
         # --- Top Section ---
         top_group = QGroupBox()
-        top_group.setStyleSheet("""
-            QGroupBox {
-                background-color: white;
-                border: 1px solid #b0b0b0;
-                border-radius: 8px;
-            }
-        """)
+        top_group.setObjectName("girder_details_group")
         top_layout = QGridLayout(top_group)
         top_layout.setContentsMargins(15, 15, 15, 15)
         top_layout.setHorizontalSpacing(20)
@@ -1163,7 +912,7 @@ class GirderDetailsTab(QWidget):
 
         # Row 0
         lbl_girder = QLabel("Select Girder:")
-        lbl_girder.setStyleSheet(label_style)
+        lbl_girder.setObjectName("girder_field_label")
         top_layout.addWidget(lbl_girder, 0, 0)
         
         self.select_girder = QComboBox()
@@ -1176,16 +925,16 @@ class GirderDetailsTab(QWidget):
 
         # Row 1
         lbl_span = QLabel("Span:")
-        lbl_span.setStyleSheet(label_style)
+        lbl_span.setObjectName("girder_field_label")
         top_layout.addWidget(lbl_span, 1, 0)
         
         self.span_combo = QComboBox()
-        self.span_combo.addItems(["Custom", "Span 1", "Span 2"])
+        self.span_combo.addItems(["Custom"])
         apply_field_style(self.span_combo)
         top_layout.addWidget(self.span_combo, 1, 1)
 
         lbl_member_id = QLabel("Member ID:")
-        lbl_member_id.setStyleSheet(label_style)
+        lbl_member_id.setObjectName("girder_field_label")
         top_layout.addWidget(lbl_member_id, 1, 3)
         
         self.member_id = QLineEdit("G1-1")
@@ -1194,7 +943,7 @@ class GirderDetailsTab(QWidget):
 
         # Row 2
         lbl_dist = QLabel("Distance from left edge (m):")
-        lbl_dist.setStyleSheet(label_style)
+        lbl_dist.setObjectName("girder_field_label")
         top_layout.addWidget(lbl_dist, 2, 0)
         
         dist_layout = QHBoxLayout()
@@ -1208,7 +957,7 @@ class GirderDetailsTab(QWidget):
         
         dist_start_label = QLabel("Start")
         dist_start_label.setAlignment(Qt.AlignCenter)
-        dist_start_label.setStyleSheet("font-size: 10px; color: #555555;")
+        dist_start_label.setObjectName("girder_hint_label")
         dist_start_layout.addWidget(dist_start_label)
         dist_layout.addLayout(dist_start_layout)
 
@@ -1220,14 +969,14 @@ class GirderDetailsTab(QWidget):
         
         dist_end_label = QLabel("End")
         dist_end_label.setAlignment(Qt.AlignCenter)
-        dist_end_label.setStyleSheet("font-size: 10px; color: #555555;")
+        dist_end_label.setObjectName("girder_hint_label")
         dist_end_layout.addWidget(dist_end_label)
         dist_layout.addLayout(dist_end_layout)
         
         top_layout.addLayout(dist_layout, 2, 1)
 
         lbl_length = QLabel("Length (m):")
-        lbl_length.setStyleSheet(label_style)
+        lbl_length.setObjectName("girder_field_label")
         top_layout.addWidget(lbl_length, 2, 3)
         
         self.length_input = QLineEdit()
@@ -1246,19 +995,12 @@ class GirderDetailsTab(QWidget):
 
         # Section Inputs Group
         inputs_group = QGroupBox()
-        inputs_group.setStyleSheet("""
-            QGroupBox {
-                background-color: white;
-                border: 1px solid #b0b0b0;
-                border-radius: 8px;
-                padding-top: 10px;
-            }
-        """)
+        inputs_group.setObjectName("girder_details_form_group")
         inputs_layout = QVBoxLayout(inputs_group)
         inputs_layout.setContentsMargins(15, 15, 15, 15)
         
         inputs_title = QLabel("Section Inputs:")
-        inputs_title.setStyleSheet(title_style)
+        inputs_title.setObjectName("girder_group_title")
         inputs_layout.addWidget(inputs_title)
 
         inputs_grid = QGridLayout()
@@ -1268,7 +1010,7 @@ class GirderDetailsTab(QWidget):
 
         row = 0
         lbl_design = QLabel("Design:")
-        lbl_design.setStyleSheet(label_style)
+        lbl_design.setObjectName("girder_field_label")
         inputs_grid.addWidget(lbl_design, row, 0)
         
         self.design_combo = QComboBox()
@@ -1278,7 +1020,7 @@ class GirderDetailsTab(QWidget):
         row += 1
 
         lbl_type = QLabel("Type:")
-        lbl_type.setStyleSheet(label_style)
+        lbl_type.setObjectName("girder_field_label")
         inputs_grid.addWidget(lbl_type, row, 0)
         
         self.type_combo = QComboBox()
@@ -1288,7 +1030,7 @@ class GirderDetailsTab(QWidget):
         row += 1
 
         lbl_symmetry = QLabel("Symmetry:")
-        lbl_symmetry.setStyleSheet(label_style)
+        lbl_symmetry.setObjectName("girder_field_label")
         inputs_grid.addWidget(lbl_symmetry, row, 0)
         
         self.symmetry_combo = QComboBox()
@@ -1298,58 +1040,61 @@ class GirderDetailsTab(QWidget):
         row += 1
 
         lbl_depth = QLabel("Total Depth (mm):")
-        lbl_depth.setStyleSheet(label_style)
+        lbl_depth.setObjectName("girder_field_label")
         inputs_grid.addWidget(lbl_depth, row, 0)
         
         self.total_depth = QLineEdit()
+        self.total_depth.setObjectName(KEY_GIRDER_DEPTH)
         apply_field_style(self.total_depth)
         inputs_grid.addWidget(self.total_depth, row, 1)
         row += 1
 
         lbl_web_thick = QLabel("Web Thickness (mm):")
-        lbl_web_thick.setStyleSheet(label_style)
+        lbl_web_thick.setObjectName("girder_field_label")
         inputs_grid.addWidget(lbl_web_thick, row, 0)
         
-        self.web_thickness = QComboBox()
-        self.web_thickness.addItems(["All", "Custom"])
+        self.web_thickness = QLineEdit()
+        self.web_thickness.setObjectName(KEY_GIRDER_WEB_THICKNESS)
         apply_field_style(self.web_thickness)
         inputs_grid.addWidget(self.web_thickness, row, 1)
         row += 1
 
         lbl_top_width = QLabel("Width of Top Flange (mm):")
-        lbl_top_width.setStyleSheet(label_style)
+        lbl_top_width.setObjectName("girder_field_label")
         inputs_grid.addWidget(lbl_top_width, row, 0)
         
         self.top_flange_width = QLineEdit()
+        self.top_flange_width.setObjectName(KEY_GIRDER_TOP_FLANGE_WIDTH)
         apply_field_style(self.top_flange_width)
         inputs_grid.addWidget(self.top_flange_width, row, 1)
         row += 1
 
         lbl_top_thick = QLabel("Top Flange Thickness (mm):")
-        lbl_top_thick.setStyleSheet(label_style)
+        lbl_top_thick.setObjectName("girder_field_label")
         inputs_grid.addWidget(lbl_top_thick, row, 0)
         
-        self.top_flange_thickness = QComboBox()
-        self.top_flange_thickness.addItems(["All", "Custom"])
+        self.top_flange_thickness = QLineEdit()
+        self.top_flange_thickness.setObjectName(KEY_GIRDER_TOP_FLANGE_THICKNESS)
         apply_field_style(self.top_flange_thickness)
         inputs_grid.addWidget(self.top_flange_thickness, row, 1)
         row += 1
 
         lbl_bot_width = QLabel("Width of Bottom Flange (mm):")
-        lbl_bot_width.setStyleSheet(label_style)
+        lbl_bot_width.setObjectName("girder_field_label")
         inputs_grid.addWidget(lbl_bot_width, row, 0)
         
         self.bottom_flange_width = QLineEdit()
+        self.bottom_flange_width.setObjectName(KEY_GIRDER_BOTTOM_FLANGE_WIDTH)
         apply_field_style(self.bottom_flange_width)
         inputs_grid.addWidget(self.bottom_flange_width, row, 1)
         row += 1
 
         lbl_bot_thick = QLabel("Bottom Flange Thickness (mm):")
-        lbl_bot_thick.setStyleSheet(label_style)
+        lbl_bot_thick.setObjectName("girder_field_label")
         inputs_grid.addWidget(lbl_bot_thick, row, 0)
         
-        self.bottom_flange_thickness = QComboBox()
-        self.bottom_flange_thickness.addItems(["All", "Custom"])
+        self.bottom_flange_thickness = QLineEdit()
+        self.bottom_flange_thickness.setObjectName(KEY_GIRDER_BOTTOM_FLANGE_THICKNESS)
         apply_field_style(self.bottom_flange_thickness)
         inputs_grid.addWidget(self.bottom_flange_thickness, row, 1)
         row += 1
@@ -1359,13 +1104,7 @@ class GirderDetailsTab(QWidget):
 
         # Restraints Group
         restraints_group = QGroupBox()
-        restraints_group.setStyleSheet("""
-            QGroupBox {
-                background-color: white;
-                border: 1px solid #b0b0b0;
-                border-radius: 8px;
-            }
-        """)
+        restraints_group.setObjectName("girder_details_group")
         restraints_layout = QGridLayout(restraints_group)
         restraints_layout.setContentsMargins(15, 15, 15, 15)
         restraints_layout.setHorizontalSpacing(15)
@@ -1374,7 +1113,7 @@ class GirderDetailsTab(QWidget):
 
         r_row = 0
         lbl_torsion = QLabel("Torsional Restraint:")
-        lbl_torsion.setStyleSheet(label_style)
+        lbl_torsion.setObjectName("girder_field_label")
         restraints_layout.addWidget(lbl_torsion, r_row, 0)
         
         self.torsional_restraint = QComboBox()
@@ -1384,7 +1123,7 @@ class GirderDetailsTab(QWidget):
         r_row += 1
 
         lbl_warping = QLabel("Warping Restraint:")
-        lbl_warping.setStyleSheet(label_style)
+        lbl_warping.setObjectName("girder_field_label")
         restraints_layout.addWidget(lbl_warping, r_row, 0)
         
         self.warping_restraint = QComboBox()
@@ -1394,7 +1133,7 @@ class GirderDetailsTab(QWidget):
         r_row += 1
 
         lbl_web_type = QLabel("Web Type*:")
-        lbl_web_type.setStyleSheet(label_style)
+        lbl_web_type.setObjectName("girder_field_label")
         restraints_layout.addWidget(lbl_web_type, r_row, 0)
         
         self.web_type = QComboBox()
@@ -1411,17 +1150,11 @@ class GirderDetailsTab(QWidget):
 
         # Image Preview
         image_frame = QFrame()
-        image_frame.setStyleSheet("""
-            QFrame {
-                background-color: #d9d9d9;
-                border: 1px solid #b0b0b0;
-                border-radius: 8px;
-            }
-        """)
+        image_frame.setObjectName("girder_section_image")
         image_frame.setMinimumHeight(200)
         image_layout = QVBoxLayout(image_frame)
         image_label = QLabel("Dynamic Image")
-        image_label.setStyleSheet("color: #333333; font-weight: bold;")
+        image_label.setObjectName("girder_section_image_label")
         image_label.setAlignment(Qt.AlignCenter)
         image_layout.addWidget(image_label)
         
@@ -1429,19 +1162,12 @@ class GirderDetailsTab(QWidget):
 
         # Section Properties Group
         props_group = QGroupBox()
-        props_group.setStyleSheet("""
-            QGroupBox {
-                background-color: white;
-                border: 1px solid #b0b0b0;
-                border-radius: 8px;
-                padding-top: 10px;
-            }
-        """)
+        props_group.setObjectName("girder_details_form_group")
         props_layout = QVBoxLayout(props_group)
         props_layout.setContentsMargins(15, 15, 15, 15)
         
         props_title = QLabel("Section Properties:")
-        props_title.setStyleSheet(title_style)
+        props_title.setObjectName("girder_group_title")
         props_layout.addWidget(props_title)
 
         props_grid = QGridLayout()
@@ -1467,7 +1193,7 @@ class GirderDetailsTab(QWidget):
         self.prop_inputs = {}
         for i, (label_text, _) in enumerate(properties):
             lbl_prop = QLabel(label_text)
-            lbl_prop.setStyleSheet(label_style)
+            lbl_prop.setObjectName("girder_field_label")
             props_grid.addWidget(lbl_prop, i, 0)
             
             line_edit = QLineEdit()
@@ -1487,8 +1213,9 @@ class GirderDetailsTab(QWidget):
 class StiffenerDetailsTab(QWidget):
     """Tab for Stiffener Details"""
     
-    def __init__(self, parent=None):
+    def __init__(self, inputs, parent=None):
         super().__init__(parent)
+        self.inputs = inputs
         self.init_ui()
     
     def init_ui(self):
@@ -1500,10 +1227,7 @@ class StiffenerDetailsTab(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            "QScrollArea > QWidget > QWidget { background: transparent; }"
-        )
+        scroll.setObjectName("details_scroll")
         main_layout.addWidget(scroll)
 
         container = QWidget()
@@ -1514,7 +1238,7 @@ class StiffenerDetailsTab(QWidget):
         container_layout.setSpacing(0)
 
         form_frame = QFrame()
-        form_frame.setStyleSheet("QFrame { background: transparent; }")
+        form_frame.setObjectName("details_form")
         self.form_layout = QGridLayout(form_frame)
         self.form_layout.setContentsMargins(0, 0, 0, 0)
         self.form_layout.setHorizontalSpacing(28)
@@ -1526,12 +1250,14 @@ class StiffenerDetailsTab(QWidget):
 
         row = 0
         self.method_combo = QComboBox()
+        self.method_combo.setObjectName(KEY_STIFFENER_DESIGN_METHOD)
         self.method_combo.addItems(VALUES_STIFFENER_DESIGN)
         apply_field_style(self.method_combo)
         row = self.add_row(row, "Stiffener design method:", self.method_combo)
 
         self.thick_combo = QComboBox()
-        self.thick_combo.addItems(["Optimized", "All"])
+        self.thick_combo.setObjectName(KEY_STIFFENER_PLATE_THICKNESS)
+        self.thick_combo.addItems(VALUES_THICKNESS_MODE)
         apply_field_style(self.thick_combo)
         row = self.add_row(row, "Stiffener Plate Thickness (mm):", self.thick_combo)
 
@@ -1539,25 +1265,29 @@ class StiffenerDetailsTab(QWidget):
         self.spacing_field.mode_combo.clear()
         self.spacing_field.mode_combo.addItems(["Optimized", "Customized"])
         self.spacing_field.on_mode_changed(self.spacing_field.mode_combo.currentText())
+        self.spacing_field.input_field.setObjectName(KEY_STIFFENER_SPACING)
         self.prepare_optimizable_field(self.spacing_field)
         row = self.add_row(row, "Stiffener Spacing (mm):", self.spacing_field)
 
         self.long_req_combo = QComboBox()
+        self.long_req_combo.setObjectName(KEY_LONGITUDINAL_STIFFENER)
         self.long_req_combo.addItems(VALUES_YES_NO)
         apply_field_style(self.long_req_combo)
         row = self.add_row(row, "Longitudinal stiffener requirement:", self.long_req_combo)
 
         self.long_thick_combo = QComboBox()
-        self.long_thick_combo.addItems(["Optimized", "All"])
+        self.long_thick_combo.setObjectName(KEY_LONGITUDINAL_STIFFENER_THICKNESS)
+        self.long_thick_combo.addItems(VALUES_THICKNESS_MODE)
         self.long_thick_combo.setEnabled(False)
         apply_field_style(self.long_thick_combo)
         self.add_row(row, "Longitudinal stiffener thickness:", self.long_thick_combo)
 
         self.long_req_combo.currentTextChanged.connect(self.on_long_req_changed)
+        self.bindings = bind_children(self, self.inputs)
 
     def create_label(self, text):
         label = QLabel(text)
-        label.setStyleSheet("font-size: 13px; color: #2f2f2f; font-weight: 600;")
+        label.setObjectName("details_field_label")
         return label
 
     def add_row(self, row, text, widget):
@@ -1580,8 +1310,9 @@ class StiffenerDetailsTab(QWidget):
 class CrossBracingDetailsTab(QWidget):
     """Tab for Cross-Bracing Details"""
     
-    def __init__(self, parent=None):
+    def __init__(self, inputs, parent=None):
         super().__init__(parent)
+        self.inputs = inputs
         self.init_ui()
     
     def init_ui(self):
@@ -1593,10 +1324,7 @@ class CrossBracingDetailsTab(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            "QScrollArea > QWidget > QWidget { background: transparent; }"
-        )
+        scroll.setObjectName("details_scroll")
         main_layout.addWidget(scroll)
 
         container = QWidget()
@@ -1607,7 +1335,7 @@ class CrossBracingDetailsTab(QWidget):
         container_layout.setSpacing(0)
 
         form_frame = QFrame()
-        form_frame.setStyleSheet("QFrame { background: transparent; }")
+        form_frame.setObjectName("details_form")
         self.form_layout = QGridLayout(form_frame)
         self.form_layout.setContentsMargins(0, 0, 0, 0)
         self.form_layout.setHorizontalSpacing(28)
@@ -1619,48 +1347,36 @@ class CrossBracingDetailsTab(QWidget):
 
         row = 0
         self.type_combo = QComboBox()
+        self.type_combo.setObjectName(KEY_CROSS_BRACING_TYPE)
         self.type_combo.addItems(VALUES_CROSS_BRACING_TYPE)
         apply_field_style(self.type_combo)
         row = self.add_row(row, "Type of Bracing:", self.type_combo)
 
         self.section_combo = QComboBox()
-        self.section_combo.addItems([
-            "Select Section",
-            "ISA 50x50x6", "ISA 65x65x6", "ISA 75x75x6", "ISA 90x90x8",
-            "ISA 100x100x8", "ISA 110x110x10", "ISA 130x130x10",
-            "2-ISA 50x50x6 (LL)", "2-ISA 65x65x6 (LL)", "2-ISA 75x75x6 (LL)",
-            "2-ISA 50x50x6 (SL)", "2-ISA 65x65x6 (SL)", "2-ISA 75x75x6 (SL)",
-            "ISMC 75", "ISMC 100", "ISMC 125", "ISMC 150",
-            "2-ISMC 75", "2-ISMC 100", "2-ISMC 125"
-        ])
+        self.section_combo.setObjectName(KEY_CROSS_BRACING_SECTION)
+        self.section_combo.addItems(VALUES_CROSS_BRACING_SECTION)
         apply_field_style(self.section_combo)
         row = self.add_row(row, "Bracing Section:", self.section_combo)
 
         self.bracket_combo = QComboBox()
-        self.bracket_combo.addItems([
-            "Select Section",
-            "ISA 50x50x6", "ISA 65x65x6", "ISA 75x75x6", "ISA 90x90x8",
-            "ISA 100x100x8", "ISA 110x110x10",
-            "2-ISA 50x50x6 (LL)", "2-ISA 65x65x6 (LL)", "2-ISA 75x75x6 (LL)",
-            "2-ISA 50x50x6 (SL)", "2-ISA 65x65x6 (SL)", "2-ISA 75x75x6 (SL)",
-            "ISMC 75", "ISMC 100", "ISMC 125",
-            "2-ISMC 75", "2-ISMC 100"
-        ])
+        self.bracket_combo.setObjectName(KEY_BRACKET_SECTION)
+        self.bracket_combo.addItems(VALUES_BRACKET_SECTION)
         self.bracket_combo.setEnabled(False)
         apply_field_style(self.bracket_combo)
         row = self.add_row(row, "Bracket Section:", self.bracket_combo)
 
         self.spacing_input = QLineEdit()
+        self.spacing_input.setObjectName(KEY_CROSS_BRACING_SPACING)
         self.spacing_input.setPlaceholderText("Enter spacing in mm")
-        self.spacing_input.setValidator(QDoubleValidator(0, 100000, 2))
         apply_field_style(self.spacing_input)
         self.add_row(row, "Spacing (mm):", self.spacing_input)
 
         self.type_combo.currentTextChanged.connect(self.on_bracing_type_changed)
+        self.bindings = bind_children(self, self.inputs)
 
     def create_label(self, text):
         label = QLabel(text)
-        label.setStyleSheet("font-size: 13px; color: #2f2f2f; font-weight: 600;")
+        label.setObjectName("details_field_label")
         return label
 
     def add_row(self, row, text, widget):
@@ -1679,8 +1395,9 @@ class CrossBracingDetailsTab(QWidget):
 class EndDiaphragmDetailsTab(QWidget):
     """Tab for End Diaphragm Details"""
     
-    def __init__(self, parent=None):
+    def __init__(self, inputs, parent=None):
         super().__init__(parent)
+        self.inputs = inputs
         self.plate_rows = []
         self.init_ui()
     
@@ -1693,10 +1410,7 @@ class EndDiaphragmDetailsTab(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            "QScrollArea > QWidget > QWidget { background: transparent; }"
-        )
+        scroll.setObjectName("details_scroll")
         main_layout.addWidget(scroll)
 
         container = QWidget()
@@ -1707,7 +1421,7 @@ class EndDiaphragmDetailsTab(QWidget):
         container_layout.setSpacing(0)
 
         form_frame = QFrame()
-        form_frame.setStyleSheet("QFrame { background: transparent; }")
+        form_frame.setObjectName("details_form")
         self.form_layout = QGridLayout(form_frame)
         self.form_layout.setContentsMargins(0, 0, 0, 0)
         self.form_layout.setHorizontalSpacing(28)
@@ -1719,6 +1433,7 @@ class EndDiaphragmDetailsTab(QWidget):
 
         row = 0
         self.type_combo = QComboBox()
+        self.type_combo.setObjectName(KEY_END_DIAPHRAGM_TYPE)
         self.type_combo.addItems(VALUES_END_DIAPHRAGM_TYPE)
         apply_field_style(self.type_combo)
         self.form_layout.addWidget(self.create_label("Type of Section:"), row, 0, Qt.AlignVCenter)
@@ -1727,13 +1442,8 @@ class EndDiaphragmDetailsTab(QWidget):
 
         self.is_section_label = self.create_label("Select IS Beam Section:")
         self.is_beam_combo = QComboBox()
-        self.is_beam_combo.addItems([
-            "Select Section",
-            "ISMB 100", "ISMB 125", "ISMB 150", "ISMB 175", "ISMB 200",
-            "ISMB 225", "ISMB 250", "ISMB 300", "ISMB 350", "ISMB 400",
-            "ISWB 150", "ISWB 175", "ISWB 200", "ISWB 225", "ISWB 250",
-            "ISWB 300", "ISWB 350", "ISWB 400"
-        ])
+        self.is_beam_combo.setObjectName(KEY_END_DIAPHRAGM_SECTION)
+        self.is_beam_combo.addItems(VALUES_END_DIAPHRAGM_SECTION)
         apply_field_style(self.is_beam_combo)
         self.form_layout.addWidget(self.is_section_label, row, 0, Qt.AlignVCenter)
         self.form_layout.addWidget(self.is_beam_combo, row, 1)
@@ -1764,8 +1474,8 @@ class EndDiaphragmDetailsTab(QWidget):
         row = self.add_plate_row(row, "Web Thickness (mm):", self.web_thick_field)
 
         self.spacing_input = QLineEdit()
+        self.spacing_input.setObjectName(KEY_END_DIAPHRAGM_SPACING)
         self.spacing_input.setPlaceholderText("Enter spacing in mm")
-        self.spacing_input.setValidator(QDoubleValidator(0, 100000, 2))
         apply_field_style(self.spacing_input)
         self.spacing_label = self.create_label("Spacing (mm):")
         self.form_layout.addWidget(self.spacing_label, row, 0, Qt.AlignVCenter)
@@ -1773,10 +1483,11 @@ class EndDiaphragmDetailsTab(QWidget):
 
         self.type_combo.currentTextChanged.connect(self.on_type_changed)
         self.on_type_changed(self.type_combo.currentText())
+        self.bindings = bind_children(self, self.inputs)
 
     def create_label(self, text):
         label = QLabel(text)
-        label.setStyleSheet("font-size: 13px; color: #2f2f2f; font-weight: 600;")
+        label.setObjectName("details_field_label")
         return label
 
     def prepare_optimizable_field(self, field):
@@ -1817,78 +1528,49 @@ class EndDiaphragmDetailsTab(QWidget):
 class AdditionalInputsWidget(QWidget):
     """Main widget for Additional Inputs with tabbed interface"""
     
-    def __init__(self, footpath_value="None", carriageway_width=7.5, parent=None):
+    def __init__(self, inputs, parent=None, validation=None):
         super().__init__(parent)
-        self.footpath_value = footpath_value
-        self.carriageway_width = carriageway_width
+        self.inputs = inputs
+        self.validation = validation
+        self.selected_girder = None
         self.init_ui()
     
     def init_ui(self):
         self.setAttribute(Qt.WA_StyledBackground, True)
-        self.setStyleSheet("background-color: white;")
+        self.setObjectName("additional_inputs")
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
         # Header
         header_widget = QWidget()
-        header_widget.setStyleSheet("background-color: white; border-bottom: 1px solid #d0d0d0;")
+        header_widget.setObjectName("additional_inputs_header")
         header_widget.setMinimumHeight(50)
         header_layout = QHBoxLayout(header_widget)
         header_layout.setContentsMargins(20, 0, 20, 0)
         
         title = QLabel("Additional Inputs")
-        title.setStyleSheet("font-size: 16px; font-weight: bold; color: #333;")
+        title.setObjectName("additional_inputs_title")
         header_layout.addWidget(title)
         
         main_layout.addWidget(header_widget)
         
         # Main tab widget
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: none;
-                background: #ffffff;
-                margin-top: -1px;
-            }
-            QTabBar {
-                background: #ffffff;
-            }
-            QTabBar::tab {
-                background: #e9e9e9;
-                color: #3a3a3a;
-                border: 1px solid #d1d1d1;
-                border-bottom: none;
-                padding: 10px 22px;
-                margin-right: 4px;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-                font-weight: 500;
-            }
-            QTabBar::tab:selected {
-                background: #90af13;
-                color: #ffffff;
-                border: 1px solid #90af13;
-                border-bottom: none;
-            }
-            QTabBar::tab:hover:!selected {
-                background: #f5f5f5;
-            }
-            QTabWidget {
-                background-color: white;
-            }
-        """)
+        self.tabs.setObjectName("additional_inputs_tabs")
         
+        # Tabs are stubs until first selected, so the dialog opens without building them
         # Sub-Tab 1: Typical Section Details
-        self.bridge_geometry_tab = BridgeGeometryTab(self.footpath_value, self.carriageway_width)
-        self.tabs.addTab(self.bridge_geometry_tab, "Typical Section Details")
+        self.bridge_geometry_page = add_lazy_tab(
+            self.tabs, lambda: BridgeGeometryTab(self.inputs, validation=self.validation),
+            "Typical Section Details")
         
         # Sub-Tab 2: Member Properties
-        self.section_properties_tab = SectionPropertiesTab()
-        self.tabs.addTab(self.section_properties_tab, "Member Properties")
+        self.section_properties_page = add_lazy_tab(
+            self.tabs, self.create_section_properties_tab, "Member Properties")
         
         # Sub-Tab 3: Loading
-        loading_tab = self.create_placeholder_tab(
+        loading_tab = partial(self.create_placeholder_tab,
             "Loading",
             "This tab will contain:\n\n" +
             "• Dead Load (Self Weight, Wearing Coat, etc.)\n" +
@@ -1896,10 +1578,10 @@ class AdditionalInputsWidget(QWidget):
             "• Lateral Load (Wind, Seismic)\n\n" +
             "Implementation in progress..."
         )
-        self.tabs.addTab(loading_tab, "Loading")
+        add_lazy_tab(self.tabs, loading_tab, "Loading")
         
         # Sub-Tab 4: Support Conditions
-        support_tab = self.create_placeholder_tab(
+        support_tab = partial(self.create_placeholder_tab,
             "Support Conditions",
             "This tab will contain:\n\n" +
             "• Left Support (Fixed/Pinned)\n" +
@@ -1909,10 +1591,10 @@ class AdditionalInputsWidget(QWidget):
             "stiffener will not be designed.\n\n" +
             "Implementation in progress..."
         )
-        self.tabs.addTab(support_tab, "Support Conditions")
+        add_lazy_tab(self.tabs, support_tab, "Support Conditions")
         
         # Sub-Tab 5: Design Options
-        shear_connection_tab = self.create_placeholder_tab(
+        shear_connection_tab = partial(self.create_placeholder_tab,
             "Design Options",
             "This tab will contain:\n\n" +
             "• Shear Connector Type\n" +
@@ -1920,10 +1602,10 @@ class AdditionalInputsWidget(QWidget):
             "• Connection Details\n\n" +
             "Implementation in progress..."
         )
-        self.tabs.addTab(shear_connection_tab, "Design Options")
+        add_lazy_tab(self.tabs, shear_connection_tab, "Design Options")
         
         # Sub-Tab 6: Design Options (Cont.)
-        analysis_design_tab = self.create_placeholder_tab(
+        analysis_design_tab = partial(self.create_placeholder_tab,
             "Design Options (Cont.)",
             "This tab will contain:\n\n" +
             "• Analysis Method\n" +
@@ -1932,14 +1614,50 @@ class AdditionalInputsWidget(QWidget):
             "• Other Design Parameters\n\n" +
             "Implementation in progress..."
         )
-        self.tabs.addTab(analysis_design_tab, "Design Options (Cont.)")
+        add_lazy_tab(self.tabs, analysis_design_tab, "Design Options (Cont.)")
         
         main_layout.addWidget(self.tabs)
     
+    def iter_bindings(self):
+        """Field bindings of every page built so far"""
+        for page in lazy_pages(self):
+            if page.is_built():
+                yield from getattr(page.widget, "bindings", ())
+    
+    def suspend_bindings(self):
+        for binding in self.iter_bindings():
+            binding.suspend()
+    
+    def resume_bindings(self):
+        for binding in self.iter_bindings():
+            binding.resume()
+    
+    def create_section_properties_tab(self):
+        tab = SectionPropertiesTab(self.inputs, validation=self.validation)
+        if self.selected_girder is not None:
+            tab.select_girder(self.selected_girder)
+        return tab
+
+    def select_girder(self, girder):
+        """Show girder (e.g. "G2") in Girder Details without building pages that are not open"""
+        self.selected_girder = girder
+        if self.section_properties_page.is_built():
+            self.section_properties_page.widget.select_girder(girder)
+
+    @property
+    def bridge_geometry_tab(self):
+        """Typical Section Details tab, built on first access"""
+        return self.bridge_geometry_page.build()
+    
+    @property
+    def section_properties_tab(self):
+        """Member Properties tab, built on first access"""
+        return self.section_properties_page.build()
+    
     def create_placeholder_tab(self, title, description):
         """Create a styled placeholder tab with title and description"""
         widget = QWidget()
-        widget.setStyleSheet("background-color: white;")
+        widget.setObjectName("placeholder_page")
         
         layout = QVBoxLayout(widget)
         layout.setAlignment(Qt.AlignCenter)
@@ -1947,40 +1665,25 @@ class AdditionalInputsWidget(QWidget):
         
         # Icon or visual indicator
         icon_label = QLabel("🚧")
-        icon_label.setStyleSheet("font-size: 48px;")
+        icon_label.setObjectName("placeholder_icon")
         icon_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(icon_label)
         
         # Title
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: #333;
-            margin-top: 20px;
-            margin-bottom: 10px;
-        """)
+        title_label.setObjectName("placeholder_title")
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
         # Status
         status_label = QLabel("Under Development")
-        status_label.setStyleSheet("""
-            font-size: 14px;
-            color: #f39c12;
-            font-weight: bold;
-            margin-bottom: 20px;
-        """)
+        status_label.setObjectName("placeholder_status")
         status_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(status_label)
         
         # Description
         desc_label = QLabel(description)
-        desc_label.setStyleSheet("""
-            font-size: 12px;
-            color: #666;
-            line-height: 1.6;
-        """)
+        desc_label.setObjectName("placeholder_description")
         desc_label.setAlignment(Qt.AlignCenter)
         desc_label.setWordWrap(True)
         desc_label.setMaximumWidth(600)
@@ -1989,8 +1692,37 @@ class AdditionalInputsWidget(QWidget):
         layout.addStretch()
         
         return widget
+
+
+class AdditionalInputsDialog(QDialog):
+    """Long-lived dialog hosting AdditionalInputsWidget.
+
+    The dialog is built once and hidden rather than destroyed when closed.
+    While hidden its fields stop following the model; they are re-synced
+    from the model when the dialog is shown again.
+    """
     
-    def update_footpath_value(self, footpath_value):
-        """Update footpath value across all tabs"""
-        self.footpath_value = footpath_value
-        self.bridge_geometry_tab.update_footpath_value(footpath_value)
+    def __init__(self, inputs, parent=None, validation=None):
+        super().__init__(parent)
+        self.setWindowTitle("Additional Inputs - Manual Bridge Parameter Definition")
+        self.resize(900, 700)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.widget = AdditionalInputsWidget(inputs, self, validation=validation)
+        layout.addWidget(self.widget)
+    
+    def open_dialog(self):
+        """Show the dialog, or bring it to front if already open"""
+        self.show()
+        self.raise_()
+        self.activateWindow()
+    
+    def showEvent(self, event):
+        self.widget.resume_bindings()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        self.widget.suspend_bindings()
+        super().hideEvent(event)
@@ -0,0 +1,106 @@
+"""
+Two-way bindings between input widgets and the BridgeInputs model.
+Widget edits are parsed once into the model; model changes are pushed back
+to the widget only when the displayed value differs.
+"""
+from PySide6.QtWidgets import QComboBox, QLineEdit, QWidget
+from PySide6.QtGui import QDoubleValidator, QIntValidator
+
+from osbridge.backend.model import format_value
+from osbridge.backend.schema import INPUT_SCHEMA
+
+
+def field_validator(spec, parent=None):
+    """Qt validator matching a schema field's type and bounds, or None for text fields"""
+    if spec.type is int:
+        return QIntValidator(int(spec.minimum), int(spec.maximum), parent)
+    if spec.type is float:
+        return QDoubleValidator(spec.minimum, spec.maximum, spec.decimals, parent)
+    return None
+
+
+class FieldBinding:
+    """Keeps one widget and one model key in sync"""
+
+    def __init__(self, widget, inputs, key):
+        self.widget = widget
+        self.inputs = inputs
+        self.key = key
+        self.suspended = False  # Model changes are not pushed while suspended
+        self.stale = False
+
+        spec = INPUT_SCHEMA.specs.get(key)
+        if spec is not None and isinstance(widget, QLineEdit):
+            validator = field_validator(spec, widget)
+            if validator is not None:
+                widget.setValidator(validator)
+
+        self.refresh()
+        if isinstance(widget, QComboBox):
+            widget.currentTextChanged.connect(self.on_widget_changed)
+        else:
+            widget.textChanged.connect(self.on_widget_changed)
+        inputs.subscribe(self.on_model_changed, keys=(key,))
+        widget.destroyed.connect(self.unbind)
+
+    def widget_value(self):
+        if isinstance(self.widget, QComboBox):
+            return INPUT_SCHEMA.parse(self.key, self.widget.currentText())
+        return INPUT_SCHEMA.parse(self.key, self.widget.text())
+
+    def on_widget_changed(self, text):
+        self.inputs.set(self.key, text)
+
+    def on_model_changed(self, key, old, new):
+        if self.suspended:
+            self.stale = True
+        elif self.widget_value() != new:
+            self.refresh()
+
+    def suspend(self):
+        """Stop pushing model changes to the widget, e.g. while it is hidden"""
+        self.suspended = True
+
+    def resume(self):
+        """Push model changes missed while suspended"""
+        self.suspended = False
+        if self.stale:
+            self.stale = False
+            if self.widget_value() != self.inputs[self.key]:
+                self.refresh()
+
+    def refresh(self):
+        """Push the model value to the widget"""
+        value = self.inputs[self.key]
+        if isinstance(self.widget, QComboBox):
+            text = format_value(value)
+            if self.widget.findText(text) < 0 and text:
+                self.widget.addItem(text)
+            self.widget.setCurrentText(text)
+        else:
+            self.widget.setText(format_value(value))
+
+    def unbind(self, *args):
+        self.inputs.unsubscribe(self.on_model_changed)
+
+
+def bind_field(widget, inputs, key):
+    """Bind a QLineEdit or QComboBox to a model key and return the binding"""
+    if not isinstance(widget, (QComboBox, QLineEdit)):
+        raise TypeError(f"Cannot bind {type(widget).__name__} to '{key}'")
+    return FieldBinding(widget, inputs, key)
+
+
+def bind_children(container, inputs):
+    """Bind every input widget in container named after a model key; returns the bindings"""
+    return [
+        bind_field(widget, inputs, widget.objectName())
+        for widget in container.findChildren(QWidget)
+        if widget.objectName() in inputs
+    ]
+
+
+def subscribe_widget(widget, inputs, callback, keys=None):
+    """Subscribe callback to model changes for as long as widget is alive"""
+    inputs.subscribe(callback, keys=keys)
+    widget.destroyed.connect(lambda *args: inputs.unsubscribe(callback))
@@ -0,0 +1,586 @@
+"""
+Software-rendered CAD view of the 3D bridge model.
+Rasterizes the instanced components from backend.model3d into a depth
+buffer with NumPy (backend.raster), so it needs no OpenGL. Every instance
+is tessellated into model-space triangles once; component diffs
+re-tessellate just the added and moved instances and patch their
+component's slices of the scene arrays, and a frame is rendered again only
+when the camera or the model changes. While the camera moves,
+frames are rendered at reduced resolution and sharpened once it comes to
+rest; while the view is resized the last frame is stretched until the
+size settles. Instances that are small on screen are drawn as their
+bounding boxes or left out, chosen per frame from their projected size.
+Clicking picks the instance under the cursor and shift-dragging a box
+selects the instances inside it, both through a bounding volume
+hierarchy per component.
+"""
+import math
+
+import numpy as np
+from PySide6.QtCore import Qt, QRect, QTimer, Signal
+from PySide6.QtGui import QColor, QImage, QPainter, QPalette, QPixmap
+from PySide6.QtWidgets import QRubberBand, QWidget, QStyle, QStyleOption
+
+from osbridge.backend.bvh import BoundingVolumeHierarchy
+from osbridge.backend.model3d import coarse_mesh, enclosing_instances
+from osbridge.backend.raster import COMPONENT_COLORS, DEFAULT_COLOR, tessellate, clip_near, shade, rasterize
+from osbridge.backend.checks import utilization_colors
+
+
+SELECTION_COLOR = "#f0b030"
+
+FIELD_OF_VIEW = math.radians(40)
+NEAR_PLANE = 0.05  # m
+DEFAULT_YAW = math.radians(-60)
+DEFAULT_PITCH = math.radians(-20)  # Slightly from below, so girders and bracing show
+ORBIT_SPEED = 0.01  # rad per px
+ZOOM_STEP = 1.15
+CLICK_DISTANCE = 4  # px the cursor may move between press and release of a click
+
+# Resolution of frames rendered while the camera moves, and the pause after
+# the last camera move before a full resolution frame is rendered (ms)
+INTERACTIVE_SCALE = 0.5
+SETTLE_DELAY_MS = 150
+
+# Screen sizes (rendered px) choosing the level of detail of an instance: the
+# full mesh while its cross-section, the middle one of its three extents,
+# spans DETAIL_PIXELS, its bounding box below that, and nothing once even its
+# largest extent is under MIN_PIXELS. Frames rendered while the camera moves
+# are smaller, so they also switch to boxes sooner.
+DETAIL_PIXELS = 24
+MIN_PIXELS = 1.0
+HIDDEN = 2  # Level of instances that are not drawn
+
+
+def ray_distance(origin, direction, triangles):
+    """Distance along a ray to the nearest of triangles (n, 3, 3), inf when it misses them all"""
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    ab, ac = b - a, c - a
+    p = np.cross(direction, ac)
+    det = np.einsum("ij,ij->i", ab, p)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverse = 1.0 / det
+        s = origin - a
+        u = np.einsum("ij,ij->i", s, p) * inverse
+        q = np.cross(s, ab)
+        v = (q @ direction) * inverse
+        t = np.einsum("ij,ij->i", ac, q) * inverse
+    hit = (np.abs(det) > 1e-12) & (u >= 0) & (v >= 0) & (u + v <= 1) & (t > 0)
+    return float(t[hit].min()) if hit.any() else np.inf
+
+
+class SceneComponent:
+    """Tessellated instances of one component at each level of detail, kept in step with its diffs.
+
+    levels -- (triangles, normals) of the full mesh, then of the bounding box
+              when the mesh has more faces than its box
+    bounds -- model-space bounding box of each instance, (instances, 2, 3)
+    sizes  -- middle and largest extent of each instance (m), (instances, 2)
+    tree   -- BoundingVolumeHierarchy over bounds, None until hierarchy() is first
+              needed after instances were added or removed
+    """
+
+    __slots__ = ("component", "levels", "bounds", "sizes", "tree")
+
+    def __init__(self, component):
+        self.component = component
+        self.levels = [tessellate(mesh, component.transforms) for mesh in self.meshes()]
+        self.measure()
+        self.tree = None
+
+    def meshes(self):
+        """Prototype meshes of the levels of detail, finest first"""
+        coarse = coarse_mesh(self.component.mesh)
+        return (self.component.mesh,) if coarse is None else (self.component.mesh, coarse)
+
+    def measure(self):
+        component = self.component
+        self.bounds = component.bounds()
+        extent = component.mesh.vertices.max(axis=0) - component.mesh.vertices.min(axis=0)
+        # Length of each local box edge after the instance transform
+        extents = np.linalg.norm(component.transforms[:, :3, :3], axis=1) * extent
+        self.sizes = np.sort(extents, axis=1)[:, 1:]
+
+    def apply(self, diff):
+        """Take over unchanged instances and tessellate the added and moved ones"""
+        new = diff.component
+        rows = np.concatenate((diff.added, diff.moved))
+        old_levels, self.component, self.levels = self.levels, new, []
+        for level, mesh in enumerate(self.meshes()):
+            triangles = np.empty((len(new), len(mesh.faces), 3, 3))
+            normals = np.empty((len(new), len(mesh.faces), 3))
+            # Instances are only kept when the prototype is unchanged, so the levels match
+            if len(diff.kept_new):
+                triangles[diff.kept_new] = old_levels[level][0][diff.kept_old]
+                normals[diff.kept_new] = old_levels[level][1][diff.kept_old]
+            triangles[rows], normals[rows] = tessellate(mesh, new.transforms[rows])
+            self.levels.append((triangles, normals))
+        self.measure()
+        # Moved instances only refit the tree; added or removed ones change its leaves,
+        # so it is built again when next picked from
+        if len(diff.added) or len(diff.removed):
+            self.tree = None
+        elif len(diff.moved) and self.tree is not None:
+            self.tree.refit(self.bounds)
+
+    def hierarchy(self):
+        """The BoundingVolumeHierarchy over the instance bounds, built on first use"""
+        if self.tree is None:
+            self.tree = BoundingVolumeHierarchy(self.bounds)
+        return self.tree
+
+
+class CadView(QWidget):
+    """Orbit view of the bridge model.
+
+    Faces are backface culled, shaded flat and depth buffered. Left drag
+    orbits, right or middle drag pans, the wheel zooms and a double click
+    fits the whole model again. A click selects the instance under the
+    cursor, or clears the selection over empty space, and a shift-drag
+    selects every instance whose bounding box lies inside the dragged
+    rectangle. level_of_detail = False draws every instance with its full
+    mesh.
+    """
+
+    selection_changed = Signal(list)  # Emitted with the selected instance IDs
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("cad_view")
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.scene = {}  # component name -> SceneComponent, in drawing order
+        self.utilization = {}  # girder ID -> RGB of its controlling utilization
+        self.faces = None  # Concatenated scene arrays, laid out again when instances are added or removed
+        self.instances = None  # Per instance arrays choosing the level of detail, laid out with faces
+        self.colors = None  # RGB of every instance, laid out with faces
+        self.base_colors = None  # Component RGB of every instance, laid out with faces
+        self.rows = {}  # Instance ID -> scene-wide index, laid out with faces
+        self.slices = {}  # component name -> (first instance, first face of each level) in the scene arrays
+        self.touched = set()  # Components whose instances moved since their slices were patched
+        self.enclosures = {}  # (container, component) name -> enclosing_instances, until either changes
+        self.level_of_detail = True
+        self.frame = None  # Pixmap of the last rendered frame
+        self.interactive = False  # Camera moving: render at INTERACTIVE_SCALE
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(SETTLE_DELAY_MS)
+        self.settle_timer.timeout.connect(self.settle)
+        self.target = np.zeros(3)
+        self.distance = 10.0
+        self.yaw = DEFAULT_YAW
+        self.pitch = DEFAULT_PITCH
+        self.auto_fit = True  # Refit on resize until the user moves the camera
+        self.resized = False  # Size changed since the last frame was rendered; fit and render on settle
+        self.drag = None
+        self.press = None  # Cursor position of the last button press, until it moves away
+        self.selected = set()  # Selected instance IDs
+        self.rubber_band = QRubberBand(QRubberBand.Rectangle, self)
+        self.band_origin = None
+
+    def set_components(self, components):
+        """Show a new model and fit it in the view"""
+        self.scene = {component.name: SceneComponent(component) for component in components}
+        self.enclosures = {}
+        self.scene_changed()
+        self.fit()
+
+    def apply_diffs(self, diffs):
+        """Update the model from backend.model3d.ComponentDiffs, keeping the camera.
+
+        A component whose instances only moved keeps its slices of the scene
+        arrays and is patched in place; any other change lays them out again.
+        """
+        for diff in diffs:
+            scene = self.scene.get(diff.name)
+            if diff.component is None:
+                self.scene.pop(diff.name, None)
+                self.faces = None
+            elif scene is not None:
+                shapes = [triangles.shape for triangles, normals in scene.levels]
+                scene.apply(diff)
+                if len(diff.added) or len(diff.removed) or shapes != [t.shape for t, n in scene.levels]:
+                    self.faces = None
+                else:
+                    self.touched.add(diff.name)
+            else:
+                self.scene[diff.name] = SceneComponent(diff.component)
+                self.faces = None
+            self.enclosures = {pair: inside for pair, inside in self.enclosures.items() if diff.name not in pair}
+        self.invalidate()
+
+    def set_utilization(self, checks):
+        """Colour each girder by its controlling utilization ratio (None: plain model)"""
+        previous, self.utilization = self.utilization, {}
+        if checks is not None:
+            ratio = checks.controlling()[0].max(axis=1)
+            girders = {}
+            for girder, member_ratio in zip(checks.girders, ratio.tolist()):
+                girders[girder] = max(girders.get(girder, member_ratio), member_ratio)
+            colors = utilization_colors(list(girders.values()))[:, :3]
+            self.utilization = dict(zip(girders, colors))
+        self.recolor(set(previous) | set(self.utilization))
+        self.invalidate()
+
+    def scene_changed(self):
+        self.faces = None
+        self.invalidate()
+
+    def invalidate(self):
+        self.frame = None
+        self.update()
+
+    def camera_moved(self):
+        """Render coarse frames until the camera has been still for SETTLE_DELAY_MS"""
+        self.auto_fit = False
+        self.interactive = True
+        self.settle_timer.start()
+        self.invalidate()
+
+    def settle(self):
+        self.interactive = False
+        if self.resized and self.auto_fit and self.scene:
+            self.fit()
+        self.resized = False
+        self.invalidate()
+
+    def scene_faces(self):
+        """Every face of the scene at every level of detail, concatenated.
+
+        Returns triangles, normals, the scene-wide index of the instance each
+        face belongs to and its level of detail. Also keeps self.instances
+        (the bounds, sizes, whether a bounding box level exists and the
+        enclosing instance, -1 for none, of every instance) and self.colors
+        in step. Components whose instances moved are copied over their own
+        slices; the arrays are only laid out again when instances or
+        components are added or removed.
+        """
+        if self.faces is None:
+            self.lay_out()
+        elif self.touched:
+            self.patch()
+        return self.faces
+
+    def lay_out(self):
+        """Concatenate the scene arrays from the components, recording each component's slices"""
+        faces = ([], [], [], [])
+        instances = ([], [], [])
+        self.slices = {}
+        first = face = 0
+        for name, scene in self.scene.items():
+            count = len(scene.component)
+            starts = []
+            for level, (triangles, normals) in enumerate(scene.levels):
+                per_instance = triangles.shape[1]
+                starts.append(face)
+                face += count * per_instance
+                for values, new in zip(faces, (
+                        triangles.reshape(-1, 3, 3), normals.reshape(-1, 3),
+                        np.repeat(np.arange(first, first + count), per_instance),
+                        np.full(count * per_instance, level, dtype=np.int8))):
+                    values.append(new)
+            instances[0].append(scene.bounds)
+            instances[1].append(scene.sizes)
+            instances[2].append(np.full(count, len(scene.levels) > 1))
+            self.slices[name] = (first, starts)
+            first += count
+        empty = (np.empty((0, 3, 3)), np.empty((0, 3)), np.empty(0, dtype=np.intp), np.empty(0, dtype=np.int8))
+        self.faces = tuple(np.concatenate(values) if values else default
+                           for values, default in zip(faces, empty))
+        empty = (np.empty((0, 2, 3)), np.empty((0, 2)), np.empty(0, dtype=bool))
+        self.instances = tuple(np.concatenate(values) if values else default
+                               for values, default in zip(instances, empty)) + (self.enclosing(first),)
+        self.colors, self.base_colors, self.rows = np.empty((first, 3)), np.empty((first, 3)), {}
+        for name in self.scene:
+            self.color_component(name)
+        self.touched.clear()
+
+    def patch(self):
+        """Copy the components whose instances moved over their slices of the scene arrays"""
+        triangles, normals = self.faces[:2]
+        bounds, sizes, coarse, enclosing = self.instances
+        for name in self.touched:
+            scene = self.scene[name]
+            first, starts = self.slices[name]
+            rows = slice(first, first + len(scene.component))
+            for start, (level_triangles, level_normals) in zip(starts, scene.levels):
+                faces = slice(start, start + level_triangles.shape[0] * level_triangles.shape[1])
+                triangles[faces] = level_triangles.reshape(-1, 3, 3)
+                normals[faces] = level_normals.reshape(-1, 3)
+            bounds[rows], sizes[rows] = scene.bounds, scene.sizes
+            # Matching is by ID, so the instances may also have changed order
+            self.color_component(name)
+        self.touched.clear()
+        enclosing[:] = self.enclosing(len(enclosing))
+
+    def color_component(self, name):
+        """Colours and scene-wide indices of the instances of one component"""
+        scene = self.scene[name]
+        first = self.slices[name][0]
+        rows = slice(first, first + len(scene.component))
+        color = QColor(COMPONENT_COLORS.get(name, DEFAULT_COLOR))
+        self.base_colors[rows] = self.colors[rows] = (color.red(), color.green(), color.blue())
+        self.rows.update(zip(scene.component.ids, range(rows.start, rows.stop)))
+        self.recolor(instance for instance in scene.component.ids
+                     if instance in self.selected or instance in self.utilization)
+
+    def recolor(self, instances):
+        """Colour the instances with these IDs by selection, then utilization, then component"""
+        if self.faces is None:
+            return
+        color = QColor(SELECTION_COLOR)
+        for instance in instances:
+            row = self.rows.get(instance)
+            if row is None:
+                continue
+            if instance in self.selected:
+                self.colors[row] = (color.red(), color.green(), color.blue())
+            elif instance in self.utilization:
+                self.colors[row] = self.utilization[instance]
+            else:
+                self.colors[row] = self.base_colors[row]
+
+    def enclosing(self, count):
+        """Scene-wide index of the instance of another component whose bounding box encloses each
+        of the count instances of the scene, -1 for none. Pairs of components that have not
+        changed since they were last compared are taken from self.enclosures."""
+        enclosing = np.full(count, -1, dtype=np.intp)
+        for name, scene in self.scene.items():
+            first = self.slices[name][0]
+            enclosed = enclosing[first:first + len(scene.component)]
+            for other_name, other in self.scene.items():
+                if other is not scene and len(other.levels) > 1:
+                    inside = self.enclosures.get((other_name, name))
+                    if inside is None:
+                        inside = self.enclosures[other_name, name] = enclosing_instances(other.component,
+                                                                                         scene.component)
+                    found = (inside >= 0) & (enclosed < 0)
+                    enclosed[found] = inside[found] + self.slices[other_name][0]
+        return enclosing
+
+    def instance_levels(self, eye, focal):
+        """Level of detail of every instance: 0 full mesh, 1 bounding box or HIDDEN"""
+        self.scene_faces()
+        bounds, sizes, coarse, enclosing = self.instances
+        levels = np.zeros(len(sizes), dtype=np.int8)
+        if not self.level_of_detail:
+            return levels
+        # Size on screen at the nearest point of the bounding box, so long
+        # members seen end on keep their detail close to the camera
+        distance = np.linalg.norm(eye - np.clip(eye, bounds[:, 0], bounds[:, 1]), axis=1)
+        pixels = focal * sizes / np.maximum(distance, NEAR_PLANE)[:, None]
+        levels[coarse & (pixels[:, 0] < DETAIL_PIXELS)] = 1
+        levels[pixels[:, 1] < MIN_PIXELS] = HIDDEN
+        enclosed = np.flatnonzero(enclosing >= 0)
+        levels[enclosed[levels[enclosing[enclosed]] > 0]] = HIDDEN
+        return levels
+
+    def bounds(self):
+        triangles = self.scene_faces()[0]
+        if not len(triangles):
+            return np.zeros(3), np.ones(3)
+        points = triangles.reshape(-1, 3)
+        return points.min(axis=0), points.max(axis=0)
+
+    def fit(self):
+        """Centre the camera on the whole model"""
+        low, high = self.bounds()
+        self.target = (low + high) / 2
+        radius = max(np.linalg.norm(high - low) / 2, 1e-3)
+        # The narrower of the vertical and horizontal fields of view
+        half_angle = math.atan(math.tan(FIELD_OF_VIEW / 2) * min(self.width() / max(self.height(), 1), 1.0))
+        self.distance = radius / math.sin(half_angle) * 1.05
+        self.auto_fit = True
+        self.invalidate()
+
+    def camera(self):
+        """Eye position and the right, up and forward unit vectors"""
+        forward = -np.array((math.cos(self.pitch) * math.cos(self.yaw),
+                             math.cos(self.pitch) * math.sin(self.yaw),
+                             math.sin(self.pitch)))
+        eye = self.target - forward * self.distance
+        right = np.cross(forward, (0.0, 0.0, 1.0))
+        right /= np.linalg.norm(right)
+        up = np.cross(right, forward)
+        return eye, np.stack((right, up, forward))
+
+    def focal_length(self, height):
+        """Focal length (px) of an image height px high"""
+        return height / 2 / math.tan(FIELD_OF_VIEW / 2)
+
+    def project(self, points, eye, axes, width, height):
+        """Screen x, y (px of a width x height image) and depth of model points"""
+        return self.to_screen((points - eye) @ axes.T, width, height)
+
+    def to_screen(self, view, width, height):
+        """Screen x, y and depth of view-space points"""
+        focal = self.focal_length(height)
+        depth = view[..., 2]
+        safe = np.maximum(depth, NEAR_PLANE)
+        x = width / 2 + focal * view[..., 0] / safe
+        y = height / 2 - focal * view[..., 1] / safe
+        return x, y, depth
+
+    def visible_faces(self, width, height):
+        """Screen corners, reciprocal depths and shaded ARGB of the faces in front of the camera,
+        at the level of detail of their instances"""
+        triangles, normals, instance, level = self.scene_faces()
+        eye, axes = self.camera()
+        shown = self.instance_levels(eye, self.focal_length(height))[instance] == level
+        shown &= np.einsum("ij,ij->i", eye - triangles[:, 0], normals) > 0
+        triangles, normals, colors = triangles[shown], normals[shown], self.colors[instance[shown]]
+
+        view, source = clip_near((triangles - eye) @ axes.T, NEAR_PLANE)
+        normals, colors = normals[source], colors[source]
+        x, y, depth = self.to_screen(view, width, height)
+        keep = ((x.max(axis=1) >= 0) & (x.min(axis=1) <= width)
+                & (y.max(axis=1) >= 0) & (y.min(axis=1) <= height))
+        return x[keep], y[keep], 1.0 / depth[keep], shade(normals[keep], colors[keep], axes)
+
+    def ray(self, x, y):
+        """Eye and unit direction of the ray through widget position x, y"""
+        eye, axes = self.camera()
+        focal = self.focal_length(self.height())
+        direction = np.array(((x - self.width() / 2) / focal, (self.height() / 2 - y) / focal, 1.0)) @ axes
+        return eye, direction / np.linalg.norm(direction)
+
+    def pick(self, x, y):
+        """ID of the instance drawn at widget position x, y, None over empty space.
+
+        The component trees give the instances whose bounding boxes the ray
+        enters, nearest first; their triangles, at the level of detail of
+        the last full frame, are tested until the nearest hit is closer
+        than the next box.
+        """
+        eye, direction = self.ray(x, y)
+        self.scene_faces()
+        levels = self.instance_levels(eye, self.focal_length(self.height() * self.devicePixelRatioF()))
+        candidates = []
+        first = 0
+        for scene in self.scene.values():
+            rows, entries = scene.hierarchy().ray(eye, direction)
+            candidates += zip(entries.tolist(), (first + rows).tolist(), [scene] * len(rows), rows.tolist())
+            first += len(scene.component)
+        nearest, picked = np.inf, None
+        for entry, instance, scene, row in sorted(candidates, key=lambda candidate: candidate[0]):
+            if entry > nearest:
+                break
+            level = levels[instance]
+            if level != HIDDEN:
+                distance = ray_distance(eye, direction, scene.levels[level][0][row])
+                if distance < nearest:
+                    nearest, picked = distance, scene.component.ids[row]
+        return picked
+
+    def box_planes(self, rect):
+        """Planes (a, b, c, d), inside where a x + b y + c z + d >= 0, of the volume seen through rect"""
+        eye, axes = self.camera()
+        focal = self.focal_length(self.height())
+        left, right = (rect.left() - self.width() / 2) / focal, (rect.right() + 1 - self.width() / 2) / focal
+        top, bottom = (self.height() / 2 - rect.top()) / focal, (self.height() / 2 - rect.bottom() - 1) / focal
+        # View-space normals of the four sides and the near plane
+        normals = np.array(((1.0, 0.0, -left), (-1.0, 0.0, right), (0.0, -1.0, top), (0.0, 1.0, -bottom),
+                            (0.0, 0.0, 1.0))) @ axes
+        offsets = -normals @ eye
+        offsets[4] -= NEAR_PLANE
+        return np.column_stack((normals, offsets))
+
+    def select_box(self, rect):
+        """IDs of the instances whose bounding boxes lie inside rect (widget px)"""
+        planes = self.box_planes(rect)
+        return [scene.component.ids[row] for scene in self.scene.values()
+                for row in np.sort(scene.hierarchy().frustum(planes, contained=True)).tolist()]
+
+    def set_selection(self, instances):
+        """Highlight the instances with these IDs and emit selection_changed.
+
+        Only the colours of the instances entering or leaving the selection
+        change; the scene arrays are left as they are.
+        """
+        previous, self.selected = self.selected, set(instances)
+        self.recolor(previous ^ self.selected)
+        self.invalidate()
+        self.selection_changed.emit(list(instances))
+
+    def render_frame(self):
+        ratio = self.devicePixelRatioF() * (INTERACTIVE_SCALE if self.interactive else 1.0)
+        width, height = max(int(self.width() * ratio), 1), max(int(self.height() * ratio), 1)
+        pixels = rasterize(*self.visible_faces(width, height), width, height)
+        image = QImage(pixels.data, width, height, width * 4, QImage.Format_ARGB32)
+        frame = QPixmap.fromImage(image)
+        frame.setDevicePixelRatio(ratio)
+        return frame
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+        if not self.scene:
+            painter.setPen(self.palette().color(QPalette.WindowText))
+            painter.drawText(self.rect(), Qt.AlignCenter, "No model")
+            return
+        if self.frame is None:
+            self.frame = self.render_frame()
+        painter.drawPixmap(self.rect(), self.frame)
+
+    def resizeEvent(self, event):
+        if self.frame is None:
+            if self.auto_fit and self.scene:
+                self.fit()
+        else:
+            # Stretch the last frame while the size keeps changing; fit and render once it settles
+            self.resized = True
+            self.settle_timer.start()
+        super().resizeEvent(event)
+
+    def wheelEvent(self, event):
+        steps = event.angleDelta().y() / 120
+        if steps:
+            self.distance /= ZOOM_STEP ** steps
+            self.camera_moved()
+        event.accept()
+
+    def mousePressEvent(self, event):
+        self.drag = (event.button(), event.position())
+        self.press = event.position()
+        if event.button() == Qt.LeftButton and event.modifiers() & Qt.ShiftModifier:
+            self.drag = None
+            self.band_origin = event.position().toPoint()
+            self.rubber_band.setGeometry(QRect(self.band_origin, self.band_origin))
+            self.rubber_band.show()
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self.press is not None and (event.position() - self.press).manhattanLength() >= CLICK_DISTANCE:
+            self.press = None
+        if self.rubber_band.isVisible():
+            self.rubber_band.setGeometry(QRect(self.band_origin, event.position().toPoint()).normalized())
+        elif self.drag is not None and self.press is None:
+            button, last = self.drag
+            dx, dy = event.position().x() - last.x(), event.position().y() - last.y()
+            if button == Qt.LeftButton:
+                self.yaw -= dx * ORBIT_SPEED
+                self.pitch = min(max(self.pitch + dy * ORBIT_SPEED, -1.55), 1.55)
+            else:
+                eye, axes = self.camera()
+                scale = 2 * self.distance * math.tan(FIELD_OF_VIEW / 2) / max(self.height(), 1)
+                self.target = self.target - axes[0] * dx * scale + axes[1] * dy * scale
+            self.drag = (button, event.position())
+            self.camera_moved()
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        if self.rubber_band.isVisible():
+            self.rubber_band.hide()
+            if self.press is None:
+                self.set_selection(self.select_box(self.rubber_band.geometry()))
+        elif event.button() == Qt.LeftButton and self.press is not None and self.scene:
+            picked = self.pick(event.position().x(), event.position().y())
+            self.set_selection([] if picked is None else [picked])
+        self.drag = None
+        self.press = None
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        self.fit()
+        super().mouseDoubleClickEvent(event)
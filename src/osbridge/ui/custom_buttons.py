@@ -6,57 +6,32 @@ from PySide6.QtWidgets import (
     QWidget, QPushButton, QVBoxLayout, QHBoxLayout, QApplication, QGridLayout,
     QLabel, QMainWindow, QSizePolicy, QFrame
 )
-from PySide6.QtSvgWidgets import QSvgWidget
 from PySide6.QtCore import Qt, Signal, QSize, QEvent, QRect, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import QFont, QIcon, QPainter
+from osbridge.ui.icon_cache import svg_pixmap
 
 class DockCustomButton(QPushButton):
     def __init__(self, text: str, icon_path: str, parent=None):
         super().__init__(parent)
         self.setCursor(Qt.PointingHandCursor)
         self.setObjectName("dock_custom_button")
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #90AF13;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7a9a12;
-            }
-        """)
 
         # Layout for icons and text
         layout = QHBoxLayout(self)
         layout.setContentsMargins(10, 0, 10, 0)
         layout.setSpacing(0)
 
-        # Left icon
-        left_icon = QSvgWidget()
-        left_icon.load(icon_path)
+        # Left icon, painted from the shared vector cache
+        left_icon = QLabel()
+        left_icon.setPixmap(svg_pixmap(icon_path, QSize(18, 18)))
         left_icon.setFixedSize(18, 18)
         left_icon.setObjectName("button_icon")
-        left_icon.setStyleSheet("""
-            QSvgWidget {
-                background: transparent;
-            }
-        """)
         layout.addWidget(left_icon)
 
         # Center text
         text_label = QLabel(text)
         text_label.setAlignment(Qt.AlignCenter)
         text_label.setObjectName("button_label")
-        text_label.setStyleSheet("""
-            QLabel {
-                background: transparent;
-                color: white;
-            }
-        """)
         layout.addWidget(text_label)
 
         layout.setAlignment(Qt.AlignVCenter)
@@ -0,0 +1,323 @@
+"""
+Force, moment and deflection diagrams along the members.
+Each diagram can hold millions of station values, so curves are drawn from
+a min/max pyramid built when the results arrive: level j holds the min and
+max of blocks of 2 ** (j + 1) stations, and a view draws the level whose
+blocks are at most a pixel wide. Drawing slices the pyramid into point
+arrays and strokes all series of one colour as a single QPainterPath,
+and the painted tiles of the current view are kept as pixmaps, so
+repainting and panning only copy pixmaps.
+"""
+import math
+import struct
+
+import numpy as np
+from PySide6.QtCore import Qt, QByteArray, QDataStream, QPointF, QRectF, Signal
+from PySide6.QtGui import QColor, QPainter, QPainterPath, QPalette, QPen, QPixmap, QTransform
+from PySide6.QtWidgets import QWidget, QStyle, QStyleOption
+
+from osbridge.backend.results import ENVELOPE, ALL_COMBINATIONS
+
+
+# Screen width of one cached pixmap tile (px)
+TILE_WIDTH = 512
+
+ZOOM_STEP = 1.25
+MARGIN = 24
+
+COMPONENT_COLORS = {
+    "Fx": "#d9534f", "Fy": "#5cb85c", "Fz": "#428bca",
+    "Mx": "#e67e22", "My": "#8e44ad", "Mz": "#16a085",
+    "Dx": "#c0392b", "Dy": "#2c3e50", "Dz": "#7f8c8d",
+}
+
+
+def min_max_pyramid(values):
+    """Min and max of blocks of 2, 4, 8... stations along axis 1 of values.
+
+    Returns a list whose entry j is (low, high) for blocks of 2 ** (j + 1)
+    stations; an odd last station forms a block of its own. Peaks are never
+    dropped, which matters for design forces.
+    """
+    levels = []
+    low = high = values
+    while low.shape[1] > 2:
+        count = low.shape[1]
+        shape = (low.shape[0], (count + 1) // 2) + low.shape[2:]
+        next_low, next_high = np.empty(shape), np.empty(shape)
+        np.minimum(low[:, 0:count - 1:2], low[:, 1::2], out=next_low[:, :count // 2])
+        np.maximum(high[:, 0:count - 1:2], high[:, 1::2], out=next_high[:, :count // 2])
+        if count % 2:
+            next_low[:, -1], next_high[:, -1] = low[:, -1], high[:, -1]
+        low, high = next_low, next_high
+        levels.append((low, high))
+    return levels
+
+
+def polyline_path(polylines):
+    """QPainterPath with one subpath through each (n, 2) array of points.
+
+    The path is read in one call from its QDataStream form (element count,
+    then type, x and y of each element), so no Python object is made per point.
+    """
+    count = sum(len(points) for points in polylines)
+    elements = np.empty(count, [("type", ">i4"), ("x", ">f8"), ("y", ">f8")])
+    elements["type"] = QPainterPath.LineToElement.value
+    start = 0
+    for points in polylines:
+        if len(points):
+            elements["type"][start] = QPainterPath.MoveToElement.value
+        elements["x"][start:start + len(points)], elements["y"][start:start + len(points)] = points.T
+        start += len(points)
+    raw = struct.pack(">i", count) + elements.tobytes() + struct.pack(">i", Qt.OddEvenFill.value)
+    path = QPainterPath()
+    QDataStream(QByteArray(raw)) >> path
+    return path
+
+
+def min_max_points(x, low, high):
+    """Polyline with one vertical stroke between low and high at each x.
+
+    Strokes alternate between rising and falling, so the segment joining
+    two of them stays short instead of crossing the whole range again.
+    """
+    points = np.empty((2 * len(x), 2))
+    points[0::2, 0] = points[1::2, 0] = x
+    points[0::2, 1], points[1::2, 1] = low, high
+    points[2::4, 1], points[3::4, 1] = high[1::2], low[1::2]
+    return points
+
+
+class DiagramView(QWidget):
+    """Diagrams of the checked components for the selected members.
+
+    Wheel zooms around the cursor, dragging pans and a double click fits
+    the whole length again. The pyramid of the envelope is built when the
+    results arrive and that of a single combination the first time it is
+    shown. Pixmap tiles hold all visible series at the current scale and are
+    dropped when the scale, the visible series or the plot size change.
+    """
+
+    zoomed = Signal(float)  # Emitted with the new scale (px per m)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("diagram_view")
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setMinimumHeight(160)
+        self.results = None
+        self.components = []
+        self.member = None
+        self.combination = ENVELOPE
+        self.series = {}  # (member, component, label) -> (x, y, min, max, pyramid levels)
+        self.pyramids = {}  # ENVELOPE or combination -> min_max_pyramid of its values
+        self.pixmaps = {}  # tile -> QPixmap of the visible series at the current view
+        self.pixmap_view = None
+        self.scale = None  # px per m; None fits the whole length
+        self.offset = 0.0  # m at the left edge of the plot area
+        self.drag_start = None
+
+    def set_results(self, results):
+        self.results = results
+        self.series.clear()
+        self.pyramids.clear()
+        self.pixmaps.clear()
+        if results is not None:
+            self.pyramids[ENVELOPE] = min_max_pyramid(results.envelope())
+        self.scale = None
+        self.update()
+
+    def set_components(self, components):
+        self.components = list(components)
+        self.update()
+
+    def set_filter(self, member=None, combination=ENVELOPE):
+        self.member = member
+        self.combination = combination
+        self.update()
+
+    def visible_series(self):
+        """Keys of the series drawn for the current components, member and combination"""
+        if self.results is None:
+            return []
+        members = self.results.members if self.member is None else (self.member,)
+        if self.combination in (ENVELOPE, ALL_COMBINATIONS):
+            labels = ("Max", "Min")
+        else:
+            labels = (self.combination,)
+        return [(member, component, label)
+                for component in self.components if component in self.results.components
+                for member in members for label in labels]
+
+    def series_data(self, key):
+        """Station positions, values, value range and pyramid levels of a series, sliced once"""
+        data = self.series.get(key)
+        if data is None:
+            member, component, label = key
+            m = self.results.member_index(member)
+            k = self.results.components.index(component)
+            if label in ("Max", "Min"):
+                source, values, column = ENVELOPE, self.results.envelope(), 0 if label == "Max" else 1
+            else:
+                c = self.results.combination_index(label)
+                source, values, column = label, self.results.values[:, :, c:c + 1], 0
+            levels = self.pyramids.get(source)
+            if levels is None:
+                levels = self.pyramids[source] = min_max_pyramid(values)
+            y = values[m, :, column, k]
+            levels = [(low[m, :, column, k], high[m, :, column, k]) for low, high in levels]
+            low, high = levels[-1] if levels else (y, y)
+            value_range = (float(low.min()), float(high.max())) if len(y) else (0.0, 0.0)
+            data = self.series[key] = (self.results.stations, y) + value_range + (levels,)
+        return data
+
+    def plot_rect(self):
+        return QRectF(self.rect()).adjusted(MARGIN, MARGIN / 2, -MARGIN / 2, -MARGIN / 2)
+
+    def length_range(self):
+        stations = self.results.stations
+        return float(stations[0]), float(stations[-1]) if len(stations) > 1 else float(stations[0]) + 1.0
+
+    def current_scale(self):
+        if self.scale is None:
+            start, end = self.length_range()
+            self.offset = start
+            return self.plot_rect().width() / max(end - start, 1e-9)
+        return self.scale
+
+    def series_points(self, key, start, end, scale, high, y_scale):
+        """(n, 2) polyline points of a series over [start, end] m, from the coarsest level whose blocks fit in a pixel.
+
+        Points are in px from start and from the value high, so the series
+        is drawn without a transform.
+        """
+        x, y, _, _, levels = self.series_data(key)
+        level = -1
+        if len(x) > 1 and x[-1] > x[0]:
+            stations_per_px = (len(x) - 1) / ((x[-1] - x[0]) * scale)
+            level = min(int(math.log2(max(stations_per_px, 1.0))) - 1, len(levels) - 1)
+        if level >= 0:
+            x = x[::2 ** (level + 1)]
+        # One point either side joins the tile to its neighbours
+        first, last = np.searchsorted(x, (start, end))
+        first, last = max(first - 1, 0), min(last + 1, len(x))
+        x = (x[first:last] - start) * scale
+        if level < 0:
+            return np.column_stack((x, (high - y[first:last]) * y_scale))
+        # Merge the blocks sharing a pixel column into one stroke
+        column = np.floor(x).astype(np.intp)
+        starts = np.flatnonzero(np.r_[True, column[1:] != column[:-1]])
+        low = np.minimum.reduceat(levels[level][0][first:last], starts)
+        top = np.maximum.reduceat(levels[level][1][first:last], starts)
+        return min_max_points(x[starts], (high - low) * y_scale, (high - top) * y_scale)
+
+    def value_range(self, keys):
+        low, high = 0.0, 0.0
+        for key in keys:
+            series_low, series_high = self.series_data(key)[2:4]
+            low, high = min(low, series_low), max(high, series_high)
+        if high - low < 1e-12:
+            high, low = high + 1.0, low - 1.0
+        return low, high
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+        text_color = self.palette().color(QPalette.WindowText)
+        keys = self.visible_series()
+        if not keys:
+            painter.setPen(text_color)
+            text = "No results" if self.results is None else "Check a component to show its diagram"
+            painter.drawText(self.rect(), Qt.AlignCenter, text)
+            return
+
+        rect = self.plot_rect()
+        scale = self.current_scale()
+        low, high = self.value_range(keys)
+        y_scale = rect.height() / (high - low)
+        # Data (m, value) to screen, values growing upwards
+        transform = QTransform(scale, 0, 0, -y_scale, rect.left() - self.offset * scale, rect.top() + high * y_scale)
+
+        painter.setPen(QPen(text_color, 0))
+        zero = transform.map(QPointF(self.offset, 0.0)).y()
+        painter.drawLine(QPointF(rect.left(), zero), QPointF(rect.right(), zero))
+        painter.setClipRect(rect)
+
+        view = (tuple(keys), scale, rect.height(), low, high, self.devicePixelRatioF())
+        if view != self.pixmap_view:
+            self.pixmaps.clear()
+            self.pixmap_view = view
+        start, end = self.length_range()
+        first_tile = max(int((self.offset - start) * scale // TILE_WIDTH), 0)
+        last_tile = int((min(self.offset + rect.width() / scale, end) - start) * scale // TILE_WIDTH)
+        for tile in range(first_tile, last_tile + 1):
+            pixmap = self.pixmaps.get(tile)
+            if pixmap is None:
+                pixmap = self.pixmaps[tile] = self.paint_tile(keys, tile, scale, rect.height(), high, y_scale)
+            left = rect.left() + (start + tile * TILE_WIDTH / scale - self.offset) * scale
+            painter.drawPixmap(QPointF(left, rect.top()), pixmap)
+
+    def paint_tile(self, keys, tile, scale, height, high, y_scale):
+        """Pixmap of one screen tile with every visible series"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(TILE_WIDTH * ratio), int(math.ceil(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        tile_start = self.length_range()[0] + tile * TILE_WIDTH / scale
+        tile_end = tile_start + TILE_WIDTH / scale
+
+        # Series sharing a colour are drawn together, one pen change and one path per colour
+        groups = {}
+        for key in keys:
+            points = self.series_points(key, tile_start, tile_end, scale, high, y_scale)
+            groups.setdefault((key[1], key[2] == "Min"), []).append(points)
+        painter = QPainter(pixmap)
+        for (component, lighter), polylines in groups.items():
+            color = QColor(COMPONENT_COLORS.get(component, "#333333"))
+            if lighter:
+                color = color.lighter(150)
+            painter.setPen(QPen(color, 0))
+            painter.drawPath(polyline_path(polylines))
+        painter.end()
+        return pixmap
+
+    def zoom(self, factor, anchor_x):
+        """Scale the length axis by factor, keeping the position under anchor_x fixed"""
+        if self.results is None:
+            return
+        scale = self.current_scale()
+        anchor = self.offset + (anchor_x - self.plot_rect().left()) / scale
+        self.scale = scale * factor
+        self.offset = anchor - (anchor_x - self.plot_rect().left()) / self.scale
+        self.update()
+        self.zoomed.emit(self.scale)
+
+    def wheelEvent(self, event):
+        steps = event.angleDelta().y() / 120
+        if steps:
+            self.zoom(ZOOM_STEP ** steps, event.position().x())
+        event.accept()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and self.results is not None:
+            self.drag_start = (event.position().x(), self.offset, self.current_scale())
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self.drag_start is not None:
+            x, offset, scale = self.drag_start
+            self.scale = scale
+            self.offset = offset - (event.position().x() - x) / scale
+            self.update()
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        self.drag_start = None
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        self.scale = None
+        self.update()
+        super().mouseDoubleClickEvent(event)
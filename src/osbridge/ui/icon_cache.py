@@ -0,0 +1,97 @@
+"""
+Shared raster cache for the SVG vectors in the Qt resources.
+Each vector is parsed once and rendered once per size and device pixel
+ratio; buttons then paint from the cached pixmaps instead of re-parsing
+the SVG every time an icon is created or a button repaints.
+"""
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QGuiApplication, QIcon, QIconEngine, QImage, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtWidgets import QApplication, QStyleOption
+
+# Import resources to register them
+from osbridge.resources import resources_rc
+
+
+_renderers = {}  # resource path -> QSvgRenderer
+_pixmaps = {}  # (resource path, width, height, device pixel ratio, mode) -> QPixmap
+_icons = {}  # (path when checked, path otherwise) -> QIcon
+
+
+def _renderer(path):
+    renderer = _renderers.get(path)
+    if renderer is None:
+        renderer = QSvgRenderer(path)
+        if not renderer.isValid():
+            raise FileNotFoundError(f"Vector resource not found: {path}")
+        _renderers[path] = renderer
+    return renderer
+
+
+def svg_pixmap(path, size, device_pixel_ratio=None, mode=QIcon.Normal):
+    """Pixmap of the vector at path, size in logical pixels, rendered on first request"""
+    if device_pixel_ratio is None:
+        device_pixel_ratio = QGuiApplication.instance().devicePixelRatio()
+    if mode == QIcon.Active:
+        mode = QIcon.Normal
+    key = (path, size.width(), size.height(), device_pixel_ratio, mode)
+    pixmap = _pixmaps.get(key)
+    if pixmap is not None:
+        return pixmap
+
+    if mode == QIcon.Normal:
+        image = QImage(size * device_pixel_ratio, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        _renderer(path).render(painter)
+        painter.end()
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+    else:
+        normal = svg_pixmap(path, size, device_pixel_ratio)
+        pixmap = QApplication.style().generatedIconPixmap(mode, normal, QStyleOption())
+    _pixmaps[key] = pixmap
+    return pixmap
+
+
+class CachedSvgIconEngine(QIconEngine):
+    """Icon engine that paints an On and an Off vector from the shared cache"""
+
+    def __init__(self, on_path, off_path=None):
+        super().__init__()
+        self.on_path = on_path
+        self.off_path = off_path or on_path
+
+    def path(self, state):
+        return self.on_path if state == QIcon.On else self.off_path
+
+    def pixmap(self, size, mode, state):
+        return svg_pixmap(self.path(state), size, 1.0, mode)
+
+    def scaledPixmap(self, size, mode, state, scale):
+        return svg_pixmap(self.path(state), size, scale, mode)
+
+    def paint(self, painter, rect, mode, state):
+        scale = painter.device().devicePixelRatio() if painter.device() else 1.0
+        pixmap = svg_pixmap(self.path(state), rect.size(), scale, mode)
+        painter.drawPixmap(rect, pixmap)
+
+    def actualSize(self, size, mode, state):
+        return size
+
+    def clone(self):
+        return CachedSvgIconEngine(self.on_path, self.off_path)
+
+    def key(self):
+        return "CachedSvgIconEngine"
+
+
+def svg_icon(on_path, off_path=None):
+    """Shared icon for a vector; off_path is used while a checkable button is unchecked"""
+    key = (on_path, off_path or on_path)
+    icon = _icons.get(key)
+    if icon is None:
+        icon = QIcon(CachedSvgIconEngine(*key))
+        _icons[key] = icon
+    return icon
+
@@ -4,12 +4,17 @@ from PySide6.QtWidgets import (
     QApplication, QWidget, QHBoxLayout, QVBoxLayout, QPushButton,
     QComboBox, QScrollArea, QLabel, QFormLayout, QLineEdit, QGroupBox, QSizePolicy, QMessageBox, QInputDialog, QDialog, QCheckBox, QFrame
 )
-from PySide6.QtCore import Qt, QRegularExpression, QSize
-from PySide6.QtGui import QPixmap, QDoubleValidator, QRegularExpressionValidator, QIcon
+from PySide6.QtCore import Qt, QSize, Signal
+from PySide6.QtGui import QPixmap, QIcon
 from PySide6.QtSvgWidgets import *
 from osbridge.backend.common import *
-from osbridge.ui.additional_inputs import AdditionalInputsWidget
+from osbridge.backend.schema import INPUT_SCHEMA
+from osbridge.ui.additional_inputs import AdditionalInputsDialog
 from osbridge.ui.custom_buttons import DockCustomButton
+from osbridge.ui.theme import theme_manager
+from osbridge.ui.icon_cache import svg_icon
+from osbridge.ui.binding import bind_field
+from osbridge.ui.validation_status import ValidationMonitor
 
 
 class NoScrollComboBox(QComboBox):
@@ -19,98 +24,13 @@ class NoScrollComboBox(QComboBox):
 def apply_field_style(widget):
     widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
     widget.setMinimumHeight(28)
-    
-    if isinstance(widget, QComboBox):
-        style = """
-            QComboBox{
-                padding: 2px;
-                border: 1px solid black;
-                border-radius: 5px;
-                background-color: white;
-                color: black;
-            }
-            QComboBox::drop-down{
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                border-left: 0px;
-            }
-            QComboBox::down-arrow{
-                image: url(:/vectors/arrow_down_light.svg);
-                width: 20px;
-                height: 20px;
-                margin-right: 8px;
-            }
-            QComboBox::down-arrow:on {
-                image: url(:/vectors/arrow_up_light.svg);
-                width: 20px;
-                height: 20px;
-                margin-right: 8px;
-            }
-            QComboBox QAbstractItemView{
-                background-color: white;
-                border: 1px solid black;
-                outline: none;
-            }
-            QComboBox QAbstractItemView::item{
-                color: black;
-                background-color: white;
-                border: none;
-                border: 1px solid white;
-                border-radius: 0;
-                padding: 2px;
-            }
-            QComboBox QAbstractItemView::item:hover{
-                border: 1px solid #90AF13;
-                background-color: #90AF13;
-                color: black;
-            }
-            QComboBox QAbstractItemView::item:selected{
-                background-color: #90AF13;
-                color: black;
-                border: 1px solid #90AF13;
-            }
-            QComboBox QAbstractItemView::item:selected:hover{
-                background-color: #90AF13;
-                color: black;
-                border: 1px solid #94b816;
-            } 
-        """
-        widget.setStyleSheet(style)
-    elif isinstance(widget, QLineEdit):
-        widget.setStyleSheet("""
-            QLineEdit {
-                padding: 1px 7px;
-                border: 1px solid #070707;
-                border-radius: 6px;
-                background-color: white;
-                color: #000000;
-                font-weight: normal;
-            }
-        """)
+    # Styled by the [field="basic"] rules of the application stylesheet
+    widget.setProperty("field", "basic")
 
 def create_group_box(title):
     """Create a styled group box"""
     group_box = QGroupBox(title)
-    group_box.setStyleSheet("""
-        QGroupBox {
-            font-weight: bold;
-            font-size: 12px;
-            color: #333;
-            border: 1px solid #90AF13;
-            border-radius: 4px;
-            margin-top: 0.8em;
-            padding: 10px;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            subcontrol-position: top left;
-            left: 8px;
-            padding: 0 4px;
-            margin-top: 4px;
-            background-color: white;
-            color: #333;
-        }
-    """)
+    group_box.setObjectName("input_group_box")
     return group_box
 
 
@@ -120,15 +40,10 @@ def create_form_row(label_text, widget, tooltip=None):
     row.setSpacing(10)
     
     label = QLabel(label_text)
-    label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-    label.setMinimumWidth(140)
-    label.setMaximumWidth(140)
+    label.setObjectName("dock_field_label")
+    label.setMinimumWidth(120)
+    label.setMaximumWidth(120)
+    label.setWordWrap(True)  # Schema labels carry their bounds, e.g. "Span (m)* [20-45]"
     
     if tooltip:
         widget.setToolTip(tooltip)
@@ -139,19 +54,47 @@ def create_form_row(label_text, widget, tooltip=None):
     return row
 
 
+def field_placeholder(spec):
+    """Hint shown in an empty text field: its default, else its bounds"""
+    if spec.default is not None:
+        return f"Default: {spec.default:g}"
+    if spec.minimum is not None and spec.maximum is not None:
+        return f"{spec.minimum:g}-{spec.maximum:g}"
+    return ""
+
+
+def create_input_widget(key, entry_type, values):
+    """Combobox or text field for one entry of the schema's input_values(), named after its key"""
+    if entry_type == TYPE_COMBOBOX:
+        widget = NoScrollComboBox()
+        widget.addItems(values)
+    else:
+        widget = QLineEdit()
+        widget.setPlaceholderText(field_placeholder(INPUT_SCHEMA[key]))
+    widget.setObjectName(key)
+    apply_field_style(widget)
+    return widget
+
+
 class InputDock(QWidget):
+    design_requested = Signal()  # Emitted when Design is clicked
+
     def __init__(self, backend, parent):
         super().__init__()
         self.parent = parent
         self.backend = backend
+        self.inputs = backend.inputs
+        # Validates model edits after a quiet period and highlights fields inline
+        self.validation = ValidationMonitor(self.inputs, parent=self)
         self.input_widget = None
         self.structure_type_combo = None
         self.project_location_combo = None
         self.custom_location_input = None
-        self.footpath_combo = None
         self.additional_inputs_window = None
+        self.additional_inputs_widget = None
+        self.selected_girder = None
 
-        self.setStyleSheet("background: transparent;")
+        self.setObjectName("input_dock")
         self.main_layout = QHBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
@@ -166,7 +109,7 @@ class InputDock(QWidget):
 
         # Toggle strip
         self.toggle_strip = QWidget()
-        self.toggle_strip.setStyleSheet("background-color: #90AF13;")
+        self.toggle_strip.setObjectName("toggle_strip")
         self.toggle_strip.setFixedWidth(6)
         toggle_layout = QVBoxLayout(self.toggle_strip)
         toggle_layout.setContentsMargins(0, 0, 0, 0)
@@ -177,32 +120,12 @@ class InputDock(QWidget):
         self.toggle_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.toggle_btn.setFixedSize(6, 60)
         self.toggle_btn.setToolTip("Hide panel")
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c8408;
-                color: white;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 0px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #5e7407;
-            }
-        """)
+        self.toggle_btn.setObjectName("toggle_strip_button")
         toggle_layout.addStretch()
         toggle_layout.addWidget(self.toggle_btn)
         toggle_layout.addStretch()
         self.main_layout.addWidget(self.toggle_strip)
 
-    def get_validator(self, validator):
-        if validator == 'Int Validator':
-            return QRegularExpressionValidator(QRegularExpression("^(0|[1-9]\\d*)(\\.\\d+)?$"))
-        elif validator == 'Double Validator':
-            return QDoubleValidator()
-        else:
-            return None
-    
     def on_structure_type_changed(self, text):
         """Handle structure type combo box changes"""
         if text == "Other":
@@ -264,17 +187,7 @@ class InputDock(QWidget):
         dialog.setMinimumHeight(650)
         
         # Set white background for the entire dialog
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: white;
-            }
-            QCheckBox {
-                color: black;
-            }
-            QLabel {
-                color: black;
-            }
-        """)
+        dialog.setObjectName("project_location_dialog")
         
         main_layout = QVBoxLayout(dialog)
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -285,34 +198,13 @@ class InputDock(QWidget):
         coords_row.setSpacing(15)
         
         self.coords_checkbox = QCheckBox("Enter Coordinates")
-        self.coords_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 12px; 
-                font-weight: normal;
-                color: black;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #b0b0b0;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #90AF13;
-                border-color: #90AF13;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #7a9a12;
-            }
-        """)
+        self.coords_checkbox.setObjectName("location_option_checkbox")
         coords_row.addWidget(self.coords_checkbox)
         
         coords_row.addStretch()
         
         lat_label = QLabel("Latitude (°)")
-        lat_label.setStyleSheet("font-size: 11px;")
+        lat_label.setObjectName("location_coordinate_label")
         coords_row.addWidget(lat_label)
         
         self.latitude_input = QLineEdit()
@@ -322,7 +214,7 @@ class InputDock(QWidget):
         coords_row.addWidget(self.latitude_input)
         
         lng_label = QLabel("Longitude (°)")
-        lng_label.setStyleSheet("font-size: 11px;")
+        lng_label.setObjectName("location_coordinate_label")
         coords_row.addWidget(lng_label)
         
         self.longitude_input = QLineEdit()
@@ -337,7 +229,7 @@ class InputDock(QWidget):
         line1 = QFrame()
         line1.setFrameShape(QFrame.HLine)
         line1.setFrameShadow(QFrame.Sunken)
-        line1.setStyleSheet("background-color: #d0d0d0;")
+        line1.setObjectName("location_separator")
         main_layout.addWidget(line1)
         
         # === Enter Location Name Row ===
@@ -345,34 +237,13 @@ class InputDock(QWidget):
         location_row.setSpacing(15)
         
         self.location_checkbox = QCheckBox("Enter Location Name")
-        self.location_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 12px; 
-                font-weight: normal;
-                color: black;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #b0b0b0;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #90AF13;
-                border-color: #90AF13;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #7a9a12;
-            }
-        """)
+        self.location_checkbox.setObjectName("location_option_checkbox")
         location_row.addWidget(self.location_checkbox)
         
         location_row.addStretch()
         
         state_label = QLabel("State")
-        state_label.setStyleSheet("font-size: 11px;")
+        state_label.setObjectName("location_coordinate_label")
         location_row.addWidget(state_label)
         
         self.state_combo = NoScrollComboBox()
@@ -383,7 +254,7 @@ class InputDock(QWidget):
         location_row.addWidget(self.state_combo)
         
         district_label = QLabel("District")
-        district_label.setStyleSheet("font-size: 11px;")
+        district_label.setObjectName("location_coordinate_label")
         location_row.addWidget(district_label)
         
         self.district_combo = NoScrollComboBox()
@@ -399,7 +270,7 @@ class InputDock(QWidget):
         line2 = QFrame()
         line2.setFrameShape(QFrame.HLine)
         line2.setFrameShadow(QFrame.Sunken)
-        line2.setStyleSheet("background-color: #d0d0d0;")
+        line2.setObjectName("location_separator")
         main_layout.addWidget(line2)
         
         # === Select on Map Section ===
@@ -407,40 +278,12 @@ class InputDock(QWidget):
         map_section.setSpacing(8)
         
         self.map_checkbox = QCheckBox("Select on Map")
-        self.map_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 12px; 
-                font-weight: normal;
-                color: black;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #b0b0b0;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #90AF13;
-                border-color: #90AF13;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #7a9a12;
-            }
-        """)
+        self.map_checkbox.setObjectName("location_option_checkbox")
         map_section.addWidget(self.map_checkbox)
         
         # Map placeholder
         self.map_placeholder = QLabel()
-        self.map_placeholder.setStyleSheet("""
-            QLabel {
-                border: 1px solid #e0e0e0;
-                background-color: white;
-                padding: 20px;
-                color: #999999;
-            }
-        """)
+        self.map_placeholder.setObjectName("map_placeholder")
         self.map_placeholder.setAlignment(Qt.AlignCenter)
         self.map_placeholder.setMinimumHeight(200)
         self.map_placeholder.setText("Map Placeholder\n(Will be added later)")
@@ -453,7 +296,7 @@ class InputDock(QWidget):
         line3 = QFrame()
         line3.setFrameShape(QFrame.HLine)
         line3.setFrameShadow(QFrame.Sunken)
-        line3.setStyleSheet("background-color: #d0d0d0;")
+        line3.setObjectName("location_separator")
         main_layout.addWidget(line3)
         
         # === IRC 6 (2017) Values Section ===
@@ -461,19 +304,19 @@ class InputDock(QWidget):
         results_section.setSpacing(8)
         
         results_title = QLabel("IRC 6 (2017) Values")
-        results_title.setStyleSheet("font-size: 12px; font-weight: bold; color: #4CAF50;")
+        results_title.setObjectName("location_results_title")
         results_section.addWidget(results_title)
         
         self.wind_speed_label = QLabel("Basic Wind Speed (m/sec)")
-        self.wind_speed_label.setStyleSheet("font-size: 11px; color: #4CAF50;")
+        self.wind_speed_label.setObjectName("location_result_label")
         results_section.addWidget(self.wind_speed_label)
         
         self.seismic_zone_label = QLabel("Seismic Zone and Zone Factor")
-        self.seismic_zone_label.setStyleSheet("font-size: 11px; color: #4CAF50;")
+        self.seismic_zone_label.setObjectName("location_result_label")
         results_section.addWidget(self.seismic_zone_label)
         
         self.temp_label = QLabel("Shade Air Temperature (°C)")
-        self.temp_label.setStyleSheet("font-size: 11px; color: #4CAF50;")
+        self.temp_label.setObjectName("location_result_label")
         results_section.addWidget(self.temp_label)
         
         main_layout.addLayout(results_section)
@@ -482,32 +325,12 @@ class InputDock(QWidget):
         line4 = QFrame()
         line4.setFrameShape(QFrame.HLine)
         line4.setFrameShadow(QFrame.Sunken)
-        line4.setStyleSheet("background-color: #d0d0d0;")
+        line4.setObjectName("location_separator")
         main_layout.addWidget(line4)
         
         # === Custom Loading Parameters Checkbox ===
         self.custom_params_checkbox = QCheckBox("Tabulate Custom Loading Parameters")
-        self.custom_params_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 11px;
-                color: black;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border: 2px solid #b0b0b0;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #90AF13;
-                border-color: #90AF13;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #7a9a12;
-            }
-        """)
+        self.custom_params_checkbox.setObjectName("location_params_checkbox")
         main_layout.addWidget(self.custom_params_checkbox)
         
         main_layout.addStretch()
@@ -518,38 +341,14 @@ class InputDock(QWidget):
         
         ok_btn = QPushButton("OK")
         ok_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        ok_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #333;
-                border: 1px solid #c0c0c0;
-                border-radius: 3px;
-                padding: 6px 16px;
-                min-height: 28px;
-            }
-            QPushButton:hover {
-                background-color: #f5f5f5;
-            }
-        """)
+        ok_btn.setObjectName("dialog_button")
         ok_btn.setMinimumWidth(100)
         ok_btn.clicked.connect(dialog.accept)
         btn_layout.addWidget(ok_btn)
         
         cancel_btn = QPushButton("Cancel")
         cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #333;
-                border: 1px solid #c0c0c0;
-                border-radius: 3px;
-                padding: 6px 16px;
-                min-height: 28px;
-            }
-            QPushButton:hover {
-                background-color: #f5f5f5;
-            }
-        """)
+        cancel_btn.setObjectName("dialog_button")
         cancel_btn.setMinimumWidth(100)
         cancel_btn.clicked.connect(dialog.reject)
         btn_layout.addWidget(cancel_btn)
@@ -567,24 +366,8 @@ class InputDock(QWidget):
             enabled = (state == 2)
             self.map_placeholder.setEnabled(enabled)
             if enabled:
-                self.map_placeholder.setStyleSheet("""
-                    QLabel {
-                        border: 2px solid #90AF13;
-                        background-color: white;
-                        padding: 20px;
-                        color: #666666;
-                    }
-                """)
                 self.map_placeholder.setText("Map Placeholder\n(Click to select location)\n(Will be implemented later)")
             else:
-                self.map_placeholder.setStyleSheet("""
-                    QLabel {
-                        border: 1px solid #e0e0e0;
-                        background-color: #f5f5f5;
-                        padding: 20px;
-                        color: #999999;
-                    }
-                """)
                 self.map_placeholder.setText("Map Placeholder\n(Will be added later)")
         
         # Connect checkbox signals to enable/disable fields
@@ -604,7 +387,7 @@ class InputDock(QWidget):
         left_layout.setSpacing(0)
 
         self.left_panel = QWidget()
-        self.left_panel.setStyleSheet("background-color: white;")
+        self.left_panel.setObjectName("input_dock_panel")
         panel_layout = QVBoxLayout(self.left_panel)
         panel_layout.setContentsMargins(15, 10, 15, 10)
         panel_layout.setSpacing(0)
@@ -615,46 +398,14 @@ class InputDock(QWidget):
         top_bar.setContentsMargins(0, 0, 0, 15)
         
         input_dock_btn = QPushButton("Basic Inputs")
-        input_dock_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #90AF13;
-                color: white;
-                font-weight: bold;
-                font-size: 13px;
-                border: none;
-                border-radius: 4px;
-                padding: 7px 20px;
-                min-width: 80px;
-            }
-        """)
+        input_dock_btn.setObjectName("dock_title_button")
         input_dock_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         top_bar.addWidget(input_dock_btn)
         
         # Additional Inputs button with lock icon on the right
         additional_inputs_btn = QPushButton("Additional Inputs")
         additional_inputs_btn.setCursor(Qt.CursorShape.PointingHandCursor)        
-        additional_inputs_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: black;
-                font-weight: bold;
-                font-size: 13px;
-                border-radius: 5px;
-                border: 1px solid black;
-                padding: 7px 20px;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: #90AF13;
-                border: 1px solid #90AF13;
-                color: white;
-            }
-            QPushButton:pressed {
-                color: black;
-                background-color: white;
-                border: 1px solid black;
-            }
-        """)
+        additional_inputs_btn.setObjectName("additional_inputs_button")
         additional_inputs_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         additional_inputs_btn.clicked.connect(self.show_additional_inputs)
         top_bar.addWidget(additional_inputs_btn)           
@@ -663,18 +414,18 @@ class InputDock(QWidget):
         lock_button = QPushButton()
         lock_button.setCursor(Qt.CursorShape.PointingHandCursor) 
         lock_state = [1]  # Use list to make it mutable
-        lock_button.setIcon(QIcon(":/vectors/lock_close.svg"))
+        lock_button.setIcon(svg_icon(":/vectors/lock_close.svg"))
         lock_button.setIconSize(QSize(30, 30))
-        lock_button.setStyleSheet("border: none;")
+        lock_button.setObjectName("lock_button")
         top_bar.addWidget(lock_button)
 
         def toggle_lock():
             if lock_state[0] == 0:
                 lock_state[0] = 1
-                lock_button.setIcon(QIcon(":/vectors/lock_close.svg"))
+                lock_button.setIcon(svg_icon(":/vectors/lock_close.svg"))
             elif lock_state[0] == 1:
                 lock_state[0] = 0
-                lock_button.setIcon(QIcon(":/vectors/lock_open.svg"))
+                lock_button.setIcon(svg_icon(":/vectors/lock_open.svg"))
                 
         lock_button.clicked.connect(toggle_lock)
         
@@ -686,46 +437,7 @@ class InputDock(QWidget):
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                padding: 0px 5px;
-                border-top: 1px solid #909090;
-                border-bottom: 1px solid #909090;
-            }
-
-            QScrollArea QScrollBar:vertical {
-                border: none;
-                background: #f0f0f0;
-                width: 8px;
-                margin-left: 2px;
-            }
-
-            QScrollArea QScrollBar::handle:vertical {
-                background: #c0c0c0;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-
-            QScrollArea QScrollBar::handle:vertical:hover {
-                background: #a0a0a0;
-            }
-
-            QScrollArea QScrollBar::handle:vertical:pressed {
-                background: #808080;
-            }
-
-            QScrollArea QScrollBar::add-line:vertical,
-            QScrollArea QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-            }
-
-            QScrollArea QScrollBar::add-page:vertical,
-            QScrollArea QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
+        scroll_area.setObjectName("input_dock_scroll")
 
         group_container = QWidget()
         self.input_widget = group_container
@@ -734,134 +446,31 @@ class InputDock(QWidget):
         group_container_layout.setSpacing(12)
 
         # === Type of Structure Box ===
-        type_box = QGroupBox("Type of Structure")
-        type_box.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #90AF13;
-                border-radius: 4px;
-                background-color: white;
-                padding: 8px;
-                margin-top: 12px;
-                font-size: 10px;
-                font-weight: bold;
-                color: #333;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 8px;
-                padding: 0 4px;
-                margin-top: 4px;
-                background-color: white;
-                color: #333;
-            }
-        """)
+        type_box = QGroupBox(DISP_TITLE_STRUCTURE)
+        type_box.setObjectName("input_section_box")
         type_box_layout = QVBoxLayout(type_box)
         type_box_layout.setContentsMargins(8, 8, 8, 8)
         type_box_layout.setSpacing(8)
-        
-        # Type of Structure field
-        type_row = QHBoxLayout()
-        type_field_label = QLabel("Type of Structure")
-        type_field_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-        type_field_label.setMinimumWidth(110)
-        
-        self.structure_type_combo = NoScrollComboBox()
-        self.structure_type_combo.setObjectName(KEY_STRUCTURE_TYPE)
-        apply_field_style(self.structure_type_combo)
-        self.structure_type_combo.addItems(VALUES_STRUCTURE_TYPE)
-        
-        type_row.addWidget(type_field_label)
-        type_row.addWidget(self.structure_type_combo, 1)
-        type_box_layout.addLayout(type_row)
-
-        self.structure_note = QLabel("*Other structures not included")
-        self.structure_note.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-        self.structure_note.setVisible(False)
-        type_box_layout.addWidget(self.structure_note)
-
-        self.structure_type_combo.currentTextChanged.connect(self.on_structure_type_changed)
         group_container_layout.addWidget(type_box)
         
         # === Project Location Box ===
         location_box = QGroupBox()
-        location_box.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #90AF13;
-                border-radius: 4px;
-                background-color: white;
-                padding: 8px;
-                margin-top: 12px;
-            }
-        """)
+        location_box.setObjectName("input_location_box")
         location_box_layout = QVBoxLayout(location_box)
         location_box_layout.setContentsMargins(8, 8, 8, 8)
         location_box_layout.setSpacing(8)
 
-        loc_header = QHBoxLayout()
-        loc_title = QLabel("Project Location")
-        loc_title.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-        loc_title.setMinimumWidth(110)
-        loc_header.addWidget(loc_title)
-        
         add_here_btn = QPushButton("Add Here")
         add_here_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        add_here_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #90AF13;
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: 11px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #7a9a12;
-            }
-        """)
+        add_here_btn.setObjectName("dock_action_button")
         add_here_btn.clicked.connect(self.show_project_location_dialog)
-        loc_header.addWidget(add_here_btn, 1)
-        location_box_layout.addLayout(loc_header)
-        
-        self.project_location_combo = NoScrollComboBox()
-        self.project_location_combo.setObjectName(KEY_PROJECT_LOCATION)
-        self.project_location_combo.addItems(VALUES_PROJECT_LOCATION)
-        self.project_location_combo.currentTextChanged.connect(self.on_project_location_changed)
-        self.project_location_combo.hide()
+        location_box_layout.addLayout(create_form_row(DISP_TITLE_PROJECT, add_here_btn))
         
         group_container_layout.addWidget(location_box)
         
         # === Superstructure Section (Contains Everything) ===
         structure_group = QGroupBox()
-        structure_group.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #90AF13;
-                border-radius: 5px;
-                margin-top: 0px;
-                padding-top: 5px;
-                background-color: white;
-            }
-        """)
+        structure_group.setObjectName("dock_structure_group")
         structure_layout = QVBoxLayout()
         structure_layout.setContentsMargins(10, 10, 10, 10)
         structure_layout.setSpacing(10)
@@ -869,7 +478,7 @@ class InputDock(QWidget):
         # Header with title and collapse icon
         struct_header = QHBoxLayout()
         struct_title = QLabel("Superstructure")
-        struct_title.setStyleSheet("font-size: 13px; font-weight: bold; color: #333;")
+        struct_title.setObjectName("dock_structure_title")
         struct_header.addWidget(struct_title)
         struct_header.addStretch()
         
@@ -878,21 +487,10 @@ class InputDock(QWidget):
         toggle_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         toggle_btn.setCheckable(True)
         toggle_btn.setChecked(True)
-        toggle_btn.setIcon(QIcon(":/vectors/arrow_up_light.svg"))
+        # Arrow up while expanded, down while collapsed
+        theme_manager().set_themed_icon(toggle_btn, "arrow_up", "arrow_down")
         toggle_btn.setIconSize(QSize(20, 20))
-        toggle_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background: transparent;
-            }
-            QPushButton:pressed {
-                background: transparent;
-            }
-        """)
+        toggle_btn.setObjectName("dock_collapse_button")
         struct_header.addWidget(toggle_btn)
 
         structure_layout.addLayout(struct_header)
@@ -909,274 +507,69 @@ class InputDock(QWidget):
         def _toggle_structure(checked):
             # checked True means show body (open)
             structure_body.setVisible(checked)
-            toggle_btn.setIcon(QIcon(":/vectors/arrow_up_light.svg" if checked else ":/vectors/arrow_down_light.svg"))
 
         toggle_btn.toggled.connect(_toggle_structure)
         
         # === Geometric Details Box ===
-        geo_box = QGroupBox("Geometric Details")
-        geo_box.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #90AF13;
-                border-radius: 4px;
-                background-color: white;
-                padding: 8px;
-                margin-top: 12px;
-                font-size: 10px;
-                font-weight: bold;
-                color: #333;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 8px;
-                padding: 0 4px;
-                margin-top: 4px;
-                background-color: white;
-                color: #333;
-            }
-        """)
+        geo_box = QGroupBox(DISP_TITLE_GEOMETRIC)
+        geo_box.setObjectName("input_section_box")
         geo_box_layout = QVBoxLayout(geo_box)
         geo_box_layout.setContentsMargins(8, 8, 8, 8)
         geo_box_layout.setSpacing(8)
-        
-        # Span
-        span_row = QHBoxLayout()
-        span_label = QLabel("Span (m)")
-        span_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-        span_label.setMinimumWidth(110)
-        self.span_input = QLineEdit()
-        self.span_input.setObjectName(KEY_SPAN)
-        apply_field_style(self.span_input)
-        self.span_input.setValidator(QDoubleValidator(SPAN_MIN, SPAN_MAX, 2))
-        self.span_input.setPlaceholderText(f"{SPAN_MIN}-{SPAN_MAX} m")
-        span_row.addWidget(span_label)
-        span_row.addWidget(self.span_input, 1)
-        geo_box_layout.addLayout(span_row)
-        
-        # Carriageway Width
-        carriageway_row = QHBoxLayout()
-        carriageway_label = QLabel("Carriageway (m)")
-        carriageway_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-        carriageway_label.setMinimumWidth(110)
-        self.carriageway_input = QLineEdit()
-        self.carriageway_input.setObjectName(KEY_CARRIAGEWAY_WIDTH)
-        apply_field_style(self.carriageway_input)
-        self.carriageway_input.setValidator(QDoubleValidator(CARRIAGEWAY_WIDTH_MIN, 100.0, 2))
-        self.carriageway_input.setPlaceholderText(f"Min {CARRIAGEWAY_WIDTH_MIN} m")
-        carriageway_row.addWidget(carriageway_label)
-        carriageway_row.addWidget(self.carriageway_input, 1)
-        geo_box_layout.addLayout(carriageway_row)
-        
-        # Footpath
-        footpath_row = QHBoxLayout()
-        footpath_label = QLabel("Footpath")
-        footpath_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-        footpath_label.setMinimumWidth(110)
-        self.footpath_combo = NoScrollComboBox()
-        self.footpath_combo.setObjectName(KEY_FOOTPATH)
-        apply_field_style(self.footpath_combo)
-        self.footpath_combo.addItems(VALUES_FOOTPATH)
-        self.footpath_combo.setCurrentIndex(0)
-        self.footpath_combo.currentTextChanged.connect(self.on_footpath_changed)
-        footpath_row.addWidget(footpath_label)
-        footpath_row.addWidget(self.footpath_combo, 1)
-        geo_box_layout.addLayout(footpath_row)
-        
-        # Skew Angle
-        skew_row = QHBoxLayout()
-        skew_label = QLabel("Skew Angle")
-        skew_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-        skew_label.setMinimumWidth(110)
-        self.skew_input = QLineEdit()
-        self.skew_input.setObjectName(KEY_SKEW_ANGLE)
-        apply_field_style(self.skew_input)
-        self.skew_input.setValidator(QDoubleValidator(SKEW_ANGLE_MIN, SKEW_ANGLE_MAX, 1))
-        self.skew_input.setText(str(SKEW_ANGLE_DEFAULT))
-        self.skew_input.setPlaceholderText(f"Default: {SKEW_ANGLE_DEFAULT}°")
-        skew_row.addWidget(skew_label)
-        skew_row.addWidget(self.skew_input, 1)
-        geo_box_layout.addLayout(skew_row)
-        
-        # Additional Geometry (inside Geometric Details)
-        add_geo_row = QHBoxLayout()
-        add_geo_label = QLabel("Additional Geometry")
-        add_geo_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-        add_geo_label.setMinimumWidth(110)
-        add_geo_row.addWidget(add_geo_label)
-        
-        modify_geo_btn = QPushButton("Modify Here")
-        modify_geo_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        modify_geo_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #90AF13;
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: 11px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #7a9a12;
-            }
-        """)
-        modify_geo_btn.clicked.connect(self.show_additional_inputs)
-        add_geo_row.addWidget(modify_geo_btn, 1)
-        geo_box_layout.addLayout(add_geo_row)
-        
         structure_body_layout.addWidget(geo_box)
         
         # === Material Inputs Box ===
-        material_box = QGroupBox("Material Inputs")
-        material_box.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #90AF13;
-                border-radius: 4px;
-                background-color: white;
-                padding: 8px;
-                margin-top: 12px;
-                font-size: 10px;
-                font-weight: bold;
-                color: #333;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 8px;
-                padding: 0 4px;
-                margin-top: 4px;
-                background-color: white;
-                color: #333;
-            }
-        """)
+        material_box = QGroupBox(DISP_TITLE_MATERIAL)
+        material_box.setObjectName("input_section_box")
         material_box_layout = QVBoxLayout(material_box)
         material_box_layout.setContentsMargins(8, 8, 8, 8)
         material_box_layout.setSpacing(8)
-        
-        # Girder
-        girder_row = QHBoxLayout()
-        girder_label = QLabel("Girder")
-        girder_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-        girder_label.setMinimumWidth(110)
-        self.girder_combo = NoScrollComboBox()
-        self.girder_combo.setObjectName(KEY_GIRDER)
-        apply_field_style(self.girder_combo)
-        self.girder_combo.addItems(VALUES_MATERIAL)
-        girder_row.addWidget(girder_label)
-        girder_row.addWidget(self.girder_combo, 1)
-        material_box_layout.addLayout(girder_row)
-        
-        # Cross Bracing
-        cross_bracing_row = QHBoxLayout()
-        cross_bracing_label = QLabel("Cross Bracing")
-        cross_bracing_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-        cross_bracing_label.setMinimumWidth(110)
-        self.cross_bracing_combo = NoScrollComboBox()
-        self.cross_bracing_combo.setObjectName(KEY_CROSS_BRACING)
-        apply_field_style(self.cross_bracing_combo)
-        self.cross_bracing_combo.addItems(VALUES_MATERIAL)
-        cross_bracing_row.addWidget(cross_bracing_label)
-        cross_bracing_row.addWidget(self.cross_bracing_combo, 1)
-        material_box_layout.addLayout(cross_bracing_row)
-        
-        # Deck
-        deck_row = QHBoxLayout()
-        deck_label = QLabel("Deck")
-        deck_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-        deck_label.setMinimumWidth(110)
-        self.deck_combo = NoScrollComboBox()
-        self.deck_combo.setObjectName(KEY_DECK_CONCRETE_GRADE_BASIC)
-        apply_field_style(self.deck_combo)
-        self.deck_combo.addItems(VALUES_DECK_CONCRETE_GRADE)
-        self.deck_combo.setCurrentText("M25")
-        deck_row.addWidget(deck_label)
-        deck_row.addWidget(self.deck_combo, 1)
-        material_box_layout.addLayout(deck_row)
+        structure_body_layout.addWidget(material_box)
+
+        # Field rows come from the schema layout, each under the box of its section title
+        section_layouts = {
+            DISP_TITLE_STRUCTURE: type_box_layout,
+            DISP_TITLE_PROJECT: location_box_layout,
+            DISP_TITLE_GEOMETRIC: geo_box_layout,
+            DISP_TITLE_MATERIAL: material_box_layout,
+        }
+        self.fields = {}
+        section_layout = None
+        for key, label, entry_type, values, enabled, validator in field_list:
+            if entry_type == TYPE_TITLE:
+                section_layout = section_layouts[label]
+            elif entry_type in (TYPE_COMBOBOX, TYPE_TEXTBOX):
+                widget = create_input_widget(key, entry_type, values)
+                widget.setEnabled(enabled)
+                self.fields[key] = widget
+                if key == KEY_PROJECT_LOCATION:
+                    # Chosen through the Add Here dialog, so kept out of the dock and its theme repolish
+                    widget.hide()
+                else:
+                    section_layout.addLayout(create_form_row(label, widget))
+
+        self.structure_type_combo = self.fields[KEY_STRUCTURE_TYPE]
+        self.structure_type_combo.currentTextChanged.connect(self.on_structure_type_changed)
+        self.project_location_combo = self.fields[KEY_PROJECT_LOCATION]
+        self.project_location_combo.currentTextChanged.connect(self.on_project_location_changed)
 
-        # Material Properties header with button
-        mat_prop_header = QHBoxLayout()
-        mat_prop_title = QLabel("Modify Properties")
-        mat_prop_title.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
-        mat_prop_title.setMinimumWidth(110)
-        mat_prop_header.addWidget(mat_prop_title)
+        self.structure_note = QLabel("*Other structures not included")
+        self.structure_note.setObjectName("dock_field_label")
+        self.structure_note.setVisible(False)
+        type_box_layout.addWidget(self.structure_note)
         
+        # Additional Geometry (inside Geometric Details)
+        modify_geo_btn = QPushButton("Modify Here")
+        modify_geo_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        modify_geo_btn.setObjectName("dock_action_button")
+        modify_geo_btn.clicked.connect(self.show_additional_inputs)
+        geo_box_layout.addLayout(create_form_row("Additional Geometry", modify_geo_btn))
+
+        # Material Properties row with button
         modify_mat_btn = QPushButton("Modify Here")
         modify_mat_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        modify_mat_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #90AF13;
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: 11px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #7a9a12;
-            }
-        """)
-        mat_prop_header.addWidget(modify_mat_btn, 1)
-        material_box_layout.addLayout(mat_prop_header)
-        
-        structure_body_layout.addWidget(material_box)
+        modify_mat_btn.setObjectName("dock_action_button")
+        material_box_layout.addLayout(create_form_row("Modify Properties", modify_mat_btn))
         
         # Close the Superstructure section
         structure_group.setLayout(structure_layout)
@@ -1184,22 +577,14 @@ class InputDock(QWidget):
 
         # === Substructure Section (empty body for now) ===
         sub_group = QGroupBox()
-        sub_group.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #90AF13;
-                border-radius: 5px;
-                margin-top: 8px;
-                padding-top: 5px;
-                background-color: white;
-            }
-        """)
+        sub_group.setObjectName("input_substructure_group")
         sub_layout = QVBoxLayout()
         sub_layout.setContentsMargins(10, 10, 10, 10)
         sub_layout.setSpacing(8)
 
         sub_header = QHBoxLayout()
         sub_title = QLabel("Substructure")
-        sub_title.setStyleSheet("font-size: 13px; font-weight: bold; color: #333;")
+        sub_title.setObjectName("dock_structure_title")
         sub_header.addWidget(sub_title)
         sub_header.addStretch()
 
@@ -1207,21 +592,9 @@ class InputDock(QWidget):
         sub_toggle.setCursor(Qt.CursorShape.PointingHandCursor)
         sub_toggle.setCheckable(True)
         sub_toggle.setChecked(True)
-        sub_toggle.setIcon(QIcon(":/vectors/arrow_up_light.svg"))
+        theme_manager().set_themed_icon(sub_toggle, "arrow_up", "arrow_down")
         sub_toggle.setIconSize(QSize(20, 20))
-        sub_toggle.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background: transparent;
-            }
-            QPushButton:pressed {
-                background: transparent;
-            }
-        """)
+        sub_toggle.setObjectName("dock_collapse_button")
         sub_header.addWidget(sub_toggle)
         sub_layout.addLayout(sub_header)
 
@@ -1235,7 +608,6 @@ class InputDock(QWidget):
 
         def _toggle_sub(checked):
             sub_body.setVisible(checked)
-            sub_toggle.setIcon(QIcon(":/vectors/arrow_up_light.svg" if checked else ":/vectors/arrow_down_light.svg"))
 
         sub_toggle.toggled.connect(_toggle_sub)
 
@@ -1245,7 +617,9 @@ class InputDock(QWidget):
         group_container_layout.addStretch()
         scroll_area.setWidget(group_container)
 
-        self.data = {}
+        # Basic input widgets are named after their model keys
+        self.bindings = [bind_field(widget, self.inputs, key) for key, widget in self.fields.items()]
+        self.validation.watch_bindings(self.bindings)
         panel_layout.addWidget(scroll_area)
 
         # Bottom buttons
@@ -1260,6 +634,7 @@ class InputDock(QWidget):
         design_btn = DockCustomButton("Design", ":/vectors/design.svg")
         design_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         btn_button_layout.addWidget(design_btn)
+        design_btn.clicked.connect(self.design_requested)
 
         panel_layout.addLayout(btn_button_layout)
 
@@ -1269,66 +644,36 @@ class InputDock(QWidget):
         h_scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         h_scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         h_scroll_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        h_scroll_area.setStyleSheet("""
-            QScrollArea{
-                background: transparent;
-            }
-            QScrollBar:horizontal{
-                background: #E0E0E0;
-                height: 8px;
-                margin: 3px 0px 0px 0px;
-                border-radius: 2px;
-            }
-            QScrollBar::handle:horizontal{
-                background: #A0A0A0;
-                min-width: 30px;
-                border-radius: 2px;
-            }
-            QScrollBar::handle:horizontal:hover{
-                background: #707070;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal{
-                width: 0px;
-            }
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal{
-                background: none;
-            }
-        """)
+        h_scroll_area.setObjectName("input_dock_hscroll")
         h_scroll_area.setWidget(self.left_panel)
 
         left_layout.addWidget(h_scroll_area)
     
+    def flush_edits(self):
+        """Run the pending girder recalculation of the Additional Inputs now, if one is queued"""
+        widget = self.additional_inputs_widget
+        if widget is not None and widget.bridge_geometry_page.is_built():
+            widget.bridge_geometry_page.widget.recalc_scheduler.flush()
+
     def show_additional_inputs(self):
-        """Show Additional Inputs dialog"""
-        footpath_value = self.footpath_combo.currentText() if self.footpath_combo else "None"
-        
-        carriageway_width = 7.5
-        if self.input_widget:
-            carriageway_field = self.input_widget.findChild(QLineEdit, KEY_CARRIAGEWAY_WIDTH)
-            if carriageway_field and carriageway_field.text():
-                try:
-                    carriageway_width = float(carriageway_field.text())
-                except ValueError:
-                    carriageway_width = 7.5
-        
-        if self.additional_inputs_window is None or not self.additional_inputs_window.isVisible():
-            self.additional_inputs_window = QDialog(self)
-            self.additional_inputs_window.setWindowTitle("Additional Inputs - Manual Bridge Parameter Definition")
-            self.additional_inputs_window.resize(900, 700)
-            
-            layout = QVBoxLayout(self.additional_inputs_window)
-            layout.setContentsMargins(0, 0, 0, 0)
-            
-            self.additional_inputs_widget = AdditionalInputsWidget(footpath_value, carriageway_width, self.additional_inputs_window)
-            layout.addWidget(self.additional_inputs_widget)
-            
-            self.additional_inputs_window.show()
-        else:
-            self.additional_inputs_window.raise_()
-            self.additional_inputs_window.activateWindow()
+        """Show the Additional Inputs dialog, building it on first use"""
+        if self.additional_inputs_window is None:
+            self.additional_inputs_window = AdditionalInputsDialog(self.inputs, self, validation=self.validation)
+            self.additional_inputs_widget = self.additional_inputs_window.widget
+            if self.selected_girder is not None:
+                self.additional_inputs_widget.select_girder(self.selected_girder)
+        self.additional_inputs_window.open_dialog()
     
-    def on_footpath_changed(self, footpath_value):
-        """Update additional inputs when footpath changes"""
-        if self.additional_inputs_window and self.additional_inputs_window.isVisible():
-            if hasattr(self, 'additional_inputs_widget'):
-                self.additional_inputs_widget.update_footpath_value(footpath_value)
\ No newline at end of file
+    def select_girder(self, girder):
+        """Show girder (e.g. "G2") in Girder Details, now or when the dialog is next built"""
+        self.selected_girder = girder
+        if self.additional_inputs_widget is not None:
+            self.additional_inputs_widget.select_girder(girder)
+
+    def release_additional_inputs(self):
+        """Destroy the Additional Inputs dialog; it is rebuilt on next use"""
+        if self.additional_inputs_window is not None:
+            self.additional_inputs_window.hide()
+            self.additional_inputs_window.deleteLater()
+            self.additional_inputs_window = None
+            self.additional_inputs_widget = None
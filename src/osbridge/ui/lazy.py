@@ -0,0 +1,73 @@
+"""
+Deferred construction of tab and stack pages.
+A LazyWidget is an empty placeholder page that calls its factory the first
+time it is shown, so dialogs open without building pages nobody looked at.
+A built page that is hidden can be parked: its content is taken out of the
+widget tree, so restyling the window does not re-polish it, and is put back
+when the page is next shown.
+"""
+from PySide6.QtWidgets import QWidget, QVBoxLayout
+from PySide6.QtCore import Signal
+
+
+class LazyWidget(QWidget):
+    """Placeholder page that builds its real content on first show"""
+
+    built = Signal(QWidget)  # Emitted with the content widget once it is built
+
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self.factory = factory
+        self.widget = None
+        self.parked = False
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+    def is_built(self):
+        return self.widget is not None
+
+    def build(self):
+        """Build the content now if it has not been built yet, and return it"""
+        if self.widget is None:
+            self.widget = self.factory()
+            self.factory = None
+            self.layout().addWidget(self.widget)
+            self.built.emit(self.widget)
+        return self.widget
+
+    def park(self):
+        """Take the built content out of the widget tree until the page is next shown"""
+        if self.widget is not None and not self.parked and not self.isVisible():
+            self.widget.setParent(None)
+            self.parked = True
+
+    def showEvent(self, event):
+        if self.parked:
+            # Re-parenting re-polishes the content with the current stylesheet
+            self.parked = False
+            self.layout().addWidget(self.widget)
+            self.widget.show()
+        self.build()
+        super().showEvent(event)
+
+
+def add_lazy_tab(tab_widget, factory, title):
+    """Add a tab whose content is built by factory when first selected"""
+    page = LazyWidget(factory)
+    tab_widget.addTab(page, title)
+    return page
+
+
+def lazy_pages(widget):
+    """Every LazyWidget under widget, including those inside parked content"""
+    pages = widget.findChildren(LazyWidget)
+    for page in pages:
+        if page.parked:
+            pages.extend(page.widget.findChildren(LazyWidget))
+    return pages
+
+
+def content(widget):
+    """The real content of a (possibly lazy) page, building it if needed"""
+    return widget.build() if isinstance(widget, LazyWidget) else widget
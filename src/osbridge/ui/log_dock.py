@@ -0,0 +1,59 @@
+"""
+Log dock for Highway Bridge Design.
+Lists the current validation diagnostics below the CAD window; selecting an
+entry focuses the input field it refers to.
+"""
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QColor
+
+from osbridge.backend.validation import SEVERITY_ERROR, SEVERITY_WARNING
+
+
+SEVERITY_COLORS = {
+    SEVERITY_ERROR: QColor("#c62828"),
+    SEVERITY_WARNING: QColor("#e65100"),
+}
+
+
+class LogDock(QWidget):
+    """Diagnostics list fed by the ValidationMonitor"""
+
+    field_requested = Signal(str)  # Emitted with the input key of an activated entry
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("logs_dock")
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        self.header = QLabel("Log")
+        layout.addWidget(self.header)
+
+        self.list_widget = QListWidget()
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.itemActivated.connect(self.on_item_activated)
+        self.list_widget.itemClicked.connect(self.on_item_activated)
+        layout.addWidget(self.list_widget)
+
+    def show_diagnostics(self, diagnostics):
+        """Replace the list with diagnostics in one batched update"""
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            self.list_widget.clear()
+            for diagnostic in diagnostics:
+                item = QListWidgetItem(f"{diagnostic.severity.upper()}: {diagnostic.message}")
+                item.setForeground(SEVERITY_COLORS.get(diagnostic.severity, QColor("#000000")))
+                item.setToolTip(f"{diagnostic.title} ({diagnostic.clause})")
+                item.setData(Qt.UserRole, diagnostic.keys[0])
+                self.list_widget.addItem(item)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
+
+        errors = sum(1 for d in diagnostics if d.severity == SEVERITY_ERROR)
+        warnings = len(diagnostics) - errors
+        self.header.setText(f"Log - {errors} error(s), {warnings} warning(s)" if diagnostics else "Log")
+
+    def on_item_activated(self, item):
+        self.field_requested.emit(item.data(Qt.UserRole))
@@ -6,6 +6,7 @@ from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QIcon
 
 from osbridge.ui.custom_buttons import DockCustomButton
+from osbridge.ui.theme import theme_manager
 from osbridge.ui.input_dock import NoScrollComboBox, apply_field_style
 
 
@@ -14,7 +15,7 @@ class OutputDock(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.setStyleSheet("background: transparent;")
+        self.setObjectName("output_dock")
         self.init_ui()
 
     def init_ui(self):
@@ -25,7 +26,7 @@ class OutputDock(QWidget):
 
         # Toggle strip on the left
         self.toggle_strip = QWidget()
-        self.toggle_strip.setStyleSheet("background-color: #90AF13;")
+        self.toggle_strip.setObjectName("output_toggle_strip")
         self.toggle_strip.setFixedWidth(6)
         toggle_layout = QVBoxLayout(self.toggle_strip)
         toggle_layout.setContentsMargins(0, 0, 0, 0)
@@ -36,19 +37,7 @@ class OutputDock(QWidget):
         self.toggle_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.toggle_btn.setFixedSize(6, 60)
         self.toggle_btn.setToolTip("Hide panel")
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7a9a12;
-                color: white;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 0px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #6a8a10;
-            }
-        """)
+        self.toggle_btn.setObjectName("output_toggle_strip_button")
         toggle_layout.addStretch()
         toggle_layout.addWidget(self.toggle_btn)
         toggle_layout.addStretch()
@@ -56,7 +45,7 @@ class OutputDock(QWidget):
 
         # Content container
         content_container = QWidget()
-        content_container.setStyleSheet("background-color: white;")
+        content_container.setObjectName("output_dock_panel")
         content_layout = QVBoxLayout(content_container)
         content_layout.setContentsMargins(8, 8, 8, 8)
         content_layout.setSpacing(10)
@@ -67,18 +56,7 @@ class OutputDock(QWidget):
         top_bar.setContentsMargins(0, 0, 0, 15)
         
         input_dock_btn = QPushButton("Output Dock")
-        input_dock_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #90AF13;
-                color: white;
-                font-weight: bold;
-                font-size: 13px;
-                border: none;
-                border-radius: 4px;
-                padding: 7px 20px;
-                min-width: 80px;
-            }
-        """)
+        input_dock_btn.setObjectName("dock_title_button")
         input_dock_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         top_bar.addWidget(input_dock_btn)
         top_bar.addStretch()
@@ -87,7 +65,7 @@ class OutputDock(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { border: none; background: white; }")
+        scroll.setObjectName("output_dock_scroll")
 
         scroll_content = QWidget()
         scroll_layout = QVBoxLayout(scroll_content)
@@ -95,34 +73,14 @@ class OutputDock(QWidget):
         scroll_layout.setSpacing(10)
 
         results_group = QGroupBox("Analysis Results")
-        results_group.setStyleSheet(
-            """
-            QGroupBox {
-                font-weight: bold;
-                font-size: 11px;
-                color: #333;
-                border: 1px solid #90AF13;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 12px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 8px;
-                padding: 0 4px;
-                background-color: white;
-            }
-            """
-        )
+        results_group.setObjectName("output_group_box")
         results_layout = QVBoxLayout(results_group)
         results_layout.setContentsMargins(10, 8, 10, 10)
         results_layout.setSpacing(8)
 
         member_row = QHBoxLayout()
         member_label = QLabel("Member:")
-        member_label.setStyleSheet("font-size: 10px; color: #333; font-weight: normal;")
+        member_label.setObjectName("output_option")
         member_label.setMinimumWidth(100)
         self.member_combo = NoScrollComboBox()
         self.member_combo.addItems(["All"])
@@ -133,7 +91,7 @@ class OutputDock(QWidget):
 
         load_combo_row = QHBoxLayout()
         load_combo_label = QLabel("Load Combination:")
-        load_combo_label.setStyleSheet("font-size: 10px; color: #333; font-weight: normal;")
+        load_combo_label.setObjectName("output_option")
         load_combo_label.setMinimumWidth(100)
         self.load_combo = NoScrollComboBox()
         self.load_combo.addItems(["Envelope"])
@@ -148,17 +106,17 @@ class OutputDock(QWidget):
         col1 = QVBoxLayout()
         for text in ["Fx", "Mx", "Dx"]:
             cb = QCheckBox(text)
-            cb.setStyleSheet("font-size: 10px; color: #333;")
+            cb.setObjectName("output_option")
             col1.addWidget(cb)
         col2 = QVBoxLayout()
         for text in ["Fy", "My", "Dy"]:
             cb = QCheckBox(text)
-            cb.setStyleSheet("font-size: 10px; color: #333;")
+            cb.setObjectName("output_option")
             col2.addWidget(cb)
         col3 = QVBoxLayout()
         for text in ["Fz", "Mz", "Dz"]:
             cb = QCheckBox(text)
-            cb.setStyleSheet("font-size: 10px; color: #333;")
+            cb.setObjectName("output_option")
             col3.addWidget(cb)
         forces_grid.addLayout(col1)
         forces_grid.addLayout(col2)
@@ -166,61 +124,33 @@ class OutputDock(QWidget):
         results_layout.addLayout(forces_grid)
 
         display_label = QLabel("Display Options:")
-        display_label.setStyleSheet("font-size: 10px; color: #333; font-weight: normal; margin-top: 4px;")
+        display_label.setObjectName("output_display_label")
         results_layout.addWidget(display_label)
 
         display_row = QHBoxLayout()
         display_row.setSpacing(12)
         for text in ["Max", "Min"]:
             cb = QCheckBox(text)
-            cb.setStyleSheet("font-size: 10px; color: #333;")
+            cb.setObjectName("output_option")
             display_row.addWidget(cb)
         display_row.addStretch()
         results_layout.addLayout(display_row)
 
         utilization_check = QCheckBox("Controlling Utilization Ratio")
-        utilization_check.setStyleSheet("font-size: 10px; color: #333;")
+        utilization_check.setObjectName("output_option")
         results_layout.addWidget(utilization_check)
 
         scroll_layout.addWidget(results_group)
 
         design_group = QGroupBox("Design")
-        design_group.setStyleSheet(
-            """
-            QGroupBox {
-                font-weight: bold;
-                font-size: 11px;
-                color: #333;
-                border: 1px solid #90AF13;
-                border-radius: 4px;
-                margin-top: 8px;
-                padding-top: 12px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 8px;
-                padding: 0 4px;
-                background-color: white;
-            }
-            """
-        )
+        design_group.setObjectName("output_group_box")
         design_layout = QVBoxLayout(design_group)
         design_layout.setContentsMargins(10, 8, 10, 10)
         design_layout.setSpacing(8)
 
         # === Superstructure Section (Contains Everything) ===
         structure_group = QGroupBox()
-        structure_group.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #90AF13;
-                border-radius: 5px;
-                margin-top: 0px;
-                padding-top: 5px;
-                background-color: white;
-            }
-        """)
+        structure_group.setObjectName("dock_structure_group")
         structure_layout = QVBoxLayout()
         structure_layout.setContentsMargins(10, 10, 10, 10)
         structure_layout.setSpacing(10)
@@ -228,7 +158,7 @@ class OutputDock(QWidget):
         # Header with title and collapse icon
         struct_header = QHBoxLayout()
         struct_title = QLabel("Superstructure")
-        struct_title.setStyleSheet("font-size: 13px; font-weight: bold; color: #333;")
+        struct_title.setObjectName("dock_structure_title")
         struct_header.addWidget(struct_title)
         struct_header.addStretch()
         
@@ -237,21 +167,10 @@ class OutputDock(QWidget):
         toggle_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         toggle_btn.setCheckable(True)
         toggle_btn.setChecked(True)
-        toggle_btn.setIcon(QIcon(":/vectors/arrow_up_light.svg"))
+        # Arrow up while expanded, down while collapsed
+        theme_manager().set_themed_icon(toggle_btn, "arrow_up", "arrow_down")
         toggle_btn.setIconSize(QSize(20, 20))
-        toggle_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background: transparent;
-            }
-            QPushButton:pressed {
-                background: transparent;
-            }
-        """)
+        toggle_btn.setObjectName("dock_collapse_button")
         struct_header.addWidget(toggle_btn)
 
         structure_layout.addLayout(struct_header)
@@ -267,33 +186,13 @@ class OutputDock(QWidget):
         # Additional Geometry (inside Superstructure body)
         add_geo_row = QHBoxLayout()
         add_geo_label = QLabel("Steel Design")
-        add_geo_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
+        add_geo_label.setObjectName("dock_field_label")
         add_geo_label.setMinimumWidth(110)
         add_geo_row.addWidget(add_geo_label)
         
         modify_geo_btn = QPushButton("Here")
         modify_geo_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        modify_geo_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #90AF13;
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: 11px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #7a9a12;
-            }
-        """)
+        modify_geo_btn.setObjectName("dock_action_button")
         modify_geo_btn.clicked.connect(self.show_additional_inputs)
         add_geo_row.addWidget(modify_geo_btn, 1)
         structure_body_layout.addLayout(add_geo_row)
@@ -303,33 +202,13 @@ class OutputDock(QWidget):
                 # Additional Geometry (inside Superstructure body)
         add_geo_row = QHBoxLayout()
         add_geo_label = QLabel("Deck Design")
-        add_geo_label.setStyleSheet("""
-            QLabel {
-                color: #000000;
-                font-size: 12px;
-                background: transparent;
-            }
-        """)
+        add_geo_label.setObjectName("dock_field_label")
         add_geo_label.setMinimumWidth(110)
         add_geo_row.addWidget(add_geo_label)
         
         modify_geo_btn = QPushButton("Here")
         modify_geo_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        modify_geo_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #90AF13;
-                color: white;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 20px;
-                font-size: 11px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #7a9a12;
-            }
-        """)
+        modify_geo_btn.setObjectName("dock_action_button")
         modify_geo_btn.clicked.connect(self.show_additional_inputs)
         add_geo_row.addWidget(modify_geo_btn, 1)
         structure_body_layout.addLayout(add_geo_row)
@@ -341,7 +220,6 @@ class OutputDock(QWidget):
         def _toggle_structure(checked):
             # checked True means show body (open)
             structure_body.setVisible(checked)
-            toggle_btn.setIcon(QIcon(":/vectors/arrow_up_light.svg" if checked else ":/vectors/arrow_down_light.svg"))
 
         toggle_btn.toggled.connect(_toggle_structure)
         structure_group.setLayout(structure_layout)
@@ -349,15 +227,7 @@ class OutputDock(QWidget):
 
         # === Substructure Section (Contains Everything) ===
         structure_group = QGroupBox()
-        structure_group.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #90AF13;
-                border-radius: 5px;
-                margin-top: 0px;
-                padding-top: 5px;
-                background-color: white;
-            }
-        """)
+        structure_group.setObjectName("dock_structure_group")
         structure_layout = QVBoxLayout()
         structure_layout.setContentsMargins(10, 10, 10, 10)
         structure_layout.setSpacing(10)
@@ -365,7 +235,7 @@ class OutputDock(QWidget):
         # Header with title and collapse icon
         struct_header = QHBoxLayout()
         struct_title = QLabel("Substructure")
-        struct_title.setStyleSheet("font-size: 13px; font-weight: bold; color: #333;")
+        struct_title.setObjectName("dock_structure_title")
         struct_header.addWidget(struct_title)
         struct_header.addStretch()
         
@@ -374,21 +244,9 @@ class OutputDock(QWidget):
         toggle_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         toggle_btn.setCheckable(True)
         toggle_btn.setChecked(True)
-        toggle_btn.setIcon(QIcon(":/vectors/arrow_up_light.svg"))
+        theme_manager().set_themed_icon(toggle_btn, "arrow_up", "arrow_down")
         toggle_btn.setIconSize(QSize(20, 20))
-        toggle_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background: transparent;
-            }
-            QPushButton:pressed {
-                background: transparent;
-            }
-        """)
+        toggle_btn.setObjectName("dock_collapse_button")
         struct_header.addWidget(toggle_btn)
 
         structure_layout.addLayout(struct_header)
@@ -408,7 +266,6 @@ class OutputDock(QWidget):
         def _toggle_structure(checked):
             # checked True means show body (open)
             structure_body.setVisible(checked)
-            toggle_btn.setIcon(QIcon(":/vectors/arrow_up_light.svg" if checked else ":/vectors/arrow_down_light.svg"))
 
         toggle_btn.toggled.connect(_toggle_structure)
         structure_group.setLayout(structure_layout)
@@ -0,0 +1,198 @@
+"""
+Results grid for Highway Bridge Design.
+The table model reads cells straight from the AnalysisResults array: rows
+are positions in an index array over (member, station, combination), so
+sorting and filtering only reorder integers and no per-cell objects exist.
+"""
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QTableView, QHeaderView, QAbstractItemView
+
+from osbridge.backend.results import ENVELOPE, ENVELOPE_LABELS, ALL_COMBINATIONS
+
+
+# Leading columns before the result components
+LABEL_COLUMNS = ("Member", "Station (m)", "Combination")
+
+ROW_HEIGHT = 24
+
+# data() runs for every visible cell and role on each repaint; comparing plain
+# ints is several times faster than comparing the Qt enums
+DISPLAY_ROLE = Qt.DisplayRole.value
+ALIGNMENT_ROLE = Qt.TextAlignmentRole.value
+LABEL_ALIGNMENT = (Qt.AlignLeft | Qt.AlignVCenter).value
+VALUE_ALIGNMENT = (Qt.AlignRight | Qt.AlignVCenter).value
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Table over AnalysisResults, one row per member, station and combination.
+
+    The combination filter picks one combination, ALL_COMBINATIONS, or
+    ENVELOPE, which replaces the combination axis by the max and min over
+    all combinations. set_filter() and sort() replace the row index
+    array; data() turns a row back into array indices with two divmods.
+    """
+
+    def __init__(self, results=None, parent=None):
+        super().__init__(parent)
+        self.results = None
+        self.member = None
+        self.combination = ENVELOPE
+        self.sort_column = -1
+        self.sort_order = Qt.AscendingOrder
+        self.set_results(results)
+
+    def set_results(self, results):
+        """Show results, keeping the current filter and sort where they still apply"""
+        self.beginResetModel()
+        self.results = results
+        if results is None or self.member not in results.members:
+            self.member = None
+        if not self._is_combination(self.combination):
+            self.combination = ENVELOPE
+        self._select_rows()
+        self.endResetModel()
+
+    def set_filter(self, member=None, combination=ENVELOPE):
+        """Restrict rows to one member (None: all) and a load combination choice"""
+        self.beginResetModel()
+        self.member = member
+        self.combination = combination
+        if self.results is None or member not in self.results.members:
+            self.member = None
+        if not self._is_combination(combination):
+            self.combination = ENVELOPE
+        self._select_rows()
+        self.endResetModel()
+
+    def _is_combination(self, name):
+        if name in (ENVELOPE, ALL_COMBINATIONS):
+            return True
+        return self.results is not None and name in self.results.combinations
+
+    def _select_rows(self):
+        if self.results is None:
+            self.table = np.empty((0, 0, 0, 0))
+            self.labels = ()
+            self.rows = np.empty(0, dtype=np.intp)
+            return
+        if self.combination == ENVELOPE:
+            self.table = self.results.envelope()
+            self.labels = ENVELOPE_LABELS
+        elif self.combination == ALL_COMBINATIONS:
+            self.table = self.results.values
+            self.labels = self.results.combinations
+        else:
+            index = self.results.combination_index(self.combination)
+            self.table = self.results.values[:, :, index:index + 1, :]
+            self.labels = (self.combination,)
+        members, stations, combinations, components = self.table.shape
+        self.flat = self.table.reshape(-1, components)
+        self.member_stride = stations * combinations
+        self.station_stride = combinations
+        if self.member is None:
+            self.rows = np.arange(members * self.member_stride, dtype=np.intp)
+        else:
+            start = self.results.member_index(self.member) * self.member_stride
+            self.rows = np.arange(start, start + self.member_stride, dtype=np.intp)
+        self._apply_sort()
+
+    def _apply_sort(self):
+        if self.sort_column < 0 or not len(self.rows):
+            return
+        rows = self.rows
+        column = self.sort_column
+        descending = self.sort_order == Qt.DescendingOrder
+        if column < len(LABEL_COLUMNS):
+            # Integer member, station and combination indices (stations are in
+            # order along the member); a stable sort keeps the other labels grouped
+            if column == 0:
+                keys = rows // self.member_stride
+            elif column == 1:
+                keys = rows % self.member_stride // self.station_stride
+            else:
+                keys = rows % self.station_stride
+            if descending:
+                # Sort the reversed keys so equal keys keep their original order
+                order = len(keys) - 1 - np.argsort(keys[::-1], kind="stable")[::-1]
+            else:
+                order = np.argsort(keys, kind="stable")
+        else:
+            order = np.argsort(self.flat[rows, column - len(LABEL_COLUMNS)])
+            if descending:
+                order = order[::-1]
+        self.rows = rows[order]
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.beginResetModel()
+        self.sort_column = column
+        self.sort_order = order
+        self._select_rows()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.results is None:
+            return 0
+        return len(LABEL_COLUMNS) + len(self.results.components)
+
+    def data(self, index, role=DISPLAY_ROLE):
+        if role == DISPLAY_ROLE:
+            column = index.column()
+            row = int(self.rows[index.row()])
+            if column >= len(LABEL_COLUMNS):
+                return f"{float(self.flat[row, column - len(LABEL_COLUMNS)]):.3f}"
+            return self.label(row, column)
+        if role == ALIGNMENT_ROLE:
+            return LABEL_ALIGNMENT if index.column() < len(LABEL_COLUMNS) else VALUE_ALIGNMENT
+        return None
+
+    def label(self, row, column):
+        """Member, station or combination text of a flat row index"""
+        member, rest = divmod(row, self.member_stride)
+        station, combination = divmod(rest, self.station_stride)
+        if column == 0:
+            return self.results.members[member]
+        if column == 1:
+            return f"{self.results.stations[station]:.3f}"
+        return self.labels[combination]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal or self.results is None:
+            return None
+        if section < len(LABEL_COLUMNS):
+            return LABEL_COLUMNS[section]
+        return self.results.components[section - len(LABEL_COLUMNS)]
+
+
+class ResultsTableDialog(QDialog):
+    """Sortable results grid; uniform row heights keep scrolling independent of row count"""
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setObjectName("results_table_dialog")
+        self.setWindowTitle("Analysis Results")
+        self.resize(900, 600)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+
+        self.view = QTableView()
+        self.view.setObjectName("results_table")
+        self.view.setModel(model)
+        # Start in array order; sorting is enabled once a header is clicked
+        self.view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.view.setSortingEnabled(True)
+        self.view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.view.setAlternatingRowColors(True)
+        self.view.setWordWrap(False)
+        vertical = self.view.verticalHeader()
+        vertical.setSectionResizeMode(QHeaderView.Fixed)
+        vertical.setDefaultSectionSize(ROW_HEIGHT)
+        vertical.hide()
+        horizontal = self.view.horizontalHeader()
+        horizontal.setSectionResizeMode(QHeaderView.Interactive)
+        horizontal.setDefaultSectionSize(90)
+        horizontal.setStretchLastSection(True)
+        layout.addWidget(self.view)
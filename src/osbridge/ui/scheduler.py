@@ -0,0 +1,67 @@
+"""
+Coalescing scheduler for live recalculation in the input panels.
+Collapses bursts of edits into a single deferred run of the latest state.
+"""
+from PySide6.QtCore import QObject, QTimer
+
+
+# Quiet period after the last edit before a recalculation runs (ms)
+DEFAULT_RECALC_DELAY_MS = 150
+
+
+class CoalescingScheduler(QObject):
+    """Run a callback once, after a burst of schedule() calls has settled.
+
+    Every call to schedule() restarts the quiet-period timer and bumps a
+    generation counter, so typing "2.75" results in one run rather than four.
+    A run is stale when the generation moves on while the callback runs, e.g.
+    a model change it triggers schedules another edit. flush() runs a pending
+    callback at once and repeats stale runs, so actions that must see the
+    settled state, such as designing or exporting, never start on a stale
+    result.
+    """
+
+    def __init__(self, callback, delay_ms=DEFAULT_RECALC_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self.callback = callback
+        self.generation = 0
+        self.running = False
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.run_now)
+
+    def schedule(self):
+        """Request a run; restarts the quiet period if one is pending"""
+        self.generation += 1
+        self.timer.start()
+
+    def cancel(self):
+        """Drop the pending run and mark any in-flight run as stale"""
+        self.generation += 1
+        self.timer.stop()
+
+    def flush(self):
+        """Run immediately if a run is pending, until a run is not made stale by newer edits"""
+        while self.timer.isActive():
+            if self.run_now():
+                break
+
+    def is_stale(self, generation):
+        """True when newer edits arrived after the given generation started"""
+        return generation != self.generation
+
+    def run_now(self):
+        """Run the callback for the current generation; False if the result is already stale"""
+        self.timer.stop()
+        if self.running:
+            # Re-entrant edit from inside the callback: run again afterwards
+            self.timer.start()
+            return False
+        generation = self.generation
+        self.running = True
+        try:
+            self.callback()
+        finally:
+            self.running = False
+        return not self.is_stale(generation)
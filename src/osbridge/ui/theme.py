@@ -0,0 +1,129 @@
+"""
+Application theme for Highway Bridge Design.
+Widgets only carry object names and dynamic properties; their look comes
+from one stylesheet compiled into the Qt resources and set once on each
+top-level window, so Qt parses the rules a single time instead of per widget.
+The ThemeManager keeps both stylesheets in memory and switches between
+them, together with the themed icons, without rebuilding any widget.
+"""
+from PySide6.QtCore import QObject, QFile, QIODevice, QTextStream, Signal
+from PySide6.QtWidgets import QApplication
+
+# Import resources to register them
+from osbridge.resources import resources_rc
+from osbridge.ui.icon_cache import svg_icon
+from osbridge.ui.lazy import LazyWidget
+
+
+THEME_LIGHT = "light"
+THEME_DARK = "dark"
+
+THEME_STYLESHEETS = {
+    THEME_LIGHT: ":/themes/lightstyle.qss",
+    THEME_DARK: ":/themes/darkstyle.qss",
+}
+
+DEFAULT_THEME = THEME_LIGHT
+
+
+def load_stylesheet(theme=DEFAULT_THEME):
+    """Read the stylesheet of theme from the resources"""
+    path = THEME_STYLESHEETS[theme]
+    qss_file = QFile(path)
+    if not qss_file.open(QIODevice.ReadOnly | QIODevice.Text):
+        raise FileNotFoundError(f"Stylesheet resource not found: {path}")
+    try:
+        return QTextStream(qss_file).readAll()
+    finally:
+        qss_file.close()
+
+
+def vector_path(name, theme=DEFAULT_THEME):
+    """Resource path of the theme variant of a vector, e.g. "arrow_up" -> arrow_up_light.svg"""
+    return f":/vectors/{name}_{theme}.svg"
+
+
+class ThemeManager(QObject):
+    """Owns the theme stylesheet and the icons that follow the theme.
+
+    Both stylesheets are read once up front. The stylesheet goes on the
+    windows registered with add_window rather than on the QApplication:
+    replacing the application stylesheet re-polishes every widget in the
+    process and costs several times more than re-styling our own windows.
+    Dialogs parented to a registered window inherit its stylesheet. Before
+    a switch, built lazy pages that are hidden, including every page of a
+    hidden dialog, are parked, so only what is on screen is re-polished and
+    a parked page picks up the new stylesheet when it is next shown.
+
+    Buttons whose icon depends on the theme are registered with
+    set_themed_icon; a switch swaps their icons and the stylesheet while
+    painting is suspended, so every widget is re-polished and repainted once.
+    """
+
+    theme_changed = Signal(str)  # Emitted with the new theme name
+
+    def __init__(self, app=None, theme=DEFAULT_THEME):
+        super().__init__(app or QApplication.instance())
+        self.app = app or QApplication.instance()
+        self.theme = theme
+        self.stylesheets = {name: load_stylesheet(name) for name in THEME_STYLESHEETS}
+        self.windows = []
+        self.themed_icons = {}  # button -> (icon name when checked, icon name otherwise)
+
+    def add_window(self, window):
+        """Style window with the current theme and keep it in step with theme switches"""
+        if window not in self.windows:
+            self.windows.append(window)
+            window.destroyed.connect(lambda *args: self.windows.remove(window))
+        window.setStyleSheet(self.stylesheets[self.theme])
+
+    def apply(self):
+        """Set the stylesheet of the current theme on every registered window"""
+        stylesheet = self.stylesheets[self.theme]
+        for window in self.windows:
+            for page in window.findChildren(LazyWidget):
+                page.park()
+            window.setStyleSheet(stylesheet)
+
+    def icon(self, on_name, off_name=None, theme=None):
+        """Icon of the current theme; off_name is used while a checkable button is unchecked"""
+        theme = theme or self.theme
+        return svg_icon(vector_path(on_name, theme), vector_path(off_name or on_name, theme))
+
+    def set_themed_icon(self, button, on_name, off_name=None):
+        """Give button a themed icon and keep it in step with theme switches"""
+        if button not in self.themed_icons:
+            button.destroyed.connect(lambda *args: self.themed_icons.pop(button, None))
+        self.themed_icons[button] = (on_name, off_name)
+        button.setIcon(self.icon(on_name, off_name))
+
+    def set_theme(self, theme):
+        """Switch the stylesheet and every themed icon to theme"""
+        if theme not in self.stylesheets:
+            raise ValueError(f"Unknown theme: {theme}")
+        if theme == self.theme:
+            return
+        self.theme = theme
+        windows = [w for w in self.windows if w.isVisible() and w.updatesEnabled()]
+        for window in windows:
+            window.setUpdatesEnabled(False)
+        try:
+            for button, names in self.themed_icons.items():
+                button.setIcon(self.icon(*names))
+            self.apply()
+        finally:
+            for window in windows:
+                window.setUpdatesEnabled(True)
+        self.theme_changed.emit(theme)
+
+
+_theme_manager = None
+
+
+def theme_manager(app=None):
+    """The application's ThemeManager, created on first use"""
+    global _theme_manager
+    if _theme_manager is None:
+        _theme_manager = ThemeManager(app)
+    return _theme_manager
+
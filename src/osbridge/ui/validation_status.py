@@ -0,0 +1,107 @@
+"""
+Inline validation status for the input panels.
+Model edits are validated after a quiet period and reported by highlighting
+the offending fields and publishing the diagnostics to the log dock, so no
+modal dialog ever interrupts an edit.
+"""
+from PySide6.QtCore import QObject, Signal
+
+from osbridge.backend.validation import VALIDATION_ENGINE, SEVERITY_ERROR
+from osbridge.ui.scheduler import CoalescingScheduler
+
+
+# Dynamic property read by the [validation=...] rules of the application stylesheet:
+# "", "warning" or "error"
+VALIDATION_PROPERTY = "validation"
+
+# Validation waits a little longer than the girder recalculation
+DEFAULT_VALIDATION_DELAY_MS = 250
+
+
+def set_validation_state(widget, state, message=None, tooltip=""):
+    """Set the highlight property on widget and re-polish it"""
+    widget.setProperty(VALIDATION_PROPERTY, state)
+    widget.setToolTip(message or tooltip)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+class ValidationMonitor(QObject):
+    """Validates the input model in the background of editing.
+
+    Changed keys are collected until the scheduler fires, then only the rules
+    depending on them are re-evaluated. Watched widgets are re-polished only
+    when their own state changes.
+    """
+
+    diagnostics_changed = Signal(list)  # Emitted with the current list of Diagnostics
+
+    def __init__(self, inputs, engine=VALIDATION_ENGINE, delay_ms=DEFAULT_VALIDATION_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self.inputs = inputs
+        self.engine = engine
+        self.diagnostics = []
+        self.changed_keys = set()
+        self.fields = {}  # key -> list of (widget, original tooltip)
+        self.states = {}  # key -> (severity, message) currently shown
+        self.scheduler = CoalescingScheduler(self.run_validation, delay_ms, self)
+        inputs.subscribe(self.on_inputs_changed)
+        self.destroyed.connect(lambda *args: inputs.unsubscribe(self.on_inputs_changed))
+        self.validate_now()
+
+    def watch(self, widget, key):
+        """Highlight widget with the diagnostics reported on key"""
+        entry = (widget, widget.toolTip())
+        self.fields.setdefault(key, []).append(entry)
+        widget.destroyed.connect(lambda *args: self.fields[key].remove(entry))
+        severity, message = self.states.get(key, ("", None))
+        set_validation_state(widget, severity, message, entry[1])
+
+    def watch_bindings(self, bindings):
+        for binding in bindings:
+            self.watch(binding.widget, binding.key)
+
+    def on_inputs_changed(self, key, old, new):
+        self.changed_keys.add(key)
+        self.scheduler.schedule()
+
+    def run_validation(self):
+        changed, self.changed_keys = self.changed_keys, set()
+        self.diagnostics = self.engine.reevaluate(self.inputs, changed, self.diagnostics)
+        self.publish()
+
+    def validate_now(self):
+        """Evaluate every rule immediately, dropping any pending run"""
+        self.scheduler.cancel()
+        self.changed_keys.clear()
+        self.diagnostics = self.engine.evaluate(self.inputs)
+        self.publish()
+
+    def publish(self):
+        states = {}
+        for diagnostic in self.diagnostics:
+            key = diagnostic.keys[0]
+            if key not in states or diagnostic.severity == SEVERITY_ERROR and states[key][0] != SEVERITY_ERROR:
+                states[key] = (diagnostic.severity, diagnostic.message)
+        for key in self.states.keys() | states.keys():
+            state = states.get(key, ("", None))
+            if self.states.get(key, ("", None)) != state:
+                for widget, tooltip in self.fields.get(key, ()):
+                    set_validation_state(widget, state[0], state[1], tooltip)
+        self.states = states
+        self.diagnostics_changed.emit(list(self.diagnostics))
+
+    def diagnostics_for(self, key):
+        """Current diagnostics reported on key"""
+        return [d for d in self.diagnostics if d.keys[0] == key]
+
+    def has_errors(self):
+        return any(d.severity == SEVERITY_ERROR for d in self.diagnostics)
+
+    def focus_field(self, key):
+        """Give focus to the first visible widget of key"""
+        for widget, tooltip in self.fields.get(key, ()):
+            if widget.isVisible():
+                widget.setFocus()
+                return True
+        return False